@@ -3,6 +3,8 @@ PDF viewer component using PyMuPDF (fitz)
 Material Design styled PDF viewer with text selection overlay
 """
 
+from bisect import bisect_right
+from collections.abc import Sequence
 from dataclasses import dataclass
 
 from PySide6.QtCore import (
@@ -82,6 +84,10 @@ class PDFPageViewer(QFrame):
         viewer.next_page()
         viewer.set_zoom(1.5)
 
+        # Jump to the page holding a coded segment
+        viewer.set_page_offsets(source_page_starts)
+        viewer.go_to_offset(segment_start)
+
     Signals:
         page_changed(page): Emitted when current page changes
         text_selected(PDFSelection): Emitted when text is selected
@@ -112,6 +118,7 @@ class PDFPageViewer(QFrame):
         self._selection_start = None
         self._selection_rect = None
         self._text_blocks: list[PDFTextBlock] = []
+        self._page_starts: tuple[int, ...] = ()
 
         self._setup_ui(show_toolbar, show_thumbnails)
 
@@ -492,6 +499,23 @@ class PDFPageViewer(QFrame):
 
             self.page_changed.emit(page)
 
+    def set_page_offsets(self, starts: Sequence[int]):
+        """
+        Set where each page starts in the document's extracted text.
+
+        Offsets come from text extraction (one per page, ascending) and let
+        text positions such as coded segments be mapped to pages.
+        """
+        self._page_starts = tuple(starts)
+
+    def page_for_offset(self, position: int) -> int:
+        """Page (0-indexed) holding a text position, by binary search"""
+        return max(bisect_right(self._page_starts, position) - 1, 0)
+
+    def go_to_offset(self, position: int):
+        """Navigate to the page holding a text position"""
+        self.go_to_page(self.page_for_offset(position))
+
     def next_page(self):
         """Go to the next page"""
         self.go_to_page(self._current_page + 1)
@@ -586,6 +610,7 @@ class PDFPageViewer(QFrame):
         if self._doc:
             self._doc.close()
             self._doc = None
+            self._page_starts = ()
             self._page_count = 0
             self._current_page = 0
             self._view.scene().clear()
@@ -599,6 +599,18 @@ class TestPDFPageViewer:
         assert viewer.page_count == 0
         assert viewer.zoom == 1.0
 
+    def test_viewer_page_for_offset(self, qtbot):
+        """PDFPageViewer should map text offsets to pages"""
+        viewer = PDFPageViewer()
+        qtbot.addWidget(viewer)
+
+        viewer.set_page_offsets([0, 100, 100, 250])
+
+        assert viewer.page_for_offset(0) == 0
+        assert viewer.page_for_offset(99) == 0
+        assert viewer.page_for_offset(100) == 2  # Page 1 has no text
+        assert viewer.page_for_offset(300) == 3
+
 
 class TestPDFGraphicsView:
     """Tests for PDFGraphicsView component"""
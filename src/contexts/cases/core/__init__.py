@@ -19,6 +19,8 @@ from src.contexts.cases.core.entities import (
     AttributeType,
     Case,
     CaseAttribute,
+    CaseFilter,
+    CasePage,
 )
 from src.contexts.cases.core.events import (
     CaseAttributeRemoved,
@@ -51,6 +53,8 @@ __all__ = [
     "Case",
     "CaseAttribute",
     "AttributeType",
+    "CaseFilter",
+    "CasePage",
     # Events
     "CaseCreated",
     "CaseUpdated",
@@ -13,7 +13,14 @@ from src.contexts.cases.core.derivers import CaseState
 from src.shared.common.operation_result import OperationResult
 
 if TYPE_CHECKING:
-    from src.contexts.cases.core.entities import Case, CaseAttribute
+    from collections.abc import Iterable, Sequence
+
+    from src.contexts.cases.core.entities import (
+        Case,
+        CaseAttribute,
+        CaseFilter,
+        CasePage,
+    )
     from src.shared.common.types import CaseId, SourceId
     from src.shared.infra.state import ProjectState
 
@@ -29,7 +36,15 @@ class CaseRepository(Protocol):
 
     def get_all(self) -> list[Case]: ...
     def get_by_id(self, case_id: CaseId) -> Case | None: ...
+    def get_by_ids(self, case_ids: Iterable[CaseId]) -> list[Case]: ...
+    def list_cases(
+        self,
+        offset: int = 0,
+        limit: int | None = None,
+        case_filter: CaseFilter | None = None,
+    ) -> CasePage: ...
     def save(self, case: Case) -> None: ...
+    def insert_many(self, cases: Sequence[Case]) -> int: ...
     def delete(self, case_id: CaseId) -> None: ...
     def link_source(
         self, case_id: CaseId, source_id: SourceId, source_name: str
@@ -119,3 +119,32 @@ class Case:
             if attr.name == attr_name:
                 return attr
         return None
+
+
+@dataclass(frozen=True)
+class CaseFilter:
+    """
+    Criteria for listing cases.
+
+    All set criteria must match. ``name_contains`` is case-insensitive.
+    """
+
+    name_contains: str | None = None
+    source_id: str | None = None
+    with_sources: bool = False
+    has_attributes: bool = False
+
+
+@dataclass(frozen=True)
+class CasePage:
+    """One page of cases plus the total number of matches."""
+
+    cases: tuple[Case, ...]
+    total: int
+    offset: int = 0
+    limit: int | None = None
+
+    @property
+    def has_more(self) -> bool:
+        """True when further matches exist after this page."""
+        return self.offset + len(self.cases) < self.total
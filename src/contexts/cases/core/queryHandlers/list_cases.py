@@ -1,7 +1,7 @@
 """
 List Cases Use Case (Query)
 
-Functional query use case for listing all cases.
+Functional query use case for listing cases, one page at a time.
 Returns OperationResult for consistent handling in UI and AI consumers.
 """
 
@@ -11,6 +11,7 @@ from src.contexts.cases.core.commandHandlers._state import (
     CaseRepository,
     require_project,
 )
+from src.contexts.cases.core.entities import CaseFilter
 from src.shared.common.operation_result import OperationResult
 from src.shared.infra.state import ProjectState
 
@@ -18,16 +19,54 @@ from src.shared.infra.state import ProjectState
 def list_cases(
     state: ProjectState,
     case_repo: CaseRepository | None = None,
+    offset: int = 0,
+    limit: int | None = None,
+    query: str | None = None,
 ) -> OperationResult:
-    """List all cases in the current project."""
+    """
+    List cases in the current project, ordered by name.
+
+    Args:
+        state: Project state (for project check)
+        case_repo: Repository for case queries (source of truth)
+        offset: Number of matching cases to skip
+        limit: Maximum number of cases to return (None for all)
+        query: Optional case-insensitive name filter
+
+    Returns:
+        OperationResult with the page of cases and the total match count
+    """
     if failure := require_project(state, "CASES_NOT_LISTED/NO_PROJECT"):
         return failure
 
-    cases = case_repo.get_all() if case_repo else []
+    if offset < 0 or (limit is not None and limit < 0):
+        return OperationResult.fail(
+            error="offset and limit must not be negative",
+            error_code="CASES_NOT_LISTED/INVALID_PAGE",
+            suggestions=("Use offset >= 0 and limit >= 0",),
+        )
+
+    if case_repo is None:
+        return OperationResult.ok(
+            data={
+                "total_count": 0,
+                "offset": offset,
+                "limit": limit,
+                "has_more": False,
+                "cases": [],
+            }
+        )
+
+    page = case_repo.list_cases(
+        offset=offset, limit=limit, case_filter=CaseFilter(name_contains=query)
+    )
 
     return OperationResult.ok(
         data={
-            "total_count": len(cases),
+            "total_count": page.total,
+            "offset": page.offset,
+            "limit": page.limit,
+            "has_more": page.has_more,
             "cases": [
                 {
                     "case_id": c.id.value,
@@ -36,7 +75,7 @@ def list_cases(
                     "attribute_count": len(c.attributes),
                     "source_count": len(c.source_ids),
                 }
-                for c in cases
+                for c in page.cases
             ],
         }
     )
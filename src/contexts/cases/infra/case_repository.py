@@ -7,15 +7,24 @@ Implements the repository for Case entities using the cas_* tables.
 from __future__ import annotations
 
 import logging
+from collections import defaultdict
+from collections.abc import Iterable, Sequence
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import delete, func, select, update
+from sqlalchemy import and_, bindparam, delete, exists, func, select, update
 
-from src.contexts.cases.core.entities import AttributeType, Case, CaseAttribute
+from src.contexts.cases.core.entities import (
+    AttributeType,
+    Case,
+    CaseAttribute,
+    CaseFilter,
+    CasePage,
+)
 from src.contexts.cases.infra.schema import cas_attribute, cas_case, cas_source_link
 from src.shared import CaseId, SourceId
 from src.shared.common.uuid7 import new_uuid7
+from src.shared.infra.repositories.bulk import chunked, delete_many, upsert_many
 
 if TYPE_CHECKING:
     from sqlalchemy import Connection
@@ -31,6 +40,10 @@ class SQLiteCaseRepository:
 
     Maps between domain Case entities and the cas_* tables.
     Uses prefixed tables from the Cases bounded context.
+
+    Attributes and source links are fetched with one set-based query each
+    for every batch of cases loaded, so reads cost three queries whatever
+    the number of cases.
     """
 
     def __init__(
@@ -42,8 +55,7 @@ class SQLiteCaseRepository:
     def get_all(self) -> list[Case]:
         """Get all cases in the project."""
         stmt = select(cas_case).order_by(cas_case.c.name)
-        result = self._conn.execute(stmt)
-        cases = [self._row_to_case(row) for row in result]
+        cases = self._load_cases(stmt)
         logger.debug("get_all: count=%d", len(cases))
         return cases
 
@@ -51,56 +63,164 @@ class SQLiteCaseRepository:
         """Get a case by its ID."""
         logger.debug("get_by_id: %s", case_id.value)
         stmt = select(cas_case).where(cas_case.c.id == case_id.value)
-        result = self._conn.execute(stmt)
-        row = result.fetchone()
-        return self._row_to_case(row) if row else None
+        cases = self._load_cases(stmt)
+        return cases[0] if cases else None
+
+    def get_by_ids(self, case_ids: Iterable[CaseId]) -> list[Case]:
+        """Get several cases by ID, ordered by name. Unknown IDs are skipped."""
+        ids = list(dict.fromkeys(case_id.value for case_id in case_ids))
+        cases: list[Case] = []
+        for chunk in chunked(ids, 500):
+            stmt = select(cas_case).where(cas_case.c.id.in_(chunk))
+            cases.extend(self._load_cases(stmt))
+        return sorted(cases, key=lambda c: c.name)
 
     def get_by_name(self, name: str) -> Case | None:
         """Get a case by its name (case-insensitive)."""
-        stmt = select(cas_case).where(func.lower(cas_case.c.name) == name.lower())
-        result = self._conn.execute(stmt)
-        row = result.fetchone()
-        return self._row_to_case(row) if row else None
+        stmt = (
+            select(cas_case).where(func.lower(cas_case.c.name) == name.lower()).limit(1)
+        )
+        cases = self._load_cases(stmt)
+        return cases[0] if cases else None
+
+    def list_cases(
+        self,
+        offset: int = 0,
+        limit: int | None = None,
+        case_filter: CaseFilter | None = None,
+    ) -> CasePage:
+        """
+        Get one page of cases ordered by name, with the total match count.
+
+        Filtering, ordering and paging all happen in SQL, so the cost of a
+        page does not grow with the number of cases in the project.
+        """
+        conditions = self._filter_conditions(case_filter or CaseFilter())
+        total = self._conn.execute(
+            select(func.count()).select_from(cas_case).where(*conditions)
+        ).scalar()
+
+        stmt = (
+            select(cas_case)
+            .where(*conditions)
+            .order_by(cas_case.c.name, cas_case.c.id)
+            .offset(offset)
+        )
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        cases = self._load_cases(stmt) if total else []
+        logger.debug(
+            "list_cases: offset=%d limit=%s total=%d", offset, limit, total or 0
+        )
+        return CasePage(
+            cases=tuple(cases), total=total or 0, offset=offset, limit=limit
+        )
 
     def save(self, case: Case) -> None:
         """Save a case (insert or update)."""
         logger.debug("save: %s (name=%s)", case.id.value, case.name)
-        exists = self.exists(case.id)
-
-        if exists:
-            stmt = (
-                update(cas_case)
-                .where(cas_case.c.id == case.id.value)
-                .values(
-                    name=case.name,
-                    description=case.description,
-                    memo=case.memo,
-                    updated_at=datetime.now(UTC),
-                )
-            )
-        else:
-            stmt = cas_case.insert().values(
-                id=case.id.value,
-                name=case.name,
-                description=case.description,
-                memo=case.memo,
-                owner=None,
-                created_at=case.created_at,
-                updated_at=case.updated_at,
+        self._write_cases((case,))
+        if self._outbox:
+            self._outbox.write_upsert(
+                "case", case.id.value, {"name": case.name, "memo": case.memo}
             )
 
-        self._conn.execute(stmt)
+    def save_many(self, cases: Sequence[Case]) -> int:
+        """
+        Insert or update cases with their attributes and source links.
 
-        # Save attributes
-        self._save_attributes(case.id, case.attributes)
+        Cases are upserted in one statement; attributes are replaced and
+        source links reconciled with one executemany per table.
 
-        # Save source links
-        self._save_source_links(case.id, case.source_ids)
+        Returns the number of cases written.
+        """
+        count = self._write_cases(cases)
+        logger.debug("save_many: count=%d", count)
+        if self._outbox:
+            for c in cases:
+                self._outbox.write_upsert(
+                    "case", c.id.value, {"name": c.name, "memo": c.memo}
+                )
+        return count
 
+    def insert_many(self, cases: Sequence[Case]) -> int:
+        """
+        Insert new cases with their attributes, one executemany per table.
+
+        Unlike save_many there is no upsert, attribute replacement or link
+        reconciliation, so the cases must not exist yet (e.g. an import).
+        Source links are not written.
+
+        Returns the number of cases inserted.
+        """
+        if not cases:
+            return 0
+        self._conn.execute(
+            cas_case.insert(),
+            [
+                {
+                    "id": case.id.value,
+                    "name": case.name,
+                    "description": case.description,
+                    "memo": case.memo,
+                    "owner": None,
+                    "created_at": case.created_at,
+                    "updated_at": case.updated_at,
+                }
+                for case in cases
+            ],
+        )
+        attr_rows = [
+            self._attribute_to_values(case.id, attr)
+            for case in cases
+            for attr in case.attributes
+        ]
+        if attr_rows:
+            self._conn.execute(cas_attribute.insert(), attr_rows)
+        logger.debug("insert_many: cases=%d attributes=%d", len(cases), len(attr_rows))
         if self._outbox:
-            self._outbox.write_upsert(
-                "case", case.id.value, {"name": case.name, "memo": case.memo}
-            )
+            for c in cases:
+                self._outbox.write_upsert(
+                    "case", c.id.value, {"name": c.name, "memo": c.memo}
+                )
+        return len(cases)
+
+    def _write_cases(self, cases: Sequence[Case]) -> int:
+        """Upsert case rows, replace attributes and reconcile source links."""
+        count = upsert_many(
+            self._conn,
+            cas_case,
+            [
+                {
+                    "id": case.id.value,
+                    "name": case.name,
+                    "description": case.description,
+                    "memo": case.memo,
+                    "owner": None,
+                    "created_at": case.created_at,
+                    "updated_at": case.updated_at,
+                }
+                for case in cases
+            ],
+            key="id",
+            update_columns=("name", "description", "memo"),
+            update_values={"updated_at": datetime.now(UTC)},
+        )
+        if not count:
+            return 0
+
+        # Replace attributes
+        delete_many(self._conn, cas_attribute.c.case_id, [c.id.value for c in cases])
+        attr_rows = [
+            self._attribute_to_values(case.id, attr)
+            for case in cases
+            for attr in case.attributes
+        ]
+        if attr_rows:
+            self._conn.execute(cas_attribute.insert(), attr_rows)
+
+        self._save_source_links_many(cases)
+        return count
 
     def delete(self, case_id: CaseId) -> None:
         """Delete a case and its attributes/links."""
@@ -118,6 +238,18 @@ class SQLiteCaseRepository:
         if self._outbox:
             self._outbox.write_delete("case", case_id.value)
 
+    def delete_many(self, case_ids: Iterable[CaseId]) -> int:
+        """Delete cases with their attributes and links, returns count deleted."""
+        ids = [case_id.value for case_id in case_ids]
+        delete_many(self._conn, cas_attribute.c.case_id, ids)
+        delete_many(self._conn, cas_source_link.c.case_id, ids)
+        count = delete_many(self._conn, cas_case.c.id, ids)
+        logger.debug("delete_many: count=%d", count)
+        if self._outbox:
+            for entity_id in ids:
+                self._outbox.write_delete("case", entity_id)
+        return count
+
     def exists(self, case_id: CaseId) -> bool:
         """Check if a case exists."""
         stmt = select(func.count()).where(cas_case.c.id == case_id.value)
@@ -142,12 +274,10 @@ class SQLiteCaseRepository:
         """Get all cases linked to a source."""
         stmt = (
             select(cas_case)
-            .join(cas_source_link, cas_case.c.id == cas_source_link.c.case_id)
-            .where(cas_source_link.c.source_id == source_id.value)
+            .where(*self._filter_conditions(CaseFilter(source_id=source_id.value)))
             .order_by(cas_case.c.name)
         )
-        result = self._conn.execute(stmt)
-        return [self._row_to_case(row) for row in result]
+        return self._load_cases(stmt)
 
     def link_source(
         self, case_id: CaseId, source_id: SourceId, source_name: str | None = None
@@ -247,77 +377,122 @@ class SQLiteCaseRepository:
 
         return result.rowcount > 0
 
-    def _save_attributes(
-        self, case_id: CaseId, attributes: tuple[CaseAttribute, ...]
-    ) -> None:
-        """Save case attributes (replace all)."""
-        # Delete existing attributes
-        self._conn.execute(
-            delete(cas_attribute).where(cas_attribute.c.case_id == case_id.value)
-        )
-
-        # Insert new attributes
-        for attr in attributes:
-            values = self._attribute_to_values(case_id, attr)
-            self._conn.execute(cas_attribute.insert().values(**values))
-
-    def _save_source_links(self, case_id: CaseId, source_ids: tuple[str, ...]) -> None:
-        """Save source links for a case."""
-        # Get existing links
-        existing = {
-            row[0]
-            for row in self._conn.execute(
-                select(cas_source_link.c.source_id).where(
-                    cas_source_link.c.case_id == case_id.value
+    def _save_source_links_many(self, cases: Sequence[Case]) -> None:
+        """Reconcile source links for several cases (add new, drop removed)."""
+        case_ids = [case.id.value for case in cases]
+        existing: set[tuple[str, str]] = set()
+        for chunk in chunked(case_ids, 500):
+            existing.update(
+                (row.case_id, row.source_id)
+                for row in self._conn.execute(
+                    select(
+                        cas_source_link.c.case_id, cas_source_link.c.source_id
+                    ).where(cas_source_link.c.case_id.in_(chunk))
                 )
             )
-        }
 
-        new_ids = set(source_ids)
+        wanted = {(case.id.value, sid) for case in cases for sid in case.source_ids}
 
         # Remove links that are no longer present
-        to_remove = existing - new_ids
+        to_remove = existing - wanted
         if to_remove:
             self._conn.execute(
                 delete(cas_source_link).where(
-                    cas_source_link.c.case_id == case_id.value,
-                    cas_source_link.c.source_id.in_(to_remove),
-                )
+                    and_(
+                        cas_source_link.c.case_id == bindparam("b_case_id"),
+                        cas_source_link.c.source_id == bindparam("b_source_id"),
+                    )
+                ),
+                [{"b_case_id": c, "b_source_id": s} for c, s in to_remove],
             )
 
         # Add new links (source_name will need to be fetched separately)
-        to_add = new_ids - existing
-        for source_id in to_add:
+        to_add = wanted - existing
+        if to_add:
+            now = datetime.now(UTC).isoformat()
             self._conn.execute(
-                cas_source_link.insert().values(
-                    id=new_uuid7(),
-                    case_id=case_id.value,
-                    source_id=source_id,
-                    source_name=None,  # Will be populated by sync
-                    date=datetime.now(UTC).isoformat(),
-                )
+                cas_source_link.insert(),
+                [
+                    {
+                        "id": new_uuid7(),
+                        "case_id": case_id,
+                        "source_id": source_id,
+                        "source_name": None,  # Will be populated by sync
+                        "date": now,
+                    }
+                    for case_id, source_id in sorted(to_add)
+                ],
             )
 
-    def _row_to_case(self, row) -> Case:
-        """Convert a database row to a Case entity."""
-        case_id = CaseId(value=row.id)
+    def _filter_conditions(self, case_filter: CaseFilter) -> list:
+        """Translate a CaseFilter into WHERE clauses on cas_case."""
+        conditions = []
+        if case_filter.name_contains:
+            conditions.append(
+                func.lower(cas_case.c.name).contains(
+                    case_filter.name_contains.lower(), autoescape=True
+                )
+            )
+        if case_filter.source_id is not None:
+            conditions.append(
+                exists().where(
+                    cas_source_link.c.case_id == cas_case.c.id,
+                    cas_source_link.c.source_id == case_filter.source_id,
+                )
+            )
+        if case_filter.with_sources:
+            conditions.append(
+                exists().where(cas_source_link.c.case_id == cas_case.c.id)
+            )
+        if case_filter.has_attributes:
+            conditions.append(exists().where(cas_attribute.c.case_id == cas_case.c.id))
+        return conditions
 
-        # Load attributes
-        attr_rows = self._conn.execute(
-            select(cas_attribute).where(cas_attribute.c.case_id == case_id.value)
-        )
-        attributes = tuple(self._row_to_attribute(r) for r in attr_rows)
+    def _load_cases(self, stmt) -> list[Case]:
+        """
+        Run a SELECT over cas_case and attach attributes and source links.
 
-        # Load source links
-        link_rows = self._conn.execute(
-            select(cas_source_link.c.source_id).where(
-                cas_source_link.c.case_id == case_id.value
+        The same statement, reduced to its id column, drives one query for
+        attributes and one for links, so loading N cases costs three queries.
+        """
+        rows = self._conn.execute(stmt).fetchall()
+        if not rows:
+            return []
+
+        case_ids = stmt.with_only_columns(cas_case.c.id)
+
+        attributes: dict[str, list[CaseAttribute]] = defaultdict(list)
+        for r in self._conn.execute(
+            select(cas_attribute).where(cas_attribute.c.case_id.in_(case_ids))
+        ):
+            attributes[r.case_id].append(self._row_to_attribute(r))
+
+        source_ids: dict[str, list[str]] = defaultdict(list)
+        for r in self._conn.execute(
+            select(cas_source_link.c.case_id, cas_source_link.c.source_id).where(
+                cas_source_link.c.case_id.in_(case_ids)
             )
-        )
-        source_ids = tuple(r[0] for r in link_rows)
-
+        ):
+            source_ids[r.case_id].append(r.source_id)
+
+        return [
+            self._row_to_case(
+                row,
+                attributes=tuple(attributes.get(row.id, ())),
+                source_ids=tuple(source_ids.get(row.id, ())),
+            )
+            for row in rows
+        ]
+
+    def _row_to_case(
+        self,
+        row,
+        attributes: tuple[CaseAttribute, ...] = (),
+        source_ids: tuple[str, ...] = (),
+    ) -> Case:
+        """Convert a database row plus its pre-fetched children to a Case."""
         return Case(
-            id=case_id,
+            id=CaseId(value=row.id),
             name=row.name,
             description=row.description,
             memo=row.memo,
@@ -357,7 +532,7 @@ class SQLiteCaseRepository:
             case AttributeType.TEXT:
                 value_text = str(attr.value) if attr.value else None
             case AttributeType.NUMBER:
-                value_number = int(attr.value) if attr.value else None
+                value_number = int(attr.value) if attr.value not in (None, "") else None
             case AttributeType.DATE:
                 value_date = attr.value
             case AttributeType.BOOLEAN:
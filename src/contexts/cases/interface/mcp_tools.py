@@ -67,10 +67,33 @@ class CaseToolsContext(Protocol):
 list_cases_tool = ToolDefinition(
     name="list_cases",
     description=(
-        "List all cases in the project. Cases organize data by participant, "
-        "site, or other groupings. Returns case IDs, names, and summary information."
+        "List cases in the project, ordered by name. Cases organize data by "
+        "participant, site, or other groupings. Returns case IDs, names, and "
+        "summary information for one page plus the total number of matches."
+    ),
+    parameters=(
+        ToolParameter(
+            name="offset",
+            type="integer",
+            description="Number of cases to skip (for paging).",
+            required=False,
+            default=0,
+        ),
+        ToolParameter(
+            name="limit",
+            type="integer",
+            description="Maximum number of cases to return (all if omitted).",
+            required=False,
+            default=None,
+        ),
+        ToolParameter(
+            name="query",
+            type="string",
+            description="Only return cases whose name contains this text.",
+            required=False,
+            default=None,
+        ),
     ),
-    parameters=(),
 )
 
 # Tool: get_case
@@ -235,11 +258,11 @@ class CaseTools:
     # list_cases Handler (AC #5)
     # ============================================================
 
-    def _execute_list_cases(self, _arguments: dict[str, Any]) -> dict[str, Any]:
+    def _execute_list_cases(self, arguments: dict[str, Any]) -> dict[str, Any]:
         """
         Execute list_cases tool.
 
-        Returns list of all cases with summary information.
+        Returns one page of cases with summary information.
         """
         if self._state is None:
             return OperationResult.fail(
@@ -248,7 +271,24 @@ class CaseTools:
                 suggestions=("Open a project first",),
             ).to_dict()
 
-        result = list_cases(self._state, case_repo=self._case_repo)
+        limit = arguments.get("limit")
+        try:
+            offset = int(arguments.get("offset") or 0)
+            limit = int(limit) if limit is not None else None
+        except (TypeError, ValueError):
+            return OperationResult.fail(
+                error="offset and limit must be integers",
+                error_code="CASES_NOT_LISTED/INVALID_PAGE",
+                suggestions=("Use offset >= 0 and limit >= 0",),
+            ).to_dict()
+
+        result = list_cases(
+            self._state,
+            case_repo=self._case_repo,
+            offset=offset,
+            limit=limit,
+            query=arguments.get("query") or None,
+        )
         return result.to_dict()
 
     # ============================================================
@@ -401,24 +441,35 @@ class CaseTools:
                 suggestions=("Open a project first",),
             ).to_dict()
 
-        case_repo = self._case_repo
+        if self._state.project is None:
+            return OperationResult.fail(
+                error="No project is currently open",
+                error_code="CASES_NOT_COMPARED/NO_PROJECT",
+                suggestions=("Open a project first",),
+            ).to_dict()
 
-        # Fetch all cases using get_case use case
-        cases = []
-        for cid in case_ids:
-            result = get_case(str(cid), self._state, case_repo=case_repo)
-            if result.is_failure:
-                return OperationResult.fail(
-                    error=f"Case not found: {cid}",
-                    error_code="CASES_NOT_COMPARED/CASE_NOT_FOUND",
-                    suggestions=(
-                        "Use list_cases to see available cases",
-                        f"Check if case ID {cid} exists",
-                    ),
-                ).to_dict()
-            case = case_repo.get_by_id(CaseId(value=str(cid))) if case_repo else None
-            if case:
-                cases.append(case)
+        # Fetch all requested cases in one batch, keeping the caller's order
+        case_repo = self._case_repo
+        found = {
+            case.id.value: case
+            for case in (
+                case_repo.get_by_ids([CaseId(value=str(cid)) for cid in case_ids])
+                if case_repo
+                else []
+            )
+        }
+        missing = [str(cid) for cid in case_ids if str(cid) not in found]
+        if missing:
+            cid = missing[0]
+            return OperationResult.fail(
+                error=f"Case not found: {cid}",
+                error_code="CASES_NOT_COMPARED/CASE_NOT_FOUND",
+                suggestions=(
+                    "Use list_cases to see available cases",
+                    f"Check if case ID {cid} exists",
+                ),
+            ).to_dict()
+        cases = [found[str(cid)] for cid in dict.fromkeys(case_ids)]
 
         # Build comparison data using segment repo from coding context
         coding_ctx = (
@@ -431,12 +482,16 @@ class CaseTools:
         case_code_sets: dict[int, set[int]] = {}
         case_segment_counts: dict[int, int] = {}
 
+        # Sources shared between cases are only read once
+        source_segments: dict[str, list] = {}
         for case in cases:
             code_ids: set[int] = set()
             seg_count = 0
             if segment_repo and case.source_ids:
                 for sid in case.source_ids:
-                    segs = segment_repo.get_by_source(SourceId(sid))
+                    if sid not in source_segments:
+                        source_segments[sid] = segment_repo.get_by_source(SourceId(sid))
+                    segs = source_segments[sid]
                     seg_count += len(segs)
                     for seg in segs:
                         code_ids.add(seg.code_id.value)
@@ -17,6 +17,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from typing import TYPE_CHECKING
 
 from PySide6.QtCore import Signal
 
@@ -31,6 +32,9 @@ from src.contexts.cases.core.events import (
 )
 from src.shared.infra.signal_bridge.base import BaseSignalBridge, EventConverter
 
+if TYPE_CHECKING:
+    from src.contexts.exchange.core.events import SurveyCSVImported
+
 # =============================================================================
 # Payloads - Data transferred via signals
 # =============================================================================
@@ -68,6 +72,19 @@ class CaseAttributePayload:
     is_ai_action: bool = False
 
 
+@dataclass(frozen=True)
+class CasesImportedPayload:
+    """Payload for cases imported in bulk from a survey file."""
+
+    event_type: str
+    source_path: str
+    cases_created: int
+    attributes_per_case: int
+    timestamp: datetime = field(default_factory=_now)
+    session_id: str = "local"
+    is_ai_action: bool = False
+
+
 @dataclass(frozen=True)
 class SourceLinkPayload:
     """Payload for source link/unlink signals."""
@@ -116,6 +133,20 @@ class CaseRemovedConverter(EventConverter[CaseRemoved, CasePayload]):
         )
 
 
+class SurveyImportedConverter(
+    EventConverter["SurveyCSVImported", CasesImportedPayload]
+):
+    """A survey import creates many cases but publishes one summary event."""
+
+    def convert(self, event: SurveyCSVImported) -> CasesImportedPayload:
+        return CasesImportedPayload(
+            event_type="survey_csv_imported",
+            source_path=event.source_path,
+            cases_created=event.cases_created,
+            attributes_per_case=event.attributes_per_case,
+        )
+
+
 class CaseAttributeSetConverter(EventConverter[CaseAttributeSet, CaseAttributePayload]):
     def convert(self, event: CaseAttributeSet) -> CaseAttributePayload:
         return CaseAttributePayload(
@@ -175,6 +206,7 @@ class CasesSignalBridge(BaseSignalBridge):
     case_created = Signal(object)
     case_updated = Signal(object)
     case_removed = Signal(object)
+    cases_imported = Signal(object)
 
     # Attribute signals
     case_attribute_set = Signal(object)
@@ -196,6 +228,11 @@ class CasesSignalBridge(BaseSignalBridge):
             CaseCreatedConverter(),
             "case_created",
         )
+        self.register_converter(
+            "exchange.survey_csv_imported",
+            SurveyImportedConverter(),
+            "cases_imported",
+        )
         self.register_converter(
             "cases.case_updated",
             CaseUpdatedConverter(),
@@ -23,7 +23,12 @@ from unittest.mock import Mock
 import allure
 import pytest
 
-from src.contexts.cases.core.entities import AttributeType, Case, CaseAttribute
+from src.contexts.cases.core.entities import (
+    AttributeType,
+    Case,
+    CaseAttribute,
+    CasePage,
+)
 from src.contexts.cases.interface.mcp_tools import (
     CaseTools,
     ToolDefinition,
@@ -65,6 +70,21 @@ class MockCaseRepository:
                 return case
         return None
 
+    def get_by_ids(self, case_ids) -> list[Case]:
+        wanted = {case_id.value for case_id in case_ids}
+        return [case for case in self.cases if case.id.value in wanted]
+
+    def list_cases(self, offset=0, limit=None, case_filter=None) -> CasePage:
+        query = (case_filter.name_contains or "").lower() if case_filter else ""
+        matches = [c for c in self.cases if query in c.name.lower()]
+        end = None if limit is None else offset + limit
+        return CasePage(
+            cases=tuple(matches[offset:end]),
+            total=len(matches),
+            offset=offset,
+            limit=limit,
+        )
+
 
 @dataclass
 class MockCasesContext:
@@ -257,7 +277,7 @@ class TestPredefinedToolSchemas:
     @pytest.mark.parametrize(
         "tool, expected_name, required_params, optional_params",
         [
-            (list_cases_tool, "list_cases", [], []),
+            (list_cases_tool, "list_cases", [], ["offset", "limit", "query"]),
             (get_case_tool, "get_case", ["case_id"], []),
             (
                 suggest_case_groupings_tool,
@@ -396,6 +416,30 @@ class TestListCasesTool:
         assert case_a["attribute_count"] == 2
         assert case_a["source_count"] == 2
 
+    @allure.title("list_cases pages and filters by name")
+    def test_list_cases_paging(self, context_with_cases):
+        tools = CaseTools(ctx=context_with_cases)
+
+        result = tools.execute("list_cases", {"offset": 1, "limit": 1})
+
+        assert result["success"] is True
+        data = result["data"]
+        assert data["total_count"] == 3
+        assert [c["name"] for c in data["cases"]] == ["Participant B"]
+        assert data["has_more"] is True
+
+        filtered = tools.execute("list_cases", {"query": "pant c"})["data"]
+        assert filtered["total_count"] == 1
+        assert filtered["has_more"] is False
+
+        invalid = tools.execute("list_cases", {"offset": -1})
+        assert invalid["error_code"] == "CASES_NOT_LISTED/INVALID_PAGE"
+
+        for args in ({"offset": "two"}, {"limit": "all"}, {"limit": [1]}):
+            invalid = tools.execute("list_cases", args)
+            assert invalid["success"] is False
+            assert invalid["error_code"] == "CASES_NOT_LISTED/INVALID_PAGE"
+
     @allure.title("list_cases returns empty list when no cases exist")
     def test_list_cases_empty(self, context_with_project):
         tools = CaseTools(ctx=context_with_project)
@@ -556,7 +600,7 @@ class TestCompareCasesTool:
         [
             ("context_with_project", {}, "MISSING_PARAM"),
             ("context_with_project", {"case_ids": [1]}, "INSUFFICIENT_CASES"),
-            ("context_no_project", {"case_ids": [1, 2]}, "CASE_NOT_FOUND"),
+            ("context_no_project", {"case_ids": [1, 2]}, "NO_PROJECT"),
             ("context_with_cases", {"case_ids": [1, 999]}, "CASE_NOT_FOUND"),
         ],
         ids=["missing-param", "insufficient-cases", "no-project", "case-not-found"],
@@ -382,15 +382,7 @@ class CaseManagerScreen(QWidget):
         if not self._viewmodel:
             return
 
-        # Reload all cases - filtering would be applied here
-        cases = self._viewmodel.load_cases()
-
-        # Apply filter (if any)
-        if filter_type == "with_sources":
-            cases = [c for c in cases if c.source_count > 0]
-        elif filter_type == "has_attributes":
-            cases = [c for c in cases if c.attributes]
-
+        cases = self._viewmodel.filter_cases(filter_type=filter_type)
         self._page.set_cases(cases)
 
     def _on_search_changed(self, query: str):
@@ -402,13 +394,9 @@ class CaseManagerScreen(QWidget):
             cases = self._viewmodel.search_cases(query)
         else:
             # No search - apply current filter if any
-            current_filter = self._page.get_active_filter()
-            cases = self._viewmodel.load_cases()
-
-            if current_filter == "with_sources":
-                cases = [c for c in cases if c.source_count > 0]
-            elif current_filter == "has_attributes":
-                cases = [c for c in cases if c.attributes]
+            cases = self._viewmodel.filter_cases(
+                filter_type=self._page.get_active_filter()
+            )
 
         self._page.set_cases(cases)
 
@@ -33,9 +33,11 @@ from src.contexts.cases.core.commandHandlers import (
     unlink_source_from_case,
     update_case,
 )
+from src.contexts.cases.core.entities import CaseFilter
 from src.contexts.cases.interface.signal_bridge import (
     CaseAttributePayload,
     CasePayload,
+    CasesImportedPayload,
     CasesSignalBridge,
     SourceLinkPayload,
 )
@@ -54,7 +56,7 @@ from src.shared.presentation.dto import CaseAttributeDTO, CaseDTO, CaseSummaryDT
 if TYPE_CHECKING:
     from typing import Protocol
 
-    from src.contexts.cases.core.entities import Case
+    from src.contexts.cases.core.entities import Case, CasePage
     from src.shared.infra.app_context import CasesContext
     from src.shared.infra.event_bus import EventBus
     from src.shared.infra.session import Session
@@ -65,6 +67,12 @@ if TYPE_CHECKING:
 
         def get_all(self) -> list[Case]: ...
         def get_by_id(self, case_id: CaseId) -> Case | None: ...
+        def list_cases(
+            self,
+            offset: int = 0,
+            limit: int | None = None,
+            case_filter: CaseFilter | None = None,
+        ) -> CasePage: ...
         def save(self, case: Case) -> None: ...
         def delete(self, case_id: CaseId) -> bool: ...
         def delete_attribute(self, case_id: CaseId, attr_name: str) -> bool: ...
@@ -133,6 +141,7 @@ class CaseManagerViewModel(QObject):
         self._signal_bridge.case_created.connect(self._on_case_created)
         self._signal_bridge.case_updated.connect(self._on_case_updated)
         self._signal_bridge.case_removed.connect(self._on_case_removed)
+        self._signal_bridge.cases_imported.connect(self._on_cases_imported)
 
         # Attributes
         self._signal_bridge.case_attribute_set.connect(self._on_attribute_set)
@@ -150,6 +159,7 @@ class CaseManagerViewModel(QObject):
         self._signal_bridge.case_created.disconnect(self._on_case_created)
         self._signal_bridge.case_updated.disconnect(self._on_case_updated)
         self._signal_bridge.case_removed.disconnect(self._on_case_removed)
+        self._signal_bridge.cases_imported.disconnect(self._on_cases_imported)
         self._signal_bridge.case_attribute_set.disconnect(self._on_attribute_set)
         self._signal_bridge.case_attribute_removed.disconnect(
             self._on_attribute_removed
@@ -177,6 +187,11 @@ class CaseManagerViewModel(QObject):
         self.cases_changed.emit()
         self.summary_changed.emit()
 
+    def _on_cases_imported(self, _payload: CasesImportedPayload) -> None:
+        """Handle cases imported in bulk (one event for the whole import)."""
+        self.cases_changed.emit()
+        self.summary_changed.emit()
+
     def _on_attribute_set(self, payload: CaseAttributePayload) -> None:
         """Handle attribute set event."""
         self._emit_case_update(payload.case_id)
@@ -382,11 +397,36 @@ class CaseManagerViewModel(QObject):
 
     def search_cases(self, query: str) -> list[CaseDTO]:
         """Search cases by name (case-insensitive)."""
-        query_lower = query.lower()
-        matching = [
-            c for c in self._case_repo.get_all() if query_lower in c.name.lower()
-        ]
-        return [self._case_to_dto(c) for c in matching]
+        return self.filter_cases(query=query)
+
+    def filter_cases(
+        self,
+        filter_type: str | None = None,
+        query: str = "",
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> list[CaseDTO]:
+        """
+        Get cases matching a stats-row filter and/or name query.
+
+        Filtering and paging run in the repository, so only the requested
+        page of cases is loaded.
+
+        Args:
+            filter_type: "with_sources", "has_attributes" or None for all
+            query: Case-insensitive name filter ("" for no filter)
+            offset: Number of matching cases to skip
+            limit: Maximum number of cases to return (None for all)
+        """
+        case_filter = CaseFilter(
+            name_contains=query or None,
+            with_sources=filter_type == "with_sources",
+            has_attributes=filter_type == "has_attributes",
+        )
+        page = self._case_repo.list_cases(
+            offset=offset, limit=limit, case_filter=case_filter
+        )
+        return [self._case_to_dto(c) for c in page.cases]
 
     # =========================================================================
     # Private Helpers
@@ -10,6 +10,7 @@ Contracts exported:
 - Value Objects: Color, TextPosition, ImageRegion, TimeRange
 - Events: CodeCreated, CodeDeleted, SegmentCoded, etc.
 - Invariants: Business rule predicates
+- IntervalIndex / SegmentIndex: Position queries over segments
 - Derivers: Pure event generators
 """
 
@@ -69,6 +70,7 @@ from src.contexts.coding.core.events import (
     SegmentCoded,
     SegmentEvent,
     SegmentMemoUpdated,
+    SegmentsCoded,
     SegmentUncoded,
 )
 
@@ -116,6 +118,9 @@ from src.contexts.coding.core.invariants import (
     is_valid_time_range,
 )
 
+# Segment index
+from src.contexts.coding.core.segment_index import IntervalIndex, SegmentIndex
+
 # Services
 from src.contexts.coding.core.services import (
     MatchScope,
@@ -155,6 +160,7 @@ __all__ = [
     "SegmentCoded",
     "SegmentUncoded",
     "SegmentMemoUpdated",
+    "SegmentsCoded",
     # Batch Events
     "BatchCreated",
     "BatchUndone",
@@ -202,6 +208,9 @@ __all__ = [
     "does_category_exist",
     "count_segments_for_code",
     "count_codes_in_category",
+    # Interval index
+    "IntervalIndex",
+    "SegmentIndex",
     # Derivers
     "CodingState",
     "derive_create_code",
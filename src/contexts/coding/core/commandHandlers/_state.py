@@ -13,7 +13,10 @@ from src.contexts.coding.core.derivers import CodingState
 from src.shared.common.types import SourceId
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
     from src.contexts.coding.core.entities import Category, Code, TextSegment
+    from src.shared.common.types import CodeId, SegmentId
 
 
 # ============================================================
@@ -49,8 +52,15 @@ class SegmentRepository(Protocol):
     def get_all(self) -> list[TextSegment]: ...
     def get_by_id(self, segment_id) -> TextSegment | None: ...
     def get_by_source(self, source_id) -> list[TextSegment]: ...
+    def iter_pages_by_source(
+        self, source_id, page_size: int = ...
+    ) -> Iterator[list[TextSegment]]: ...
     def get_by_code(self, code_id) -> list[TextSegment]: ...
+    def get_overlapping(
+        self, source_id, code_id, start: int, end: int
+    ) -> list[TextSegment]: ...
     def save(self, segment: TextSegment) -> None: ...
+    def save_many(self, segments: Sequence[TextSegment]) -> int: ...
     def delete(self, segment_id) -> None: ...
     def delete_by_code(self, code_id) -> int: ...
     def reassign_code(self, from_code_id, to_code_id) -> int: ...
@@ -59,6 +69,83 @@ class SegmentRepository(Protocol):
 # ============================================================
 # State Building
 # ============================================================
+#
+# Each deriver only reads part of CodingState, so handlers use the
+# narrowest builder that covers it. Segments are never loaded wholesale:
+# a project can hold hundreds of thousands of them.
+
+
+def build_code_state(
+    code_repo: CodeRepository,
+    category_repo: CategoryRepository | None = None,
+) -> CodingState:
+    """
+    Build state holding codes (and optionally categories), without segments.
+
+    Covers create/rename/recolor/memo/move of codes and category commands.
+    """
+    return CodingState(
+        existing_codes=tuple(code_repo.get_all()),
+        existing_categories=tuple(category_repo.get_all()) if category_repo else (),
+    )
+
+
+def build_code_usage_state(
+    code_repo: CodeRepository,
+    segment_repo: SegmentRepository,
+    code_id: CodeId,
+) -> CodingState:
+    """
+    Build state holding codes plus only the segments that use ``code_id``.
+
+    Covers delete_code and merge_codes, which count a code's segments.
+    """
+    return CodingState(
+        existing_codes=tuple(code_repo.get_all()),
+        existing_segments=tuple(segment_repo.get_by_code(code_id)),
+    )
+
+
+def build_apply_code_state(
+    code_repo: CodeRepository,
+    segment_repo: SegmentRepository,
+    code_id: CodeId,
+    source_id: SourceId,
+    start: int,
+    end: int,
+    source_exists: bool = True,
+    source_content_provider=None,
+) -> CodingState:
+    """
+    Build state for applying one code to ``[start, end)`` of a source.
+
+    Holds only the target code (if it exists) and the same-code segments on
+    that source overlapping the range - exactly what
+    derive_apply_code_to_text checks.
+    """
+    code = code_repo.get_by_id(code_id)
+
+    source_length = None
+    if source_content_provider:
+        source_length = source_content_provider.get_length(source_id)
+
+    return CodingState(
+        existing_codes=(code,) if code else (),
+        existing_segments=tuple(
+            segment_repo.get_overlapping(source_id, code_id, start, end)
+        ),
+        source_length=source_length,
+        source_exists=source_exists,
+    )
+
+
+def build_segment_state(
+    segment_repo: SegmentRepository,
+    segment_id: SegmentId,
+) -> CodingState:
+    """Build state holding a single segment (if it exists)."""
+    segment = segment_repo.get_by_id(segment_id)
+    return CodingState(existing_segments=(segment,) if segment else ())
 
 
 def build_coding_state(
@@ -70,7 +157,10 @@ def build_coding_state(
     source_content_provider=None,
 ) -> CodingState:
     """
-    Build the current state for derivers.
+    Build the full state for derivers.
+
+    Loads every code, category and segment. Prefer the scoped builders above
+    in command handlers.
 
     Args:
         code_repo: Repository for codes
@@ -108,8 +198,12 @@ def get_selected_text(
 ) -> str:
     """Get the selected text from a source content provider.
 
+    Providers with ``get_text_range`` are asked for the range only, so the
+    whole source text is not loaded to extract a few characters.
+
     Args:
-        source_provider: Optional provider with get_content(source_id) method
+        source_provider: Optional provider with get_content(source_id) method,
+            and optionally get_text_range(source_id, start, end)
         source_id: ID of the source document
         start: Start character position
         end: End character position
@@ -118,7 +212,11 @@ def get_selected_text(
         The selected text, or a placeholder if provider is unavailable
     """
     if source_provider:
-        content = source_provider.get_content(source_id)
-        if content:
-            return content[start:end]
+        if hasattr(type(source_provider), "get_text_range"):
+            if source_provider.get_length(source_id):
+                return source_provider.get_text_range(source_id, start, end) or ""
+        else:
+            content = source_provider.get_content(source_id)
+            if content:
+                return content[start:end]
     return f"[text from {start} to {end}]"
@@ -14,7 +14,7 @@ from src.contexts.coding.core.commandHandlers._state import (
     CategoryRepository,
     CodeRepository,
     SegmentRepository,
-    build_coding_state,
+    build_apply_code_state,
     get_selected_text,
 )
 from src.contexts.coding.core.commands import ApplyCodeCommand, RemoveCodeCommand
@@ -73,11 +73,13 @@ def apply_code(
     )
 
     # Build state with source info
-    state = build_coding_state(
+    state = build_apply_code_state(
         code_repo,
-        category_repo,
         segment_repo,
+        code_id=code_id,
         source_id=source_id,
+        start=command.start_position,
+        end=command.end_position,
         source_exists=True,
         source_content_provider=source_content_provider,
     )
@@ -2,7 +2,10 @@
 Batch Apply Codes Use Case.
 
 Functional use case for applying multiple codes to multiple text segments
-in a single batch operation. Designed for AI agent efficiency.
+in a single batch operation. Designed for AI agent efficiency: state is
+built once per batch, every operation is validated in memory, accepted
+segments are written with one bulk insert, and a single SegmentsCoded event
+is published for the whole batch.
 
 Returns OperationResult with detailed success/failure information for each
 operation in the batch.
@@ -11,6 +14,8 @@ operation in the batch.
 from __future__ import annotations
 
 import logging
+from bisect import bisect_left, insort
+from collections import defaultdict
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
@@ -18,19 +23,20 @@ from src.contexts.coding.core.commandHandlers._state import (
     CategoryRepository,
     CodeRepository,
     SegmentRepository,
-    build_coding_state,
     get_selected_text,
 )
 from src.contexts.coding.core.commands import ApplyCodeCommand, BatchApplyCodesCommand
-from src.contexts.coding.core.derivers import derive_apply_code_to_text
+from src.contexts.coding.core.derivers import CodingState, derive_apply_code_to_text
 from src.contexts.coding.core.entities import TextSegment
-from src.contexts.coding.core.events import SegmentCoded
+from src.contexts.coding.core.events import SegmentCoded, SegmentsCoded
+from src.contexts.coding.core.segment_index import SegmentIndex
 from src.shared.common.failure_events import FailureEvent
 from src.shared.common.operation_result import OperationResult
 from src.shared.common.types import CodeId, SourceId
 from src.shared.infra.metrics import metered_command
 
 if TYPE_CHECKING:
+    from src.contexts.coding.core.entities import Code
     from src.shared.infra.event_bus import EventBus
     from src.shared.infra.session import Session
 
@@ -118,27 +124,25 @@ def batch_apply_codes(
             suggestions=("Provide at least one operation in the batch",),
         )
 
+    batch = _BatchState(code_repo, segment_repo, source_content_provider)
     results: list[BatchOperationResult] = []
-    succeeded = 0
-    failed = 0
+    coded: list[SegmentCoded] = []
 
-    # Process each operation
+    # Validate every operation against the in-memory state; accepted
+    # segments are visible to later operations in the same batch.
     for index, op in enumerate(command.operations):
-        op_result = _apply_single_code(
-            op=op,
-            index=index,
-            code_repo=code_repo,
-            category_repo=category_repo,
-            segment_repo=segment_repo,
-            event_bus=event_bus,
-            source_content_provider=source_content_provider,
-        )
+        op_result, event = _apply_single_code(op, index, batch, event_bus)
         results.append(op_result)
+        if event is not None:
+            coded.append(event)
+
+    succeeded = len(coded)
+    failed = len(results) - succeeded
 
-        if op_result.success:
-            succeeded += 1
-        else:
-            failed += 1
+    # One bulk insert and one aggregated event for the whole batch
+    if coded:
+        segment_repo.save_many([r.segment for r in results if r.segment])
+        event_bus.publish(SegmentsCoded.create(segments=tuple(coded)))
 
     # Build aggregated result
     batch_result = BatchApplyCodesResult(
@@ -164,35 +168,99 @@ def batch_apply_codes(
     return OperationResult.ok(data=batch_result)
 
 
+class _BatchState:
+    """
+    State shared by all operations of one batch.
+
+    Codes, source lengths and existing segments are each read once per
+    distinct code or source. Segments accepted earlier in the batch are
+    kept per (source, code) sorted by start so overlap checks stay
+    logarithmic without touching the database.
+    """
+
+    def __init__(
+        self,
+        code_repo: CodeRepository,
+        segment_repo: SegmentRepository,
+        source_content_provider: Any | None,
+    ) -> None:
+        self._code_repo = code_repo
+        self._segment_repo = segment_repo
+        self._provider = source_content_provider
+        self._codes: dict[str, Code | None] = {}
+        self._lengths: dict[str, int | None] = {}
+        self._existing: dict[str, SegmentIndex] = {}
+        self._accepted: dict[tuple[str, str], list[TextSegment]] = defaultdict(list)
+
+    def code(self, code_id: CodeId) -> Code | None:
+        if code_id.value not in self._codes:
+            self._codes[code_id.value] = self._code_repo.get_by_id(code_id)
+        return self._codes[code_id.value]
+
+    def selected_text(self, source_id: SourceId, start: int, end: int) -> str:
+        return get_selected_text(self._provider, source_id, start, end)
+
+    def source_length(self, source_id: SourceId) -> int | None:
+        if not self._provider:
+            return None
+        if source_id.value not in self._lengths:
+            self._lengths[source_id.value] = self._provider.get_length(source_id)
+        return self._lengths[source_id.value]
+
+    def overlapping(
+        self, source_id: SourceId, code_id: CodeId, start: int, end: int
+    ) -> tuple[TextSegment, ...]:
+        """Existing and batch-accepted same-code segments overlapping a range."""
+        if source_id.value not in self._existing:
+            self._existing[source_id.value] = SegmentIndex.from_segments(
+                self._segment_repo.get_by_source(source_id)
+            )
+        hits = self._existing[source_id.value].overlapping(
+            source_id, start, end, code_id=code_id
+        )
+
+        # Accepted segments of one code never overlap each other, so walking
+        # back from the first start >= end can stop at the first non-empty
+        # segment ending at or before ``start``.
+        accepted = self._accepted.get((source_id.value, code_id.value), [])
+        i = bisect_left(accepted, end, key=lambda s: s.position.start)
+        for segment in reversed(accepted[:i]):
+            position = segment.position
+            if position.end > start:
+                hits.append(segment)
+            elif position.start < position.end:
+                break
+        return tuple(hits)
+
+    def accept(self, segment: TextSegment) -> None:
+        insort(
+            self._accepted[(segment.source_id.value, segment.code_id.value)],
+            segment,
+            key=lambda s: s.position.start,
+        )
+
+
 def _apply_single_code(
     op: ApplyCodeCommand,
     index: int,
-    code_repo: CodeRepository,
-    category_repo: CategoryRepository,
-    segment_repo: SegmentRepository,
+    batch: _BatchState,
     event_bus: EventBus,
-    source_content_provider: Any | None,
-) -> BatchOperationResult:
-    """Apply a single code operation within the batch."""
+) -> tuple[BatchOperationResult, SegmentCoded | None]:
+    """Validate a single operation within the batch and stage its segment."""
     code_id = CodeId(value=op.code_id)
     source_id = SourceId(value=op.source_id)
 
     # Get source content for the selected text
-    selected_text = get_selected_text(
-        source_content_provider,
-        source_id,
-        op.start_position,
-        op.end_position,
-    )
-
-    # Build state with source info
-    state = build_coding_state(
-        code_repo,
-        category_repo,
-        segment_repo,
-        source_id=source_id,
+    selected_text = batch.selected_text(source_id, op.start_position, op.end_position)
+
+    code = batch.code(code_id)
+    state = CodingState(
+        existing_codes=(code,) if code else (),
+        existing_segments=batch.overlapping(
+            source_id, code_id, op.start_position, op.end_position
+        ),
+        source_length=batch.source_length(source_id),
         source_exists=True,
-        source_content_provider=source_content_provider,
     )
 
     result = derive_apply_code_to_text(
@@ -215,11 +283,11 @@ def _apply_single_code(
             success=False,
             error=result.message,
             error_code=f"BATCH_APPLY_CODES/{result.event_type.upper()}",
-        )
+        ), None
 
     event: SegmentCoded = result
 
-    # Create and persist segment
+    # Stage the segment; the batch persists all of them at once
     segment = TextSegment(
         id=event.segment_id,
         source_id=source_id,
@@ -230,12 +298,6 @@ def _apply_single_code(
         importance=op.importance,
         owner=event.owner,
     )
-    segment_repo.save(segment)
+    batch.accept(segment)
 
-    event_bus.publish(event)
-
-    return BatchOperationResult(
-        index=index,
-        success=True,
-        segment=segment,
-    )
+    return BatchOperationResult(index=index, success=True, segment=segment), event
@@ -14,7 +14,7 @@ from src.contexts.coding.core.commandHandlers._state import (
     CategoryRepository,
     CodeRepository,
     SegmentRepository,
-    build_coding_state,
+    build_code_state,
 )
 from src.contexts.coding.core.commands import ChangeCodeColorCommand
 from src.contexts.coding.core.derivers import derive_change_code_color
@@ -60,7 +60,7 @@ def change_code_color(
         command.new_color,
     )
 
-    state = build_coding_state(code_repo, category_repo, segment_repo)
+    state = build_code_state(code_repo)
     code_id = CodeId(value=command.code_id)
 
     try:
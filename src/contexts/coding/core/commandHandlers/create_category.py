@@ -14,7 +14,7 @@ from src.contexts.coding.core.commandHandlers._state import (
     CategoryRepository,
     CodeRepository,
     SegmentRepository,
-    build_coding_state,
+    build_code_state,
 )
 from src.contexts.coding.core.commands import (
     CreateCategoryCommand,
@@ -59,7 +59,7 @@ def create_category(
     """
     logger.debug("create_category: name=%s", command.name)
 
-    state = build_coding_state(code_repo, category_repo, segment_repo)
+    state = build_code_state(code_repo, category_repo)
     parent_id = CategoryId(value=command.parent_id) if command.parent_id else None
 
     result = derive_create_category(
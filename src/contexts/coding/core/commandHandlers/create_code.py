@@ -14,7 +14,7 @@ from src.contexts.coding.core.commandHandlers._state import (
     CategoryRepository,
     CodeRepository,
     SegmentRepository,
-    build_coding_state,
+    build_code_state,
 )
 from src.contexts.coding.core.commands import CreateCodeCommand, DeleteCodeCommand
 from src.contexts.coding.core.derivers import derive_create_code
@@ -68,7 +68,7 @@ def create_code(
         )
 
     # Build current state
-    state = build_coding_state(code_repo, category_repo, segment_repo)
+    state = build_code_state(code_repo, category_repo)
 
     # Parse category ID
     category_id = CategoryId(value=command.category_id) if command.category_id else None
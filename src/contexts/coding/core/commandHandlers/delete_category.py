@@ -14,7 +14,7 @@ from src.contexts.coding.core.commandHandlers._state import (
     CategoryRepository,
     CodeRepository,
     SegmentRepository,
-    build_coding_state,
+    build_code_state,
 )
 from src.contexts.coding.core.commands import DeleteCategoryCommand
 from src.contexts.coding.core.derivers import derive_delete_category
@@ -55,7 +55,7 @@ def delete_category(
     """
     logger.debug("delete_category: category_id=%s", command.category_id)
 
-    state = build_coding_state(code_repo, category_repo, segment_repo)
+    state = build_code_state(code_repo, category_repo)
     category_id = CategoryId(value=command.category_id)
 
     result = derive_delete_category(
@@ -14,7 +14,7 @@ from src.contexts.coding.core.commandHandlers._state import (
     CategoryRepository,
     CodeRepository,
     SegmentRepository,
-    build_coding_state,
+    build_code_usage_state,
 )
 from src.contexts.coding.core.commands import DeleteCodeCommand
 from src.contexts.coding.core.derivers import derive_delete_code
@@ -55,8 +55,8 @@ def delete_code(
     """
     logger.debug("delete_code: code_id=%s", command.code_id)
 
-    state = build_coding_state(code_repo, category_repo, segment_repo)
     code_id = CodeId(value=command.code_id)
+    state = build_code_usage_state(code_repo, segment_repo, code_id)
 
     result = derive_delete_code(
         code_id=code_id,
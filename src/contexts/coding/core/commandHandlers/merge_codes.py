@@ -14,7 +14,7 @@ from src.contexts.coding.core.commandHandlers._state import (
     CategoryRepository,
     CodeRepository,
     SegmentRepository,
-    build_coding_state,
+    build_code_usage_state,
 )
 from src.contexts.coding.core.commands import MergeCodesCommand
 from src.contexts.coding.core.derivers import derive_merge_codes
@@ -59,8 +59,8 @@ def merge_codes(
         command.target_code_id,
     )
 
-    state = build_coding_state(code_repo, category_repo, segment_repo)
     source_code_id = CodeId(value=command.source_code_id)
+    state = build_code_usage_state(code_repo, segment_repo, source_code_id)
     target_code_id = CodeId(value=command.target_code_id)
 
     result = derive_merge_codes(
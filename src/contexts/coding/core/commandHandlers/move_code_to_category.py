@@ -14,7 +14,7 @@ from src.contexts.coding.core.commandHandlers._state import (
     CategoryRepository,
     CodeRepository,
     SegmentRepository,
-    build_coding_state,
+    build_code_state,
 )
 from src.contexts.coding.core.commands import MoveCodeToCategoryCommand
 from src.contexts.coding.core.derivers import derive_move_code_to_category
@@ -59,7 +59,7 @@ def move_code_to_category(
         command.category_id,
     )
 
-    state = build_coding_state(code_repo, category_repo, segment_repo)
+    state = build_code_state(code_repo, category_repo)
     code_id = CodeId(value=command.code_id)
     new_category_id = (
         CategoryId(value=command.category_id) if command.category_id else None
@@ -14,7 +14,7 @@ from src.contexts.coding.core.commandHandlers._state import (
     CategoryRepository,
     CodeRepository,
     SegmentRepository,
-    build_coding_state,
+    build_segment_state,
 )
 from src.contexts.coding.core.commands import RemoveCodeCommand
 from src.contexts.coding.core.derivers import derive_remove_segment
@@ -56,7 +56,7 @@ def remove_segment(
     logger.debug("remove_segment: segment_id=%s", command.segment_id)
 
     segment_id = SegmentId(value=command.segment_id)
-    state = build_coding_state(code_repo, category_repo, segment_repo)
+    state = build_segment_state(segment_repo, segment_id)
 
     result = derive_remove_segment(
         segment_id=segment_id,
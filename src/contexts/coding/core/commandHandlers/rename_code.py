@@ -14,7 +14,7 @@ from src.contexts.coding.core.commandHandlers._state import (
     CategoryRepository,
     CodeRepository,
     SegmentRepository,
-    build_coding_state,
+    build_code_state,
 )
 from src.contexts.coding.core.commands import RenameCodeCommand
 from src.contexts.coding.core.derivers import derive_rename_code
@@ -57,7 +57,7 @@ def rename_code(
         "rename_code: code_id=%s, new_name=%s", command.code_id, command.new_name
     )
 
-    state = build_coding_state(code_repo, category_repo, segment_repo)
+    state = build_code_state(code_repo)
     code_id = CodeId(value=command.code_id)
 
     result = derive_rename_code(
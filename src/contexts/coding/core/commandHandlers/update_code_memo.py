@@ -14,7 +14,7 @@ from src.contexts.coding.core.commandHandlers._state import (
     CategoryRepository,
     CodeRepository,
     SegmentRepository,
-    build_coding_state,
+    build_code_state,
 )
 from src.contexts.coding.core.commands import UpdateCodeMemoCommand
 from src.contexts.coding.core.derivers import derive_update_code_memo
@@ -55,7 +55,7 @@ def update_code_memo(
     """
     logger.debug("update_code_memo: code_id=%s", command.code_id)
 
-    state = build_coding_state(code_repo, category_repo, segment_repo)
+    state = build_code_state(code_repo)
     code_id = CodeId(value=command.code_id)
 
     result = derive_update_code_memo(
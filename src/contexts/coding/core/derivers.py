@@ -15,6 +15,7 @@ Architecture:
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cached_property
 
 from src.contexts.coding.core.entities import (
     AutoCodeBatch,
@@ -63,12 +64,14 @@ from src.contexts.coding.core.invariants import (
     count_codes_in_category,
     count_segments_for_code,
     does_category_exist,
+    does_segment_overlap,
     is_category_name_unique,
     is_code_name_unique,
     is_valid_category_name,
     is_valid_code_name,
     is_valid_text_position,
 )
+from src.contexts.coding.core.segment_index import SegmentIndex
 from src.shared.common.types import (
     CategoryId,
     CodeId,
@@ -98,6 +101,11 @@ class CodingState:
     source_length: int | None = None  # For text segment validation
     source_exists: bool = True
 
+    @cached_property
+    def segment_index(self) -> SegmentIndex:
+        """Per-source interval index over existing_segments, built on first use."""
+        return SegmentIndex.from_segments(self.existing_segments)
+
 
 # ============================================================
 # Failure Reasons (Additional to shared types)
@@ -598,15 +606,10 @@ def derive_apply_code_to_text(
         return SegmentNotCoded.invalid_position(start, end, state.source_length)
 
     # Check for overlapping segments with the same code on the same source
-    for seg in state.existing_segments:
-        if (
-            hasattr(seg, "position")
-            and seg.code_id == code_id
-            and seg.source_id == source_id
-            and seg.position.start < end
-            and start < seg.position.end
-        ):
-            return SegmentNotCoded.overlapping_segment(code_id, source_id, start, end)
+    if does_segment_overlap(
+        position, state.segment_index.for_source(source_id), code_id
+    ):
+        return SegmentNotCoded.overlapping_segment(code_id, source_id, start, end)
 
     # Generate segment ID
     segment_id = SegmentId.new()
@@ -383,6 +383,33 @@ class SegmentMemoUpdated(DomainEvent):
         )
 
 
+@dataclass(frozen=True)
+class SegmentsCoded(DomainEvent):
+    """Several segments were coded in one batch (one event per batch)"""
+
+    event_type: ClassVar[str] = "coding.segments_coded"
+
+    segments: tuple[SegmentCoded, ...]
+
+    @property
+    def source_ids(self) -> tuple[SourceId, ...]:
+        """Distinct sources touched by the batch, in first-seen order."""
+        return tuple(dict.fromkeys(s.source_id for s in self.segments))
+
+    @property
+    def code_ids(self) -> tuple[CodeId, ...]:
+        """Distinct codes applied by the batch, in first-seen order."""
+        return tuple(dict.fromkeys(s.code_id for s in self.segments))
+
+    @classmethod
+    def create(cls, segments: tuple[SegmentCoded, ...]) -> "SegmentsCoded":
+        return cls(
+            event_id=cls._generate_id(),
+            occurred_at=cls._now(),
+            segments=segments,
+        )
+
+
 # ============================================================
 # Batch Events (Auto-coding operations)
 # ============================================================
@@ -459,7 +486,7 @@ CodeEvent = (
 
 CategoryEvent = CategoryCreated | CategoryRenamed | CategoryDeleted
 
-SegmentEvent = SegmentCoded | SegmentUncoded | SegmentMemoUpdated
+SegmentEvent = SegmentCoded | SegmentUncoded | SegmentMemoUpdated | SegmentsCoded
 
 BatchEvent = BatchCreated | BatchUndone
 
@@ -24,6 +24,7 @@ from src.contexts.coding.core.entities import (
     TextSegment,
     TimeRange,
 )
+from src.shared.common.interval_index import IntervalIndex
 from src.shared.common.types import CategoryId, CodeId
 from src.shared.core.validation import (
     is_acyclic_hierarchy,
@@ -306,7 +307,7 @@ def is_valid_importance(importance: int) -> bool:
 
 def does_segment_overlap(
     new_position: TextPosition,
-    existing_segments: Iterable[TextSegment],
+    existing_segments: Iterable[TextSegment] | IntervalIndex[TextSegment],
     same_code_id: CodeId,
 ) -> bool:
     """
@@ -316,12 +317,17 @@ def does_segment_overlap(
 
     Args:
         new_position: Position of the new segment
-        existing_segments: Existing segments to check against
+        existing_segments: Existing segments to check against, or an interval
+            index of them (one source) to avoid a linear scan
         same_code_id: Only check segments with this code
 
     Returns:
         True if there is an overlap
     """
+    if isinstance(existing_segments, IntervalIndex):
+        existing_segments = existing_segments.overlapping(
+            new_position.start, new_position.end
+        )
     for segment in existing_segments:
         if segment.code_id != same_code_id:
             continue
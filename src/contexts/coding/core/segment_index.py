@@ -0,0 +1,78 @@
+"""
+Coding Context: Segment Index
+
+Per-source interval indexes over text segments, used to answer "which
+segments cover this position / overlap this range" without scanning every
+segment of a source. Built on the shared IntervalIndex.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+from src.shared.common.interval_index import IntervalIndex
+
+if TYPE_CHECKING:
+    from src.contexts.coding.core.entities import TextSegment
+    from src.shared.common.types import CodeId, SourceId
+
+
+def _segment_bounds(segment: TextSegment) -> tuple[int, int]:
+    return segment.position.start, segment.position.end
+
+
+class SegmentIndex:
+    """
+    Per-source interval index of text segments.
+
+    Example:
+        index = SegmentIndex.from_segments(segment_repo.get_by_source(sid))
+        index.at(sid, cursor_pos)
+        index.overlapping(sid, start, end, code_id=code_id)
+    """
+
+    __slots__ = ("_by_source",)
+
+    def __init__(self, by_source: dict[str, IntervalIndex[TextSegment]]) -> None:
+        self._by_source = by_source
+
+    @classmethod
+    def from_segments(cls, segments: Iterable[TextSegment]) -> SegmentIndex:
+        """Build an index from text segments (other segment kinds are skipped)."""
+        grouped: dict[str, list[TextSegment]] = defaultdict(list)
+        for segment in segments:
+            if hasattr(segment, "position"):
+                grouped[segment.source_id.value].append(segment)
+        return cls(
+            {
+                source: IntervalIndex(items, _segment_bounds)
+                for source, items in grouped.items()
+            }
+        )
+
+    def for_source(self, source_id: SourceId) -> IntervalIndex[TextSegment]:
+        """The interval index of one source (empty if it has no segments)."""
+        found = self._by_source.get(source_id.value)
+        return found if found is not None else IntervalIndex((), _segment_bounds)
+
+    def at(self, source_id: SourceId, pos: int) -> list[TextSegment]:
+        """Segments on a source that contain ``pos``."""
+        return self.for_source(source_id).stab(pos)
+
+    def overlapping(
+        self,
+        source_id: SourceId,
+        start: int,
+        end: int,
+        code_id: CodeId | None = None,
+    ) -> list[TextSegment]:
+        """Segments on a source overlapping ``[start, end)``, optionally one code."""
+        hits = self.for_source(source_id).overlapping(start, end)
+        if code_id is None:
+            return hits
+        return [s for s in hits if s.code_id == code_id]
+
+    def __len__(self) -> int:
+        return sum(len(index) for index in self._by_source.values())
@@ -110,9 +110,26 @@ class MockSegmentRepository:
     def get_by_code(self, code_id: CodeId) -> list[TextSegment]:
         return [s for s in self._segments.values() if s.code_id == code_id]
 
+    def get_overlapping(
+        self, source_id: SourceId, code_id: CodeId, start: int, end: int
+    ) -> list[TextSegment]:
+        return [
+            s
+            for s in self._segments.values()
+            if s.source_id == source_id
+            and s.code_id == code_id
+            and s.position.start < end
+            and start < s.position.end
+        ]
+
     def save(self, segment: TextSegment) -> None:
         self._segments[segment.id.value] = segment
 
+    def save_many(self, segments: list[TextSegment]) -> int:
+        for segment in segments:
+            self.save(segment)
+        return len(segments)
+
     def delete(self, segment_id: SegmentId) -> None:
         self._segments.pop(segment_id.value, None)
 
@@ -552,6 +569,204 @@ class TestApplyCodeHandler:
         assert len(event_bus.published_events) == 1
 
 
+# ============================================================
+# Scoped State Tests
+# ============================================================
+
+
+class NoFullScanSegmentRepository(MockSegmentRepository):
+    """Segment repository that fails if a handler loads every segment."""
+
+    def get_all(self) -> list[TextSegment]:
+        raise AssertionError("handler loaded every segment")
+
+
+@allure.story("QC-028.14 Scoped Coding State")
+class TestScopedCodingState:
+    """Handlers build only the slice of state their deriver reads."""
+
+    @pytest.fixture
+    def segment_repo(self) -> NoFullScanSegmentRepository:
+        return NoFullScanSegmentRepository()
+
+    @allure.title("apply_code only reads same-code segments overlapping the range")
+    def test_apply_code_scoped(
+        self,
+        code_repo: MockCodeRepository,
+        category_repo: MockCategoryRepository,
+        segment_repo: NoFullScanSegmentRepository,
+        event_bus: MockEventBus,
+        sample_code: Code,
+        sample_segment: TextSegment,
+    ):
+        from src.contexts.coding.core.commandHandlers._state import (
+            build_apply_code_state,
+        )
+        from src.contexts.coding.core.commandHandlers.apply_code import apply_code
+
+        code_repo.save(sample_code)
+        code_repo.save(Code(id=CodeId(value="2"), name="Other", color=Color(1, 1, 1)))
+        segment_repo.save(sample_segment)  # code 1, source 1, [0, 10)
+
+        state = build_apply_code_state(
+            code_repo,
+            segment_repo,
+            code_id=sample_code.id,
+            source_id=SourceId(value="1"),
+            start=5,
+            end=20,
+        )
+        assert state.existing_codes == (sample_code,)
+        assert state.existing_segments == (sample_segment,)
+        assert state.existing_categories == ()
+
+        def apply(code_id: str, start: int, end: int):
+            return apply_code(
+                command=ApplyCodeCommand(
+                    code_id=code_id,
+                    source_id="1",
+                    start_position=start,
+                    end_position=end,
+                ),
+                code_repo=code_repo,
+                category_repo=category_repo,
+                segment_repo=segment_repo,
+                event_bus=event_bus,
+            )
+
+        assert apply("1", 5, 20).error_code == "SEGMENT_NOT_CODED/OVERLAPPING_SEGMENT"
+        assert apply("1", 10, 20).is_success
+        assert apply("2", 0, 10).is_success
+        assert apply("99", 30, 40).error_code == "SEGMENT_NOT_CODED/CODE_NOT_FOUND"
+
+    @allure.title("delete_code and remove_segment avoid full segment scans")
+    def test_code_and_segment_handlers_scoped(
+        self,
+        code_repo: MockCodeRepository,
+        category_repo: MockCategoryRepository,
+        segment_repo: NoFullScanSegmentRepository,
+        event_bus: MockEventBus,
+        sample_code: Code,
+        sample_segment: TextSegment,
+    ):
+        from src.contexts.coding.core.commandHandlers.delete_code import delete_code
+        from src.contexts.coding.core.commandHandlers.remove_segment import (
+            remove_segment,
+        )
+        from src.contexts.coding.core.commands import (
+            DeleteCodeCommand,
+            RemoveCodeCommand,
+        )
+
+        code_repo.save(sample_code)
+        segment_repo.save(sample_segment)
+        repos = {
+            "code_repo": code_repo,
+            "category_repo": category_repo,
+            "segment_repo": segment_repo,
+            "event_bus": event_bus,
+        }
+
+        blocked = delete_code(command=DeleteCodeCommand(code_id="1"), **repos)
+        assert blocked.error_code == "CODE_NOT_DELETED/HAS_REFERENCES"
+
+        removed = remove_segment(command=RemoveCodeCommand(segment_id="1"), **repos)
+        assert removed.is_success
+        assert delete_code(command=DeleteCodeCommand(code_id="1"), **repos).is_success
+
+
+@allure.story("QC-028.16 Batch Apply Codes")
+class TestBatchApplyCodesHandler:
+    """batch_apply_codes validates in memory and writes once."""
+
+    @pytest.fixture
+    def segment_repo(self) -> NoFullScanSegmentRepository:
+        return NoFullScanSegmentRepository()
+
+    @allure.title("Per-operation results match applying each code in turn")
+    def test_matches_sequential_apply(
+        self,
+        code_repo: MockCodeRepository,
+        category_repo: MockCategoryRepository,
+        segment_repo: NoFullScanSegmentRepository,
+        event_bus: MockEventBus,
+        sample_code: Code,
+        sample_segment: TextSegment,
+    ):
+        from src.contexts.coding.core.commandHandlers.apply_code import apply_code
+        from src.contexts.coding.core.commandHandlers.batch_apply_codes import (
+            batch_apply_codes,
+        )
+        from src.contexts.coding.core.commands import BatchApplyCodesCommand
+        from src.contexts.coding.core.events import SegmentCoded, SegmentsCoded
+
+        def seeded() -> dict:
+            codes = MockCodeRepository()
+            codes.save(sample_code)
+            codes.save(Code(id=CodeId(value="2"), name="Other", color=Color(1, 1, 1)))
+            segments = NoFullScanSegmentRepository()
+            segments.save(sample_segment)  # code 1, source 1, [0, 10)
+            return {
+                "code_repo": codes,
+                "category_repo": category_repo,
+                "segment_repo": segments,
+                "event_bus": MockEventBus(),
+            }
+
+        ops = (
+            ApplyCodeCommand(
+                code_id="1", source_id="1", start_position=5, end_position=20
+            ),
+            ApplyCodeCommand(
+                code_id="1", source_id="1", start_position=20, end_position=30
+            ),
+            ApplyCodeCommand(
+                code_id="1", source_id="1", start_position=25, end_position=26
+            ),
+            ApplyCodeCommand(
+                code_id="2", source_id="1", start_position=25, end_position=26
+            ),
+            ApplyCodeCommand(
+                code_id="1", source_id="2", start_position=25, end_position=26
+            ),
+            ApplyCodeCommand(
+                code_id="1", source_id="1", start_position=10, end_position=20
+            ),
+            ApplyCodeCommand(
+                code_id="1", source_id="1", start_position=12, end_position=12
+            ),
+            ApplyCodeCommand(
+                code_id="1", source_id="1", start_position=11, end_position=15
+            ),
+            ApplyCodeCommand(
+                code_id="99", source_id="1", start_position=0, end_position=5
+            ),
+        )
+
+        sequential = seeded()
+        expected = [apply_code(command=op, **sequential).error_code for op in ops]
+
+        batched = seeded()
+        result = batch_apply_codes(
+            command=BatchApplyCodesCommand(operations=ops), **batched
+        )
+
+        assert result.is_success
+        assert [r.error_code for r in result.data.results] == [
+            f"BATCH_APPLY_CODES/{code.upper()}" if code else None for code in expected
+        ]
+        assert result.data.succeeded == 4
+        assert len(batched["segment_repo"].get_by_source(SourceId(value="1"))) == 4
+
+        with allure.step("One aggregated event replaces per-segment events"):
+            published = batched["event_bus"].published_events
+            assert not any(isinstance(e, SegmentCoded) for e in published)
+            (batch_event,) = [e for e in published if isinstance(e, SegmentsCoded)]
+            assert len(batch_event.segments) == 4
+            assert [s.value for s in batch_event.source_ids] == ["1", "2"]
+            assert [c.value for c in batch_event.code_ids] == ["1", "2"]
+
+
 # ============================================================
 # Integration-like Tests (Testing Handler Flow)
 # ============================================================
@@ -0,0 +1,70 @@
+"""
+Coding Context: Segment Index Tests
+
+Tests for the per-source segment index used for position queries.
+"""
+
+from __future__ import annotations
+
+import allure
+import pytest
+
+from src.contexts.coding.core.entities import TextPosition, TextSegment
+from src.contexts.coding.core.segment_index import SegmentIndex
+from src.shared.common.types import CodeId, SegmentId, SourceId
+
+pytestmark = [
+    pytest.mark.unit,
+    allure.epic("QualCoder v2"),
+    allure.feature("QC-029 Apply Codes to Text"),
+]
+
+
+def _segment(n: int, start: int, end: int, source="s1", code="c1") -> TextSegment:
+    return TextSegment(
+        id=SegmentId(value=f"g{n}"),
+        source_id=SourceId(value=source),
+        code_id=CodeId(value=code),
+        position=TextPosition(start=start, end=end),
+        selected_text="",
+    )
+
+
+@allure.story("QC-029.05 Segment Interval Index")
+class TestSegmentIndex:
+    """Tests for the per-source SegmentIndex and its uses."""
+
+    @allure.title("Segments are indexed per source and filtered by code")
+    def test_per_source_queries(self):
+        index = SegmentIndex.from_segments(
+            [
+                _segment(1, 0, 10),
+                _segment(2, 5, 15, code="c2"),
+                _segment(3, 0, 10, source="s2"),
+            ]
+        )
+        s1 = SourceId(value="s1")
+
+        assert [s.id.value for s in index.at(s1, 7)] == ["g1", "g2"]
+        assert [
+            s.id.value for s in index.overlapping(s1, 8, 20, code_id=CodeId("c2"))
+        ] == ["g2"]
+        assert index.at(SourceId(value="none"), 0) == []
+        assert len(index) == 3
+
+    @allure.title("does_segment_overlap accepts an interval index")
+    def test_invariant_with_index(self):
+        from src.contexts.coding.core.invariants import does_segment_overlap
+
+        segments = [_segment(1, 10, 20), _segment(2, 30, 40, code="c2")]
+        index = SegmentIndex.from_segments(segments).for_source(SourceId("s1"))
+
+        for start, end, code, expected in [
+            (15, 25, "c1", True),
+            (20, 30, "c1", False),
+            (35, 36, "c1", False),
+            (35, 36, "c2", True),
+        ]:
+            position = TextPosition(start=start, end=end)
+            assert does_segment_overlap(position, index, CodeId(code)) is expected
+            assert does_segment_overlap(position, segments, CodeId(code)) is expected
@@ -3,6 +3,8 @@ Infrastructure layer for the Coding bounded context.
 
 Provides:
 - SQLAlchemy Core implementations of repository protocols
+- Event-driven in-memory codebook read model
+- Trigger-maintained segment counts per code, source and (code, source)
 - AI-assisted coding infrastructure (LLM, embeddings, vector store)
 """
 
@@ -12,6 +14,12 @@ from src.contexts.coding.infra.code_comparator import (
     MockCodeComparator,
     VectorCodeComparator,
 )
+from src.contexts.coding.infra.codebook_read_model import CodebookReadModel
+from src.contexts.coding.infra.codebook_version import (
+    codebook_version,
+    create_codebook_version,
+    drop_codebook_version,
+)
 from src.contexts.coding.infra.config import (
     AIConfig,
     EmbeddingConfig,
@@ -48,6 +56,10 @@ from src.contexts.coding.infra.schema import (
     drop_all,
     metadata,
 )
+from src.contexts.coding.infra.segment_counts import (
+    create_segment_counts,
+    drop_segment_counts,
+)
 from src.contexts.coding.infra.vector_store import (
     ChromaVectorStore,
     MockVectorStore,
@@ -67,10 +79,17 @@ __all__ = [
     "create_all",
     "drop_all",
     "metadata",
+    "create_segment_counts",
+    "drop_segment_counts",
+    "create_codebook_version",
+    "drop_codebook_version",
+    "codebook_version",
     # Repositories
     "SQLiteCategoryRepository",
     "SQLiteCodeRepository",
     "SQLiteSegmentRepository",
+    # Read models
+    "CodebookReadModel",
     # AI Config
     "AIConfig",
     "EmbeddingConfig",
@@ -0,0 +1,381 @@
+"""
+Coding Context: Codebook Read Model
+
+In-memory projection of the codebook for an open project. Viewmodels and
+MCP tools used to reload every code and category (plus a GROUP BY over
+segments) on each refresh; the read model is loaded once when the project
+opens and then kept current from coding domain events.
+
+Provides:
+- O(1) code lookup by id and by name, category lookup by id
+- codes per category and the category tree (children per parent)
+- segment counts per code
+
+Events carry ids rather than full entities, so changed codes and categories
+are re-read by primary key. Events that remove segments without saying
+which codes they belonged to (batch undo, source removal) mark the counts
+stale; they are reloaded with one grouped count on next access.
+
+Codes and categories written without an event (repositories used directly,
+raw SQL) are caught by the codebook version counter (see codebook_version):
+when it no longer matches the version the model last saw, the codebook is
+reloaded on next access.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.contexts.coding.core.entities import Category, Code
+    from src.shared.infra.event_bus import EventBus, Subscription
+    from src.shared.infra.repositories import (
+        CategoryRepositoryProtocol,
+        CodeRepositoryProtocol,
+        SegmentRepositoryProtocol,
+    )
+
+logger = logging.getLogger("qualcoder.coding.infra")
+
+# Events after which the whole codebook is reloaded (bulk writes that do not
+# publish per-row coding events)
+RELOAD_EVENTS: tuple[str, ...] = (
+    "exchange.code_list_imported",
+    "exchange.refi_qda_imported",
+    "exchange.rqda_imported",
+    "projects.snapshot_restored",
+)
+
+# Events after which per-code segment counts are unknown
+STALE_COUNT_EVENTS: tuple[str, ...] = (
+    "coding.batch_created",
+    "coding.batch_undone",
+    "projects.source_removed",
+)
+
+
+def _key(entity_id: Any) -> str:
+    # IDs arrive as str or int depending on the caller
+    value = getattr(entity_id, "value", entity_id)
+    return str(value)
+
+
+def _name_key(name: str) -> str:
+    # Names match case-insensitively, like CodeRepository.get_by_name
+    return name.casefold()
+
+
+class CodebookReadModel:
+    """
+    Thread-safe in-memory codebook kept current by domain events.
+
+    Example:
+        codebook = CodebookReadModel(
+            code_repo, category_repo, segment_repo,
+            version=lambda: codebook_version(connection),
+        )
+        codebook.enable(event_bus)   # load and subscribe
+        codebook.get_code_by_name("Trust")
+        codebook.segment_counts()
+    """
+
+    def __init__(
+        self,
+        code_repo: CodeRepositoryProtocol,
+        category_repo: CategoryRepositoryProtocol,
+        segment_repo: SegmentRepositoryProtocol,
+        version: Callable[[], int] | None = None,
+    ) -> None:
+        self._code_repo = code_repo
+        self._category_repo = category_repo
+        self._segment_repo = segment_repo
+        self._version_of = version
+        self._lock = threading.RLock()
+        self._subscriptions: list[Subscription] = []
+        self._loaded = False
+        self._version: int | None = None
+
+        self._codes: dict[str, Code] = {}
+        self._code_ids_by_name: dict[str, str] = {}
+        self._categories: dict[str, Category] = {}
+        self._counts: dict[str, int] = {}
+        self._counts_stale = False
+
+        # Name-sorted views, rebuilt lazily after changes
+        self._sorted_codes: list[Code] | None = None
+        self._sorted_categories: list[Category] | None = None
+
+    # =========================================================================
+    # Loading
+    # =========================================================================
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._loaded
+
+    def reload(self) -> None:
+        """Load codes, categories and segment counts from the repositories."""
+        # Read first: a write landing during the load triggers another reload
+        version = self._current_version()
+        codes = self._code_repo.get_all()
+        categories = self._category_repo.get_all()
+        counts = self._segment_repo.count_all_by_code()
+        with self._lock:
+            self._codes = {_key(c.id): c for c in codes}
+            self._code_ids_by_name = {_name_key(c.name): _key(c.id) for c in codes}
+            self._categories = {_key(c.id): c for c in categories}
+            self._counts = {_key(cid): n for cid, n in counts.items()}
+            self._counts_stale = False
+            self._sorted_codes = codes
+            self._sorted_categories = categories
+            self._version = version
+            self._loaded = True
+        logger.debug(
+            "codebook loaded: codes=%d categories=%d", len(codes), len(categories)
+        )
+
+    def _current_version(self) -> int | None:
+        return self._version_of() if self._version_of is not None else None
+
+    def _ensure_loaded(self) -> None:
+        if not self._loaded:
+            self.reload()
+        elif self._version_of is not None and self._current_version() != self._version:
+            logger.debug("codebook changed without events; reloading")
+            self.reload()
+
+    def _sync_version(self) -> None:
+        """Record writes already applied from events as seen."""
+        if self._version_of is not None:
+            version = self._current_version()
+            with self._lock:
+                self._version = version
+
+    def _ensure_counts(self) -> None:
+        if self._counts_stale:
+            counts = self._segment_repo.count_all_by_code()
+            with self._lock:
+                self._counts = {_key(cid): n for cid, n in counts.items()}
+                self._counts_stale = False
+
+    # =========================================================================
+    # Queries
+    # =========================================================================
+
+    def get_all_codes(self) -> list[Code]:
+        """All codes, ordered by name (same order as the repository)."""
+        self._ensure_loaded()
+        with self._lock:
+            if self._sorted_codes is None:
+                self._sorted_codes = sorted(self._codes.values(), key=lambda c: c.name)
+            return list(self._sorted_codes)
+
+    def get_code(self, code_id: Any) -> Code | None:
+        self._ensure_loaded()
+        with self._lock:
+            return self._codes.get(_key(code_id))
+
+    def get_code_by_name(self, name: str) -> Code | None:
+        self._ensure_loaded()
+        with self._lock:
+            code_id = self._code_ids_by_name.get(_name_key(name))
+            return self._codes.get(code_id) if code_id is not None else None
+
+    def get_all_categories(self) -> list[Category]:
+        """All categories, ordered by name (same order as the repository)."""
+        self._ensure_loaded()
+        with self._lock:
+            if self._sorted_categories is None:
+                self._sorted_categories = sorted(
+                    self._categories.values(), key=lambda c: c.name
+                )
+            return list(self._sorted_categories)
+
+    def get_category(self, category_id: Any) -> Category | None:
+        self._ensure_loaded()
+        with self._lock:
+            return self._categories.get(_key(category_id))
+
+    def codes_by_category(self) -> dict[Any, list[Code]]:
+        """
+        Codes grouped by category id, each group ordered by name.
+
+        Codes without a category, or whose category no longer exists, are
+        grouped under ``None``.
+        """
+        grouped: dict[Any, list[Code]] = {}
+        codes = self.get_all_codes()
+        with self._lock:
+            for code in codes:
+                cat = code.category_id
+                if cat is not None and _key(cat) in self._categories:
+                    grouped.setdefault(self._categories[_key(cat)].id.value, []).append(
+                        code
+                    )
+                else:
+                    grouped.setdefault(None, []).append(code)
+        return grouped
+
+    def category_children(self) -> dict[Any, list[Category]]:
+        """
+        Category tree as child lists keyed by parent id (``None`` for roots).
+        """
+        children: dict[Any, list[Category]] = {}
+        for category in self.get_all_categories():
+            parent = category.parent_id.value if category.parent_id else None
+            children.setdefault(parent, []).append(category)
+        return children
+
+    def segment_count(self, code_id: Any) -> int:
+        self._ensure_loaded()
+        self._ensure_counts()
+        with self._lock:
+            return self._counts.get(_key(code_id), 0)
+
+    def segment_counts(self) -> dict[Any, int]:
+        """Segment counts keyed by code id value, for codes that have segments."""
+        self._ensure_loaded()
+        self._ensure_counts()
+        with self._lock:
+            return {
+                code.id.value: self._counts[key]
+                for key, code in self._codes.items()
+                if self._counts.get(key)
+            }
+
+    # =========================================================================
+    # Event wiring
+    # =========================================================================
+
+    def enable(self, event_bus: EventBus) -> None:
+        """Load the codebook and subscribe to the events that change it."""
+        if self._subscriptions:
+            return
+        self.reload()
+        handlers: dict[str, Callable[[Any], None]] = {
+            "coding.code_created": self._on_code_changed,
+            "coding.code_renamed": self._on_code_changed,
+            "coding.code_color_changed": self._on_code_changed,
+            "coding.code_memo_updated": self._on_code_changed,
+            "coding.code_moved_to_category": self._on_code_changed,
+            "coding.code_deleted": self._on_code_deleted,
+            "coding.codes_merged": self._on_codes_merged,
+            "coding.category_created": self._on_category_changed,
+            "coding.category_renamed": self._on_category_changed,
+            "coding.category_deleted": self._on_category_deleted,
+            "coding.segment_coded": self._on_segment_coded,
+            "coding.segments_coded": self._on_segments_coded,
+            "coding.segment_uncoded": self._on_segment_uncoded,
+        }
+        handlers.update(dict.fromkeys(STALE_COUNT_EVENTS, self._on_counts_stale))
+        handlers.update(dict.fromkeys(RELOAD_EVENTS, self._on_reload))
+        # Subscribe first so viewmodels reacting to the same event see the
+        # updated model
+        for event_type, handler in handlers.items():
+            self._subscriptions.append(
+                event_bus.subscribe(event_type, handler, first=True)
+            )
+
+    def disable(self) -> None:
+        """Cancel event subscriptions and drop the loaded codebook."""
+        for subscription in self._subscriptions:
+            subscription.cancel()
+        self._subscriptions.clear()
+        with self._lock:
+            self._codes.clear()
+            self._code_ids_by_name.clear()
+            self._categories.clear()
+            self._counts.clear()
+            self._sorted_codes = None
+            self._sorted_categories = None
+            self._version = None
+            self._loaded = False
+
+    def _put_code(self, code: Code) -> None:
+        key = _key(code.id)
+        old = self._codes.get(key)
+        if old is not None and self._code_ids_by_name.get(_name_key(old.name)) == key:
+            del self._code_ids_by_name[_name_key(old.name)]
+        self._codes[key] = code
+        self._code_ids_by_name[_name_key(code.name)] = key
+        self._sorted_codes = None
+
+    def _drop_code(self, code_id: Any) -> None:
+        key = _key(code_id)
+        old = self._codes.pop(key, None)
+        if old is not None and self._code_ids_by_name.get(_name_key(old.name)) == key:
+            del self._code_ids_by_name[_name_key(old.name)]
+        self._counts.pop(key, None)
+        self._sorted_codes = None
+
+    def _refresh_code(self, code_id: Any) -> None:
+        code = self._code_repo.get_by_id(code_id)
+        with self._lock:
+            if code is None:
+                self._drop_code(code_id)
+            else:
+                self._put_code(code)
+        self._sync_version()
+
+    def _add_count(self, code_id: Any, delta: int) -> None:
+        key = _key(code_id)
+        with self._lock:
+            self._counts[key] = max(self._counts.get(key, 0) + delta, 0)
+
+    def _on_code_changed(self, event) -> None:
+        self._refresh_code(event.code_id)
+
+    def _on_code_deleted(self, event) -> None:
+        with self._lock:
+            self._drop_code(event.code_id)
+        self._sync_version()
+
+    def _on_codes_merged(self, event) -> None:
+        with self._lock:
+            moved = self._counts.get(_key(event.source_code_id), 0)
+            self._drop_code(event.source_code_id)
+        self._add_count(event.target_code_id, moved)
+        self._refresh_code(event.target_code_id)
+
+    def _on_category_changed(self, event) -> None:
+        category = self._category_repo.get_by_id(event.category_id)
+        with self._lock:
+            if category is not None:
+                self._categories[_key(category.id)] = category
+                self._sorted_categories = None
+        self._sync_version()
+
+    def _on_category_deleted(self, event) -> None:
+        key = _key(event.category_id)
+        with self._lock:
+            self._categories.pop(key, None)
+            self._sorted_categories = None
+            orphaned = [
+                code.id
+                for code in self._codes.values()
+                if code.category_id is not None and _key(code.category_id) == key
+            ]
+        # Orphaned codes are re-parented by the handler
+        for code_id in orphaned:
+            self._refresh_code(code_id)
+        self._sync_version()
+
+    def _on_segment_coded(self, event) -> None:
+        self._add_count(event.code_id, 1)
+
+    def _on_segments_coded(self, event) -> None:
+        for segment in event.segments:
+            self._add_count(segment.code_id, 1)
+
+    def _on_segment_uncoded(self, event) -> None:
+        self._add_count(event.code_id, -1)
+
+    def _on_counts_stale(self, _event) -> None:
+        with self._lock:
+            self._counts_stale = True
+
+    def _on_reload(self, _event) -> None:
+        self.reload()
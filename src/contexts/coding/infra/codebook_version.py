@@ -0,0 +1,99 @@
+"""
+Coding Context: Codebook Version
+
+A single counter bumped by SQLite triggers whenever a code or category row
+is inserted, updated or deleted, by any write path (handlers, repositories
+used directly, bulk imports, raw SQL).
+
+The CodebookReadModel compares it with the version it last saw: writes that
+published coding events are applied incrementally and the version is
+re-read, while writes that published nothing show up as a mismatch and
+the model reloads on next access.
+
+Layout:
+    cod_codebook_version  (id = 1, n)
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from sqlalchemy import text
+
+if TYPE_CHECKING:
+    from sqlalchemy import Connection
+
+logger = logging.getLogger("qualcoder.coding.infra")
+
+VERSION_TABLE = "cod_codebook_version"
+
+_TABLES = ("cod_code", "cod_category")
+_OPERATIONS = {"ai": "INSERT", "au": "UPDATE", "ad": "DELETE"}
+
+_TRIGGERS = tuple(
+    f"trg_ver_{table}_{suffix}" for table in _TABLES for suffix in _OPERATIONS
+)
+
+_DDL = (
+    f"""
+    CREATE TABLE IF NOT EXISTS {VERSION_TABLE} (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        n INTEGER NOT NULL
+    )
+    """,
+    f"INSERT OR IGNORE INTO {VERSION_TABLE}(id, n) VALUES (1, 0)",
+    *(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_ver_{table}_{suffix}
+        AFTER {operation} ON {table} BEGIN
+            UPDATE {VERSION_TABLE} SET n = n + 1 WHERE id = 1;
+        END
+        """
+        for table in _TABLES
+        for suffix, operation in _OPERATIONS.items()
+    ),
+)
+
+
+def create_codebook_version(connection: Connection) -> None:
+    """
+    Create the codebook version table and the triggers bumping it.
+
+    Idempotent; a cheap catalog check when everything exists.
+
+    Args:
+        connection: SQLAlchemy connection with the coding tables created
+    """
+    names = (VERSION_TABLE, *_TRIGGERS)
+    existing = {
+        row.name
+        for row in connection.execute(
+            text(
+                "SELECT name FROM sqlite_master "
+                "WHERE type IN ('table', 'trigger') AND name IN "
+                f"({', '.join(repr(n) for n in names)})"
+            )
+        )
+    }
+    if existing.issuperset(names):
+        return
+
+    logger.info("create_codebook_version: creating codebook version triggers")
+    for statement in _DDL:
+        connection.execute(text(statement))
+
+
+def drop_codebook_version(connection: Connection) -> None:
+    """Drop the codebook version table and triggers (for testing)."""
+    for trigger in _TRIGGERS:
+        connection.execute(text(f"DROP TRIGGER IF EXISTS {trigger}"))
+    connection.execute(text(f"DROP TABLE IF EXISTS {VERSION_TABLE}"))
+
+
+def codebook_version(connection: Connection) -> int:
+    """Current codebook version; changes on every code or category write."""
+    return (
+        connection.execute(text(f"SELECT n FROM {VERSION_TABLE} WHERE id = 1")).scalar()
+        or 0
+    )
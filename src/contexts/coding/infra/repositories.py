@@ -8,10 +8,11 @@ type-safe database access without full ORM overhead.
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterable, Iterator, Sequence
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import delete, func, select, update
+from sqlalchemy import delete, func, select, tuple_, update
 
 from src.contexts.coding.core.entities import (
     Category,
@@ -21,7 +22,16 @@ from src.contexts.coding.core.entities import (
     TextSegment,
 )
 from src.contexts.coding.infra.schema import code_cat, code_name, code_text
+from src.contexts.coding.infra.segment_counts import (
+    count_for_code,
+    count_for_code_and_source,
+    count_for_source,
+    counts_by_code,
+    counts_by_source,
+    total_segments,
+)
 from src.shared.common.types import CategoryId, CodeId, SegmentId, SourceId
+from src.shared.infra.repositories.bulk import delete_many, upsert_many
 
 if TYPE_CHECKING:
     from sqlalchemy import Connection
@@ -30,6 +40,21 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("qualcoder.coding.infra")
 
+# Segments per page when a source's segments are read page by page
+SEGMENT_PAGE_SIZE = 1000
+
+# Segment columns rewritten on update and mirrored to the sync outbox
+_SEGMENT_SYNC_COLUMNS = (
+    "cid",
+    "fid",
+    "pos0",
+    "pos1",
+    "seltext",
+    "memo",
+    "owner",
+    "important",
+)
+
 
 class SQLiteCodeRepository:
     """
@@ -80,38 +105,18 @@ class SQLiteCodeRepository:
     def save(self, code: Code) -> None:
         """Save a code (insert or update)."""
         logger.debug("save: %s (name=%s)", code.id.value, code.name)
-        exists = self.exists(code.id)
-
-        if exists:
-            stmt = (
-                update(code_name)
-                .where(code_name.c.cid == code.id.value)
-                .values(
-                    name=code.name,
-                    color=code.color.to_hex(),
-                    memo=code.memo,
-                    catid=code.category_id.value if code.category_id else None,
-                    owner=code.owner,
-                )
-            )
-        else:
-            stmt = code_name.insert().values(
-                cid=code.id.value,
-                name=code.name,
-                color=code.color.to_hex(),
-                memo=code.memo,
-                catid=code.category_id.value if code.category_id else None,
-                owner=code.owner,
-                date=code.created_at.isoformat(),
-            )
+        self._upsert((code,))
+        if self._outbox:
+            self._outbox.write_upsert("code", code.id.value, self._sync_payload(code))
 
-        self._conn.execute(stmt)
+    def save_many(self, codes: Sequence[Code]) -> int:
+        """Insert or update codes in one statement, returns count written."""
+        count = self._upsert(codes)
+        logger.debug("save_many: count=%d", count)
         if self._outbox:
-            self._outbox.write_upsert(
-                "code",
-                code.id.value,
-                {"name": code.name, "color": code.color.to_hex(), "memo": code.memo},
-            )
+            for c in codes:
+                self._outbox.write_upsert("code", c.id.value, self._sync_payload(c))
+        return count
 
     def delete(self, code_id: CodeId) -> None:
         """Delete a code by ID."""
@@ -121,6 +126,16 @@ class SQLiteCodeRepository:
         if self._outbox:
             self._outbox.write_delete("code", code_id.value)
 
+    def delete_many(self, code_ids: Iterable[CodeId]) -> int:
+        """Delete codes by ID, returns count deleted."""
+        ids = [code_id.value for code_id in code_ids]
+        count = delete_many(self._conn, code_name.c.cid, ids)
+        logger.debug("delete_many: count=%d", count)
+        if self._outbox:
+            for entity_id in ids:
+                self._outbox.write_delete("code", entity_id)
+        return count
+
     def exists(self, code_id: CodeId) -> bool:
         """Check if a code exists."""
         stmt = select(func.count()).where(code_name.c.cid == code_id.value)
@@ -135,6 +150,33 @@ class SQLiteCodeRepository:
         result = self._conn.execute(stmt)
         return result.scalar() > 0
 
+    def _upsert(self, codes: Sequence[Code]) -> int:
+        """Write codes with INSERT ... ON CONFLICT DO UPDATE (no probe)."""
+        rows = [
+            {
+                "cid": code.id.value,
+                "name": code.name,
+                "color": code.color.to_hex(),
+                "memo": code.memo,
+                "catid": code.category_id.value if code.category_id else None,
+                "owner": code.owner,
+                "date": code.created_at.isoformat(),
+            }
+            for code in codes
+        ]
+        return upsert_many(
+            self._conn,
+            code_name,
+            rows,
+            key="cid",
+            update_columns=("name", "color", "memo", "catid", "owner"),
+        )
+
+    @staticmethod
+    def _sync_payload(code: Code) -> dict:
+        """Fields mirrored to the sync outbox."""
+        return {"name": code.name, "color": code.color.to_hex(), "memo": code.memo}
+
     def _row_to_code(self, row) -> Code:
         """
         Map database row to domain Code entity.
@@ -203,31 +245,7 @@ class SQLiteCategoryRepository:
     def save(self, category: Category) -> None:
         """Save a category."""
         logger.debug("save: %s (name=%s)", category.id.value, category.name)
-        exists_stmt = select(func.count()).where(code_cat.c.catid == category.id.value)
-        exists = self._conn.execute(exists_stmt).scalar() > 0
-
-        if exists:
-            stmt = (
-                update(code_cat)
-                .where(code_cat.c.catid == category.id.value)
-                .values(
-                    name=category.name,
-                    supercatid=category.parent_id.value if category.parent_id else None,
-                    memo=category.memo,
-                    owner=category.owner,
-                )
-            )
-        else:
-            stmt = code_cat.insert().values(
-                catid=category.id.value,
-                name=category.name,
-                supercatid=category.parent_id.value if category.parent_id else None,
-                memo=category.memo,
-                owner=category.owner,
-                date=category.created_at.isoformat(),
-            )
-
-        self._conn.execute(stmt)
+        self._upsert((category,))
         if self._outbox:
             self._outbox.write_upsert(
                 "category",
@@ -235,6 +253,38 @@ class SQLiteCategoryRepository:
                 {"name": category.name, "memo": category.memo},
             )
 
+    def save_many(self, categories: Sequence[Category]) -> int:
+        """Insert or update categories in one statement, returns count written."""
+        count = self._upsert(categories)
+        logger.debug("save_many: count=%d", count)
+        if self._outbox:
+            for c in categories:
+                self._outbox.write_upsert(
+                    "category", c.id.value, {"name": c.name, "memo": c.memo}
+                )
+        return count
+
+    def _upsert(self, categories: Sequence[Category]) -> int:
+        """Write categories with INSERT ... ON CONFLICT DO UPDATE (no probe)."""
+        rows = [
+            {
+                "catid": c.id.value,
+                "name": c.name,
+                "supercatid": c.parent_id.value if c.parent_id else None,
+                "memo": c.memo,
+                "owner": c.owner,
+                "date": c.created_at.isoformat(),
+            }
+            for c in categories
+        ]
+        return upsert_many(
+            self._conn,
+            code_cat,
+            rows,
+            key="catid",
+            update_columns=("name", "supercatid", "memo", "owner"),
+        )
+
     def delete(self, category_id: CategoryId) -> None:
         """Delete a category."""
         logger.debug("delete: %s", category_id.value)
@@ -243,6 +293,16 @@ class SQLiteCategoryRepository:
         if self._outbox:
             self._outbox.write_delete("category", category_id.value)
 
+    def delete_many(self, category_ids: Iterable[CategoryId]) -> int:
+        """Delete categories by ID, returns count deleted."""
+        ids = [category_id.value for category_id in category_ids]
+        count = delete_many(self._conn, code_cat.c.catid, ids)
+        logger.debug("delete_many: count=%d", count)
+        if self._outbox:
+            for entity_id in ids:
+                self._outbox.write_delete("category", entity_id)
+        return count
+
     def name_exists(self, name: str, exclude_id: CategoryId | None = None) -> bool:
         """Check if a category name is already taken."""
         stmt = select(func.count()).where(func.lower(code_cat.c.name) == name.lower())
@@ -308,6 +368,29 @@ class SQLiteSegmentRepository:
         result = self._conn.execute(stmt)
         return [self._row_to_segment(row) for row in result]
 
+    def iter_pages_by_source(
+        self, source_id: SourceId, page_size: int = SEGMENT_PAGE_SIZE
+    ) -> Iterator[list[TextSegment]]:
+        """
+        Segments of a source in position order, ``page_size`` at a time.
+
+        Keyset paging on (pos0, ctid): each page is one indexed query, so
+        only a page of segments is ever held, however many the source has.
+        """
+        last: tuple[int, str] | None = None
+        while True:
+            stmt = select(code_text).where(code_text.c.fid == source_id.value)
+            if last is not None:
+                stmt = stmt.where(tuple_(code_text.c.pos0, code_text.c.ctid) > last)
+            stmt = stmt.order_by(code_text.c.pos0, code_text.c.ctid).limit(page_size)
+            rows = self._conn.execute(stmt).fetchall()
+            if not rows:
+                return
+            yield [self._row_to_segment(row) for row in rows]
+            if len(rows) < page_size:
+                return
+            last = (rows[-1].pos0, rows[-1].ctid)
+
     def get_by_code(self, code_id: CodeId) -> list[TextSegment]:
         """Get all segments with a specific code."""
         stmt = (
@@ -331,6 +414,21 @@ class SQLiteSegmentRepository:
         result = self._conn.execute(stmt)
         return [self._row_to_segment(row) for row in result]
 
+    def get_overlapping(
+        self, source_id: SourceId, code_id: CodeId, start: int, end: int
+    ) -> list[TextSegment]:
+        """Get segments with a code on a source that overlap ``[start, end)``."""
+        stmt = (
+            select(code_text)
+            .where(code_text.c.fid == source_id.value)
+            .where(code_text.c.cid == code_id.value)
+            .where(code_text.c.pos0 < end)
+            .where(code_text.c.pos1 > start)
+            .order_by(code_text.c.pos0)
+        )
+        result = self._conn.execute(stmt)
+        return [self._row_to_segment(row) for row in result]
+
     def save(self, segment: TextSegment) -> None:
         """Save a segment."""
         logger.debug(
@@ -339,55 +437,41 @@ class SQLiteSegmentRepository:
             segment.code_id.value,
             segment.source_id.value,
         )
-        exists_stmt = select(func.count()).where(code_text.c.ctid == segment.id.value)
-        exists = self._conn.execute(exists_stmt).scalar() > 0
-
-        if exists:
-            stmt = (
-                update(code_text)
-                .where(code_text.c.ctid == segment.id.value)
-                .values(
-                    cid=segment.code_id.value,
-                    fid=segment.source_id.value,
-                    pos0=segment.position.start,
-                    pos1=segment.position.end,
-                    seltext=segment.selected_text,
-                    memo=segment.memo,
-                    owner=segment.owner,
-                    important=segment.importance,
-                )
-            )
-        else:
-            stmt = code_text.insert().values(
-                ctid=segment.id.value,
-                cid=segment.code_id.value,
-                fid=segment.source_id.value,
-                pos0=segment.position.start,
-                pos1=segment.position.end,
-                seltext=segment.selected_text,
-                memo=segment.memo,
-                owner=segment.owner,
-                date=segment.created_at.isoformat(),
-                important=segment.importance,
-            )
-
-        self._conn.execute(stmt)
+        row = self._segment_to_values(segment)
+        upsert_many(
+            self._conn,
+            code_text,
+            [row],
+            key="ctid",
+            update_columns=_SEGMENT_SYNC_COLUMNS,
+        )
         if self._outbox:
             self._outbox.write_upsert(
                 "segment",
                 segment.id.value,
-                {
-                    "cid": segment.code_id.value,
-                    "fid": segment.source_id.value,
-                    "pos0": segment.position.start,
-                    "pos1": segment.position.end,
-                    "seltext": segment.selected_text,
-                    "memo": segment.memo,
-                    "owner": segment.owner,
-                    "important": segment.importance,
-                },
+                {col: row[col] for col in _SEGMENT_SYNC_COLUMNS},
             )
 
+    def save_many(self, segments: Sequence[TextSegment]) -> int:
+        """Insert or update segments in one statement, returns count written."""
+        rows = [self._segment_to_values(segment) for segment in segments]
+        count = upsert_many(
+            self._conn,
+            code_text,
+            rows,
+            key="ctid",
+            update_columns=_SEGMENT_SYNC_COLUMNS,
+        )
+        logger.debug("save_many: count=%d", count)
+        if self._outbox:
+            for row in rows:
+                self._outbox.write_upsert(
+                    "segment",
+                    row["ctid"],
+                    {col: row[col] for col in _SEGMENT_SYNC_COLUMNS},
+                )
+        return count
+
     def delete(self, segment_id: SegmentId) -> None:
         """Delete a segment by ID."""
         logger.debug("delete: %s", segment_id.value)
@@ -396,60 +480,70 @@ class SQLiteSegmentRepository:
         if self._outbox:
             self._outbox.write_delete("segment", segment_id.value)
 
+    def delete_many(self, segment_ids: Iterable[SegmentId]) -> int:
+        """Delete segments by ID, returns count deleted."""
+        ids = [segment_id.value for segment_id in segment_ids]
+        count = delete_many(self._conn, code_text.c.ctid, ids)
+        logger.debug("delete_many: count=%d", count)
+        if self._outbox:
+            for entity_id in ids:
+                self._outbox.write_delete("segment", entity_id)
+        return count
+
     def delete_by_code(self, code_id: CodeId) -> int:
         """Delete all segments with a code, returns count deleted."""
-        count = self.count_by_code(code_id)
-        logger.debug("delete_by_code: %s (count=%d)", code_id.value, count)
         stmt = delete(code_text).where(code_text.c.cid == code_id.value)
-        self._conn.execute(stmt)
-
+        count = self._conn.execute(stmt).rowcount or 0
+        logger.debug("delete_by_code: %s (count=%d)", code_id.value, count)
         return count
 
     def delete_by_source(self, source_id: SourceId) -> int:
         """Delete all segments for a source, returns count deleted."""
-        count = self.count_by_source(source_id)
-        logger.debug("delete_by_source: %s (count=%d)", source_id.value, count)
         stmt = delete(code_text).where(code_text.c.fid == source_id.value)
-        self._conn.execute(stmt)
-
+        count = self._conn.execute(stmt).rowcount or 0
+        logger.debug("delete_by_source: %s (count=%d)", source_id.value, count)
         return count
 
     def count_by_code(self, code_id: CodeId) -> int:
-        """Count segments with a specific code."""
-        stmt = select(func.count()).where(code_text.c.cid == code_id.value)
-        result = self._conn.execute(stmt)
-        return result.scalar()
+        """Count segments with a specific code (maintained aggregate)."""
+        return count_for_code(self._conn, code_id.value)
 
     def count_by_source(self, source_id: SourceId) -> int:
-        """Count segments for a specific source."""
-        stmt = select(func.count()).where(code_text.c.fid == source_id.value)
-        result = self._conn.execute(stmt)
-        return result.scalar()
+        """Count segments for a specific source (maintained aggregate)."""
+        return count_for_source(self._conn, source_id.value)
+
+    def count_by_source_and_code(self, source_id: SourceId, code_id: CodeId) -> int:
+        """Count segments for a source coded with a code (maintained aggregate)."""
+        return count_for_code_and_source(self._conn, code_id.value, source_id.value)
 
-    def count_all_by_code(self) -> dict[int, int]:
+    def count_all_by_code(self) -> dict[str, int]:
         """
-        Count segments grouped by code_id in a single query.
+        Segment counts for every code that has segments.
+
+        Reads the maintained per-code aggregate (one row per code), not
+        cod_segment.
 
         Returns:
             Dictionary mapping code_id to segment count
         """
-        stmt = select(code_text.c.cid, func.count().label("cnt")).group_by(
-            code_text.c.cid
-        )
-        result = self._conn.execute(stmt)
-        return {row.cid: row.cnt for row in result}
+        return counts_by_code(self._conn)
+
+    def count_all_by_source(self) -> dict[str, int]:
+        """Segment counts for every source that has segments."""
+        return counts_by_source(self._conn)
+
+    def count_all(self) -> int:
+        """Total number of segments in the project."""
+        return total_segments(self._conn)
 
     def reassign_code(self, from_code_id: CodeId, to_code_id: CodeId) -> int:
         """Reassign all segments from one code to another, returns count."""
-        count = self.count_by_code(from_code_id)
         stmt = (
             update(code_text)
             .where(code_text.c.cid == from_code_id.value)
             .values(cid=to_code_id.value)
         )
-        self._conn.execute(stmt)
-
-        return count
+        return self._conn.execute(stmt).rowcount or 0
 
     def update_source_name(self, source_id: SourceId, new_name: str) -> None:
         """
@@ -464,6 +558,21 @@ class SQLiteSegmentRepository:
         )
         self._conn.execute(stmt)
 
+    def _segment_to_values(self, segment: TextSegment) -> dict:
+        """Convert a TextSegment to cod_segment column values."""
+        return {
+            "ctid": segment.id.value,
+            "cid": segment.code_id.value,
+            "fid": segment.source_id.value,
+            "pos0": segment.position.start,
+            "pos1": segment.position.end,
+            "seltext": segment.selected_text,
+            "memo": segment.memo,
+            "owner": segment.owner,
+            "date": segment.created_at.isoformat(),
+            "important": segment.importance,
+        }
+
     def _row_to_segment(self, row) -> TextSegment:
         """
         Map database row to domain TextSegment entity.
@@ -14,6 +14,7 @@ from sqlalchemy import (
     String,
     Table,
     Text,
+    text,
 )
 
 # Shared metadata for all Coding context tables
@@ -83,6 +84,8 @@ cod_segment = Table(
     Index("idx_cod_segment_cid", "cid"),
     Index("idx_cod_segment_fid", "fid"),
     Index("idx_cod_segment_fid_cid", "fid", "cid"),
+    # Position order within a source, for paging (ctid breaks ties)
+    Index("idx_cod_segment_fid_pos0", "fid", "pos0", "ctid"),
 )
 
 # Additional indexes
@@ -108,6 +111,25 @@ def create_all(engine) -> None:
     metadata.create_all(engine)
 
 
+def upgrade_segment_indexes(connection) -> None:
+    """
+    Create segment indexes missing from an older database.
+
+    Idempotent.
+
+    Args:
+        connection: SQLAlchemy connection or Session
+    """
+    present = connection.execute(text("PRAGMA table_info(cod_segment)")).first()
+    if present is None:
+        return  # Table not created yet
+    for index in cod_segment.indexes:
+        columns = ", ".join(c.name for c in index.columns)
+        connection.execute(
+            text(f"CREATE INDEX IF NOT EXISTS {index.name} ON cod_segment ({columns})")
+        )
+
+
 def drop_all(engine) -> None:
     """
     Drop all Coding context tables (for testing).
@@ -0,0 +1,223 @@
+"""
+Coding Context: Maintained Segment Counts
+
+Segment counts per code, per source and per (code, source) kept in small
+aggregate tables, so code-tree badges, source delete warnings and the
+project dashboard read a row instead of scanning cod_segment.
+
+Layout:
+    cod_segment_count_code         (cid, n)
+    cod_segment_count_source       (fid, n)
+    cod_segment_count_code_source  (cid, fid, n)
+
+SQLite triggers on cod_segment keep the counts current for every write
+path (repositories, bulk imports, raw SQL). Rows are removed when their
+count drops to zero. The tables are derived data: they are rebuilt from
+cod_segment when missing or when a trigger was dropped (new project, older
+database, or a restored VCS snapshot).
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from sqlalchemy import text
+
+if TYPE_CHECKING:
+    from sqlalchemy import Connection
+
+logger = logging.getLogger("qualcoder.coding.infra")
+
+BY_CODE_TABLE = "cod_segment_count_code"
+BY_SOURCE_TABLE = "cod_segment_count_source"
+BY_CODE_SOURCE_TABLE = "cod_segment_count_code_source"
+
+COUNT_TABLES = (BY_CODE_TABLE, BY_SOURCE_TABLE, BY_CODE_SOURCE_TABLE)
+
+_TRIGGERS = (
+    "trg_cnt_cod_segment_ai",
+    "trg_cnt_cod_segment_au",
+    "trg_cnt_cod_segment_ad",
+)
+
+
+def _add(row: str) -> str:
+    """Statements adding one to every aggregate for ``row`` (new/old)."""
+    return f"""
+        INSERT INTO {BY_CODE_TABLE}(cid, n) VALUES ({row}.cid, 1)
+            ON CONFLICT(cid) DO UPDATE SET n = n + 1;
+        INSERT INTO {BY_SOURCE_TABLE}(fid, n) VALUES ({row}.fid, 1)
+            ON CONFLICT(fid) DO UPDATE SET n = n + 1;
+        INSERT INTO {BY_CODE_SOURCE_TABLE}(cid, fid, n)
+            VALUES ({row}.cid, {row}.fid, 1)
+            ON CONFLICT(cid, fid) DO UPDATE SET n = n + 1;
+    """
+
+
+def _sub(row: str) -> str:
+    """Statements subtracting one from every aggregate for ``row``."""
+    return f"""
+        UPDATE {BY_CODE_TABLE} SET n = n - 1 WHERE cid = {row}.cid;
+        DELETE FROM {BY_CODE_TABLE} WHERE cid = {row}.cid AND n <= 0;
+        UPDATE {BY_SOURCE_TABLE} SET n = n - 1 WHERE fid = {row}.fid;
+        DELETE FROM {BY_SOURCE_TABLE} WHERE fid = {row}.fid AND n <= 0;
+        UPDATE {BY_CODE_SOURCE_TABLE} SET n = n - 1
+            WHERE cid = {row}.cid AND fid = {row}.fid;
+        DELETE FROM {BY_CODE_SOURCE_TABLE}
+            WHERE cid = {row}.cid AND fid = {row}.fid AND n <= 0;
+    """
+
+
+_DDL = (
+    f"""
+    CREATE TABLE IF NOT EXISTS {BY_CODE_TABLE} (
+        cid VARCHAR(36) PRIMARY KEY,
+        n INTEGER NOT NULL
+    )
+    """,
+    f"""
+    CREATE TABLE IF NOT EXISTS {BY_SOURCE_TABLE} (
+        fid VARCHAR(36) PRIMARY KEY,
+        n INTEGER NOT NULL
+    )
+    """,
+    f"""
+    CREATE TABLE IF NOT EXISTS {BY_CODE_SOURCE_TABLE} (
+        cid VARCHAR(36) NOT NULL,
+        fid VARCHAR(36) NOT NULL,
+        n INTEGER NOT NULL,
+        PRIMARY KEY (cid, fid)
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_cnt_cod_segment_ai
+    AFTER INSERT ON cod_segment BEGIN
+        {_add("new")}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_cnt_cod_segment_au
+    AFTER UPDATE OF cid, fid ON cod_segment
+    WHEN old.cid IS NOT new.cid OR old.fid IS NOT new.fid BEGIN
+        {_sub("old")}
+        {_add("new")}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_cnt_cod_segment_ad
+    AFTER DELETE ON cod_segment BEGIN
+        {_sub("old")}
+    END
+    """,
+)
+
+_RESYNC = (
+    f"DELETE FROM {BY_CODE_TABLE}",
+    f"DELETE FROM {BY_SOURCE_TABLE}",
+    f"DELETE FROM {BY_CODE_SOURCE_TABLE}",
+    f"""
+    INSERT INTO {BY_CODE_SOURCE_TABLE}(cid, fid, n)
+    SELECT cid, fid, COUNT(*) FROM cod_segment GROUP BY cid, fid
+    """,
+    f"""
+    INSERT INTO {BY_CODE_TABLE}(cid, n)
+    SELECT cid, SUM(n) FROM {BY_CODE_SOURCE_TABLE} GROUP BY cid
+    """,
+    f"""
+    INSERT INTO {BY_SOURCE_TABLE}(fid, n)
+    SELECT fid, SUM(n) FROM {BY_CODE_SOURCE_TABLE} GROUP BY fid
+    """,
+)
+
+
+def create_segment_counts(connection: Connection) -> None:
+    """
+    Create the segment count tables and the triggers maintaining them.
+
+    Idempotent. When a table or trigger is missing the counts are rebuilt
+    from cod_segment once; otherwise this is a cheap catalog check.
+
+    Args:
+        connection: SQLAlchemy connection with the coding tables created
+    """
+    names = (*COUNT_TABLES, *_TRIGGERS)
+    existing = {
+        row.name
+        for row in connection.execute(
+            text(
+                "SELECT name FROM sqlite_master "
+                "WHERE type IN ('table', 'trigger') AND name IN "
+                f"({', '.join(repr(n) for n in names)})"
+            )
+        )
+    }
+    if existing.issuperset(names):
+        return
+
+    logger.info("create_segment_counts: rebuilding segment counts")
+    for statement in _DDL:
+        connection.execute(text(statement))
+    for statement in _RESYNC:
+        connection.execute(text(statement))
+
+
+def drop_segment_counts(connection: Connection) -> None:
+    """Drop the segment count tables and triggers (for testing)."""
+    for trigger in _TRIGGERS:
+        connection.execute(text(f"DROP TRIGGER IF EXISTS {trigger}"))
+    for table in COUNT_TABLES:
+        connection.execute(text(f"DROP TABLE IF EXISTS {table}"))
+
+
+def count_for_code(connection: Connection, code_id: str) -> int:
+    """Segments coded with ``code_id``."""
+    return (
+        connection.execute(
+            text(f"SELECT n FROM {BY_CODE_TABLE} WHERE cid = :cid"), {"cid": code_id}
+        ).scalar()
+        or 0
+    )
+
+
+def count_for_source(connection: Connection, source_id: str) -> int:
+    """Segments on ``source_id``."""
+    return (
+        connection.execute(
+            text(f"SELECT n FROM {BY_SOURCE_TABLE} WHERE fid = :fid"),
+            {"fid": source_id},
+        ).scalar()
+        or 0
+    )
+
+
+def count_for_code_and_source(
+    connection: Connection, code_id: str, source_id: str
+) -> int:
+    """Segments on ``source_id`` coded with ``code_id``."""
+    return (
+        connection.execute(
+            text(
+                f"SELECT n FROM {BY_CODE_SOURCE_TABLE} WHERE cid = :cid AND fid = :fid"
+            ),
+            {"cid": code_id, "fid": source_id},
+        ).scalar()
+        or 0
+    )
+
+
+def counts_by_code(connection: Connection) -> dict[str, int]:
+    """Segment counts for every code that has segments."""
+    rows = connection.execute(text(f"SELECT cid, n FROM {BY_CODE_TABLE}"))
+    return {row.cid: row.n for row in rows}
+
+
+def counts_by_source(connection: Connection) -> dict[str, int]:
+    """Segment counts for every source that has segments."""
+    rows = connection.execute(text(f"SELECT fid, n FROM {BY_SOURCE_TABLE}"))
+    return {row.fid: row.n for row in rows}
+
+
+def total_segments(connection: Connection) -> int:
+    """All segments in the project (one row per code, not per segment)."""
+    return connection.execute(text(f"SELECT SUM(n) FROM {BY_CODE_TABLE}")).scalar() or 0
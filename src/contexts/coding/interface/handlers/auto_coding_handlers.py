@@ -116,7 +116,7 @@ def handle_suggest_codes_for_range(
     if source_id is None or start_pos is None or end_pos is None:
         return missing_params_error("SUGGEST_CODES_RANGE")
 
-    codes = ctx.code_repo.get_all() if ctx.code_repo else []
+    codes = ctx.get_all_codes()
     source_text = ctx.get_source_text(source_id)
     text_excerpt = source_text[int(start_pos) : int(end_pos)]
     text_lower = text_excerpt.lower()
@@ -192,7 +192,7 @@ def handle_auto_suggest_codes(
         if source is None:
             return not_found_error("AUTO_SUGGEST", "Source", str(source_id))
 
-    codes = ctx.code_repo.get_all() if ctx.code_repo else []
+    codes = ctx.get_all_codes()
     batch_id = CodingSuggestionBatchId.new()
 
     if not codes:
@@ -9,7 +9,12 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 
-from src.contexts.coding.core.commandHandlers import apply_code
+from src.contexts.coding.core.commandHandlers import (
+    apply_code,
+    get_all_categories,
+    get_all_codes,
+    get_code,
+)
 from src.contexts.coding.core.commandHandlers._state import (
     CategoryRepository,
     CodeRepository,
@@ -21,6 +26,8 @@ from src.shared.common.types import SourceId
 
 if TYPE_CHECKING:
     from src.contexts.coding.core.ai_entities import CodingSuggestion
+    from src.contexts.coding.core.entities import Category, Code
+    from src.contexts.coding.infra.codebook_read_model import CodebookReadModel
     from src.contexts.coding.infra.suggestion_cache import SuggestionCache
     from src.shared.infra.event_bus import EventBus
     from src.shared.infra.session import Session
@@ -76,6 +83,10 @@ class HandlerContext:
     def segment_repo(self) -> SegmentRepository | None:
         return self._coding_context.segment_repo if self._coding_context else None
 
+    @property
+    def codebook(self) -> CodebookReadModel | None:
+        return getattr(self._coding_context, "codebook", None)
+
     @property
     def event_bus(self) -> EventBus:
         return self._ctx.event_bus
@@ -89,14 +100,43 @@ class HandlerContext:
         sources_ctx = getattr(self._ctx, "sources_context", None)
         return sources_ctx.source_repo if sources_ctx else None
 
+    @property
+    def source_content_provider(self):
+        sources_ctx = getattr(self._ctx, "sources_context", None)
+        return getattr(sources_ctx, "content_provider", None) if sources_ctx else None
+
     @property
     def suggestion_cache(self) -> SuggestionCache:
         return self._suggestion_cache
 
+    def get_all_codes(self) -> list[Code]:
+        """All codes, from the codebook read model when it is loaded."""
+        codebook = self.codebook
+        if codebook is not None and codebook.is_loaded:
+            return codebook.get_all_codes()
+        return get_all_codes(self.code_repo) if self.code_repo else []
+
+    def get_code(self, code_id: Any) -> Code | None:
+        """A single code, from the codebook read model when it is loaded."""
+        codebook = self.codebook
+        if codebook is not None and codebook.is_loaded:
+            return codebook.get_code(code_id)
+        return get_code(self.code_repo, code_id) if self.code_repo else None
+
+    def get_all_categories(self) -> list[Category]:
+        """All categories, from the codebook read model when it is loaded."""
+        codebook = self.codebook
+        if codebook is not None and codebook.is_loaded:
+            return codebook.get_all_categories()
+        return get_all_categories(self.category_repo) if self.category_repo else []
+
     def get_source_text(self, source_id: int) -> str:
         """Retrieve the full text of a source, or empty string if unavailable."""
         if self.source_repo is None:
             return ""
+        provider = self.source_content_provider
+        if provider is not None:
+            return provider.get_content(SourceId(str(source_id))) or ""
         source = self.source_repo.get_by_id(SourceId(source_id))
         return source.fulltext if source and source.fulltext else ""
 
@@ -119,6 +159,7 @@ class HandlerContext:
             category_repo=self.category_repo,
             segment_repo=self.segment_repo,
             event_bus=self.event_bus,
+            source_content_provider=self.source_content_provider,
             session=self.session,
         )
 
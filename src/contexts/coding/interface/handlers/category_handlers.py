@@ -14,7 +14,6 @@ from typing import Any
 from src.contexts.coding.core.commandHandlers import (
     create_category,
     delete_code,
-    get_all_categories,
     merge_codes,
     move_code_to_category,
     rename_code,
@@ -304,14 +303,12 @@ def handle_list_categories(
     if ctx.category_repo is None:
         return no_context_error("LIST_CATEGORIES")
 
-    categories = get_all_categories(ctx.category_repo)
+    categories = ctx.get_all_categories()
 
     # Count codes per category
     code_counts: dict[str, int] = {}
     if ctx.code_repo is not None:
-        from src.contexts.coding.core.commandHandlers import get_all_codes
-
-        codes = get_all_codes(ctx.code_repo)
+        codes = ctx.get_all_codes()
         for code in codes:
             if code.category_id:
                 cat_id = code.category_id.value
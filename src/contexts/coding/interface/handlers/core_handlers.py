@@ -14,8 +14,6 @@ from typing import Any
 from src.contexts.coding.core.commandHandlers import (
     batch_apply_codes,
     create_code,
-    get_all_codes,
-    get_code,
     get_segments_for_source,
     remove_segment,
 )
@@ -111,6 +109,7 @@ def handle_batch_apply_codes(
         category_repo=ctx.category_repo,
         segment_repo=ctx.segment_repo,
         event_bus=ctx.event_bus,
+        source_content_provider=ctx.source_content_provider,
         session=ctx.session,
     )
 
@@ -146,7 +145,7 @@ def handle_list_codes(
     if ctx.code_repo is None:
         return no_context_error("CODES_NOT_LISTED")
 
-    codes = get_all_codes(ctx.code_repo)
+    codes = ctx.get_all_codes()
     return OperationResult.ok(data=[_serialize_code(c) for c in codes]).to_dict()
 
 
@@ -162,7 +161,7 @@ def handle_get_code(
     if ctx.code_repo is None:
         return no_context_error("CODE_NOT_FOUND")
 
-    code = get_code(ctx.code_repo, str(code_id))
+    code = ctx.get_code(str(code_id))
     if code is None:
         return not_found_error("CODE_NOT_FOUND", "Code", str(code_id))
 
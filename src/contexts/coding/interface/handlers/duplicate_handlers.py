@@ -65,7 +65,7 @@ def handle_detect_duplicate_codes(
     if ctx.code_repo is None:
         return no_context_error("DETECT_DUPLICATES")
 
-    codes = ctx.code_repo.get_all()
+    codes = ctx.get_all_codes()
     candidates = []
 
     for i, code_a in enumerate(codes):
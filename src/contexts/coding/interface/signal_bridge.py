@@ -17,6 +17,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from typing import TYPE_CHECKING
 
 from PySide6.QtCore import Signal
 
@@ -30,10 +31,14 @@ from src.contexts.coding.core.events import (
     CodeRenamed,
     CodesMerged,
     SegmentCoded,
+    SegmentsCoded,
     SegmentUncoded,
 )
 from src.shared.infra.signal_bridge.base import BaseSignalBridge, EventConverter
 
+if TYPE_CHECKING:
+    from src.contexts.exchange.core.events import RefiQdaImported, RqdaImported
+
 # =============================================================================
 # Payloads - Data transferred via signals
 # =============================================================================
@@ -91,6 +96,37 @@ class SegmentPayload:
     is_ai_action: bool = False
 
 
+@dataclass(frozen=True)
+class SegmentBatchPayload:
+    """Payload for a batch of segments coded at once."""
+
+    event_type: str
+    segments: tuple[SegmentPayload, ...]
+    source_ids: tuple[int, ...]
+    code_ids: tuple[int, ...]
+    timestamp: datetime = field(default_factory=_now)
+    session_id: str = "local"
+    is_ai_action: bool = False
+
+    @property
+    def count(self) -> int:
+        return len(self.segments)
+
+
+@dataclass(frozen=True)
+class ProjectImportedPayload:
+    """Payload for a project imported from another tool (REFI-QDA, RQDA)."""
+
+    event_type: str
+    source_path: str
+    codes_created: int
+    sources_created: int
+    segments_created: int
+    timestamp: datetime = field(default_factory=_now)
+    session_id: str = "local"
+    is_ai_action: bool = False
+
+
 # =============================================================================
 # Event Converters
 # =============================================================================
@@ -218,6 +254,21 @@ class SegmentCodedConverter(EventConverter[SegmentCoded, SegmentPayload]):
         )
 
 
+class SegmentsCodedConverter(EventConverter[SegmentsCoded, SegmentBatchPayload]):
+    """Convert SegmentsCoded event to one SegmentBatchPayload for the batch."""
+
+    def __init__(self) -> None:
+        self._segment_converter = SegmentCodedConverter()
+
+    def convert(self, event: SegmentsCoded) -> SegmentBatchPayload:
+        return SegmentBatchPayload(
+            event_type="segments_coded",
+            segments=tuple(self._segment_converter.convert(s) for s in event.segments),
+            source_ids=tuple(_extract_int(s) for s in event.source_ids),
+            code_ids=tuple(_extract_int(c) for c in event.code_ids),
+        )
+
+
 class SegmentUncodedConverter(EventConverter[SegmentUncoded, SegmentPayload]):
     """Convert SegmentUncoded event to SegmentPayload."""
 
@@ -232,6 +283,21 @@ class SegmentUncodedConverter(EventConverter[SegmentUncoded, SegmentPayload]):
         )
 
 
+class ProjectImportedConverter(
+    EventConverter["RefiQdaImported | RqdaImported", ProjectImportedPayload]
+):
+    """Convert a REFI-QDA or RQDA import summary to ProjectImportedPayload."""
+
+    def convert(self, event: RefiQdaImported | RqdaImported) -> ProjectImportedPayload:
+        return ProjectImportedPayload(
+            event_type="project_imported",
+            source_path=event.source_path,
+            codes_created=event.codes_created,
+            sources_created=event.sources_created,
+            segments_created=event.segments_created,
+        )
+
+
 # =============================================================================
 # Coding Signal Bridge
 # =============================================================================
@@ -259,8 +325,12 @@ class CodingSignalBridge(BaseSignalBridge):
 
     # Segment signals
     segment_coded = Signal(object)
+    segments_coded = Signal(object)
     segment_uncoded = Signal(object)
 
+    # Import signals (codes and segments written without per-row events)
+    project_imported = Signal(object)
+
     def _get_context_name(self) -> str:
         """Return the context name for activity logging."""
         return "coding"
@@ -317,8 +387,25 @@ class CodingSignalBridge(BaseSignalBridge):
             SegmentCodedConverter(),
             "segment_coded",
         )
+        self.register_converter(
+            "coding.segments_coded",
+            SegmentsCodedConverter(),
+            "segments_coded",
+        )
         self.register_converter(
             "coding.segment_uncoded",
             SegmentUncodedConverter(),
             "segment_uncoded",
         )
+
+        # Import events
+        self.register_converter(
+            "exchange.refi_qda_imported",
+            ProjectImportedConverter(),
+            "project_imported",
+        )
+        self.register_converter(
+            "exchange.rqda_imported",
+            ProjectImportedConverter(),
+            "project_imported",
+        )
@@ -112,9 +112,26 @@ class MockSegmentRepository:
     def get_by_code(self, code_id: CodeId) -> list[TextSegment]:
         return [s for s in self._segments.values() if s.code_id == code_id]
 
+    def get_overlapping(
+        self, source_id: SourceId, code_id: CodeId, start: int, end: int
+    ) -> list[TextSegment]:
+        return [
+            s
+            for s in self._segments.values()
+            if s.source_id == source_id
+            and s.code_id == code_id
+            and s.position.start < end
+            and start < s.position.end
+        ]
+
     def save(self, segment: TextSegment) -> None:
         self._segments[segment.id.value] = segment
 
+    def save_many(self, segments: list[TextSegment]) -> int:
+        for segment in segments:
+            self.save(segment)
+        return len(segments)
+
     def delete(self, segment_id: SegmentId) -> None:
         self._segments.pop(segment_id.value, None)
 
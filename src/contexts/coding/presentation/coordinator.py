@@ -7,7 +7,7 @@ Implements the CodingProvider protocol expected by TextCodingViewModel.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from src.contexts.coding.core.commandHandlers import (
     apply_code,
@@ -38,6 +38,7 @@ from src.shared.common.operation_result import OperationResult
 
 if TYPE_CHECKING:
     from src.contexts.coding.core.entities import Category, Code, TextSegment
+    from src.contexts.coding.infra.codebook_read_model import CodebookReadModel
     from src.contexts.coding.infra.repositories import (
         SQLiteCategoryRepository,
         SQLiteCodeRepository,
@@ -52,7 +53,8 @@ class CodingCoordinator:
     Coordinator for coding operations.
 
     Provides a stateful interface over functional command handlers.
-    Holds references to repositories and event bus.
+    Holds references to repositories and event bus. Codebook queries are
+    served from the project's CodebookReadModel when one is provided.
 
     This class implements the CodingProvider protocol expected by TextCodingViewModel.
     """
@@ -64,12 +66,16 @@ class CodingCoordinator:
         segment_repo: SQLiteSegmentRepository,
         event_bus: EventBus,
         session: Session | None = None,
+        source_content_provider: Any | None = None,
+        codebook: CodebookReadModel | None = None,
     ) -> None:
         self._code_repo = code_repo
         self._category_repo = category_repo
         self._segment_repo = segment_repo
         self._event_bus = event_bus
         self._session = session
+        self._source_content_provider = source_content_provider
+        self._codebook = codebook
 
     def _dispatch(self, handler, command) -> OperationResult:
         """Dispatch a command to a handler with all standard dependencies."""
@@ -110,7 +116,15 @@ class CodingCoordinator:
 
     def apply_code(self, command: ApplyCodeCommand) -> OperationResult:
         """Apply a code to a text segment."""
-        return self._dispatch(apply_code, command)
+        return apply_code(
+            command,
+            self._code_repo,
+            self._category_repo,
+            self._segment_repo,
+            self._event_bus,
+            source_content_provider=self._source_content_provider,
+            session=self._session,
+        )
 
     def remove_segment(self, command: RemoveCodeCommand) -> OperationResult:
         """Remove coding from a segment."""
@@ -126,14 +140,20 @@ class CodingCoordinator:
 
     def get_all_codes(self) -> list[Code]:
         """Get all codes."""
+        if self._codebook is not None:
+            return self._codebook.get_all_codes()
         return get_all_codes(self._code_repo)
 
     def get_code(self, code_id: int) -> Code | None:
         """Get a specific code by ID."""
+        if self._codebook is not None:
+            return self._codebook.get_code(code_id)
         return get_code(self._code_repo, code_id)
 
     def get_all_categories(self) -> list[Category]:
         """Get all categories."""
+        if self._codebook is not None:
+            return self._codebook.get_all_categories()
         return get_all_categories(self._category_repo)
 
     def get_segments_for_source(self, source_id: int) -> list[TextSegment]:
@@ -151,4 +171,6 @@ class CodingCoordinator:
         Returns:
             Dictionary mapping code_id to segment count
         """
+        if self._codebook is not None:
+            return self._codebook.segment_counts()
         return self._segment_repo.count_all_by_code()
@@ -34,9 +34,11 @@ Structure:
 └────────────┴─────────────────────────────────┴──────────────┘
 """
 
+from __future__ import annotations
+
 import logging
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from PySide6.QtCore import Qt, Signal
 from PySide6.QtGui import QKeySequence, QShortcut
@@ -52,6 +54,9 @@ from ..dialogs.auto_code_dialog import AutoCodeDialog
 from ..pages import TextCodingPage
 from ..viewmodels import AICodingViewModel, TextCodingViewModel
 
+if TYPE_CHECKING:
+    from src.contexts.sources.infra.speaker_index import SpeakerTurnIndex
+
 logger = logging.getLogger("qualcoder.coding.presentation")
 
 # Mapping from string identifiers to domain enums (used by auto-coding dialog wiring)
@@ -270,6 +275,9 @@ class TextCodingScreen(QWidget):
         # Connect viewmodel signals to screen
         self._viewmodel.codes_changed.connect(self._on_viewmodel_codes_changed)
         self._viewmodel.segments_changed.connect(self._on_viewmodel_segments_changed)
+        self._viewmodel.segment_added.connect(self._on_viewmodel_segment_added)
+        self._viewmodel.segment_removed.connect(self._on_viewmodel_segment_removed)
+        self._viewmodel.code_recolored.connect(self._on_viewmodel_code_recolored)
 
     def _disconnect_viewmodel_signals(self):
         """Disconnect from previous viewmodel signals."""
@@ -280,6 +288,9 @@ class TextCodingScreen(QWidget):
         self.code_removed.disconnect(self._on_code_removed_from_viewmodel)
         self._viewmodel.codes_changed.disconnect(self._on_viewmodel_codes_changed)
         self._viewmodel.segments_changed.disconnect(self._on_viewmodel_segments_changed)
+        self._viewmodel.segment_added.disconnect(self._on_viewmodel_segment_added)
+        self._viewmodel.segment_removed.disconnect(self._on_viewmodel_segment_removed)
+        self._viewmodel.code_recolored.disconnect(self._on_viewmodel_code_recolored)
 
     def _on_code_applied_to_viewmodel(self, code_id: str, start: int, end: int):
         """Route code_applied signal to viewmodel."""
@@ -326,6 +337,18 @@ class TextCodingScreen(QWidget):
         # Use batch method for efficiency (avoids O(n²) overlap checks per highlight)
         self._page.editor_panel.set_highlights(segments)
 
+    def _on_viewmodel_segment_added(self, segment: dict):
+        """Handle segment_added from viewmodel - highlight just that segment."""
+        self._page.editor_panel.add_segment(segment)
+
+    def _on_viewmodel_segment_removed(self, segment_id: str):
+        """Handle segment_removed from viewmodel - repaint just its range."""
+        self._page.editor_panel.remove_segment(segment_id)
+
+    def _on_viewmodel_code_recolored(self, code_id: str, color: str):
+        """Handle code_recolored from viewmodel - repaint that code's segments."""
+        self._page.editor_panel.recolor_code(code_id, color)
+
     def set_current_source(self, source_id: int):
         """
         Set the current source document ID.
@@ -471,6 +494,18 @@ class TextCodingScreen(QWidget):
         data = viewmodel.load_initial_data()
         self.load_data(data)
 
+    def set_speaker_index(self, speaker_index: SpeakerTurnIndex | None):
+        """
+        Set the speaker turn index of the open project.
+
+        Speaker detection then reads the stored turns of the current source
+        instead of scanning its text each time.
+
+        Args:
+            speaker_index: The project's speaker turn index, or None
+        """
+        self._auto_coding_controller.set_speaker_index(speaker_index)
+
     # =========================================================================
     # Keyboard Shortcuts Setup (QC-007.10)
     # =========================================================================
@@ -700,8 +735,13 @@ class TextCodingScreen(QWidget):
         end: int,
     ):
         """Internal method to apply a code to a range."""
-        # Apply highlight to editor (AC #10)
-        if self._page and hasattr(self._page, "editor_panel"):
+        # Apply highlight to editor (AC #10); with a viewmodel the saved
+        # segment is painted once by its segment_added signal
+        if (
+            self._viewmodel is None
+            and self._page
+            and hasattr(self._page, "editor_panel")
+        ):
             self._page.editor_panel.highlight_range(start, end, code_color)
 
         # Update code count (AC #7)
@@ -1352,7 +1392,9 @@ class TextCodingScreen(QWidget):
             return
 
         # Use controller to detect speakers
-        result = self._auto_coding_controller.detect_speakers(document_text)
+        result = self._auto_coding_controller.detect_speakers(
+            document_text, self._source_id
+        )
 
         if isinstance(result, Success):
             speakers = result.unwrap()
@@ -1382,7 +1424,7 @@ class TextCodingScreen(QWidget):
 
                 # Get segments for this speaker
                 segments_result = self._auto_coding_controller.get_speaker_segments(
-                    document_text, speaker.name
+                    document_text, speaker.name, self._source_id
                 )
 
                 if isinstance(segments_result, Success):
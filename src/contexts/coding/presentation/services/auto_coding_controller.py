@@ -5,6 +5,10 @@ This provides a NoOp implementation of the AutoCodingController interface
 to allow the presentation layer to function while the broader refactoring
 moves this functionality to proper command handlers.
 
+Speaker detection is real: with a SpeakerTurnIndex and the source ID,
+turns are read from the project (scanning only text not seen before);
+without them the text is scanned on each call.
+
 TODO: Replace with proper fDDD command handler implementation.
 """
 
@@ -15,8 +19,12 @@ from typing import TYPE_CHECKING
 
 from returns.result import Failure, Result, Success
 
+from src.contexts.sources.core.services.speaker_detector import SpeakerDetector
+from src.shared.common.types import SourceId
+
 if TYPE_CHECKING:
     from src.contexts.coding.core.services.text_matcher import MatchScope, MatchType
+    from src.contexts.sources.infra.speaker_index import SpeakerTurnIndex
 
 
 @dataclass
@@ -51,21 +59,40 @@ class AutoCodingController:
     This is a temporary implementation that allows the presentation layer
     to function without errors while the broader refactoring is in progress.
 
-    All methods return empty results or default values.
+    Methods other than matching and speaker detection return empty
+    results or default values.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, speaker_index: SpeakerTurnIndex | None = None) -> None:
         self._undo_stack: list[Batch] = []
-
-    def detect_speakers(self, _text: str) -> Result[list[Speaker], str]:
-        """Detect speaker patterns in text. Returns empty list (stub)."""
-        return Success([])
+        self._speaker_index = speaker_index
+
+    def set_speaker_index(self, speaker_index: SpeakerTurnIndex | None) -> None:
+        """Use the stored speaker turns of the open project (None to scan)."""
+        self._speaker_index = speaker_index
+
+    def detect_speakers(
+        self, text: str, source_id: int | str | None = None
+    ) -> Result[list[Speaker], str]:
+        """Detect speakers in text, with the number of turns of each."""
+        return Success(
+            [
+                Speaker(name=s.name, count=s.count)
+                for s in self._detector(text, source_id).detect_speakers()
+            ]
+        )
 
     def get_speaker_segments(
-        self, _text: str, _speaker_name: str
+        self, text: str, speaker_name: str, source_id: int | str | None = None
     ) -> Result[list[TextMatch], str]:
-        """Get segments for a speaker. Returns empty list (stub)."""
-        return Success([])
+        """Get the turns of a speaker as text ranges."""
+        return Success(
+            [
+                TextMatch(start=turn.start, end=turn.end)
+                for turn in self._detector(text, source_id).turns()
+                if turn.speaker == speaker_name
+            ]
+        )
 
     def can_undo(self) -> bool:
         """Check if undo is available. Always False (stub)."""
@@ -106,6 +133,13 @@ class AutoCodingController:
 
         return Success(matches)
 
+    def _detector(self, text: str, source_id: int | str | None) -> SpeakerDetector:
+        """Detector for text, backed by the source's stored turns if known."""
+        if self._speaker_index is None or not source_id:
+            return SpeakerDetector(text)
+        turns = self._speaker_index.turns(SourceId(value=str(source_id)), text)
+        return SpeakerDetector(text, turns=turns)
+
 
 __all__ = [
     "AutoCodingController",
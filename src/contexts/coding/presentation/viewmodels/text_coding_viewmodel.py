@@ -30,8 +30,11 @@ from src.contexts.coding.interface.signal_bridge import (
     CategoryPayload,
     CodePayload,
     CodingSignalBridge,
+    ProjectImportedPayload,
+    SegmentBatchPayload,
     SegmentPayload,
 )
+from src.shared.common.interval_index import IntervalIndex
 from src.shared.infra.telemetry import traced
 from src.shared.presentation.dto import (
     CodeCategoryDTO,
@@ -59,6 +62,7 @@ class CodingProvider(Protocol):
     def apply_code(self, command: ApplyCodeCommand) -> OperationResult: ...
     def remove_segment(self, command: RemoveCodeCommand) -> OperationResult: ...
     def create_category(self, command: CreateCategoryCommand) -> OperationResult: ...
+    def get_code(self, code_id: int) -> Code | None: ...
     def get_all_codes(self) -> list: ...
     def get_all_categories(self) -> list: ...
     def get_segments_for_source(self, source_id: int) -> list: ...
@@ -79,6 +83,12 @@ class TextCodingViewModel(QObject):
         data_changed: Emitted when any data changes, with full DTO
         codes_changed: Emitted when codes list changes
         segments_changed: Emitted when segments change for current source
+        segment_added: Emitted with the highlight info of one segment coded
+            on the current source
+        segment_removed: Emitted with the ID of a segment uncoded on the
+            current source
+        code_recolored: Emitted with (code_id, hex color) when a code's
+            color changes
         code_selected: Emitted when a code is selected
         error_occurred: Emitted when an operation fails
     """
@@ -86,6 +96,9 @@ class TextCodingViewModel(QObject):
     data_changed = Signal(object)  # TextCodingDataDTO
     codes_changed = Signal(list)  # list[CodeCategoryDTO]
     segments_changed = Signal(list)  # list of segment info
+    segment_added = Signal(dict)  # segment info
+    segment_removed = Signal(str)  # segment_id
+    code_recolored = Signal(str, str)  # code_id, color
     code_selection_changed = Signal(object)  # SelectedCodeDTO
     error_occurred = Signal(str)
 
@@ -111,6 +124,10 @@ class TextCodingViewModel(QObject):
         self._current_source_id: int | None = None
         self._selected_code_id: int | None = None
 
+        # Interval index of the last loaded source's segments (position lookups)
+        self._indexed_source_id: int | None = None
+        self._segment_index: IntervalIndex[TextSegment] | None = None
+
         # Connect to signal bridge
         self._connect_signals()
 
@@ -126,7 +143,9 @@ class TextCodingViewModel(QObject):
         self._signal_bridge.category_created.connect(self._on_category_created)
         self._signal_bridge.category_deleted.connect(self._on_category_deleted)
         self._signal_bridge.segment_coded.connect(self._on_segment_coded)
+        self._signal_bridge.segments_coded.connect(self._on_segments_coded)
         self._signal_bridge.segment_uncoded.connect(self._on_segment_uncoded)
+        self._signal_bridge.project_imported.connect(self._on_project_imported)
 
     def teardown(self) -> None:
         """Disconnect all signal bridge connections. Call before replacing this ViewModel."""
@@ -140,7 +159,9 @@ class TextCodingViewModel(QObject):
         self._signal_bridge.category_created.disconnect(self._on_category_created)
         self._signal_bridge.category_deleted.disconnect(self._on_category_deleted)
         self._signal_bridge.segment_coded.disconnect(self._on_segment_coded)
+        self._signal_bridge.segments_coded.disconnect(self._on_segments_coded)
         self._signal_bridge.segment_uncoded.disconnect(self._on_segment_uncoded)
+        self._signal_bridge.project_imported.disconnect(self._on_project_imported)
 
     # =========================================================================
     # Public API - Load Data
@@ -189,6 +210,7 @@ class TextCodingViewModel(QObject):
         """
         self._current_source_id = source_id
         segments = self._controller.get_segments_for_source(source_id)
+        self._index_segments(source_id, segments)
         return self._segments_to_highlight_info(segments)
 
     def set_current_source(self, source_id: int) -> None:
@@ -332,14 +354,11 @@ class TextCodingViewModel(QObject):
         Returns:
             Segment ID if found, None otherwise
         """
-        segments = self._controller.get_segments_for_source(source_id)
-        for seg in segments:
-            # Check if segment overlaps with the query range
-            seg_start = seg.position.start
-            seg_end = seg.position.end
-            if seg_start < end and start < seg_end:
-                return seg.id.value
-        return None
+        if self._indexed_source_id != source_id or self._segment_index is None:
+            segments = self._controller.get_segments_for_source(source_id)
+            self._index_segments(source_id, segments)
+        hits = self._segment_index.overlapping(start, end)
+        return hits[0].id.value if hits else None
 
     # =========================================================================
     # Signal Handlers - React to domain events
@@ -362,9 +381,13 @@ class TextCodingViewModel(QObject):
     def _on_code_color_changed(self, payload: CodePayload) -> None:
         """Handle code color changed event."""
         self._refresh_codes_and_selection(payload)
+        code = self._controller.get_code(payload.code_id)
+        if code is not None:
+            self.code_recolored.emit(code.id.value, code.color.to_hex())
 
     def _on_code_deleted(self, payload: CodePayload) -> None:
         """Handle code deleted event."""
+        self._invalidate_segment_index()  # its segments may have been deleted
         self._emit_codes_changed()
         if self._selected_code_id == payload.code_id:
             self._selected_code_id = None
@@ -380,6 +403,7 @@ class TextCodingViewModel(QObject):
 
     def _on_codes_merged(self, _payload) -> None:
         """Handle codes merged event."""
+        self._invalidate_segment_index()
         self._emit_codes_changed()
         self._emit_segments_changed()
 
@@ -392,14 +416,29 @@ class TextCodingViewModel(QObject):
         self._emit_codes_changed()
 
     def _on_segment_coded(self, payload: SegmentPayload) -> None:
-        """Handle segment coded event."""
+        """Handle segment coded event with an update for that segment only."""
+        self._invalidate_segment_index(payload.source_id)
         if self._current_source_id == payload.source_id:
+            self.segment_added.emit(self._payload_to_highlight_info(payload))
+
+    def _on_segments_coded(self, payload: SegmentBatchPayload) -> None:
+        """Handle a coded batch with a single refresh of the current source."""
+        for source_id in payload.source_ids:
+            self._invalidate_segment_index(source_id)
+        if self._current_source_id in payload.source_ids:
             self._emit_segments_changed()
 
     def _on_segment_uncoded(self, payload: SegmentPayload) -> None:
-        """Handle segment uncoded event."""
+        """Handle segment uncoded event with an update for that segment only."""
+        self._invalidate_segment_index(payload.source_id)
         if self._current_source_id == payload.source_id:
-            self._emit_segments_changed()
+            self.segment_removed.emit(payload.segment_id)
+
+    def _on_project_imported(self, _payload: ProjectImportedPayload) -> None:
+        """Handle a project import, which publishes no per-row events."""
+        self._invalidate_segment_index()
+        self._emit_codes_changed()
+        self._emit_segments_changed()
 
     # =========================================================================
     # Private Helpers
@@ -414,9 +453,22 @@ class TextCodingViewModel(QObject):
         """Emit segments_changed for current source."""
         if self._current_source_id is not None:
             segments = self._controller.get_segments_for_source(self._current_source_id)
+            self._index_segments(self._current_source_id, segments)
             info = self._segments_to_highlight_info(segments)
             self.segments_changed.emit(info)
 
+    def _index_segments(self, source_id: int, segments: list[TextSegment]) -> None:
+        """Cache an interval index of a source's segments for position lookups."""
+        self._indexed_source_id = source_id
+        self._segment_index = IntervalIndex(
+            segments, lambda s: (s.position.start, s.position.end)
+        )
+
+    def _invalidate_segment_index(self, source_id: int | None = None) -> None:
+        """Drop the cached index (for one source, or unconditionally)."""
+        if source_id is None or source_id == self._indexed_source_id:
+            self._segment_index = None
+
     @traced("build_categories_dto")
     def _build_categories_dto(self) -> list[CodeCategoryDTO]:
         """Build category DTOs from current data."""
@@ -492,6 +544,7 @@ class TextCodingViewModel(QObject):
             result.append(
                 {
                     "id": seg.id.value,
+                    "code_id": seg.code_id.value,
                     "start": seg.position.start,
                     "end": seg.position.end,
                     "color": code.color.to_hex() if code else "#999999",
@@ -500,3 +553,16 @@ class TextCodingViewModel(QObject):
                 }
             )
         return result
+
+    def _payload_to_highlight_info(self, payload: SegmentPayload) -> dict:
+        """Highlight information for one coded segment (one code lookup)."""
+        code = self._controller.get_code(payload.code_id)
+        return {
+            "id": payload.segment_id,
+            "code_id": payload.code_id,
+            "start": payload.start_pos,
+            "end": payload.end_pos,
+            "color": code.color.to_hex() if code else "#999999",
+            "code_name": code.name if code else "Unknown",
+            "text": payload.text,
+        }
@@ -2,6 +2,10 @@
 Export REFI-QDA Use Case.
 
 Exports the full project as a REFI-QDA 1.0 .qdpx archive.
+
+The export is streamed: source texts are read from the repository in
+chunks and segments one page per source at a time, so memory does not
+grow with the size of the project.
 """
 
 from __future__ import annotations
@@ -11,20 +15,26 @@ from typing import TYPE_CHECKING
 
 from src.contexts.exchange.core.commands import ExportRefiQdaCommand
 from src.contexts.exchange.core.events import RefiQdaExported
-from src.contexts.exchange.infra.refi_qda_writer import write_refi_qda
+from src.contexts.exchange.infra.refi_qda_writer import RefiQdaWriter
 from src.shared.common.operation_result import OperationResult
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from src.contexts.coding.core.commandHandlers._state import (
         CategoryRepository,
         CodeRepository,
         SegmentRepository,
     )
     from src.contexts.sources.core.commandHandlers._state import SourceRepository
+    from src.shared.common.types import SourceId
     from src.shared.infra.event_bus import EventBus
 
 logger = logging.getLogger("qualcoder.exchange.core")
 
+# Characters of source text read from the repository at a time
+TEXT_CHUNK_CHARS = 1_000_000
+
 
 def export_refi_qda(
     command: ExportRefiQdaCommand,
@@ -37,30 +47,28 @@ def export_refi_qda(
     """
     Export full project as REFI-QDA .qdpx.
 
-    1. Load all data
-    2. Write QDPX archive
-    3. Publish event
+    1. Write the codebook
+    2. Stream each source's text into the archive
+    3. Stream each source's segments, page by page
+    4. Publish event
     """
     logger.debug("export_refi_qda: path=%s", command.output_path)
 
     codes = code_repo.get_all()
     categories = category_repo.get_all()
-    sources = source_repo.get_all()
-
-    # Collect all segments across all sources
-    all_segments = []
-    for source in sources:
-        all_segments.extend(segment_repo.get_by_source(source.id))
+    sources = source_repo.list_summaries()
 
+    segment_count = 0
     try:
-        write_refi_qda(
-            codes=codes,
-            categories=categories,
-            sources=sources,
-            segments=all_segments,
-            output_path=command.output_path,
-            project_name=command.project_name,
-        )
+        with RefiQdaWriter(command.output_path, command.project_name) as writer:
+            writer.write_codebook(codes, categories)
+            for source in sources:
+                writer.add_source(
+                    source.id, source.name, _text_chunks(source_repo, source.id)
+                )
+            for source in sources:
+                for page in segment_repo.iter_pages_by_source(source.id):
+                    segment_count += writer.add_codings(page)
     except OSError as e:
         logger.error("export_refi_qda I/O error: %s", e)
         return OperationResult.fail(
@@ -72,7 +80,7 @@ def export_refi_qda(
         output_path=command.output_path,
         code_count=len(codes),
         source_count=len(sources),
-        segment_count=len(all_segments),
+        segment_count=segment_count,
     )
     event_bus.publish(event)
 
@@ -80,8 +88,17 @@ def export_refi_qda(
         "REFI-QDA exported: %d codes, %d sources, %d segments to %s",
         len(codes),
         len(sources),
-        len(all_segments),
+        segment_count,
         command.output_path,
     )
 
     return OperationResult.ok(data=event)
+
+
+def _text_chunks(source_repo: SourceRepository, source_id: SourceId) -> Iterator[str]:
+    """A source's text in chunks of TEXT_CHUNK_CHARS, read as they are written."""
+    length = source_repo.get_length(source_id) or 0
+    for start in range(0, length, TEXT_CHUNK_CHARS):
+        chunk = source_repo.get_text_range(source_id, start, start + TEXT_CHUNK_CHARS)
+        if chunk:
+            yield chunk
@@ -1,8 +1,21 @@
 """
 Import REFI-QDA Use Case.
 
-Imports codes, sources, and codings from a REFI-QDA .qdpx archive
-by delegating to existing command handlers.
+Imports codes, sources, and codings from a REFI-QDA .qdpx archive.
+Categories and codes go through the create_category/create_code handlers;
+sources and codings are written directly with ``save_many``.
+
+The archive is read as a stream (see RefiQdaReader): sources are persisted
+in batches as they are parsed and each source text is released once its
+codings have been cut from it, so importing a multi-gigabyte archive never
+holds more than a batch of source texts in memory. The whole import is one
+transaction, rolled back if the archive is unreadable part way through or
+the import is cancelled.
+
+In bulk mode (``ImportRefiQdaCommand.bulk``) categories and codes are
+validated against the codebook once and written with ``save_many`` too, and
+only the RefiQdaImported summary is published instead of an event per code,
+source and segment.
 """
 
 from __future__ import annotations
@@ -13,25 +26,45 @@ import zipfile
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from src.contexts.coding.core.commandHandlers._state import build_code_state
 from src.contexts.coding.core.commandHandlers.create_category import create_category
 from src.contexts.coding.core.commandHandlers.create_code import create_code
 from src.contexts.coding.core.commands import (
     CreateCategoryCommand,
     CreateCodeCommand,
 )
-from src.contexts.coding.core.entities import Code, TextPosition, TextSegment
+from src.contexts.coding.core.derivers import (
+    derive_create_category,
+    derive_create_code,
+)
+from src.contexts.coding.core.entities import (
+    Category,
+    Code,
+    Color,
+    TextPosition,
+    TextSegment,
+)
 from src.contexts.coding.core.events import SegmentCoded
 from src.contexts.exchange.core.commands import ImportRefiQdaCommand
 from src.contexts.exchange.core.events import RefiQdaImported
 from src.contexts.exchange.core.failure_events import ImportFailed
-from src.contexts.exchange.infra.refi_qda_reader import read_refi_qda
+from src.contexts.exchange.infra.refi_qda_reader import (
+    ParsedCategory,
+    ParsedCode,
+    ParsedCoding,
+    ParsedSource,
+    RefiQdaReader,
+)
 from src.contexts.projects.core.events import SourceAdded
 from src.contexts.sources.core.entities import Source, SourceType
+from src.shared.common.failure_events import FailureEvent
 from src.shared.common.operation_result import OperationResult
-from src.shared.common.types import CodeId, SegmentId, SourceId
+from src.shared.common.types import CategoryId, CodeId, SegmentId, SourceId
 from src.shared.infra.metrics import metered_command
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from src.contexts.coding.core.commandHandlers._state import (
         CategoryRepository,
         CodeRepository,
@@ -43,6 +76,15 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("qualcoder.exchange.core")
 
+# Source text characters held before pending sources are written
+SOURCE_BATCH_CHARS = 8_000_000
+
+# Segments held before they are written
+SEGMENT_BATCH_SIZE = 10_000
+
+# Items parsed between progress reports (and cancellation checks)
+PROGRESS_EVERY = 1_000
+
 
 @metered_command("import_refi_qda")
 def import_refi_qda(
@@ -53,64 +95,190 @@ def import_refi_qda(
     segment_repo: SegmentRepository,
     event_bus: EventBus,
     session: Session | None = None,
+    on_progress: Callable[[int, int], None] | None = None,
+    is_cancelled: Callable[[], bool] | None = None,
 ) -> OperationResult:
     """
     Import a REFI-QDA project from a .qdpx archive.
 
-    1. Parse the archive
-    2. Create codes (via create_code handler)
-    3. Create sources
-    4. Create segments (codings)
-    5. Publish event
+    Items are handled in the order the archive lists them:
+    1. Create categories and codes (via create_category/create_code
+       handlers, or validated and batched in bulk mode)
+    2. Create sources, written in batches
+    3. Create segments (codings), cut from their source's text
+    4. Publish event (@metered_command commits the session)
+
+    Args:
+        on_progress: Called with (bytes of project.qde parsed, its size)
+            every PROGRESS_EVERY items and once when done
+        is_cancelled: Polled as often; when it returns True the import
+            stops and the session is rolled back
     """
     logger.debug("import_refi_qda: path=%s", command.source_path)
 
     source_path = Path(command.source_path)
     try:
-        parsed = read_refi_qda(source_path)
+        reader = RefiQdaReader(source_path)
     except FileNotFoundError:
         failure = ImportFailed.file_not_found(
             command.source_path, format_label="REFI_QDA"
         )
         event_bus.publish(failure)
         return OperationResult.from_failure(failure)
-    except (zipfile.BadZipFile, ET.ParseError) as e:
-        logger.error("Failed to parse QDPX: %s", e)
-        return OperationResult.fail(
-            error=f"Failed to parse QDPX file: {e}",
-            error_code="REFI_QDA_NOT_IMPORTED/PARSE_ERROR",
-        )
+    except zipfile.BadZipFile as e:
+        return _parse_failure(e)
+
+    importer = _StreamingImport(
+        source_repo=source_repo,
+        code_repo=code_repo,
+        category_repo=category_repo,
+        segment_repo=segment_repo,
+        event_bus=event_bus,
+        bulk=command.bulk,
+    )
+    with reader:
+        try:
+            for count, item in enumerate(reader.items(), start=1):
+                if isinstance(item, ParsedCategory):
+                    importer.add_category(item)
+                elif isinstance(item, ParsedCode):
+                    importer.add_code(item)
+                elif isinstance(item, ParsedSource):
+                    importer.add_source(item, reader.read_text(item))
+                elif isinstance(item, ParsedCoding):
+                    importer.add_coding(item)
+                # Cases are not imported
+                if count % PROGRESS_EVERY:
+                    continue
+                if on_progress is not None:
+                    on_progress(*reader.progress())
+                if is_cancelled is not None and is_cancelled():
+                    if session is not None:
+                        session.rollback()
+                    logger.info("import_refi_qda: cancelled after %d items", count)
+                    return OperationResult.fail(
+                        error="REFI-QDA import cancelled",
+                        error_code="REFI_QDA_NOT_IMPORTED/CANCELLED",
+                    )
+        except ET.ParseError as e:
+            # Batches already written are part of the same transaction
+            if session is not None:
+                session.rollback()
+            return _parse_failure(e)
+        _, qde_size = reader.progress()
+    importer.finish()
+    if on_progress is not None:
+        on_progress(qde_size, qde_size)
+
+    # 4. Publish event
+    event = RefiQdaImported.create(
+        source_path=command.source_path,
+        codes_created=importer.codes_created,
+        sources_created=importer.sources_created,
+        segments_created=importer.segments_created,
+    )
+    event_bus.publish(event)
+
+    logger.info(
+        "REFI-QDA imported: %d codes, %d sources, %d segments from %s",
+        importer.codes_created,
+        importer.sources_created,
+        importer.segments_created,
+        command.source_path,
+    )
+
+    return OperationResult.ok(data=event)
+
+
+def _parse_failure(error: Exception) -> OperationResult:
+    logger.error("Failed to parse QDPX: %s", error)
+    return OperationResult.fail(
+        error=f"Failed to parse QDPX file: {error}",
+        error_code="REFI_QDA_NOT_IMPORTED/PARSE_ERROR",
+    )
+
+
+class _StreamingImport:
+    """
+    Creates entities for parsed REFI-QDA items as they arrive.
+
+    Sources and segments are buffered and written with ``save_many`` once
+    ``SOURCE_BATCH_CHARS`` of text (or ``SEGMENT_BATCH_SIZE`` segments) is
+    pending. Only the text of the latest
+    source is kept: codings that follow it (its ``PlainTextSelection``s)
+    are cut from it directly, other codings are deferred and cut after the
+    stream ends, reading one stored source text at a time.
+
+    In bulk mode categories and codes are buffered as well, checked against
+    the codebook as it was before the import and against each other, and
+    no per-row events are published.
+    """
+
+    def __init__(
+        self,
+        source_repo: SourceRepository,
+        code_repo: CodeRepository,
+        category_repo: CategoryRepository,
+        segment_repo: SegmentRepository,
+        event_bus: EventBus,
+        bulk: bool = False,
+    ) -> None:
+        self._source_repo = source_repo
+        self._code_repo = code_repo
+        self._category_repo = category_repo
+        self._segment_repo = segment_repo
+        self._event_bus = event_bus
+        self._bulk = bulk
+
+        self.codes_created = 0
+        self.sources_created = 0
+        self.segments_created = 0
+
+        self._category_ids: dict[str, str] = {}
+        self._code_ids: dict[str, CodeId] = {}
+        self._code_names: dict[str, str] = {}
+        self._source_ids: dict[str, SourceId] = {}
+        self._source_names: dict[str, str] = {}
+
+        self._pending_sources: list[Source] = []
+        self._pending_chars = 0
+        self._pending_segments: list[tuple[TextSegment, ParsedCoding]] = []
+        self._deferred: dict[str, list[ParsedCoding]] = {}
+        self._current_guid: str | None = None
+        self._current_text = ""
 
-    # 1. Create categories (via create_category handler)
-    guid_to_category_id: dict[str, str] = {}
-    for parsed_cat in parsed.categories:
+        self._pending_categories: list[Category] = []
+        self._pending_codes: list[Code] = []
+        if bulk:
+            self._codebook = build_code_state(code_repo, category_repo)
+            self._taken_names: dict[str, set[str]] = {"category": set(), "code": set()}
+
+    # 1. Categories and codes (via create_category/create_code handlers)
+    # Note: The handlers get no session, so they do not commit each row and
+    # the import stays one transaction.
+
+    def add_category(self, parsed_cat: ParsedCategory) -> None:
+        if self._bulk:
+            self._add_category_bulk(parsed_cat)
+            return
         cat_result = create_category(
             command=CreateCategoryCommand(
                 name=parsed_cat.name,
                 memo=parsed_cat.memo,
             ),
-            code_repo=code_repo,
-            category_repo=category_repo,
-            segment_repo=segment_repo,
-            event_bus=event_bus,
-            session=session,
+            code_repo=self._code_repo,
+            category_repo=self._category_repo,
+            segment_repo=self._segment_repo,
+            event_bus=self._event_bus,
         )
         if cat_result.is_success:
-            guid_to_category_id[parsed_cat.guid] = cat_result.data.id.value
-
-    # 2. Create codes (via create_code handler)
-    guid_to_code_id: dict[str, CodeId] = {}
-    guid_to_code_name: dict[str, str] = {}
-    codes_created = 0
-
-    for parsed_code in parsed.codes:
-        category_id = None
-        if (
-            parsed_code.category_guid
-            and parsed_code.category_guid in guid_to_category_id
-        ):
-            category_id = guid_to_category_id[parsed_code.category_guid]
+            self._category_ids[parsed_cat.guid] = cat_result.data.id.value
 
+    def add_code(self, parsed_code: ParsedCode) -> None:
+        category_id = self._category_ids.get(parsed_code.category_guid or "")
+        if self._bulk:
+            self._add_code_bulk(parsed_code, category_id)
+            return
         result = create_code(
             command=CreateCodeCommand(
                 name=parsed_code.name,
@@ -118,104 +286,193 @@ def import_refi_qda(
                 memo=parsed_code.memo,
                 category_id=category_id,
             ),
-            code_repo=code_repo,
-            category_repo=category_repo,
-            segment_repo=segment_repo,
-            event_bus=event_bus,
-            session=session,
+            code_repo=self._code_repo,
+            category_repo=self._category_repo,
+            segment_repo=self._segment_repo,
+            event_bus=self._event_bus,
         )
-
         if result.is_success:
             code: Code = result.data
-            guid_to_code_id[parsed_code.guid] = code.id
-            guid_to_code_name[parsed_code.guid] = parsed_code.name
-            codes_created += 1
-
-    # 3. Create sources
-    # Note: We persist directly rather than delegating to add_text_source because
-    # that handler requires ProjectState and does uniqueness checks that are
-    # incompatible with bulk import. We publish SourceAdded events to keep the
-    # event log complete and trigger reactive UI updates.
-    guid_to_source_id: dict[str, SourceId] = {}
-    guid_to_source_name: dict[str, str] = {}
-    guid_to_fulltext: dict[str, str] = {}
-    sources_created = 0
-
-    for parsed_source in parsed.sources:
-        source_id = SourceId.new()
-        source = Source(
-            id=source_id,
-            name=parsed_source.name,
-            fulltext=parsed_source.fulltext,
-            source_type=SourceType.TEXT,
+            self._code_ids[parsed_code.guid] = code.id
+            self._code_names[parsed_code.guid] = parsed_code.name
+            self.codes_created += 1
+
+    def _add_category_bulk(self, parsed_cat: ParsedCategory) -> None:
+        event = derive_create_category(
+            name=parsed_cat.name,
+            parent_id=None,
+            memo=parsed_cat.memo,
+            owner=None,
+            state=self._codebook,
+        )
+        if isinstance(event, FailureEvent) or not self._take_name(
+            "category", parsed_cat.name
+        ):
+            logger.debug("import_refi_qda: category skipped: %s", parsed_cat.name)
+            return
+        self._pending_categories.append(
+            Category(id=event.category_id, name=event.name, memo=event.memo)
+        )
+        self._category_ids[parsed_cat.guid] = event.category_id.value
+
+    def _add_code_bulk(self, parsed_code: ParsedCode, category_id: str | None) -> None:
+        try:
+            color = Color.from_hex(parsed_code.color)
+        except ValueError:
+            logger.debug("import_refi_qda: invalid color for %s", parsed_code.name)
+            return
+        # The category is checked here: it may be pending, not yet in the state
+        event = derive_create_code(
+            name=parsed_code.name,
+            color=color,
+            memo=parsed_code.memo,
+            category_id=None,
+            owner=None,
+            state=self._codebook,
         )
-        source_repo.save(source)
-        event_bus.publish(
-            SourceAdded.create(
-                source_id=source_id,
+        if isinstance(event, FailureEvent) or not self._take_name(
+            "code", parsed_code.name
+        ):
+            logger.debug("import_refi_qda: code skipped: %s", parsed_code.name)
+            return
+        self._pending_codes.append(
+            Code(
+                id=event.code_id,
+                name=event.name,
+                color=event.color,
+                memo=event.memo,
+                category_id=CategoryId(value=category_id) if category_id else None,
+            )
+        )
+        self._code_ids[parsed_code.guid] = event.code_id
+        self._code_names[parsed_code.guid] = parsed_code.name
+
+    def _take_name(self, kind: str, name: str) -> bool:
+        """Whether no earlier item of this import has the name (case-insensitive)."""
+        taken = self._taken_names[kind]
+        key = name.lower()
+        if key in taken:
+            return False
+        taken.add(key)
+        return True
+
+    # 2. Sources
+    # Note: We persist directly rather than delegating to add_text_source
+    # because that handler requires ProjectState and does uniqueness checks
+    # that are incompatible with bulk import. We publish SourceAdded events to
+    # keep the event log complete and trigger reactive UI updates.
+
+    def add_source(self, parsed_source: ParsedSource, fulltext: str) -> None:
+        source_id = SourceId.new()
+        self._pending_sources.append(
+            Source(
+                id=source_id,
                 name=parsed_source.name,
+                fulltext=fulltext,
                 source_type=SourceType.TEXT,
-                file_path=Path(f"import://{parsed_source.name}"),
-                file_size=len(parsed_source.fulltext) if parsed_source.fulltext else 0,
-                origin="refi-qda-import",
             )
         )
-        guid_to_source_id[parsed_source.guid] = source_id
-        guid_to_source_name[parsed_source.guid] = parsed_source.name
-        guid_to_fulltext[parsed_source.guid] = parsed_source.fulltext
-        sources_created += 1
+        self._pending_chars += len(fulltext)
+        self._source_ids[parsed_source.guid] = source_id
+        self._source_names[parsed_source.guid] = parsed_source.name
+        self._current_guid = parsed_source.guid
+        self._current_text = fulltext
+        if self._pending_chars >= SOURCE_BATCH_CHARS:
+            self.flush()
 
-    # 4. Create segments (codings)
+    # 3. Segments (codings)
     # Note: We persist directly rather than delegating to apply_code because
-    # that handler runs overlap detection that would reject legitimate imported
-    # codings. We publish SegmentCoded events for event log completeness.
-    segments_created = 0
-    for coding in parsed.codings:
-        code_id = guid_to_code_id.get(coding.code_guid)
-        source_id = guid_to_source_id.get(coding.source_guid)
+    # that handler runs overlap detection that would reject legitimate
+    # imported codings. We publish SegmentCoded events for event log
+    # completeness.
+
+    def add_coding(self, coding: ParsedCoding) -> None:
+        if coding.source_guid != self._current_guid:
+            # Listed apart from its source; cut once all sources are stored
+            self._deferred.setdefault(coding.source_guid, []).append(coding)
+            return
+        self._add_segment(coding, self._current_text)
+
+    def _add_segment(self, coding: ParsedCoding, fulltext: str) -> None:
+        code_id = self._code_ids.get(coding.code_guid)
+        source_id = self._source_ids.get(coding.source_guid)
         if not code_id or not source_id:
-            continue
+            return
 
-        fulltext = guid_to_fulltext.get(coding.source_guid, "")
         selected_text = fulltext[coding.start : coding.end] if fulltext else ""
-        position = TextPosition(start=coding.start, end=coding.end)
-
         segment = TextSegment(
             id=SegmentId.new(),
             source_id=source_id,
             code_id=code_id,
-            position=position,
+            position=TextPosition(start=coding.start, end=coding.end),
             selected_text=selected_text,
         )
-        segment_repo.save(segment)
-        event_bus.publish(
-            SegmentCoded.create(
-                segment_id=segment.id,
-                code_id=code_id,
-                code_name=guid_to_code_name.get(coding.code_guid, ""),
-                source_id=source_id,
-                source_name=guid_to_source_name.get(coding.source_guid, ""),
-                position=position,
-                selected_text=selected_text,
-            )
-        )
-        segments_created += 1
+        self._pending_segments.append((segment, coding))
+        if len(self._pending_segments) >= SEGMENT_BATCH_SIZE:
+            self.flush()
 
-    # 5. Publish event
-    event = RefiQdaImported.create(
-        source_path=command.source_path,
-        codes_created=codes_created,
-        sources_created=sources_created,
-        segments_created=segments_created,
-    )
-    event_bus.publish(event)
+    def finish(self) -> None:
+        """Write pending rows, then the codings listed apart from their source."""
+        self.flush()
+        self._current_guid, self._current_text = None, ""
+        for source_guid, codings in self._deferred.items():
+            source_id = self._source_ids.get(source_guid)
+            if source_id is None:
+                continue
+            fulltext = self._source_repo.get_fulltext(source_id) or ""
+            for coding in codings:
+                self._add_segment(coding, fulltext)
+        self._deferred.clear()
+        self.flush()
 
-    logger.info(
-        "REFI-QDA imported: %d codes, %d sources, %d segments from %s",
-        codes_created,
-        sources_created,
-        segments_created,
-        command.source_path,
-    )
+    def flush(self) -> None:
+        """Write pending codebook rows and sources, then pending segments."""
+        if self._pending_categories:
+            self._category_repo.save_many(self._pending_categories)
+            self._pending_categories = []
+        if self._pending_codes:
+            self.codes_created += self._code_repo.save_many(self._pending_codes)
+            self._pending_codes = []
 
-    return OperationResult.ok(data=event)
+        if self._pending_sources:
+            self.sources_created += self._source_repo.save_many(self._pending_sources)
+            if not self._bulk:
+                self._publish_sources_added()
+            self._pending_sources = []
+            self._pending_chars = 0
+
+        if self._pending_segments:
+            # One executemany per batch instead of a probe + insert per row
+            self.segments_created += self._segment_repo.save_many(
+                [segment for segment, _ in self._pending_segments]
+            )
+            if not self._bulk:
+                self._publish_segments_coded()
+            self._pending_segments = []
+
+    def _publish_sources_added(self) -> None:
+        for source in self._pending_sources:
+            self._event_bus.publish(
+                SourceAdded.create(
+                    source_id=source.id,
+                    name=source.name,
+                    source_type=SourceType.TEXT,
+                    file_path=Path(f"import://{source.name}"),
+                    file_size=len(source.fulltext) if source.fulltext else 0,
+                    origin="refi-qda-import",
+                )
+            )
+
+    def _publish_segments_coded(self) -> None:
+        for segment, coding in self._pending_segments:
+            self._event_bus.publish(
+                SegmentCoded.create(
+                    segment_id=segment.id,
+                    code_id=segment.code_id,
+                    code_name=self._code_names.get(coding.code_guid, ""),
+                    source_id=segment.source_id,
+                    source_name=self._source_names.get(coding.source_guid, ""),
+                    position=segment.position,
+                    selected_text=segment.selected_text,
+                )
+            )
@@ -2,41 +2,67 @@
 Import RQDA Use Case.
 
 Imports codes, sources, and codings from an RQDA SQLite database.
+
+Legacy RQDA projects can hold millions of codings, so the database is
+streamed (see RqdaReader): rows are fetched FETCH_SIZE at a time, mapped to
+entities and written with ``save_many`` in bounded batches, all inside one
+transaction. RQDA's integer code and file ids are resolved through lookup
+maps with one entry per code and source, so memory stays flat however many
+codings there are. Throughput is logged in rows per second.
+
+Codes are validated against the codebook once and written with
+``save_many`` like the rest, and only the RqdaImported summary is published
+instead of an event per code, source and coding.
 """
 
 from __future__ import annotations
 
 import logging
 import sqlite3
+import time
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from src.contexts.coding.core.commandHandlers.create_code import create_code
-from src.contexts.coding.core.commands import CreateCodeCommand
-from src.contexts.coding.core.entities import Code, TextPosition, TextSegment
-from src.contexts.coding.core.events import SegmentCoded
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.contexts.coding.core.commandHandlers._state import build_code_state
+from src.contexts.coding.core.derivers import derive_create_code
+from src.contexts.coding.core.entities import Code, Color, TextPosition, TextSegment
 from src.contexts.exchange.core.commands import ImportRqdaCommand
 from src.contexts.exchange.core.events import RqdaImported
 from src.contexts.exchange.core.failure_events import ImportFailed
-from src.contexts.exchange.infra.rqda_reader import read_rqda
-from src.contexts.projects.core.events import SourceAdded
+from src.contexts.exchange.infra.rqda_reader import FETCH_SIZE, RqdaReader
 from src.contexts.sources.core.entities import Source, SourceType
+from src.shared.common.failure_events import FailureEvent
 from src.shared.common.operation_result import OperationResult
 from src.shared.common.types import CodeId, SegmentId, SourceId
 from src.shared.infra.metrics import metered_command
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from src.contexts.coding.core.commandHandlers._state import (
         CategoryRepository,
         CodeRepository,
         SegmentRepository,
     )
+    from src.contexts.exchange.infra.rqda_reader import (
+        RqdaCode,
+        RqdaCoding,
+        RqdaSource,
+    )
     from src.contexts.sources.core.commandHandlers._state import SourceRepository
     from src.shared.infra.event_bus import EventBus
     from src.shared.infra.session import Session
 
 logger = logging.getLogger("qualcoder.exchange.core")
 
+# Source text characters held before pending sources are written
+SOURCE_BATCH_CHARS = 8_000_000
+
+# Codings read, mapped and written per batch
+SEGMENT_BATCH_SIZE = FETCH_SIZE
+
 
 @metered_command("import_rqda")
 def import_rqda(
@@ -47,15 +73,19 @@ def import_rqda(
     segment_repo: SegmentRepository,
     event_bus: EventBus,
     session: Session | None = None,
+    on_progress: Callable[[int, int], None] | None = None,
 ) -> OperationResult:
     """
     Import an RQDA project from a SQLite database.
 
-    1. Read RQDA database
-    2. Create codes (via create_code handler)
-    3. Create sources
-    4. Create segments
-    5. Publish event
+    1. Create codes, validated against the codebook and written at once
+    2. Create sources, written in batches
+    3. Create segments, one batch of codings at a time
+    4. Publish the summary event (@metered_command commits the session)
+
+    Args:
+        on_progress: Called with (rows imported, total rows) after each
+            batch of codings
     """
     logger.debug("import_rqda: path=%s", command.source_path)
 
@@ -65,115 +95,173 @@ def import_rqda(
         event_bus.publish(failure)
         return OperationResult.from_failure(failure)
 
+    started = time.perf_counter()
+    importer = _ChunkedImport(
+        source_repo=source_repo,
+        code_repo=code_repo,
+        category_repo=category_repo,
+        segment_repo=segment_repo,
+    )
     try:
-        parsed = read_rqda(source_path)
-    except sqlite3.Error as e:
+        with RqdaReader(source_path) as reader:
+            total = reader.count_rows() if on_progress is not None else 0
+            for rqda_code in reader.codes():
+                importer.add_code(rqda_code)
+            importer.flush_codes()
+            for rqda_source in reader.sources():
+                importer.add_source(rqda_source)
+            importer.flush_sources()
+            for batch in reader.coding_batches(SEGMENT_BATCH_SIZE):
+                importer.add_codings(batch)
+                if on_progress is not None:
+                    on_progress(importer.rows, total)
+    except (sqlite3.Error, SQLAlchemyError) as e:
+        # Batches already written are part of the same transaction
+        if session is not None:
+            session.rollback()
+        if isinstance(e, SQLAlchemyError):
+            logger.error("Failed to write RQDA import: %s", e)
+            return OperationResult.fail(
+                error=f"Failed to write imported RQDA data: {e}",
+                error_code="RQDA_NOT_IMPORTED/WRITE_FAILED",
+            )
         logger.error("Failed to read RQDA: %s", e)
         return OperationResult.fail(
             error=f"Failed to read RQDA database: {e}",
             error_code="RQDA_NOT_IMPORTED/PARSE_ERROR",
         )
-
-    # 1. Create codes (via create_code handler)
-    rqda_id_to_code_id: dict[int, CodeId] = {}
-    rqda_id_to_code_name: dict[int, str] = {}
-    codes_created = 0
-
-    for rqda_code in parsed.codes:
-        result = create_code(
-            command=CreateCodeCommand(
-                name=rqda_code.name,
-                color=rqda_code.color,
-                memo=rqda_code.memo,
-            ),
-            code_repo=code_repo,
-            category_repo=category_repo,
-            segment_repo=segment_repo,
-            event_bus=event_bus,
-            session=session,
-        )
-
-        if result.is_success:
-            code: Code = result.data
-            rqda_id_to_code_id[rqda_code.id] = code.id
-            rqda_id_to_code_name[rqda_code.id] = rqda_code.name
-            codes_created += 1
-
-    # 2. Create sources
-    # Note: Direct persistence + event publishing (see import_refi_qda.py for rationale)
-    rqda_id_to_source_id: dict[int, SourceId] = {}
-    rqda_id_to_source_name: dict[int, str] = {}
-    sources_created = 0
-
-    for rqda_source in parsed.sources:
-        source_id = SourceId.new()
-        source = Source(
-            id=source_id,
-            name=rqda_source.name,
-            fulltext=rqda_source.fulltext,
-            source_type=SourceType.TEXT,
-        )
-        source_repo.save(source)
-        event_bus.publish(
-            SourceAdded.create(
-                source_id=source_id,
-                name=rqda_source.name,
-                source_type=SourceType.TEXT,
-                file_path=Path(f"import://{rqda_source.name}"),
-                file_size=len(rqda_source.fulltext) if rqda_source.fulltext else 0,
-                origin="rqda-import",
-            )
-        )
-        rqda_id_to_source_id[rqda_source.id] = source_id
-        rqda_id_to_source_name[rqda_source.id] = rqda_source.name
-        sources_created += 1
-
-    # 3. Create segments
-    # Note: Direct persistence + event publishing (see import_refi_qda.py for rationale)
-    segments_created = 0
-    for coding in parsed.codings:
-        code_id = rqda_id_to_code_id.get(coding.code_id)
-        source_id = rqda_id_to_source_id.get(coding.source_id)
-        if not code_id or not source_id:
-            continue
-
-        position = TextPosition(start=coding.start, end=coding.end)
-        segment = TextSegment(
-            id=SegmentId.new(),
-            source_id=source_id,
-            code_id=code_id,
-            position=position,
-            selected_text=coding.selected_text,
-        )
-        segment_repo.save(segment)
-        event_bus.publish(
-            SegmentCoded.create(
-                segment_id=segment.id,
-                code_id=code_id,
-                code_name=rqda_id_to_code_name.get(coding.code_id, ""),
-                source_id=source_id,
-                source_name=rqda_id_to_source_name.get(coding.source_id, ""),
-                position=position,
-                selected_text=coding.selected_text,
-            )
-        )
-        segments_created += 1
+    elapsed = time.perf_counter() - started
 
     # 4. Publish event
     event = RqdaImported.create(
         source_path=command.source_path,
-        codes_created=codes_created,
-        sources_created=sources_created,
-        segments_created=segments_created,
+        codes_created=importer.codes_created,
+        sources_created=importer.sources_created,
+        segments_created=importer.segments_created,
     )
     event_bus.publish(event)
 
     logger.info(
-        "RQDA imported: %d codes, %d sources, %d segments from %s",
-        codes_created,
-        sources_created,
-        segments_created,
+        "RQDA imported: %d codes, %d sources, %d segments from %s "
+        "(%d rows in %.2fs, %.0f rows/s)",
+        importer.codes_created,
+        importer.sources_created,
+        importer.segments_created,
         command.source_path,
+        importer.rows,
+        elapsed,
+        importer.rows / elapsed if elapsed > 0 else 0.0,
     )
 
     return OperationResult.ok(data=event)
+
+
+class _ChunkedImport:
+    """
+    Maps RQDA rows to entities and writes them in batches.
+
+    RQDA ids are resolved through ``_codes`` and ``_sources``: one
+    entry per code and source. Codings are never held beyond the batch
+    being written. Codes are checked against the codebook as it was before
+    the import and against each other; no per-row events are published.
+    """
+
+    def __init__(
+        self,
+        source_repo: SourceRepository,
+        code_repo: CodeRepository,
+        category_repo: CategoryRepository,
+        segment_repo: SegmentRepository,
+    ) -> None:
+        self._source_repo = source_repo
+        self._code_repo = code_repo
+        self._segment_repo = segment_repo
+        self._codebook = build_code_state(code_repo, category_repo)
+
+        self._codes: dict[int, CodeId] = {}
+        self._sources: dict[int, SourceId] = {}
+        self._code_names: set[str] = set()
+        self._pending_codes: list[Code] = []
+        self._pending_sources: list[Source] = []
+        self._pending_chars = 0
+
+        self.rows = 0
+        self.codes_created = 0
+        self.sources_created = 0
+        self.segments_created = 0
+
+    def add_code(self, rqda_code: RqdaCode) -> None:
+        self.rows += 1
+        try:
+            color = Color.from_hex(rqda_code.color)
+        except ValueError:
+            logger.debug("import_rqda: invalid color for %s", rqda_code.name)
+            return
+        event = derive_create_code(
+            name=rqda_code.name,
+            color=color,
+            memo=rqda_code.memo,
+            category_id=None,
+            owner=None,
+            state=self._codebook,
+        )
+        key = rqda_code.name.lower()
+        if isinstance(event, FailureEvent) or key in self._code_names:
+            logger.debug("import_rqda: code skipped: %s", rqda_code.name)
+            return
+        self._code_names.add(key)
+        self._pending_codes.append(
+            Code(id=event.code_id, name=event.name, color=event.color, memo=event.memo)
+        )
+        self._codes[rqda_code.id] = event.code_id
+
+    def flush_codes(self) -> None:
+        """Write pending codes."""
+        if self._pending_codes:
+            self.codes_created += self._code_repo.save_many(self._pending_codes)
+            self._pending_codes = []
+
+    def add_source(self, rqda_source: RqdaSource) -> None:
+        self.rows += 1
+        source = Source(
+            id=SourceId.new(),
+            name=rqda_source.name,
+            fulltext=rqda_source.fulltext,
+            source_type=SourceType.TEXT,
+        )
+        self._sources[rqda_source.id] = source.id
+        self._pending_sources.append(source)
+        self._pending_chars += len(rqda_source.fulltext)
+        if self._pending_chars >= SOURCE_BATCH_CHARS:
+            self.flush_sources()
+
+    def flush_sources(self) -> None:
+        """Write pending sources."""
+        if not self._pending_sources:
+            return
+        # Note: Direct persistence (see import_refi_qda.py)
+        self.sources_created += self._source_repo.save_many(self._pending_sources)
+        self._pending_sources = []
+        self._pending_chars = 0
+
+    def add_codings(self, codings: list[RqdaCoding]) -> None:
+        """Write one batch of codings; codings of skipped codes are dropped."""
+        self.rows += len(codings)
+        segments: list[TextSegment] = []
+        for coding in codings:
+            code_id = self._codes.get(coding.code_id)
+            source_id = self._sources.get(coding.source_id)
+            if code_id is None or source_id is None:
+                continue
+            segments.append(
+                TextSegment(
+                    id=SegmentId.new(),
+                    source_id=source_id,
+                    code_id=code_id,
+                    position=TextPosition(start=coding.start, end=coding.end),
+                    selected_text=coding.selected_text,
+                )
+            )
+        if segments:
+            # Note: Direct persistence (see import_refi_qda.py)
+            self.segments_created += self._segment_repo.save_many(segments)
@@ -57,6 +57,7 @@ class ImportRefiQdaCommand:
     """Command to import a REFI-QDA project (.qdpx)."""
 
     source_path: str
+    bulk: bool = False  # One transaction, one summary event, no per-row events
 
 
 @dataclass(frozen=True)
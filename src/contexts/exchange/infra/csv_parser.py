@@ -3,13 +3,34 @@ Exchange Infra: CSV Parser
 
 Parses survey CSV files into structured row data.
 Uses stdlib csv module for robust parsing.
+
+SurveyCsvReader streams a file instead of reading it whole: rows are
+parsed as the file is read and handed out in batches, and attribute types
+are inferred from a sampled prefix of the rows:
+
+    with SurveyCsvReader(path, name_column) as reader:
+        types = infer_attribute_types(reader.sample(TYPE_SAMPLE_ROWS))
+        for batch in reader.row_batches(500): ...
 """
 
 from __future__ import annotations
 
 import csv
 import io
+import re
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass
+from datetime import datetime
+from itertools import chain, islice
+from pathlib import Path
+
+from src.contexts.cases.core.entities import AttributeType
+
+# Rows read to infer attribute types
+TYPE_SAMPLE_ROWS = 1_000
+
+_INTEGER = re.compile(r"[+-]?\d{1,18}")
+_BOOLEANS = frozenset({"true", "false"})
 
 
 @dataclass(frozen=True)
@@ -59,3 +80,126 @@ def parse_survey_csv(
         rows=rows,
         name_column=resolved_name_column,
     )
+
+
+class SurveyCsvReader:
+    """
+    Streaming reader for a survey CSV file.
+
+    Rows come back as lists of stripped values, one per header, padded with
+    empty strings or cut to the header length.
+
+    Raises:
+        OSError: If the file cannot be opened
+        csv.Error: On malformed CSV, while iterating
+        UnicodeDecodeError: If the file is not UTF-8
+    """
+
+    def __init__(self, path: Path | str, name_column: str | None = None) -> None:
+        self._file = open(path, encoding="utf-8-sig", newline="")  # noqa: SIM115
+        self._rows = csv.reader(self._file, skipinitialspace=True)
+        try:
+            header = next(self._rows, None)
+        except (csv.Error, UnicodeDecodeError):
+            self._file.close()
+            raise
+        self.headers: list[str] = [h.strip() for h in header] if header else []
+        self.name_column: str | None = name_column or (
+            self.headers[0] if self.headers else None
+        )
+        self._sample: list[list[str]] = []
+
+    def __enter__(self) -> SurveyCsvReader:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._file.close()
+
+    @property
+    def name_index(self) -> int | None:
+        """Position of the name column, None if the file has no such header."""
+        if self.name_column in self.headers:
+            return self.headers.index(self.name_column)
+        return None
+
+    @property
+    def attribute_columns(self) -> dict[int, str]:
+        """Position -> header of the other columns; repeated headers count once."""
+        columns: dict[str, int] = {}
+        for index, header in enumerate(self.headers):
+            if header != self.name_column:
+                columns.setdefault(header, index)
+        return {index: header for header, index in columns.items()}
+
+    def sample(self, size: int = TYPE_SAMPLE_ROWS) -> list[list[str]]:
+        """The first ``size`` rows; they are still returned by row_batches."""
+        if len(self._sample) < size:
+            self._sample.extend(islice(self._clean_rows(), size - len(self._sample)))
+        return self._sample[:size]
+
+    def row_batches(self, size: int) -> Iterator[list[list[str]]]:
+        """All rows, ``size`` at a time."""
+        rows = chain(self._sample, self._clean_rows())
+        self._sample = []
+        while batch := list(islice(rows, size)):
+            yield batch
+
+    def _clean_rows(self) -> Iterator[list[str]]:
+        width = len(self.headers)
+        for row in self._rows:
+            if not row:
+                continue
+            values = [v.strip() for v in row[:width]]
+            if len(values) < width:
+                values.extend([""] * (width - len(values)))
+            yield values
+
+
+def infer_attribute_types(
+    sample: Sequence[Sequence[str]], columns: Sequence[int]
+) -> dict[int, AttributeType]:
+    """
+    Attribute type per column index, from the sampled rows.
+
+    A column is NUMBER if every non-empty sampled value is an integer,
+    BOOLEAN if every one is true/false, DATE if every one is an ISO date,
+    and TEXT otherwise or when it has no values in the sample.
+    """
+    return {
+        column: _infer_type([row[column] for row in sample if row[column]])
+        for column in columns
+    }
+
+
+def parse_attribute_value(value: str, attr_type: AttributeType) -> object | None:
+    """
+    Convert a CSV value to the attribute type; None if it does not fit.
+
+    Values later in the file than the sample may not match the inferred
+    type; callers store those as TEXT.
+    """
+    match attr_type:
+        case AttributeType.NUMBER:
+            return int(value) if _INTEGER.fullmatch(value) else None
+        case AttributeType.BOOLEAN:
+            lowered = value.lower()
+            return lowered == "true" if lowered in _BOOLEANS else None
+        case AttributeType.DATE:
+            try:
+                return datetime.fromisoformat(value)
+            except ValueError:
+                return None
+        case _:
+            return value
+
+
+def _infer_type(values: list[str]) -> AttributeType:
+    if not values:
+        return AttributeType.TEXT
+    for attr_type in (AttributeType.NUMBER, AttributeType.BOOLEAN, AttributeType.DATE):
+        if all(parse_attribute_value(v, attr_type) is not None for v in values):
+            return attr_type
+    return AttributeType.TEXT
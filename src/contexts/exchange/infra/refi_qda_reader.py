@@ -3,19 +3,47 @@ Exchange Infra: REFI-QDA Reader
 
 Parses REFI-QDA .qdpx archives (ZIP with project.qde XML)
 into structured data for import.
+
+Archives from other tools can be several gigabytes, so the archive is read
+as a stream:
+
+- ``project.qde`` is parsed with ``iterparse`` straight from the ZIP member;
+  each code, source, selection and case is yielded as soon as its element
+  ends, and the element is then cleared and dropped from the tree
+- Source texts stored as separate ZIP entries (``plainTextPath``) are only
+  read when asked for, one at a time
+
+Peak memory is bounded by the largest single source, not by the archive.
+
+Usage:
+    with RefiQdaReader(qdpx_path) as reader:
+        for item in reader.items():
+            if isinstance(item, ParsedSource):
+                text = reader.read_text(item)
+
+    # Everything at once (small archives, tests)
+    result = read_refi_qda(qdpx_path)
 """
 
 from __future__ import annotations
 
 import xml.etree.ElementTree as ET
 import zipfile
-from dataclasses import dataclass, field
+from collections.abc import Iterator
+from dataclasses import dataclass, field, replace
 from pathlib import Path
+from typing import IO
 
 from src.contexts.exchange.core.commands import DEFAULT_IMPORT_COLOR
 
 REFI_NS = "urn:QDA-XML:project:1.0"
 
+PROJECT_ENTRY = "project.qde"
+SOURCES_DIR = "Sources/"
+
+# plainTextPath prefix for files stored in the archive's Sources folder
+_INTERNAL_PREFIX = "internal://"
+
 
 @dataclass(frozen=True)
 class ParsedCode:
@@ -39,11 +67,18 @@ class ParsedCategory:
 
 @dataclass(frozen=True)
 class ParsedSource:
-    """A text source from REFI-QDA XML."""
+    """
+    A text source from REFI-QDA XML.
+
+    When the text is not inline (``PlainTextContent``), ``fulltext`` is empty
+    and ``text_path`` names the archive entry holding it; use
+    ``RefiQdaReader.read_text`` to load it.
+    """
 
     guid: str
     name: str
     fulltext: str = ""
+    text_path: str | None = None
 
 
 @dataclass(frozen=True)
@@ -56,6 +91,19 @@ class ParsedCoding:
     end: int
 
 
+@dataclass(frozen=True)
+class ParsedCase:
+    """A case from REFI-QDA XML, with the sources it groups."""
+
+    guid: str
+    name: str
+    memo: str | None = None
+    source_guids: tuple[str, ...] = ()
+
+
+RefiQdaItem = ParsedCategory | ParsedCode | ParsedSource | ParsedCoding | ParsedCase
+
+
 @dataclass
 class RefiQdaParseResult:
     """Result of parsing a REFI-QDA archive."""
@@ -65,128 +113,289 @@ class RefiQdaParseResult:
     categories: list[ParsedCategory] = field(default_factory=list)
     sources: list[ParsedSource] = field(default_factory=list)
     codings: list[ParsedCoding] = field(default_factory=list)
+    cases: list[ParsedCase] = field(default_factory=list)
 
 
 def read_refi_qda(qdpx_path: Path | str) -> RefiQdaParseResult:
     """
     Parse a REFI-QDA .qdpx archive.
 
+    Every source text is loaded; iterate a ``RefiQdaReader`` instead when the
+    archive may be large.
+
     Args:
         qdpx_path: Path to the .qdpx ZIP file
 
     Returns:
         RefiQdaParseResult with parsed project data
     """
-    qdpx_path = Path(qdpx_path)
     result = RefiQdaParseResult()
-
-    with zipfile.ZipFile(qdpx_path) as zf:
-        xml_content = zf.read("project.qde")
-        source_files = {
-            n: zf.read(n).decode("utf-8", errors="replace")
-            for n in zf.namelist()
-            if n.startswith("Sources/")
-        }
-
-    root = ET.fromstring(xml_content)
-
-    # Strip namespace for easier element access
-    ns = ""
-    if root.tag.startswith("{"):
-        ns = root.tag.split("}")[0] + "}"
-
-    result.project_name = root.get("name", "")
-
-    # Parse codes
-    codebook = root.find(f"{ns}CodeBook")
-    if codebook is not None:
-        codes_el = codebook.find(f"{ns}Codes")
-        if codes_el is not None:
-            _parse_codes(codes_el, ns, result, parent_guid=None)
-
-    # Parse sources
-    sources_el = root.find(f"{ns}Sources")
-    if sources_el is not None:
-        for src_el in sources_el:
-            tag = src_el.tag.replace(ns, "")
-            if "Source" in tag:
-                guid = src_el.get("guid", "")
-                name = src_el.get("name", "")
-
-                # Get text content
-                fulltext = ""
-                plain_el = src_el.find(f"{ns}PlainTextContent")
-                if plain_el is not None and plain_el.text:
-                    fulltext = plain_el.text
-
-                # Fall back to source file in ZIP
-                if not fulltext:
-                    plain_path = src_el.get("plainTextPath", "")
-                    if plain_path and plain_path in source_files:
-                        fulltext = source_files[plain_path]
-
-                result.sources.append(
-                    ParsedSource(
-                        guid=guid,
-                        name=name,
-                        fulltext=fulltext,
-                    )
-                )
-
-    # Parse codings
-    for coding_el in root.findall(f"{ns}Coding"):
-        code_ref = coding_el.find(f"{ns}CodeRef")
-        text_range = coding_el.find(f"{ns}TextRange")
-
-        if code_ref is not None and text_range is not None:
-            result.codings.append(
-                ParsedCoding(
-                    code_guid=code_ref.get("targetGUID", ""),
-                    source_guid=text_range.get("sourceGUID", ""),
-                    start=int(text_range.get("start", "0")),
-                    end=int(text_range.get("end", "0")),
-                )
-            )
-
+    with RefiQdaReader(qdpx_path) as reader:
+        for item in reader.items():
+            if isinstance(item, ParsedCode):
+                result.codes.append(item)
+            elif isinstance(item, ParsedCategory):
+                result.categories.append(item)
+            elif isinstance(item, ParsedSource):
+                result.sources.append(replace(item, fulltext=reader.read_text(item)))
+            elif isinstance(item, ParsedCoding):
+                result.codings.append(item)
+            else:
+                result.cases.append(item)
+        result.project_name = reader.project_name
     return result
 
 
-def _parse_codes(
-    parent_el: ET.Element,
-    ns: str,
-    result: RefiQdaParseResult,
-    parent_guid: str | None,
-) -> None:
-    """Recursively parse Code elements (categories and codes)."""
-    for code_el in parent_el.findall(f"{ns}Code"):
-        guid = code_el.get("guid", "")
-        name = code_el.get("name", "")
-        is_codable = code_el.get("isCodable", "true").lower() == "true"
-        color = code_el.get("color", DEFAULT_IMPORT_COLOR)
-
-        memo = None
-        desc_el = code_el.find(f"{ns}Description")
-        if desc_el is not None and desc_el.text:
-            memo = desc_el.text
-
-        if is_codable:
-            result.codes.append(
-                ParsedCode(
-                    guid=guid,
-                    name=name,
-                    color=color,
-                    category_guid=parent_guid,
-                    memo=memo,
-                )
-            )
-        else:
-            # Non-codable = category
-            result.categories.append(
-                ParsedCategory(
-                    guid=guid,
-                    name=name,
-                    memo=memo,
+class RefiQdaReader:
+    """
+    Streaming reader over a REFI-QDA .qdpx archive.
+
+    ``items()`` yields, in document order:
+    - each category (non-codable Code) before the codes nested in it, and
+      each codable code
+    - each source, followed by the codings of its ``PlainTextSelection``s
+    - codings written as project-level ``Coding`` elements
+    - each case
+
+    Example:
+        with RefiQdaReader("project.qdpx") as reader:
+            for item in reader.items():
+                ...
+            print(reader.project_name)
+    """
+
+    def __init__(self, qdpx_path: Path | str) -> None:
+        self._zip = zipfile.ZipFile(Path(qdpx_path))
+        self._stream: IO[bytes] | None = None
+        self.project_name = ""
+
+    def __enter__(self) -> RefiQdaReader:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the archive."""
+        self._zip.close()
+
+    def read_text(self, source: ParsedSource) -> str:
+        """Text of a source: inline, or read from its archive entry now."""
+        if source.fulltext or source.text_path is None:
+            return source.fulltext
+        return self._zip.read(source.text_path).decode("utf-8", errors="replace")
+
+    def items(self) -> Iterator[RefiQdaItem]:
+        """
+        Parse ``project.qde`` incrementally, yielding each item as it ends.
+
+        Raises:
+            KeyError: If the archive has no project.qde
+            xml.etree.ElementTree.ParseError: If project.qde is malformed
+        """
+        with self._zip.open(PROJECT_ENTRY) as stream:
+            self._stream = stream
+            try:
+                yield from self._parse(ET.iterparse(stream, events=("start", "end")))
+            finally:
+                self._stream = None
+
+    def progress(self) -> tuple[int, int]:
+        """
+        How far ``items()`` has read: (bytes of project.qde, its size).
+
+        Parsing reads ahead in blocks, so the position moves in steps.
+        """
+        size = self._zip.getinfo(PROJECT_ENTRY).file_size
+        if self._stream is None:
+            return (0, size)
+        return (min(self._stream.tell(), size), size)
+
+    def _parse(self, events) -> Iterator[RefiQdaItem]:
+        ns = ""
+        stack: list[ET.Element] = []  # Open elements, root first
+        codes: list[_OpenCode] = []  # Open Code elements
+        source: _OpenSource | None = None
+        open_items = 0  # Open item elements; their children are kept
+
+        for event, elem in events:
+            tag = elem.tag[len(ns) :] if ns else elem.tag
+            if event == "start":
+                parent = stack[-1].tag[len(ns) :] if stack else None
+                stack.append(elem)
+                if parent is None:
+                    if elem.tag.startswith("{"):
+                        ns = elem.tag.split("}")[0] + "}"
+                    self.project_name = elem.get("name", "")
+                    continue
+                if not _is_item(tag, parent):
+                    continue
+                open_items += 1
+                if tag == "Code":
+                    outer = codes[-1] if parent == "Code" else None
+                    if outer is not None and outer.pending_category():
+                        # Its Description (if any) has been parsed by now
+                        yield outer.category(ns)
+                    codes.append(_OpenCode(elem, outer))
+                elif parent == "Sources":
+                    source = _OpenSource(elem, self._entry(elem.get("plainTextPath")))
+                continue
+
+            stack.pop()
+            parent = stack[-1].tag[len(ns) :] if stack else None
+            if parent is None:
+                elem.clear()
+                continue
+            if _is_item(tag, parent):
+                open_items -= 1
+                if tag == "Code":
+                    code = codes.pop()
+                    if code.codable and not code.skipped:
+                        yield code.code(ns)
+                    elif code.pending_category():
+                        yield code.category(ns)
+                elif parent == "Sources" and source is not None:
+                    yield source.source(ns)
+                    yield from source.codings
+                    source = None
+                elif tag == "PlainTextSelection" and source is not None:
+                    source.add_selection(elem, ns)
+                elif tag == "Case":
+                    yield _case(elem, ns)
+                elif tag == "Coding":
+                    coding = _project_coding(elem, ns)
+                    if coding is not None:
+                        yield coding
+            elif open_items:
+                continue  # Still needed by the item being parsed
+            # Done with this element: free it and its subtree
+            elem.clear()
+            stack[-1].remove(elem)
+
+    def _entry(self, plain_text_path: str | None) -> str | None:
+        """Archive entry named by a plainTextPath, if the archive has it."""
+        if not plain_text_path:
+            return None
+        candidates = [plain_text_path]
+        if plain_text_path.startswith(_INTERNAL_PREFIX):
+            candidates.append(SOURCES_DIR + plain_text_path[len(_INTERNAL_PREFIX) :])
+        for name in candidates:
+            try:
+                self._zip.getinfo(name)
+            except KeyError:
+                continue
+            return name
+        return None
+
+
+def _is_item(tag: str, parent: str) -> bool:
+    """Whether an element is yielded (or collected) when it ends."""
+    if tag == "Code":
+        return parent in ("Codes", "Code")
+    if parent == "Sources":
+        return tag.endswith("Source")
+    return (
+        (tag == "PlainTextSelection" and parent.endswith("Source"))
+        or (tag == "Case" and parent == "Cases")
+        or (tag == "Coding" and parent == "Project")
+    )
+
+
+def _description(elem: ET.Element, ns: str) -> str | None:
+    desc_el = elem.find(f"{ns}Description")
+    if desc_el is not None and desc_el.text:
+        return desc_el.text
+    return None
+
+
+class _OpenCode:
+    """A Code element whose end has not been reached yet."""
+
+    def __init__(self, elem: ET.Element, outer: _OpenCode | None) -> None:
+        self.elem = elem
+        self.guid = elem.get("guid", "")
+        self.codable = elem.get("isCodable", "true").lower() == "true"
+        # Only categories contribute nested codes; children of codable codes
+        # (and everything below a skipped code) are not imported
+        self.skipped = outer is not None and (outer.skipped or outer.codable)
+        self.category_guid = outer.guid if outer is not None else None
+        self.emitted = False
+
+    def pending_category(self) -> bool:
+        return not self.codable and not self.skipped and not self.emitted
+
+    def category(self, ns: str) -> ParsedCategory:
+        self.emitted = True
+        return ParsedCategory(
+            guid=self.guid,
+            name=self.elem.get("name", ""),
+            memo=_description(self.elem, ns),
+        )
+
+    def code(self, ns: str) -> ParsedCode:
+        return ParsedCode(
+            guid=self.guid,
+            name=self.elem.get("name", ""),
+            color=self.elem.get("color", DEFAULT_IMPORT_COLOR),
+            category_guid=self.category_guid,
+            memo=_description(self.elem, ns),
+        )
+
+
+class _OpenSource:
+    """A source element whose end has not been reached yet."""
+
+    def __init__(self, elem: ET.Element, text_path: str | None) -> None:
+        self.elem = elem
+        self.guid = elem.get("guid", "")
+        self.text_path = text_path
+        self.codings: list[ParsedCoding] = []
+
+    def add_selection(self, selection: ET.Element, ns: str) -> None:
+        start = int(selection.get("startPosition", "0"))
+        end = int(selection.get("endPosition", "0"))
+        for coding_el in selection.iterfind(f"{ns}Coding"):
+            code_ref = coding_el.find(f"{ns}CodeRef")
+            if code_ref is not None:
+                self.codings.append(
+                    ParsedCoding(
+                        code_guid=code_ref.get("targetGUID", ""),
+                        source_guid=self.guid,
+                        start=start,
+                        end=end,
+                    )
                 )
+
+    def source(self, ns: str) -> ParsedSource:
+        plain_el = self.elem.find(f"{ns}PlainTextContent")
+        if plain_el is not None and plain_el.text:
+            return ParsedSource(
+                guid=self.guid, name=self.elem.get("name", ""), fulltext=plain_el.text
             )
-            # Recurse into nested codes
-            _parse_codes(code_el, ns, result, parent_guid=guid)
+        return ParsedSource(
+            guid=self.guid, name=self.elem.get("name", ""), text_path=self.text_path
+        )
+
+
+def _project_coding(elem: ET.Element, ns: str) -> ParsedCoding | None:
+    code_ref = elem.find(f"{ns}CodeRef")
+    text_range = elem.find(f"{ns}TextRange")
+    if code_ref is None or text_range is None:
+        return None
+    return ParsedCoding(
+        code_guid=code_ref.get("targetGUID", ""),
+        source_guid=text_range.get("sourceGUID", ""),
+        start=int(text_range.get("start", "0")),
+        end=int(text_range.get("end", "0")),
+    )
+
+
+def _case(elem: ET.Element, ns: str) -> ParsedCase:
+    return ParsedCase(
+        guid=elem.get("guid", ""),
+        name=elem.get("name", ""),
+        memo=_description(elem, ns),
+        source_guids=tuple(
+            ref.get("targetGUID", "") for ref in elem.iterfind(f"{ns}SourceRef")
+        ),
+    )
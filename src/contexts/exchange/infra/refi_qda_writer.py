@@ -3,23 +3,57 @@ Exchange Infra: REFI-QDA Writer
 
 Generates REFI-QDA 1.0 compatible .qdpx archives (ZIP with project.qde XML).
 
+The archive is written as a stream, so memory stays flat however many
+sources and codings a project has:
+
+- project.qde is emitted element by element (SAX ``XMLGenerator``) into a
+  temporary file and copied into the archive when the writer closes
+- Source texts are written to ``Sources/<guid>.txt`` chunk by chunk and
+  referenced as ``plainTextPath="internal://<guid>.txt"``
+- Codings are written as they are passed in, e.g. one page at a time
+
+Only the code and source GUID maps are held, one entry per code/source.
+
 REFI-QDA spec: https://www.qdasoftware.org/
+
+Usage:
+    with RefiQdaWriter(output_path, project_name) as writer:
+        writer.write_codebook(codes, categories)
+        for source in sources:
+            writer.add_source(source.id, source.name, text_chunks(source))
+        for page in segment_pages:
+            writer.add_codings(page)
 """
 
 from __future__ import annotations
 
-import xml.etree.ElementTree as ET
+import contextlib
+import logging
+import shutil
+import tempfile
 import zipfile
 from pathlib import Path
 from typing import TYPE_CHECKING
 from uuid import uuid4
+from xml.sax.saxutils import XMLGenerator
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from src.contexts.coding.core.entities import Category, Code, TextSegment
     from src.contexts.sources.core.entities import Source
+    from src.shared.common.types import SourceId
+
+logger = logging.getLogger("qualcoder.exchange.infra")
 
 REFI_NS = "urn:QDA-XML:project:1.0"
 
+SOURCES_DIR = "Sources/"
+_INTERNAL_PREFIX = "internal://"
+
+# project.qde sections in document order
+_SECTIONS = (None, "CodeBook", "Sources", "Codings")
+
 
 def write_refi_qda(
     codes: list[Code],
@@ -40,121 +74,223 @@ def write_refi_qda(
         output_path: Path for the .qdpx file
         project_name: Name of the project
     """
-    output_path = Path(output_path)
-
-    # Build XML
-    root = ET.Element("Project")
-    root.set("xmlns", REFI_NS)
-    root.set("name", project_name)
-    root.set("origin", "QualCoder v2")
-
-    # Build code GUID mapping
-    code_guids: dict[str, str] = {}
-    source_guids: dict[str, str] = {}
-
-    # CodeBook
-    codebook = ET.SubElement(root, "CodeBook")
-    codes_el = ET.SubElement(codebook, "Codes")
-
-    # Map categories to their codes
-    cat_map: dict[str, Category] = {cat.id.value: cat for cat in categories}
-    codes_by_cat: dict[str | None, list[Code]] = {}
-    for code in codes:
-        key = code.category_id.value if code.category_id else None
-        codes_by_cat.setdefault(key, []).append(code)
-
-    # Write categorized codes (categories become non-codable Code elements)
-    for cat_id_value, cat in cat_map.items():
-        cat_guid = str(uuid4())
-        cat_el = ET.SubElement(codes_el, "Code")
-        cat_el.set("guid", cat_guid)
-        cat_el.set("name", cat.name)
-        cat_el.set("isCodable", "false")
-        if cat.memo:
-            desc = ET.SubElement(cat_el, "Description")
-            desc.text = cat.memo
-
-        for code in codes_by_cat.pop(cat_id_value, []):
-            _add_code_element(cat_el, code, code_guids)
-
-    # Write uncategorized codes
-    for code in codes_by_cat.pop(None, []):
-        _add_code_element(codes_el, code, code_guids)
-
-    # Any remaining (orphaned category refs)
-    for _, remaining in codes_by_cat.items():
-        for code in remaining:
-            _add_code_element(codes_el, code, code_guids)
-
-    # Sources
-    sources_el = ET.SubElement(root, "Sources")
-    for source in sources:
-        src_guid = str(uuid4())
-        source_guids[source.id.value] = src_guid
-
-        src_el = ET.SubElement(sources_el, "TextSource")
-        src_el.set("guid", src_guid)
-        src_el.set("name", source.name)
-
-        if source.fulltext:
-            # Reference the text file in the ZIP
-            plain = ET.SubElement(src_el, "PlainTextContent")
-            plain.text = source.fulltext
-
-            # Add source file path reference
-            src_el.set("plainTextPath", f"Sources/{source.name}")
-
-    # Codings (segments)
-    if segments:
-        for seg in segments:
-            code_guid = code_guids.get(seg.code_id.value)
-            source_guid = source_guids.get(seg.source_id.value)
-            if not code_guid or not source_guid:
-                continue
-
-            coding_el = ET.SubElement(root, "Coding")
-            coding_el.set("guid", str(uuid4()))
+    with RefiQdaWriter(output_path, project_name) as writer:
+        writer.write_codebook(codes, categories)
+        for source in sources:
+            chunks = [source.fulltext] if source.fulltext else []
+            writer.add_source(source.id, source.name, chunks)
+        writer.add_codings(segments)
 
-            code_ref = ET.SubElement(coding_el, "CodeRef")
-            code_ref.set("targetGUID", code_guid)
 
-            # Text range
-            range_el = ET.SubElement(coding_el, "TextRange")
-            range_el.set("start", str(seg.position.start))
-            range_el.set("end", str(seg.position.end))
-            range_el.set("sourceGUID", source_guid)
+class RefiQdaWriter:
+    """
+    Streaming writer for a REFI-QDA .qdpx archive.
 
-    # Write ZIP
-    xml_bytes = ET.tostring(root, encoding="unicode", xml_declaration=True)
-    if not xml_bytes.startswith("<?xml"):
-        xml_bytes = '<?xml version="1.0" encoding="utf-8"?>\n' + xml_bytes
+    Sections must be written in document order: the codebook, then the
+    sources, then the codings. Closing the writer finishes project.qde;
+    leaving the ``with`` block on an exception removes the partial archive.
 
-    with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as zf:
-        zf.writestr("project.qde", xml_bytes)
+    Raises:
+        OSError: If the archive cannot be written
+        ValueError: If a section is written out of order
+    """
 
-        # Include source text files
-        for source in sources:
-            if source.fulltext:
-                zf.writestr(f"Sources/{source.name}", source.fulltext)
-
-
-def _add_code_element(
-    parent: ET.Element,
-    code: Code,
-    code_guids: dict[str, str],
-) -> ET.Element:
-    """Add a Code element to the XML tree."""
-    guid = str(uuid4())
-    code_guids[code.id.value] = guid
-
-    el = ET.SubElement(parent, "Code")
-    el.set("guid", guid)
-    el.set("name", code.name)
-    el.set("isCodable", "true")
-    el.set("color", code.color.to_hex())
-
-    if code.memo:
-        desc = ET.SubElement(el, "Description")
-        desc.text = code.memo
-
-    return el
+    def __init__(
+        self, output_path: Path | str, project_name: str = "QualCoder Project"
+    ) -> None:
+        self._output_path = Path(output_path)
+        self._zip = zipfile.ZipFile(self._output_path, "w", zipfile.ZIP_DEFLATED)
+        # zipfile allows one open entry at a time, and source texts are
+        # written while project.qde is still being generated
+        with contextlib.ExitStack() as stack:
+            self._qde = stack.enter_context(
+                tempfile.TemporaryFile(prefix="qualcoder-qde-")
+            )
+            # Closed (and deleted) by close() or abort()
+            self._spool = stack.pop_all()
+        self._xml = XMLGenerator(self._qde, encoding="utf-8", short_empty_elements=True)
+        self._code_guids: dict[str, str] = {}
+        self._source_guids: dict[str, str] = {}
+        self._section: str | None = None
+        self._closed = False
+
+        self._xml.startDocument()
+        self._xml.startElement(
+            "Project",
+            {"xmlns": REFI_NS, "name": project_name, "origin": "QualCoder v2"},
+        )
+
+    def __enter__(self) -> RefiQdaWriter:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def write_codebook(self, codes: list[Code], categories: list[Category]) -> None:
+        """Write the CodeBook; categories become non-codable Code elements."""
+        self._enter_section("CodeBook")
+        self._xml.startElement("Codes", {})
+
+        codes_by_cat: dict[str | None, list[Code]] = {}
+        for code in codes:
+            key = code.category_id.value if code.category_id else None
+            codes_by_cat.setdefault(key, []).append(code)
+
+        for cat in categories:
+            self._xml.startElement(
+                "Code",
+                {"guid": str(uuid4()), "name": cat.name, "isCodable": "false"},
+            )
+            self._description(cat.memo)
+            for code in codes_by_cat.pop(cat.id.value, []):
+                self._code(code)
+            self._xml.endElement("Code")
+
+        # Uncategorized codes, then any with an orphaned category reference
+        for code in codes_by_cat.pop(None, []):
+            self._code(code)
+        for remaining in codes_by_cat.values():
+            for code in remaining:
+                self._code(code)
+
+        self._xml.endElement("Codes")
+
+    def add_source(
+        self, source_id: SourceId, name: str, text_chunks: Iterable[str]
+    ) -> str:
+        """
+        Write a TextSource, streaming its text into the archive.
+
+        Args:
+            source_id: ID of the source, referenced by its codings
+            name: Source name
+            text_chunks: The source text in pieces; empty for no text
+
+        Returns:
+            GUID of the source in the archive
+        """
+        self._enter_section("Sources")
+        guid = str(uuid4())
+        self._source_guids[source_id.value] = guid
+
+        entry = f"{guid}.txt"
+        stream = None
+        try:
+            for chunk in text_chunks:
+                if not chunk:
+                    continue
+                if stream is None:
+                    stream = self._zip.open(SOURCES_DIR + entry, "w", force_zip64=True)
+                stream.write(chunk.encode("utf-8"))
+        finally:
+            if stream is not None:
+                stream.close()
+
+        attrs = {"guid": guid, "name": name}
+        if stream is not None:
+            attrs["plainTextPath"] = _INTERNAL_PREFIX + entry
+        self._xml.startElement("TextSource", attrs)
+        self._xml.endElement("TextSource")
+        return guid
+
+    def add_codings(self, segments: Iterable[TextSegment]) -> int:
+        """
+        Write codings for segments of already written codes and sources.
+
+        Returns:
+            Number of codings written; segments of unknown codes or sources
+            are skipped
+        """
+        self._enter_section("Codings")
+        written = 0
+        for seg in segments:
+            code_guid = self._code_guids.get(seg.code_id.value)
+            source_guid = self._source_guids.get(seg.source_id.value)
+            if not code_guid or not source_guid:
+                continue
+            self._xml.startElement("Coding", {"guid": str(uuid4())})
+            self._xml.startElement("CodeRef", {"targetGUID": code_guid})
+            self._xml.endElement("CodeRef")
+            self._xml.startElement(
+                "TextRange",
+                {
+                    "start": str(seg.position.start),
+                    "end": str(seg.position.end),
+                    "sourceGUID": source_guid,
+                },
+            )
+            self._xml.endElement("TextRange")
+            self._xml.endElement("Coding")
+            written += 1
+        return written
+
+    def close(self) -> None:
+        """Finish project.qde and the archive."""
+        if self._closed:
+            return
+        self._enter_section(None)
+        self._xml.endElement("Project")
+        self._xml.endDocument()
+        try:
+            self._qde.seek(0)
+            with self._zip.open("project.qde", "w", force_zip64=True) as entry:
+                shutil.copyfileobj(self._qde, entry)
+        finally:
+            self._closed = True
+            self._spool.close()
+            self._zip.close()
+        logger.debug(
+            "refi_qda_writer: %d codes, %d sources to %s",
+            len(self._code_guids),
+            len(self._source_guids),
+            self._output_path,
+        )
+
+    def abort(self) -> None:
+        """Discard the archive written so far."""
+        if self._closed:
+            return
+        self._closed = True
+        self._spool.close()
+        with contextlib.suppress(OSError, ValueError):
+            self._zip.close()
+        self._output_path.unlink(missing_ok=True)
+
+    def _enter_section(self, section: str | None) -> None:
+        """Close the current section and open the next, in document order."""
+        if section == self._section:
+            return
+        if section is not None and _SECTIONS.index(section) < _SECTIONS.index(
+            self._section
+        ):
+            raise ValueError(f"{section} written after {self._section}")
+        # CodeBook and Sources have wrapper elements; codings sit under Project
+        if self._section in ("CodeBook", "Sources"):
+            self._xml.endElement(self._section)
+        if section in ("CodeBook", "Sources"):
+            self._xml.startElement(section, {})
+        self._section = section
+
+    def _code(self, code: Code) -> None:
+        guid = str(uuid4())
+        self._code_guids[code.id.value] = guid
+        self._xml.startElement(
+            "Code",
+            {
+                "guid": guid,
+                "name": code.name,
+                "isCodable": "true",
+                "color": code.color.to_hex(),
+            },
+        )
+        self._description(code.memo)
+        self._xml.endElement("Code")
+
+    def _description(self, memo: str | None) -> None:
+        if memo:
+            self._xml.startElement("Description", {})
+            self._xml.characters(memo)
+            self._xml.endElement("Description")
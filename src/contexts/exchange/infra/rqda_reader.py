@@ -3,11 +3,20 @@ Exchange Infra: RQDA Reader
 
 Reads RQDA SQLite databases (.rqda files) used by the R-based RQDA package.
 RQDA uses status=1 for active records and status=0 for deleted.
+
+RqdaReader streams rows with ``fetchmany``, so a legacy project with
+millions of codings is read a bounded batch at a time:
+
+    with RqdaReader(db_path) as reader:
+        for code in reader.codes(): ...
+        for source in reader.sources(): ...
+        for batch in reader.coding_batches(): ...
 """
 
 from __future__ import annotations
 
 import sqlite3
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -34,7 +43,7 @@ class RqdaSource:
     memo: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RqdaCoding:
     """A coding (segment) from RQDA database."""
 
@@ -45,6 +54,17 @@ class RqdaCoding:
     end: int
 
 
+# Rows fetched per round trip
+FETCH_SIZE = 5_000
+
+# Sources carry their full text, so fewer are fetched at a time
+SOURCE_FETCH_SIZE = 50
+
+_CODES_SQL = "SELECT id, name, color, memo FROM freecode WHERE status=1"
+_SOURCES_SQL = "SELECT id, name, file, memo FROM source WHERE status=1"
+_CODINGS_SQL = "SELECT cid, fid, seltext, selfirst, selend FROM coding WHERE status=1"
+
+
 @dataclass
 class RqdaParseResult:
     """Result of reading an RQDA database."""
@@ -64,53 +84,81 @@ def read_rqda(db_path: Path | str) -> RqdaParseResult:
     Returns:
         RqdaParseResult with codes, sources, and codings
     """
-    db_path = Path(db_path)
-    result = RqdaParseResult()
-
-    conn = sqlite3.connect(str(db_path))
-    conn.row_factory = sqlite3.Row
-
-    try:
-        # Read codes (freecode table, status=1 means active)
-        for row in conn.execute(
-            "SELECT id, name, color, memo FROM freecode WHERE status=1"
-        ):
-            result.codes.append(
-                RqdaCode(
-                    id=row["id"],
-                    name=row["name"],
-                    color=row["color"] or DEFAULT_IMPORT_COLOR,
-                    memo=row["memo"],
+    with RqdaReader(db_path) as reader:
+        return RqdaParseResult(
+            codes=list(reader.codes()),
+            sources=list(reader.sources()),
+            codings=[c for batch in reader.coding_batches() for c in batch],
+        )
+
+
+class RqdaReader:
+    """
+    Streaming reader for an RQDA database, opened read-only.
+
+    Raises:
+        sqlite3.Error: If the database cannot be opened or queried; rows
+            are fetched lazily, so also while iterating
+    """
+
+    def __init__(self, db_path: Path | str) -> None:
+        uri = Path(db_path).resolve().as_uri() + "?mode=ro"
+        self._conn = sqlite3.connect(uri, uri=True)
+
+    def __enter__(self) -> RqdaReader:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def count_rows(self) -> int:
+        """Number of active codes, sources and codings."""
+        total = 0
+        for table in ("freecode", "source", "coding"):
+            sql = f"SELECT COUNT(*) FROM {table} WHERE status=1"
+            total += self._conn.execute(sql).fetchone()[0]
+        return total
+
+    def codes(self) -> Iterator[RqdaCode]:
+        """Active codes (freecode table)."""
+        for rows in self._fetch(_CODES_SQL, FETCH_SIZE):
+            for code_id, name, color, memo in rows:
+                yield RqdaCode(
+                    id=code_id,
+                    name=name,
+                    color=color or DEFAULT_IMPORT_COLOR,
+                    memo=memo,
                 )
-            )
-
-        # Read sources (source table)
-        for row in conn.execute(
-            "SELECT id, name, file, memo FROM source WHERE status=1"
-        ):
-            result.sources.append(
-                RqdaSource(
-                    id=row["id"],
-                    name=row["name"],
-                    fulltext=row["file"] or "",
-                    memo=row["memo"],
+
+    def sources(self) -> Iterator[RqdaSource]:
+        """Active sources with their text (source table)."""
+        for rows in self._fetch(_SOURCES_SQL, SOURCE_FETCH_SIZE):
+            for source_id, name, fulltext, memo in rows:
+                yield RqdaSource(
+                    id=source_id, name=name, fulltext=fulltext or "", memo=memo
                 )
-            )
 
-        # Read codings
-        for row in conn.execute(
-            "SELECT cid, fid, seltext, selfirst, selend FROM coding WHERE status=1"
-        ):
-            result.codings.append(
+    def coding_batches(self, size: int = FETCH_SIZE) -> Iterator[list[RqdaCoding]]:
+        """Active codings, ``size`` at a time (coding table)."""
+        for rows in self._fetch(_CODINGS_SQL, size):
+            yield [
                 RqdaCoding(
-                    code_id=row["cid"],
-                    source_id=row["fid"],
-                    selected_text=row["seltext"] or "",
-                    start=row["selfirst"],
-                    end=row["selend"],
+                    code_id=cid,
+                    source_id=fid,
+                    selected_text=seltext or "",
+                    start=start,
+                    end=end,
                 )
-            )
-    finally:
-        conn.close()
-
-    return result
+                for cid, fid, seltext, start, end in rows
+            ]
+
+    def _fetch(self, sql: str, size: int) -> Iterator[list[tuple]]:
+        cursor = self._conn.execute(sql)
+        try:
+            while rows := cursor.fetchmany(size):
+                yield rows
+        finally:
+            cursor.close()
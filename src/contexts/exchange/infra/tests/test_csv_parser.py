@@ -65,3 +65,60 @@ class TestCsvParser:
         result = parse_survey_csv(csv_text)
         assert len(result.rows) == 0
         assert result.headers == expected_headers
+
+
+@allure.epic("QualCoder v2")
+@allure.feature("QC-039 Import Export Formats")
+@allure.story("QC-036.05 Import Survey CSV")
+class TestSurveyCsvReader:
+    """Tests for the streaming survey CSV reader."""
+
+    @allure.title("Rows are streamed in batches after the sampled prefix")
+    def test_sample_and_batches(self, tmp_path):
+        from src.contexts.exchange.infra.csv_parser import SurveyCsvReader
+
+        path = tmp_path / "survey.csv"
+        lines = ["Name,Age,Age,Comment"] + [f"P{i},{i}" for i in range(7)]
+        path.write_text("\ufeff" + "\n".join(lines) + '\n\nP7,7,8,"a, b",extra\n')
+
+        with SurveyCsvReader(path) as reader:
+            assert reader.headers == ["Name", "Age", "Age", "Comment"]
+            assert (reader.name_column, reader.name_index) == ("Name", 0)
+            assert reader.attribute_columns == {1: "Age", 3: "Comment"}
+            assert [row[0] for row in reader.sample(3)] == ["P0", "P1", "P2"]
+            batches = list(reader.row_batches(3))
+
+        assert [len(batch) for batch in batches] == [3, 3, 2]
+        assert batches[0][1] == ["P1", "1", "", ""]
+        assert batches[-1][-1] == ["P7", "7", "8", "a, b"]
+
+    @allure.title("Attribute types are inferred from the sampled values")
+    def test_infer_attribute_types(self):
+        from datetime import datetime
+
+        from src.contexts.cases.core.entities import AttributeType
+        from src.contexts.exchange.infra.csv_parser import (
+            infer_attribute_types,
+            parse_attribute_value,
+        )
+
+        sample = [
+            ["30", "TRUE", "2024-03-01", "1.5", ""],
+            ["-4", "false", "2023-12-31", "2", ""],
+            ["", "", "", "x", ""],
+        ]
+        types = infer_attribute_types(sample, range(5))
+
+        assert types == {
+            0: AttributeType.NUMBER,
+            1: AttributeType.BOOLEAN,
+            2: AttributeType.DATE,
+            3: AttributeType.TEXT,
+            4: AttributeType.TEXT,
+        }
+        assert parse_attribute_value("-4", AttributeType.NUMBER) == -4
+        assert parse_attribute_value("TRUE", AttributeType.BOOLEAN) is True
+        assert parse_attribute_value("2024-03-01", AttributeType.DATE) == datetime(
+            2024, 3, 1
+        )
+        assert parse_attribute_value("n/a", AttributeType.NUMBER) is None
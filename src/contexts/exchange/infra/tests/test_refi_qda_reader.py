@@ -104,3 +104,164 @@ class TestRefiQdaReader:
         assert len(result.codes) == 1
         assert result.codes[0].name == "Joy"
         assert result.codes[0].category_guid == "cat1"
+
+
+STANDARD_XML = """\
+<?xml version="1.0" encoding="utf-8"?>
+<Project xmlns="urn:QDA-XML:project:1.0" name="Fieldwork">
+  <CodeBook>
+    <Codes>
+      <Code guid="c1" name="Joy" isCodable="true">
+        <Code guid="c1a" name="Relief" isCodable="true"/>
+      </Code>
+    </Codes>
+  </CodeBook>
+  <Sources>
+    <TextSource guid="s1" name="a.txt" plainTextPath="internal://s1.txt">
+      <PlainTextSelection guid="p1" startPosition="0" endPosition="5">
+        <Coding guid="k1"><CodeRef targetGUID="c1"/></Coding>
+      </PlainTextSelection>
+    </TextSource>
+    <TextSource guid="s2" name="b.txt" plainTextPath="internal://s2.txt"/>
+  </Sources>
+  <Cases>
+    <Case guid="case1" name="Alice">
+      <Description>First participant</Description>
+      <SourceRef targetGUID="s1"/>
+      <SourceRef targetGUID="s2"/>
+    </Case>
+  </Cases>
+</Project>
+"""
+
+
+def _make_large_qdpx(tmp_path, n_sources: int):
+    """A .qdpx with n_sources external texts, three selections each."""
+    qdpx_path = tmp_path / f"large_{n_sources}.qdpx"
+    with zipfile.ZipFile(qdpx_path, "w", zipfile.ZIP_DEFLATED) as zf:
+        with zf.open("project.qde", "w") as qde:
+            qde.write(
+                b'<Project xmlns="urn:QDA-XML:project:1.0" name="Large">'
+                b'<CodeBook><Codes><Code guid="c1" name="A" isCodable="true"/>'
+                b"</Codes></CodeBook><Sources>"
+            )
+            for i in range(n_sources):
+                selections = "".join(
+                    f'<PlainTextSelection guid="p{i}_{j}" startPosition="{j}" '
+                    f'endPosition="{j + 4}"><Coding guid="k{i}_{j}">'
+                    '<CodeRef targetGUID="c1"/></Coding></PlainTextSelection>'
+                    for j in range(3)
+                )
+                qde.write(
+                    f'<TextSource guid="s{i}" name="s{i}.txt" '
+                    f'plainTextPath="internal://s{i}.txt">{selections}'
+                    "</TextSource>".encode()
+                )
+            qde.write(b"</Sources></Project>")
+        for i in range(n_sources):
+            zf.writestr(f"Sources/s{i}.txt", f"Transcript {i} " * 50)
+    return qdpx_path
+
+
+@allure.epic("QualCoder v2")
+@allure.feature("QC-039 Import Export Formats")
+@allure.story("QC-036.01 Import REFI-QDA")
+class TestRefiQdaStreamingReader:
+    @allure.title("Yields sources with their selections, then cases, in order")
+    def test_items_in_document_order(self, tmp_path):
+        from src.contexts.exchange.infra.refi_qda_reader import (
+            ParsedCase,
+            ParsedCode,
+            ParsedCoding,
+            ParsedSource,
+            RefiQdaReader,
+        )
+
+        qdpx = _make_qdpx(
+            tmp_path,
+            STANDARD_XML,
+            {"Sources/s1.txt": "Happy days.", "Sources/s2.txt": "Second."},
+        )
+        with RefiQdaReader(qdpx) as reader:
+            items = list(reader.items())
+            assert reader.project_name == "Fieldwork"
+
+            assert items == [
+                ParsedCode(guid="c1", name="Joy"),
+                ParsedSource(guid="s1", name="a.txt", text_path="Sources/s1.txt"),
+                ParsedCoding(code_guid="c1", source_guid="s1", start=0, end=5),
+                ParsedSource(guid="s2", name="b.txt", text_path="Sources/s2.txt"),
+                ParsedCase(
+                    guid="case1",
+                    name="Alice",
+                    memo="First participant",
+                    source_guids=("s1", "s2"),
+                ),
+            ]
+            assert reader.read_text(items[1]) == "Happy days."
+
+    @allure.title("Source texts are read from the archive only when asked for")
+    def test_source_text_read_lazily(self, tmp_path, monkeypatch):
+        from src.contexts.exchange.infra.refi_qda_reader import (
+            ParsedSource,
+            RefiQdaReader,
+        )
+
+        qdpx = _make_qdpx(
+            tmp_path,
+            STANDARD_XML,
+            {"Sources/s1.txt": "Happy days.", "Sources/s2.txt": "Second."},
+        )
+        reads: list[str] = []
+        original = zipfile.ZipFile.read
+        monkeypatch.setattr(
+            zipfile.ZipFile,
+            "read",
+            lambda self, name, pwd=None: reads.append(name)
+            or original(self, name, pwd),
+        )
+        with RefiQdaReader(qdpx) as reader:
+            sources = [i for i in reader.items() if isinstance(i, ParsedSource)]
+            assert reads == []
+            assert reader.read_text(sources[1]) == "Second."
+            assert reads == ["Sources/s2.txt"]
+
+    @allure.title("Peak memory does not grow with the number of sources")
+    def test_memory_bounded(self, tmp_path):
+        import tracemalloc
+
+        from src.contexts.exchange.infra.refi_qda_reader import (
+            ParsedSource,
+            RefiQdaReader,
+        )
+
+        peaks = []
+        for n_sources in (200, 4000):
+            with RefiQdaReader(_make_large_qdpx(tmp_path, n_sources)) as reader:
+                tracemalloc.start()
+                try:
+                    count = 0
+                    for item in reader.items():
+                        count += 1
+                        if isinstance(item, ParsedSource):
+                            reader.read_text(item)
+                    peaks.append(tracemalloc.get_traced_memory()[1])
+                finally:
+                    tracemalloc.stop()
+            assert count == 1 + n_sources * 4
+
+        assert peaks[1] < peaks[0] * 2
+
+    @allure.title("Reports how far project.qde has been parsed")
+    def test_progress(self, tmp_path):
+        from src.contexts.exchange.infra.refi_qda_reader import RefiQdaReader
+
+        with RefiQdaReader(_make_large_qdpx(tmp_path, 2000)) as reader:
+            done, size = reader.progress()
+            assert done == 0
+            assert size > 0
+            positions = [reader.progress()[0] for _ in reader.items()]
+
+        assert positions == sorted(positions)
+        assert 0 < positions[0] < size
+        assert positions[-1] == size
@@ -98,3 +98,50 @@ class TestRefiQdaWriter:
         assert output.exists()
         with zipfile.ZipFile(output) as zf:
             assert "project.qde" in zf.namelist()
+
+
+@allure.epic("QualCoder v2")
+@allure.feature("QC-039 Import Export Formats")
+@allure.story("QC-036.02 Export REFI-QDA")
+class TestRefiQdaStreamingWriter:
+    """Tests for writing a .qdpx archive section by section."""
+
+    @allure.title("Source texts are streamed to internal:// archive entries")
+    def test_streams_source_texts(self, tmp_path):
+        from src.contexts.exchange.infra.refi_qda_reader import (
+            ParsedSource,
+            RefiQdaReader,
+        )
+        from src.contexts.exchange.infra.refi_qda_writer import RefiQdaWriter
+
+        output = tmp_path / "project.qdpx"
+        with RefiQdaWriter(output, "Streamed") as writer:
+            writer.write_codebook([], [])
+            guid = writer.add_source(
+                SourceId.new(), "interview.txt", iter(["I felt ", "", "happy é"])
+            )
+            writer.add_source(SourceId.new(), "photo.jpg", [])
+
+        with zipfile.ZipFile(output) as zf:
+            assert sorted(zf.namelist()) == ["Sources/" + guid + ".txt", "project.qde"]
+            root = ET.fromstring(zf.read("project.qde"))
+        ns = {"qda": "urn:QDA-XML:project:1.0"}
+        text_sources = root.findall(".//qda:TextSource", ns)
+        assert [s.get("plainTextPath") for s in text_sources] == [
+            f"internal://{guid}.txt",
+            None,
+        ]
+
+        with RefiQdaReader(output) as reader:
+            parsed = [i for i in reader.items() if isinstance(i, ParsedSource)]
+            assert reader.read_text(parsed[0]) == "I felt happy é"
+
+    @allure.title("Sections out of order are rejected and the archive removed")
+    def test_out_of_order(self, tmp_path):
+        from src.contexts.exchange.infra.refi_qda_writer import RefiQdaWriter
+
+        output = tmp_path / "project.qdpx"
+        with pytest.raises(ValueError), RefiQdaWriter(output) as writer:
+            writer.add_codings([])
+            writer.write_codebook([], [])
+        assert not output.exists()
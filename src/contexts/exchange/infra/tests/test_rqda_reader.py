@@ -114,3 +114,31 @@ class TestRqdaReader:
         assert len(result.codes) == 0
         assert len(result.sources) == 0
         assert len(result.codings) == 0
+
+    @allure.title("Codings are streamed in batches from a read-only connection")
+    def test_coding_batches(self, tmp_path):
+        from src.contexts.exchange.infra.rqda_reader import RqdaCoding, RqdaReader
+
+        db_path = tmp_path / "project.rqda"
+        conn = _create_rqda_db(db_path)
+        conn.execute("INSERT INTO freecode (name, id, status) VALUES ('Joy', 1, 1)")
+        conn.executemany(
+            "INSERT INTO coding (cid, fid, seltext, selfirst, selend, status) "
+            "VALUES (1, 1, ?, ?, ?, ?)",
+            [(f"text {i}", i, i + 4, 0 if i == 3 else 1) for i in range(12)],
+        )
+        conn.commit()
+        conn.close()
+
+        with RqdaReader(db_path) as reader:
+            batches = list(reader.coding_batches(size=5))
+            assert reader.count_rows() == 12
+            assert [c.name for c in reader.codes()] == ["Joy"]
+            with pytest.raises(sqlite3.OperationalError):
+                reader._conn.execute("DELETE FROM coding")
+
+        assert [len(batch) for batch in batches] == [5, 5, 1]
+        assert batches[0][0] == RqdaCoding(
+            code_id=1, source_id=1, selected_text="text 0", start=0, end=4
+        )
+        assert 3 not in [c.start for batch in batches for c in batch]
@@ -85,6 +85,17 @@ EXCHANGE_TOOLS = {
                 description="Column to use as case name (CSV only)",
                 required=False,
             ),
+            ToolParameter(
+                name="bulk",
+                type="boolean",
+                description=(
+                    "Write codes, sources and codings in batches and publish one "
+                    "summary event instead of one per item (refi_qda only). "
+                    "Much faster for large projects."
+                ),
+                required=False,
+                default=False,
+            ),
         ),
     ),
 }
@@ -240,7 +251,9 @@ class ExchangeTools:
 
         elif fmt == "refi_qda":
             result = self._coordinator.import_refi_qda(
-                ImportRefiQdaCommand(source_path=source_path),
+                ImportRefiQdaCommand(
+                    source_path=source_path, bulk=bool(args.get("bulk", False))
+                ),
             )
             return result.to_dict()
 
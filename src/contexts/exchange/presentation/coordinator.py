@@ -23,6 +23,8 @@ from src.contexts.exchange.core.commands import (
 from src.shared.common.operation_result import OperationResult
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from src.shared.infra.event_bus import EventBus
     from src.shared.infra.session import Session
 
@@ -134,7 +136,12 @@ class ExchangeCoordinator:
             session=self._session,
         )
 
-    def import_refi_qda(self, command: ImportRefiQdaCommand) -> OperationResult:
+    def import_refi_qda(
+        self,
+        command: ImportRefiQdaCommand,
+        on_progress: Callable[[int, int], None] | None = None,
+        is_cancelled: Callable[[], bool] | None = None,
+    ) -> OperationResult:
         """Import a REFI-QDA project (.qdpx)."""
         from src.contexts.exchange.core.commandHandlers.import_refi_qda import (
             import_refi_qda,
@@ -148,9 +155,15 @@ class ExchangeCoordinator:
             segment_repo=self._segment_repo,
             event_bus=self._event_bus,
             session=self._session,
+            on_progress=on_progress,
+            is_cancelled=is_cancelled,
         )
 
-    def import_rqda(self, command: ImportRqdaCommand) -> OperationResult:
+    def import_rqda(
+        self,
+        command: ImportRqdaCommand,
+        on_progress: Callable[[int, int], None] | None = None,
+    ) -> OperationResult:
         """Import an RQDA project (.rqda SQLite database)."""
         from src.contexts.exchange.core.commandHandlers.import_rqda import import_rqda
 
@@ -162,4 +175,5 @@ class ExchangeCoordinator:
             segment_repo=self._segment_repo,
             event_bus=self._event_bus,
             session=self._session,
+            on_progress=on_progress,
         )
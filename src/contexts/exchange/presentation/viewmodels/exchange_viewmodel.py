@@ -76,9 +76,10 @@ class ExchangeViewModel:
         )
         return self._handle_result(result)
 
-    def import_refi_qda(self, source_path: str) -> bool:
+    def import_refi_qda(self, source_path: str, bulk: bool = True) -> bool:
+        # Bulk: one transaction and one summary event; views refresh on it
         result = self._coordinator.import_refi_qda(
-            ImportRefiQdaCommand(source_path=source_path),
+            ImportRefiQdaCommand(source_path=source_path, bulk=bulk),
         )
         return self._handle_result(result)
 
@@ -13,7 +13,7 @@ from src.contexts.folders.core.derivers import FolderState
 
 if TYPE_CHECKING:
     from src.contexts.folders.core.entities import Folder
-    from src.contexts.projects.core.entities import Source
+    from src.contexts.projects.core.entities import Source, SourceSummary
     from src.shared.common.types import FolderId, SourceId
 
 
@@ -41,7 +41,7 @@ class FolderRepository(Protocol):
 class SourceRepository(Protocol):
     """Protocol for source repository operations needed for folder operations."""
 
-    def get_all(self) -> list[Source]: ...
+    def list_summaries(self) -> list[SourceSummary]: ...
     def get_by_id(self, source_id: SourceId) -> Source | None: ...
     def get_by_folder(self, folder_id: FolderId | None) -> list[Source]: ...
     def save(self, source: Source) -> None: ...
@@ -53,7 +53,7 @@ def build_folder_state(
 ) -> FolderState:
     """Build FolderState from repos (source of truth) for use with derivers."""
     existing_folders = tuple(folder_repo.get_all()) if folder_repo else ()
-    existing_sources = tuple(source_repo.get_all()) if source_repo else ()
+    existing_sources = tuple(source_repo.list_summaries()) if source_repo else ()
     return FolderState(
         existing_folders=existing_folders,
         existing_sources=existing_sources,
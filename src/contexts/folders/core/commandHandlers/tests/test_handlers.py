@@ -122,6 +122,9 @@ class MockSourceRepository:
     def get_all(self) -> list[Source]:
         return list(self._sources.values())
 
+    def list_summaries(self) -> list[Source]:
+        return list(self._sources.values())
+
     def get_by_id(self, source_id: SourceId) -> Source | None:
         return self._sources.get(source_id.value)
 
@@ -33,7 +33,7 @@ from src.contexts.folders.core.invariants import (
     is_folder_name_unique,
     is_valid_folder_name,
 )
-from src.contexts.projects.core.entities import Source
+from src.contexts.projects.core.entities import Source, SourceSummary
 from src.shared.common.types import FolderId, SourceId
 
 # ============================================================
@@ -50,7 +50,7 @@ class FolderState:
     """
 
     existing_folders: tuple[Folder, ...] = ()
-    existing_sources: tuple[Source, ...] = ()
+    existing_sources: tuple[Source | SourceSummary, ...] = ()
 
 
 # ============================================================
@@ -7,6 +7,7 @@ Implements the repository for Folder entities using the src_folder table.
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterable, Sequence
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 
@@ -15,6 +16,7 @@ from sqlalchemy import delete, func, select, update
 from src.contexts.folders.core.entities import Folder
 from src.contexts.folders.infra.schema import src_folder
 from src.shared.common.types import FolderId
+from src.shared.infra.repositories.bulk import delete_many, upsert_many
 
 if TYPE_CHECKING:
     from sqlalchemy import Connection
@@ -84,37 +86,21 @@ class SQLiteFolderRepository:
     def save(self, folder: Folder) -> None:
         """Save a folder (insert or update)."""
         logger.debug("save: %s (name=%s)", folder.id.value, folder.name)
-        exists = self.exists(folder.id)
-        parent_id_value = folder.parent_id.value if folder.parent_id else None
-
-        if exists:
-            stmt = (
-                update(src_folder)
-                .where(src_folder.c.id == folder.id.value)
-                .values(
-                    name=folder.name,
-                    parent_id=parent_id_value,
-                )
-            )
-        else:
-            stmt = src_folder.insert().values(
-                id=folder.id.value,
-                name=folder.name,
-                parent_id=parent_id_value,
-                created_at=folder.created_at,
-            )
-
-        self._conn.execute(stmt)
+        self._upsert((folder,))
         if self._outbox:
             self._outbox.write_upsert(
-                "folder",
-                folder.id.value,
-                {
-                    "name": folder.name,
-                    "parent_id": folder.parent_id.value if folder.parent_id else None,
-                },
+                "folder", folder.id.value, self._sync_payload(folder)
             )
 
+    def save_many(self, folders: Sequence[Folder]) -> int:
+        """Insert or update folders in one statement, returns count written."""
+        count = self._upsert(folders)
+        logger.debug("save_many: count=%d", count)
+        if self._outbox:
+            for f in folders:
+                self._outbox.write_upsert("folder", f.id.value, self._sync_payload(f))
+        return count
+
     def delete(self, folder_id: FolderId) -> None:
         """Delete a folder by ID."""
         logger.debug("delete: %s", folder_id.value)
@@ -123,6 +109,16 @@ class SQLiteFolderRepository:
         if self._outbox:
             self._outbox.write_delete("folder", folder_id.value)
 
+    def delete_many(self, folder_ids: Iterable[FolderId]) -> int:
+        """Delete folders by ID, returns count deleted."""
+        ids = [folder_id.value for folder_id in folder_ids]
+        count = delete_many(self._conn, src_folder.c.id, ids)
+        logger.debug("delete_many: count=%d", count)
+        if self._outbox:
+            for entity_id in ids:
+                self._outbox.write_delete("folder", entity_id)
+        return count
+
     def exists(self, folder_id: FolderId) -> bool:
         """Check if a folder exists."""
         stmt = select(func.count()).where(src_folder.c.id == folder_id.value)
@@ -169,6 +165,33 @@ class SQLiteFolderRepository:
             descendants.extend(self.get_descendants(child.id))
         return descendants
 
+    def _upsert(self, folders: Sequence[Folder]) -> int:
+        """Write folders with INSERT ... ON CONFLICT DO UPDATE (no probe)."""
+        rows = [
+            {
+                "id": f.id.value,
+                "name": f.name,
+                "parent_id": f.parent_id.value if f.parent_id else None,
+                "created_at": f.created_at,
+            }
+            for f in folders
+        ]
+        return upsert_many(
+            self._conn,
+            src_folder,
+            rows,
+            key="id",
+            update_columns=("name", "parent_id"),
+        )
+
+    @staticmethod
+    def _sync_payload(folder: Folder) -> dict:
+        """Fields mirrored to the sync outbox."""
+        return {
+            "name": folder.name,
+            "parent_id": folder.parent_id.value if folder.parent_id else None,
+        }
+
     def _row_to_folder(self, row) -> Folder:
         """Convert a database row to a Folder entity."""
         parent_id = FolderId(value=row.parent_id) if row.parent_id else None
@@ -64,6 +64,27 @@ class ImportFileSourceCommand:
     origin: str | None = None
     memo: str | None = None
     dry_run: bool = False  # If True, validate without persisting
+    folder_id: str | None = None  # Folder to place the source in (None = root)
+    skip_duplicates: bool = False  # Skip files whose content is already imported
+
+
+@dataclass(frozen=True)
+class ImportFolderCommand:
+    """Command to import every supported file under a directory."""
+
+    folder_path: str  # Absolute path to the directory to import
+    recursive: bool = True  # Descend into subdirectories
+    mirror_folders: bool = True  # Recreate subdirectories as project folders
+    origin: str | None = None
+    memo: str | None = None
+    dry_run: bool = False  # If True, return a count/size estimate only
+
+
+@dataclass(frozen=True)
+class CompressSourceTextsCommand:
+    """Command to re-store all source text with a text codec."""
+
+    codec: str | None  # "zlib" or "zstd"; None stores text plain again
 
 
 @dataclass(frozen=True)
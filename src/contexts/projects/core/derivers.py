@@ -18,7 +18,7 @@ from collections.abc import Callable
 from dataclasses import dataclass
 from pathlib import Path
 
-from src.contexts.projects.core.entities import Source, SourceStatus
+from src.contexts.projects.core.entities import Source, SourceStatus, SourceSummary
 from src.contexts.projects.core.events import (
     ProjectCreated,
     ProjectOpened,
@@ -60,7 +60,7 @@ class ProjectState:
 
     path_exists: Callable[[Path], bool] = lambda _: False
     parent_writable: Callable[[Path], bool] = lambda _: True
-    existing_sources: tuple[Source, ...] = ()
+    existing_sources: tuple[Source | SourceSummary, ...] = ()
 
 
 # FolderState re-exported from folders context
@@ -100,6 +100,11 @@ class Source:
     case_ids: tuple[int, ...] = ()  # Associated cases
     code_count: int = 0  # Number of codes applied
     fulltext: str | None = None  # Text content for text sources
+    content_hash: str | None = None  # BLAKE2b digest of the imported file
+    file_mtime_ns: int | None = None  # File mtime at import
+    # PDF: offset in fulltext where each page starts. Written with the text
+    # when set; loaded on demand (SourceRepository.get_page_map)
+    page_starts: tuple[int, ...] = ()
     created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
     modified_at: datetime = field(default_factory=lambda: datetime.now(UTC))
 
@@ -127,6 +132,51 @@ class Source:
         """Return new Source with updated name."""
         return replace(self, name=new_name, modified_at=datetime.now(UTC))
 
+    def with_file_content(
+        self,
+        fulltext: str | None,
+        file_size: int,
+        content_hash: str | None,
+        file_mtime_ns: int | None,
+        page_starts: tuple[int, ...] = (),
+    ) -> Source:
+        """Return new Source re-imported from a changed file."""
+        return replace(
+            self,
+            fulltext=fulltext,
+            file_size=file_size,
+            content_hash=content_hash,
+            file_mtime_ns=file_mtime_ns,
+            page_starts=page_starts,
+            modified_at=datetime.now(UTC),
+        )
+
+
+@dataclass(frozen=True)
+class SourceSummary:
+    """
+    Metadata-only view of a Source, without its text content.
+
+    Used by listings, counts and uniqueness checks so that browsing a
+    project never pulls every document's fulltext into memory. Load the
+    full Source (or just its text) by ID when the content is needed.
+    """
+
+    id: SourceId
+    name: str
+    source_type: SourceType
+    status: SourceStatus = SourceStatus.IMPORTED
+    file_path: Path | None = None
+    file_size: int = 0
+    memo: str | None = None
+    origin: str | None = None
+    folder_id: FolderId | None = None
+    code_count: int = 0
+    content_hash: str | None = None
+    file_mtime_ns: int | None = None
+    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    modified_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+
 
 # Folder entity re-exported from folders context
 from src.contexts.folders.core.entities import Folder  # noqa: F401, E402
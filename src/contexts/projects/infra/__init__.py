@@ -18,6 +18,7 @@ from src.contexts.projects.infra.schema import (
     metadata,
     prj_settings,
     project_settings,
+    upgrade_all_contexts,
 )
 from src.contexts.projects.infra.settings_repository import (
     SQLiteProjectSettingsRepository,
@@ -57,4 +58,5 @@ __all__ = [
     "drop_all",
     "drop_all_contexts",
     "metadata",
+    "upgrade_all_contexts",
 ]
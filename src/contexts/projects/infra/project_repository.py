@@ -12,12 +12,13 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from sqlalchemy import create_engine, func, inspect, select, update
+from sqlalchemy import create_engine, func, inspect, select, text, update
 
 from src.contexts.projects.core.entities import Project, ProjectId, ProjectSummary
 from src.contexts.projects.infra.schema import (
     create_all_contexts,
     project_settings,
+    upgrade_all_contexts,
 )
 
 if TYPE_CHECKING:
@@ -240,6 +241,15 @@ class SQLiteProjectRepository:
                 datetime.fromisoformat(created_at_str) if created_at_str else now
             )
 
+            # One transaction for the whole upgrade: SQLite would otherwise
+            # autocommit each DDL statement, keeping a half-applied migration
+            conn.execute(text("SAVEPOINT upgrade_schema"))
+            try:
+                upgrade_all_contexts(conn)
+            except Exception:
+                conn.rollback()
+                raise
+
             summary = self._compute_summary(conn)
 
             self._update_setting(conn, self.SETTING_LAST_OPENED_AT, now.isoformat())
@@ -296,33 +306,30 @@ class SQLiteProjectRepository:
         conn.execute(stmt)
 
     def _compute_summary(self, conn: Connection) -> ProjectSummary:
-        """Compute project summary statistics from the database."""
-        from src.contexts.coding.infra.schema import cod_code, cod_segment
-        from src.contexts.sources.infra.schema import src_source
+        """
+        Compute project summary statistics from the database.
 
-        def _count_where(table, condition=None) -> int:
-            """Count rows in a table, optionally filtered by condition."""
-            stmt = select(func.count()).select_from(table)
-            if condition is not None:
-                stmt = select(func.count()).where(condition)
-            return conn.execute(stmt).scalar() or 0
+        Source and segment totals come from the maintained count tables, so
+        the cost does not grow with the number of sources or segments.
+        """
+        from src.contexts.coding.infra.schema import cod_code
+        from src.contexts.coding.infra.segment_counts import total_segments
+        from src.contexts.sources.infra.source_counts import counts_by_type
 
         try:
+            by_type = counts_by_type(conn)
             return ProjectSummary(
-                total_sources=_count_where(src_source),
-                text_count=_count_where(src_source, src_source.c.source_type == "text"),
-                audio_count=_count_where(
-                    src_source, src_source.c.source_type == "audio"
-                ),
-                video_count=_count_where(
-                    src_source, src_source.c.source_type == "video"
-                ),
-                image_count=_count_where(
-                    src_source, src_source.c.source_type == "image"
-                ),
-                pdf_count=_count_where(src_source, src_source.c.source_type == "pdf"),
-                total_codes=_count_where(cod_code),
-                total_segments=_count_where(cod_segment),
+                total_sources=sum(by_type.values()),
+                text_count=by_type.get("text", 0),
+                audio_count=by_type.get("audio", 0),
+                video_count=by_type.get("video", 0),
+                image_count=by_type.get("image", 0),
+                pdf_count=by_type.get("pdf", 0),
+                total_codes=conn.execute(
+                    select(func.count()).select_from(cod_code)
+                ).scalar()
+                or 0,
+                total_segments=total_segments(conn),
             )
         except Exception:
             return ProjectSummary()
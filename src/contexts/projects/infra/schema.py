@@ -15,7 +15,9 @@ from sqlalchemy import (
     String,
     Table,
     Text,
+    text,
 )
+from sqlalchemy.schema import CreateIndex
 
 # Metadata for Projects context tables
 metadata = MetaData()
@@ -68,13 +70,20 @@ def create_all_contexts(engine) -> None:
     - Coding (cod_category, cod_code, cod_segment)
     - Cases (cas_case, cas_attribute, cas_source_link)
     - Storage (stg_data_store)
+    - Full-text search index over sources, segments and memos
+    - Maintained segment and source counts
+    - Codebook version counter
 
     Args:
         engine: SQLAlchemy engine instance
     """
     from src.contexts.cases.infra import schema as cases_schema
     from src.contexts.coding.infra import schema as coding_schema
+    from src.contexts.coding.infra.codebook_version import create_codebook_version
+    from src.contexts.coding.infra.segment_counts import create_segment_counts
     from src.contexts.sources.infra import schema as sources_schema
+    from src.contexts.sources.infra.fulltext_index import create_fulltext_index
+    from src.contexts.sources.infra.source_counts import create_source_counts
     from src.contexts.storage.infra import schema as storage_schema
 
     # Create tables in dependency order
@@ -84,6 +93,73 @@ def create_all_contexts(engine) -> None:
     cases_schema.metadata.create_all(engine)  # Cases context
     storage_schema.metadata.create_all(engine)  # Storage context
 
+    with engine.begin() as conn:
+        create_fulltext_index(conn)  # Spans sources + coding tables
+        create_segment_counts(conn)
+        create_codebook_version(conn)
+        create_source_counts(conn)
+
+
+def upgrade_all_contexts(connection) -> None:
+    """
+    Bring an existing project database up to date.
+
+    Adds columns and creates derived objects (indexes, triggers) that were
+    added after the database was created. Every step is idempotent and cheap when the
+    database is already current. Does not commit.
+
+    Args:
+        connection: SQLAlchemy connection or Session for the open project
+    """
+    from src.contexts.coding.infra.codebook_version import create_codebook_version
+    from src.contexts.coding.infra.schema import upgrade_segment_indexes
+    from src.contexts.coding.infra.segment_counts import create_segment_counts
+    from src.contexts.sources.infra.fulltext_index import create_fulltext_index
+    from src.contexts.sources.infra.schema import upgrade_source_columns
+    from src.contexts.sources.infra.source_counts import create_source_counts
+
+    upgrade_source_columns(connection)
+    upgrade_segment_indexes(connection)
+    create_missing_indexes(connection)
+    create_fulltext_index(connection)
+    create_segment_counts(connection)
+    create_codebook_version(connection)
+    create_source_counts(connection)
+
+
+def create_missing_indexes(connection) -> None:
+    """
+    Create the indexes of every context's tables that are missing.
+
+    Restoring a snapshot re-creates tables from their CREATE TABLE
+    statement alone, which drops their indexes. Idempotent.
+
+    Args:
+        connection: SQLAlchemy connection or Session
+    """
+    from src.contexts.cases.infra import schema as cases_schema
+    from src.contexts.coding.infra import schema as coding_schema
+    from src.contexts.sources.infra import schema as sources_schema
+    from src.contexts.storage.infra import schema as storage_schema
+
+    tables = set(
+        connection.execute(
+            text("SELECT name FROM sqlite_master WHERE type = 'table'")
+        ).scalars()
+    )
+    for context_metadata in (
+        metadata,
+        sources_schema.metadata,
+        coding_schema.metadata,
+        cases_schema.metadata,
+        storage_schema.metadata,
+    ):
+        for table in context_metadata.sorted_tables:
+            if table.name not in tables:
+                continue
+            for index in table.indexes:
+                connection.execute(CreateIndex(index, if_not_exists=True))
+
 
 def drop_all_contexts(engine) -> None:
     """
@@ -94,9 +170,18 @@ def drop_all_contexts(engine) -> None:
     """
     from src.contexts.cases.infra import schema as cases_schema
     from src.contexts.coding.infra import schema as coding_schema
+    from src.contexts.coding.infra.codebook_version import drop_codebook_version
+    from src.contexts.coding.infra.segment_counts import drop_segment_counts
     from src.contexts.sources.infra import schema as sources_schema
+    from src.contexts.sources.infra.fulltext_index import drop_fulltext_index
+    from src.contexts.sources.infra.source_counts import drop_source_counts
 
     # Drop in reverse order of dependencies
+    with engine.begin() as conn:
+        drop_fulltext_index(conn)
+        drop_segment_counts(conn)
+        drop_codebook_version(conn)
+        drop_source_counts(conn)
     cases_schema.metadata.drop_all(engine)
     coding_schema.metadata.drop_all(engine)
     sources_schema.metadata.drop_all(engine)
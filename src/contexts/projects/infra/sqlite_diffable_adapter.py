@@ -2,17 +2,41 @@
 
 from __future__ import annotations
 
+import ast
 import subprocess
 from pathlib import Path
 
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.contexts.projects.infra.schema import upgrade_all_contexts
+from src.contexts.sources.infra.schema import clear_speaker_turns
 from src.shared.common.operation_result import OperationResult
 
 VCS_DIR_NAME = ".qualcoder-vcs"
 
 EXCLUDE_TABLES = (
     "sqlite_sequence",
+    # Full-text index: derived data, rebuilt from the source tables on open
     "source_fulltext_fts",
+    "source_fulltext_fts_data",
+    "source_fulltext_fts_idx",
+    "source_fulltext_fts_docsize",
+    "source_fulltext_fts_config",
     "source_fulltext_data",
+    # Maintained counts: derived data, rebuilt from the source tables on open
+    "cod_segment_count_code",
+    "cod_segment_count_source",
+    "cod_segment_count_code_source",
+    "src_source_count_type",
+    "src_source_count_folder",
+    # Codebook version: bumped by triggers on every code or category write
+    "cod_codebook_version",
+    # File metadata cache: keyed by absolute paths and mtimes of this machine
+    "src_file_metadata",
+    # Speaker turns: derived from the source texts, cleared after a restore
+    "src_speaker_index",
+    "src_speaker_turn",
 )
 
 
@@ -50,6 +74,9 @@ class SqliteDiffableAdapter:
     def load(self, db_path: Path, snapshot_dir: Path) -> OperationResult:
         """Load database from diffable JSON format.
 
+        ``load --replace`` re-creates the loaded tables without their
+        triggers, so the excluded derived data is rebuilt afterwards.
+
         Args:
             db_path: Path to the SQLite database file (not a directory).
             snapshot_dir: Directory containing ndjson snapshot files.
@@ -71,7 +98,29 @@ class SqliteDiffableAdapter:
             )
 
         cmd = ["sqlite-diffable", "load", str(db_path), str(snapshot_dir), "--replace"]
-        return self._run_cli(cmd, "VCS_NOT_LOADED")
+        result = self._run_cli(cmd, "VCS_NOT_LOADED")
+        if result.is_failure:
+            return result
+        return self._rebuild_derived(db_path)
+
+    def _rebuild_derived(self, db_path: Path) -> OperationResult:
+        """Re-create triggers and rebuild the derived tables after a load."""
+        engine = create_engine(f"sqlite:///{db_path}")
+        try:
+            with engine.begin() as conn:
+                _restore_blobs(conn)
+                # Finds the triggers missing and resyncs counts and FTS
+                upgrade_all_contexts(conn)
+                # Not in the snapshot, so they still describe the old texts
+                clear_speaker_turns(conn)
+        except (SQLAlchemyError, SyntaxError, ValueError) as e:
+            return OperationResult.fail(
+                error=f"Failed to rebuild derived data: {e}",
+                error_code="VCS_NOT_LOADED/REBUILD_FAILED",
+            )
+        finally:
+            engine.dispose()
+        return OperationResult.ok()
 
     def get_vcs_dir(self, project_path: Path) -> Path:
         """Get path to the .qualcoder-vcs directory."""
@@ -105,3 +154,35 @@ class SqliteDiffableAdapter:
                 error=f"Failed to run sqlite-diffable: {e}",
                 error_code=f"{error_prefix}/OS_ERROR",
             )
+
+
+def _restore_blobs(conn, batch_size: int = 500) -> None:
+    """Turn BLOB values loaded back as their repr (``"b'...'"``) into bytes.
+
+    sqlite-diffable writes values JSON cannot hold with ``repr`` and loads
+    them as text, so compressed source text would not survive a restore.
+    """
+    tables = conn.execute(
+        text("SELECT name FROM sqlite_master WHERE type = 'table'")
+    ).scalars()
+    for table in list(tables):
+        columns = conn.execute(text(f"PRAGMA table_info('{table}')")).fetchall()
+        for column in (c.name for c in columns if c.type.upper() == "BLOB"):
+            select_repr = text(
+                f'SELECT rowid, "{column}" FROM "{table}" '
+                f"WHERE typeof(\"{column}\") = 'text' "
+                f"AND (\"{column}\" LIKE 'b''%' OR \"{column}\" LIKE 'b\"%') "
+                f"LIMIT {batch_size}"
+            )
+            update_value = text(
+                f'UPDATE "{table}" SET "{column}" = :value WHERE rowid = :rowid'
+            )
+            # Converted rows no longer match, so each batch starts afresh
+            while rows := conn.execute(select_repr).fetchall():
+                conn.execute(
+                    update_value,
+                    [
+                        {"value": ast.literal_eval(value), "rowid": rowid}
+                        for rowid, value in rows
+                    ],
+                )
@@ -26,6 +26,7 @@ MUTATION_EVENTS: tuple[str, ...] = (
     "coding.category_created",
     "coding.category_deleted",
     "coding.segment_coded",
+    "coding.segments_coded",
     "coding.segment_uncoded",
     "coding.segment_memo_updated",
     # Sources
@@ -44,6 +45,10 @@ MUTATION_EVENTS: tuple[str, ...] = (
     "folders.folder_created",
     "folders.folder_deleted",
     "folders.source_moved",
+    # Exchange (bulk imports publish one summary event)
+    "exchange.refi_qda_imported",
+    "exchange.rqda_imported",
+    "exchange.survey_csv_imported",
 )
 
 
@@ -150,7 +150,7 @@ class ProjectTools:
         sources_ctx = self._ctx.sources_context
         cases_ctx = self._ctx.cases_context
 
-        all_sources = sources_ctx.source_repo.get_all() if sources_ctx else []
+        all_sources = sources_ctx.source_repo.list_summaries() if sources_ctx else []
         all_cases = cases_ctx.case_repo.get_all() if cases_ctx else []
 
         context = {
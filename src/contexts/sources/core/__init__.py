@@ -5,7 +5,7 @@ Pure domain logic for the Sources bounded context.
 Provides entities, invariants, events, failure events, and derivers.
 
 Architecture:
-    - entities: Immutable data types (Source, SourceType, SourceStatus, Folder)
+    - entities: Immutable data types (Source, SourceSummary, SourceType, ...)
     - invariants: Pure predicate functions for business rules
     - events: Success events produced by derivers
     - failure_events: Failure events produced by derivers
@@ -26,6 +26,7 @@ from src.contexts.sources.core.entities import (
     Folder,
     Source,
     SourceStatus,
+    SourceSummary,
     SourceType,
 )
 
@@ -70,11 +71,15 @@ from src.contexts.sources.core.services import (
     Speaker,
     SpeakerDetector,
     SpeakerSegment,
+    SpeakerTurn,
+    count_speakers,
+    iter_speaker_turns,
 )
 
 __all__ = [
     # Entities
     "Source",
+    "SourceSummary",
     "SourceType",
     "SourceStatus",
     "Folder",
@@ -115,4 +120,7 @@ __all__ = [
     "Speaker",
     "SpeakerDetector",
     "SpeakerSegment",
+    "SpeakerTurn",
+    "count_speakers",
+    "iter_speaker_turns",
 ]
@@ -12,7 +12,17 @@ from typing import TYPE_CHECKING, Protocol, runtime_checkable
 from src.contexts.projects.core.derivers import ProjectState as DomainProjectState
 
 if TYPE_CHECKING:
-    from src.contexts.projects.core.entities import Source, SourceStatus, SourceType
+    from collections.abc import Iterable, Sequence
+    from pathlib import Path
+
+    from src.contexts.projects.core.entities import (
+        Source,
+        SourceStatus,
+        SourceSummary,
+        SourceType,
+    )
+    from src.contexts.sources.core.services.page_map import PageMap
+    from src.contexts.sources.infra.metadata_cache import MetadataResult
     from src.shared.common.types import FolderId, SourceId
 
 
@@ -21,27 +31,60 @@ class SourceRepository(Protocol):
     """Protocol for source repository operations needed by command handlers."""
 
     def get_all(self) -> list[Source]: ...
+    def list_summaries(self) -> list[SourceSummary]: ...
     def get_by_id(self, source_id: SourceId) -> Source | None: ...
     def get_by_name(self, name: str) -> Source | None: ...
     def get_by_type(self, source_type: SourceType) -> list[Source]: ...
     def get_by_status(self, status: SourceStatus) -> list[Source]: ...
     def get_by_folder(self, folder_id: FolderId | None) -> list[Source]: ...
     def save(self, source: Source) -> None: ...
+    def save_many(self, sources: Sequence[Source]) -> int: ...
     def delete(self, source_id: SourceId) -> None: ...
     def exists(self, source_id: SourceId) -> bool: ...
     def name_exists(self, name: str, exclude_id: SourceId | None = None) -> bool: ...
+    def get_summary_by_path(self, file_path: str | Path) -> SourceSummary | None: ...
+    def get_summary_by_content_hash(
+        self, content_hash: str
+    ) -> SourceSummary | None: ...
+    def content_hashes(self) -> set[str]: ...
+    def update_file_stat(
+        self,
+        source_id: SourceId,
+        file_size: int,
+        file_mtime_ns: int,
+        content_hash: str | None = None,
+    ) -> None: ...
+    def set_text_codec(self, codec: str | None) -> None: ...
+    def rewrite_text(self, source_id: SourceId) -> bool: ...
+    def stored_text_bytes(self) -> int: ...
+    def get_fulltext(self, source_id: SourceId) -> str | None: ...
+    def get_text_range(
+        self, source_id: SourceId, start: int, end: int
+    ) -> str | None: ...
+    def get_length(self, source_id: SourceId) -> int | None: ...
+    def get_page_map(self, source_id: SourceId) -> PageMap | None: ...
 
 
 @runtime_checkable
 class SegmentRepository(Protocol):
-    """Protocol for segment repository operations needed for cascade deletes."""
+    """Segment repository operations needed for cascade deletes and re-imports."""
 
     def delete_by_source(self, source_id: SourceId) -> int: ...
+    def count_by_source(self, source_id: SourceId) -> int: ...
+
+
+@runtime_checkable
+class MetadataCache(Protocol):
+    """Image/media metadata cache writes needed by batch imports."""
+
+    def put_many(
+        self, entries: Iterable[tuple[str, int, int, MetadataResult]]
+    ) -> int: ...
 
 
 def build_domain_state(source_repo: SourceRepository | None) -> DomainProjectState:
     """Build DomainProjectState from repo (source of truth) for use with derivers."""
-    existing_sources = tuple(source_repo.get_all()) if source_repo else ()
+    existing_sources = tuple(source_repo.list_summaries()) if source_repo else ()
     return DomainProjectState(
         path_exists=lambda p: p.exists(),
         parent_writable=lambda _p: True,
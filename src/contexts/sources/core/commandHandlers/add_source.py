@@ -20,7 +20,7 @@ from src.contexts.sources.core.commandHandlers._state import (
     SourceRepository,
     build_domain_state,
 )
-from src.contexts.sources.core.commandHandlers.import_file_source import extract_text
+from src.contexts.sources.infra.extraction_pool import extract_text_and_pages
 from src.shared.common.operation_result import OperationResult
 from src.shared.infra.metrics import metered_command
 from src.shared.infra.state import ProjectState
@@ -94,7 +94,7 @@ def add_source(
     event: SourceAdded = result
 
     # Step 3: Extract text content for text/PDF sources
-    fulltext = extract_text(event.source_type, event.file_path)
+    fulltext, page_starts = extract_text_and_pages(event.source_type, event.file_path)
     file_size = event.file_size
 
     # Create source entity
@@ -108,6 +108,7 @@ def add_source(
         origin=event.origin,
         memo=event.memo,
         fulltext=fulltext,
+        page_starts=page_starts,
     )
 
     # Step 4: Persist to repository (source of truth)
@@ -18,7 +18,6 @@ from src.contexts.projects.core.commands import (
 )
 from src.contexts.projects.core.entities import Source, SourceStatus, SourceType
 from src.contexts.projects.core.events import SourceAdded
-from src.contexts.projects.core.invariants import is_source_name_unique
 from src.contexts.sources.core.commandHandlers._state import SourceRepository
 from src.shared.common.operation_result import OperationResult
 from src.shared.common.types import SourceId
@@ -89,8 +88,7 @@ def add_text_source(
         )
 
     # Step 2: Check name uniqueness (invariant)
-    existing_sources = tuple(source_repo.get_all()) if source_repo else ()
-    if not is_source_name_unique(name, existing_sources):
+    if source_repo and source_repo.name_exists(name):
         logger.error("add_text_source: duplicate source name=%s", name)
         return OperationResult.fail(
             error=f"Source with name '{name}' already exists",
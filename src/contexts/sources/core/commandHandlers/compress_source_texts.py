@@ -0,0 +1,133 @@
+"""
+Compress Source Texts Use Case
+
+Functional use case for migrating the text of every source to compressed
+storage (or back to plain text). The codec is recorded as a project
+setting so sources imported later are stored the same way.
+
+Returns OperationResult with the number of sources rewritten and the
+stored text size before and after.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Protocol
+
+from src.contexts.projects.core.commands import CompressSourceTextsCommand
+from src.contexts.sources.core.commandHandlers._state import SourceRepository
+from src.contexts.sources.infra.text_compression import (
+    TEXT_CODEC_SETTING,
+    available_codecs,
+)
+from src.shared.common.operation_result import OperationResult
+from src.shared.infra.metrics import metered_command
+from src.shared.infra.state import ProjectState
+
+if TYPE_CHECKING:
+    from src.shared.infra.session import Session
+
+logger = logging.getLogger("qualcoder.sources.core")
+
+# Sources rewritten per commit
+DEFAULT_COMMIT_EVERY = 20
+
+
+class ProjectSettings(Protocol):
+    """Project settings needed to remember the codec."""
+
+    def set(self, key: str, value: str) -> None: ...
+    def delete(self, key: str) -> None: ...
+
+
+@metered_command("compress_source_texts")
+def compress_source_texts(
+    command: CompressSourceTextsCommand,
+    state: ProjectState,
+    source_repo: SourceRepository | None,
+    settings_repo: ProjectSettings | None = None,
+    session: Session | None = None,
+    commit_every: int = DEFAULT_COMMIT_EVERY,
+    on_progress: Callable[[int, int], None] | None = None,
+) -> OperationResult:
+    """
+    Re-store all source text with a codec (None stores it plain again).
+
+    Functional use case following 5-step pattern:
+    1. Validate project is open and the codec is available
+    2. Switch the repository to the codec for new writes
+    3. Rewrite each source stored differently (text is unchanged, so no
+       events are published)
+    4. Commit every ``commit_every`` sources
+    5. Record the codec as a project setting
+
+    Args:
+        command: Command with the target codec
+        state: Project state cache
+        source_repo: Repository for source operations
+        settings_repo: Project settings (codec for later imports)
+        session: Session committed in batches
+        commit_every: Sources rewritten per commit
+        on_progress: Called with (sources processed, total)
+
+    Returns:
+        OperationResult with rewritten/total counts and bytes before/after
+    """
+    logger.debug("compress_source_texts: codec=%s", command.codec)
+    if state.project is None or source_repo is None:
+        logger.error("compress_source_texts: no project is currently open")
+        return OperationResult.fail(
+            error="No project is currently open",
+            error_code="SOURCES_NOT_COMPRESSED/NO_PROJECT",
+            suggestions=("Open a project first",),
+        )
+    if command.codec is not None and command.codec not in available_codecs():
+        return OperationResult.fail(
+            error=f"Text codec not available: {command.codec}",
+            error_code="SOURCES_NOT_COMPRESSED/CODEC_UNAVAILABLE",
+            suggestions=(f"Use one of: {', '.join(available_codecs())}",),
+        )
+
+    bytes_before = source_repo.stored_text_bytes()
+    source_repo.set_text_codec(command.codec)
+
+    summaries = source_repo.list_summaries()
+    rewritten = 0
+    pending_commit = 0
+    for processed, summary in enumerate(summaries, start=1):
+        if source_repo.rewrite_text(summary.id):
+            rewritten += 1
+            pending_commit += 1
+        if session is not None and pending_commit >= commit_every:
+            session.commit()
+            pending_commit = 0
+        if on_progress is not None:
+            on_progress(processed, len(summaries))
+    if session is not None and pending_commit:
+        session.commit()
+
+    if settings_repo is not None:
+        if command.codec is None:
+            settings_repo.delete(TEXT_CODEC_SETTING)
+        else:
+            settings_repo.set(TEXT_CODEC_SETTING, command.codec)
+
+    bytes_after = source_repo.stored_text_bytes()
+    logger.info(
+        "compress_source_texts: codec=%s, %d of %d rewritten, %d -> %d bytes",
+        command.codec,
+        rewritten,
+        len(summaries),
+        bytes_before,
+        bytes_after,
+    )
+    return OperationResult.ok(
+        data={
+            "codec": command.codec,
+            "rewritten": rewritten,
+            "total": len(summaries),
+            "bytes_before": bytes_before,
+            "bytes_after": bytes_after,
+        }
+    )
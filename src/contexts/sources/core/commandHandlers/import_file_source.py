@@ -5,22 +5,36 @@ Functional use case for importing a file-based source by file path.
 Used by AI agents to programmatically add documents, PDFs, images,
 audio, and video to the project without inline content.
 Returns OperationResult with error codes, suggestions, and rollback support.
+
+Each source records a content fingerprint of its file (size, mtime and a
+BLAKE2b digest), so importing a file again is cheap:
+- same path, size and mtime: skipped without reading the file
+- same content under another path or name: detected, and skipped when the
+  command asks for it (batch and folder imports do)
+- same path, changed content: text re-extracted into the existing source
+
+PDF sources also record where each page starts in the text, so segments
+can be mapped back to pages without re-extracting.
 """
 
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable, Sequence
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from returns.result import Success
-
 from src.contexts.projects.core.commands import (
     ImportFileSourceCommand,
     RemoveSourceCommand,
 )
-from src.contexts.projects.core.entities import Source, SourceStatus, SourceType
-from src.contexts.projects.core.events import SourceAdded
+from src.contexts.projects.core.entities import (
+    Source,
+    SourceStatus,
+    SourceSummary,
+    SourceType,
+)
+from src.contexts.projects.core.events import SourceAdded, SourceUpdated
 from src.contexts.projects.core.invariants import (
     AUDIO_EXTENSIONS,
     IMAGE_EXTENSIONS,
@@ -28,13 +42,15 @@ from src.contexts.projects.core.invariants import (
     TEXT_EXTENSIONS,
     VIDEO_EXTENSIONS,
     detect_source_type,
-    is_source_name_unique,
 )
-from src.contexts.sources.core.commandHandlers._state import SourceRepository
-from src.contexts.sources.infra.pdf_extractor import PdfExtractor
-from src.contexts.sources.infra.text_extractor import TextExtractor
+from src.contexts.sources.core.commandHandlers._state import (
+    SegmentRepository,
+    SourceRepository,
+)
+from src.contexts.sources.infra.content_hash import hash_file
+from src.contexts.sources.infra.extraction_pool import extract_text_and_pages
 from src.shared.common.operation_result import OperationResult
-from src.shared.common.types import SourceId
+from src.shared.common.types import FolderId, SourceId
 from src.shared.infra.metrics import metered_command
 from src.shared.infra.state import ProjectState
 
@@ -52,24 +68,30 @@ ALL_SUPPORTED_EXTENSIONS = sorted(
     | VIDEO_EXTENSIONS
 )
 
-_TEXT_EXTRACTORS = {
-    SourceType.TEXT: TextExtractor,
-    SourceType.PDF: PdfExtractor,
-}
+# Failures that mean "already imported"; batch imports count them as skipped
+UNCHANGED = "SOURCE_NOT_IMPORTED/UNCHANGED"
+DUPLICATE_CONTENT = "SOURCE_NOT_IMPORTED/DUPLICATE_CONTENT"
+SKIPPED_ERROR_CODES = frozenset({UNCHANGED, DUPLICATE_CONTENT})
+
+# A changed file whose source has coded segments is not re-extracted: the
+# segments' offsets point into the old text
+CODED_SOURCE_CHANGED = "SOURCE_NOT_IMPORTED/CODED_SOURCE_CHANGED"
 
 
-def extract_text(source_type: SourceType, file_path: Path) -> str | None:
-    """Extract text content from a file if the source type supports it."""
-    extractor_cls = _TEXT_EXTRACTORS.get(source_type)
-    if extractor_cls is None:
-        return None
-    extractor = extractor_cls()
-    if not extractor.supports(file_path):
-        return None
-    result = extractor.extract(file_path)
-    if isinstance(result, Success):
-        return result.unwrap().content
-    return None
+def file_unchanged(source_repo: SourceRepository | None, file_path: str | Path) -> bool:
+    """
+    True if ``file_path`` was imported and its size and mtime still match.
+
+    One stat() and one indexed lookup; the file is not read. Batch imports
+    use it to keep unchanged files away from the extraction workers.
+    """
+    if source_repo is None:
+        return False
+    existing = source_repo.get_summary_by_path(Path(file_path))
+    if existing is None:
+        return False
+    stat = Path(file_path).stat()
+    return _stat_matches(existing, stat.st_size, stat.st_mtime_ns)
 
 
 @metered_command("import_file_source")
@@ -79,6 +101,10 @@ def import_file_source(
     source_repo: SourceRepository | None,
     event_bus: EventBus,
     session: Session | None = None,
+    text_extractor: Callable[[SourceType, Path], str | None] | None = None,
+    content_hash: str | None = None,
+    page_starts: Sequence[int] = (),
+    segment_repo: SegmentRepository | None = None,
 ) -> OperationResult:
     """
     Import a file-based source into the current project.
@@ -86,15 +112,27 @@ def import_file_source(
     Functional use case following 5-step pattern:
     1. Validate project is open and file path is valid
     2. Detect source type and validate it's supported
-    3. Resolve name, check uniqueness; if dry_run return preview
+    3. Compare the file's fingerprint with imported sources, resolve name,
+       check uniqueness; if dry_run return preview
     4. Extract text content where applicable, persist source
-    5. Publish SourceAdded event
+    5. Publish SourceAdded (or SourceUpdated for a changed file) event
 
     Args:
         command: Command with file path and optional metadata
         state: Project state cache
         source_repo: Repository for source operations
         event_bus: Event bus for publishing events
+        session: Session that @metered_command commits on success; omit it
+            when the caller batches commits (the handler never commits)
+        text_extractor: Text extraction for text/PDF sources; batch imports
+            pass text already extracted in a worker process (default:
+            extract here, including PDF page starts)
+        content_hash: Digest of the file if already computed (batch imports
+            hash in the worker process); hashed here otherwise
+        page_starts: PDF page start offsets from the caller's extraction
+        segment_repo: Segment repository; a changed file whose source has
+            coded segments fails with CODED_SOURCE_CHANGED instead of being
+            re-extracted (not checked when omitted)
 
     Returns:
         OperationResult with Source entity on success, or error details on failure
@@ -155,7 +193,65 @@ def import_file_source(
             error_code="SOURCE_NOT_IMPORTED/UNSUPPORTED_TYPE",
         )
 
-    # Step 3: Resolve name and check uniqueness
+    # Step 3: Compare with sources already imported from this file
+    stat = file_path.stat()
+    file_size = stat.st_size
+    file_mtime_ns = stat.st_mtime_ns
+    existing = source_repo.get_summary_by_path(file_path) if source_repo else None
+    if existing is not None and _stat_matches(existing, file_size, file_mtime_ns):
+        return _unchanged(existing)
+
+    content_hash = content_hash or hash_file(file_path)
+    if existing is not None:
+        # Sources imported before fingerprints were recorded are assumed
+        # current when the size matches, rather than re-extracting (and
+        # shifting the coded text of) every old source
+        same_content = (
+            existing.content_hash == content_hash
+            if existing.content_hash is not None
+            else existing.file_size == file_size
+        )
+        if same_content:
+            if source_repo and not command.dry_run:
+                source_repo.update_file_stat(
+                    existing.id, file_size, file_mtime_ns, content_hash
+                )
+            return _unchanged(existing)
+        return _reimport_changed(
+            command,
+            existing.id,
+            source_type,
+            file_path,
+            file_size,
+            file_mtime_ns,
+            content_hash,
+            source_repo,
+            segment_repo,
+            event_bus,
+            text_extractor,
+            page_starts,
+        )
+
+    duplicate = (
+        source_repo.get_summary_by_content_hash(content_hash) if source_repo else None
+    )
+    if duplicate is not None:
+        logger.info(
+            "import_file_source: %s has the same content as source %s",
+            file_path,
+            duplicate.name,
+        )
+    if duplicate is not None and command.skip_duplicates:
+        return OperationResult.fail(
+            error=f"Source '{duplicate.name}' already exists with identical content",
+            error_code=DUPLICATE_CONTENT,
+            suggestions=(
+                f"The file is a renamed or moved copy of '{duplicate.name}'",
+                "Check existing sources with list_sources",
+            ),
+        )
+
+    # Resolve name and check uniqueness
     name = command.name.strip() if command.name else file_path.name
     if not name:
         logger.error("import_file_source: source name is empty")
@@ -165,8 +261,7 @@ def import_file_source(
             suggestions=("Provide a non-empty name or omit to use filename",),
         )
 
-    existing_sources = tuple(source_repo.get_all()) if source_repo else ()
-    if not is_source_name_unique(name, existing_sources):
+    if source_repo and source_repo.name_exists(name):
         logger.error("import_file_source: duplicate source name=%s", name)
         return OperationResult.fail(
             error=f"Source with name '{name}' already exists",
@@ -177,9 +272,6 @@ def import_file_source(
             ),
         )
 
-    # Get file size
-    file_size = file_path.stat().st_size
-
     # Dry run: return preview without persisting
     if command.dry_run:
         return OperationResult.ok(
@@ -194,7 +286,7 @@ def import_file_source(
         )
 
     # Step 4: Extract text content for text/PDF sources
-    fulltext = extract_text(source_type, file_path)
+    fulltext, pages = _extract(source_type, file_path, text_extractor, page_starts)
 
     # Create Source entity
     source_id = SourceId.new()
@@ -209,6 +301,10 @@ def import_file_source(
         origin=command.origin,
         memo=command.memo,
         fulltext=fulltext,
+        folder_id=FolderId(value=command.folder_id) if command.folder_id else None,
+        content_hash=content_hash,
+        file_mtime_ns=file_mtime_ns,
+        page_starts=pages,
     )
 
     # Persist to repository
@@ -238,3 +334,111 @@ def import_file_source(
         data=source,
         rollback=RemoveSourceCommand(source_id=source.id.value),
     )
+
+
+def _extract(
+    source_type: SourceType,
+    file_path: Path,
+    text_extractor: Callable[[SourceType, Path], str | None] | None,
+    page_starts: Sequence[int],
+) -> tuple[str | None, tuple[int, ...]]:
+    """Text and PDF page starts, extracted here unless the caller did."""
+    if text_extractor is None:
+        return extract_text_and_pages(source_type, file_path)
+    return text_extractor(source_type, file_path), tuple(page_starts)
+
+
+def _stat_matches(existing: SourceSummary, file_size: int, file_mtime_ns: int) -> bool:
+    return (
+        existing.content_hash is not None
+        and existing.file_size == file_size
+        and existing.file_mtime_ns == file_mtime_ns
+    )
+
+
+def _unchanged(existing: SourceSummary) -> OperationResult:
+    logger.debug("import_file_source: %s is unchanged", existing.file_path)
+    return OperationResult.fail(
+        error=f"Source '{existing.name}' already exists for this file and is unchanged",
+        error_code=UNCHANGED,
+        suggestions=("Modify the file to import its new content",),
+    )
+
+
+def _reimport_changed(
+    command: ImportFileSourceCommand,
+    source_id: SourceId,
+    source_type: SourceType,
+    file_path: Path,
+    file_size: int,
+    file_mtime_ns: int,
+    content_hash: str,
+    source_repo: SourceRepository | None,
+    segment_repo: SegmentRepository | None,
+    event_bus: EventBus,
+    text_extractor: Callable[[SourceType, Path], str | None] | None,
+    page_starts: Sequence[int],
+) -> OperationResult:
+    """Re-extract a changed file into the source imported from it."""
+    source = source_repo.get_by_id(source_id) if source_repo else None
+    if source is None:
+        return OperationResult.fail(
+            error=f"Source not found: {source_id.value}",
+            error_code="SOURCE_NOT_IMPORTED/NOT_FOUND",
+        )
+
+    coded = segment_repo.count_by_source(source_id) if segment_repo else 0
+    if coded:
+        logger.warning(
+            "import_file_source: %s changed but source %s has %d coded segment(s)",
+            file_path,
+            source.name,
+            coded,
+        )
+        return OperationResult.fail(
+            error=(
+                f"Source '{source.name}' has {coded} coded segment(s); "
+                "its changed file was not re-extracted"
+            ),
+            error_code=CODED_SOURCE_CHANGED,
+            suggestions=(
+                "Copy the file to a new path to import it as a separate source",
+                "Remove the source's codings first to replace its text",
+            ),
+        )
+
+    if command.dry_run:
+        return OperationResult.ok(
+            data={
+                "dry_run": True,
+                "file_path": str(file_path),
+                "name": source.name,
+                "source_type": source_type.value,
+                "file_size": file_size,
+                "message": f"File '{source.name}' has changed and will be re-extracted",
+            }
+        )
+
+    fulltext, pages = _extract(source_type, file_path, text_extractor, page_starts)
+    updated = source.with_file_content(
+        fulltext=fulltext,
+        file_size=file_size,
+        content_hash=content_hash,
+        file_mtime_ns=file_mtime_ns,
+        page_starts=pages,
+    )
+    source_repo.save(updated)
+    event_bus.publish(
+        SourceUpdated.create(
+            source_id=source_id,
+            memo=updated.memo,
+            origin=updated.origin,
+            status=updated.status.value,
+        )
+    )
+    logger.info(
+        "import_file_source: re-extracted changed source name=%s, id=%s",
+        updated.name,
+        source_id,
+    )
+    return OperationResult.ok(data=updated)
@@ -0,0 +1,369 @@
+"""
+Import Folder Use Case
+
+Functional use case for importing every supported file under a directory
+(QC-027.11). Files are discovered lazily, extracted in an extraction
+pipeline and persisted one by one through ``import_file_source``, so memory
+stays flat however large the tree is. Subdirectories are mirrored as
+project folders. Re-importing a tree skips files that are unchanged or
+already imported under another name, and re-extracts only changed files.
+
+Returns OperationResult with import totals, or a count/size estimate for
+dry runs.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from src.contexts.folders.core.commandHandlers.create_folder import create_folder
+from src.contexts.folders.core.commands import CreateFolderCommand
+from src.contexts.projects.core.commands import (
+    ImportFileSourceCommand,
+    ImportFolderCommand,
+)
+from src.contexts.sources.core.commandHandlers._state import (
+    MetadataCache,
+    SegmentRepository,
+    SourceRepository,
+)
+from src.contexts.sources.core.commandHandlers.import_file_source import (
+    ALL_SUPPORTED_EXTENSIONS,
+    SKIPPED_ERROR_CODES,
+    file_unchanged,
+    import_file_source,
+)
+from src.contexts.sources.infra.extraction_pool import (
+    ExtractedFile,
+    ExtractionPipeline,
+)
+from src.contexts.sources.infra.folder_scanner import (
+    estimate_folder,
+    iter_source_files,
+)
+from src.shared.common.operation_result import OperationResult
+from src.shared.common.types import FolderId
+from src.shared.infra.metrics import metered_command
+from src.shared.infra.state import ProjectState
+
+if TYPE_CHECKING:
+    from src.contexts.folders.core.commandHandlers._state import FolderRepository
+    from src.contexts.sources.infra.metadata_cache import MetadataResult
+    from src.shared.infra.event_bus import EventBus
+    from src.shared.infra.session import Session
+
+logger = logging.getLogger("qualcoder.sources.core")
+
+# Sources persisted per commit
+DEFAULT_COMMIT_EVERY = 50
+
+# Failures listed in the result (the count is always complete)
+MAX_REPORTED_FAILURES = 20
+
+
+class FolderMirror:
+    """
+    Maps directories under an import root to project folders.
+
+    The root directory becomes a top-level folder and each subdirectory a
+    child folder. Folders are created on first use, so directories without
+    importable files are not mirrored; existing folders with the same name
+    and parent are reused.
+    """
+
+    def __init__(
+        self,
+        root: str | Path,
+        state: ProjectState,
+        folder_repo: FolderRepository | None,
+        event_bus: EventBus,
+    ) -> None:
+        self._root = Path(root)
+        self._state = state
+        self._folder_repo = folder_repo
+        self._event_bus = event_bus
+        self._ids: dict[tuple[str, ...], str | None] = {(): None}
+        self.created = 0
+
+    def folder_for(self, file_path: str | Path) -> str | None:
+        """Folder id for the directory containing ``file_path``."""
+        relative = Path(file_path).parent.relative_to(self._root).parts
+        return self._resolve((self._root.name, *relative))
+
+    def _resolve(self, parts: tuple[str, ...]) -> str | None:
+        if parts in self._ids:
+            return self._ids[parts]
+        parent_id = self._resolve(parts[:-1])
+        name = parts[-1]
+        folder_id = parent_id
+        existing = (
+            self._folder_repo.get_by_name(
+                name, FolderId(value=parent_id) if parent_id else None
+            )
+            if self._folder_repo
+            else None
+        )
+        if existing is not None:
+            folder_id = existing.id.value
+        else:
+            result = create_folder(
+                command=CreateFolderCommand(name=name, parent_id=parent_id),
+                state=self._state,
+                folder_repo=self._folder_repo,
+                source_repo=None,
+                event_bus=self._event_bus,
+            )
+            if result.is_success:
+                folder_id = result.data.id.value
+                self.created += 1
+            else:
+                # Fall back to the parent folder rather than failing the file
+                logger.warning(
+                    "import_folder: cannot mirror folder %s: %s", name, result.error
+                )
+        self._ids[parts] = folder_id
+        return folder_id
+
+
+def source_name_for(
+    root: str | Path, file_path: str | Path, source_repo: SourceRepository | None
+) -> str:
+    """
+    Source name for a file in a folder import.
+
+    The file name when it is free; otherwise the path relative to the import
+    root, so same-named files in different directories can all be imported.
+    """
+    path = Path(file_path)
+    if source_repo is None or not source_repo.name_exists(path.name):
+        return path.name
+    return path.relative_to(root).as_posix()
+
+
+@metered_command("import_folder")
+def import_folder(
+    command: ImportFolderCommand,
+    state: ProjectState,
+    source_repo: SourceRepository | None,
+    folder_repo: FolderRepository | None,
+    event_bus: EventBus,
+    session: Session | None = None,
+    pipeline: ExtractionPipeline | None = None,
+    commit_every: int = DEFAULT_COMMIT_EVERY,
+    on_progress: Callable[[int, str], None] | None = None,
+    segment_repo: SegmentRepository | None = None,
+    metadata_cache: MetadataCache | None = None,
+) -> OperationResult:
+    """
+    Import all supported files under a directory into the current project.
+
+    Functional use case following 5-step pattern:
+    1. Validate project is open and the path is an absolute directory
+    2. If dry_run, return a file count and size estimate
+    3. Stream discovered files through the extraction pipeline (unchanged
+       and already-imported files are not extracted)
+    4. Persist each file via import_file_source, mirroring its directory
+    5. Commit every ``commit_every`` files (events are published per file),
+       caching the image/media metadata the pipeline extracted
+
+    Args:
+        command: Command with directory path and import options
+        state: Project state cache
+        source_repo: Repository for source operations
+        folder_repo: Repository for folder operations (for mirroring)
+        event_bus: Event bus for publishing events
+        session: Session committed in batches and on success
+        pipeline: Extraction pipeline (default: process pool, one per core)
+        commit_every: Files persisted per commit
+        on_progress: Called with (files processed, file name) after each file
+        segment_repo: Segment repository; changed files of coded sources are
+            reported as failures instead of being re-extracted
+        metadata_cache: Cache for the metadata of imported image and media
+            files, so the source list never probes them again
+
+    Returns:
+        OperationResult with import totals, including files skipped as
+        unchanged or duplicate (or an estimate for dry runs)
+    """
+    logger.debug("import_folder: folder_path=%s", command.folder_path)
+    if state.project is None:
+        logger.error("import_folder: no project is currently open")
+        return OperationResult.fail(
+            error="No project is currently open",
+            error_code="FOLDER_NOT_IMPORTED/NO_PROJECT",
+            suggestions=("Open a project first",),
+        )
+
+    root = Path(command.folder_path)
+    if not root.is_absolute():
+        return OperationResult.fail(
+            error=f"Folder path must be absolute: {command.folder_path}",
+            error_code="FOLDER_NOT_IMPORTED/RELATIVE_PATH",
+            suggestions=("Provide an absolute directory path",),
+        )
+    if not root.is_dir():
+        return OperationResult.fail(
+            error=f"Directory not found: {command.folder_path}",
+            error_code="FOLDER_NOT_IMPORTED/NOT_A_DIRECTORY",
+            suggestions=("Check that the path exists and is a directory",),
+        )
+
+    if command.dry_run:
+        estimate = estimate_folder(root, ALL_SUPPORTED_EXTENSIONS, command.recursive)
+        return OperationResult.ok(
+            data={
+                "dry_run": True,
+                "folder_path": str(root),
+                "file_count": estimate.file_count,
+                "total_bytes": estimate.total_bytes,
+                "directory_count": estimate.directory_count,
+                "skipped_count": estimate.skipped_count,
+                "by_extension": estimate.by_extension,
+                "message": (
+                    f"{estimate.file_count} file(s), {estimate.total_bytes} bytes "
+                    f"in {estimate.directory_count} folder(s) ready to import"
+                ),
+            }
+        )
+
+    pipeline = pipeline or ExtractionPipeline(
+        known_hashes=source_repo.content_hashes() if source_repo else (),
+        is_unchanged=lambda path: file_unchanged(source_repo, path),
+    )
+    mirror = (
+        FolderMirror(root, state, folder_repo, event_bus)
+        if command.mirror_folders
+        else None
+    )
+    paths = (
+        scanned.path
+        for scanned in iter_source_files(
+            root, ALL_SUPPORTED_EXTENSIONS, command.recursive
+        )
+    )
+
+    imported = 0
+    skipped = 0
+    pending_commit = 0
+    pending_metadata: list[tuple[str, int, int, MetadataResult]] = []
+    failures: list[dict[str, str]] = []
+    failed = 0
+    for processed, extracted in enumerate(pipeline.iter_results(paths), start=1):
+        result = _import_extracted(
+            extracted,
+            root,
+            command,
+            mirror,
+            state,
+            source_repo,
+            segment_repo,
+            event_bus,
+        )
+        if result.is_success:
+            imported += 1
+            pending_commit += 1
+            if (
+                metadata_cache is not None
+                and extracted.metadata is not None
+                and extracted.file_mtime_ns is not None
+            ):
+                pending_metadata.append(
+                    (
+                        extracted.path,
+                        extracted.file_size,
+                        extracted.file_mtime_ns,
+                        extracted.metadata,
+                    )
+                )
+        elif result.error_code in SKIPPED_ERROR_CODES:
+            skipped += 1
+            pending_commit += 1  # May have refreshed the recorded mtime
+        else:
+            failed += 1
+            if len(failures) < MAX_REPORTED_FAILURES:
+                failures.append({"file": extracted.path, "error": result.error or ""})
+        if pending_commit >= commit_every:
+            _store_metadata(metadata_cache, pending_metadata)
+            if session is not None:
+                session.commit()
+            pending_commit = 0
+        if on_progress is not None:
+            on_progress(processed, Path(extracted.path).name)
+
+    _store_metadata(metadata_cache, pending_metadata)
+
+    logger.info(
+        "import_folder: %s — %d imported, %d unchanged, %d failed, "
+        "%d folder(s) created",
+        root,
+        imported,
+        skipped,
+        failed,
+        mirror.created if mirror else 0,
+    )
+    return OperationResult.ok(
+        data={
+            "folder_path": str(root),
+            "imported": imported,
+            "skipped": skipped,
+            "failed": failed,
+            "folders_created": mirror.created if mirror else 0,
+            "failures": failures,
+        }
+    )
+
+
+def _store_metadata(
+    metadata_cache: MetadataCache | None,
+    pending: list[tuple[str, int, int, MetadataResult]],
+) -> None:
+    """Cache metadata of the files imported since the last commit."""
+    if metadata_cache is not None and pending:
+        try:
+            metadata_cache.put_many(pending)
+        except Exception as exc:
+            logger.warning("import_folder: metadata not cached: %s", exc)
+    pending.clear()
+
+
+def _import_extracted(
+    extracted: ExtractedFile,
+    root: Path,
+    command: ImportFolderCommand,
+    mirror: FolderMirror | None,
+    state: ProjectState,
+    source_repo: SourceRepository | None,
+    segment_repo: SegmentRepository | None,
+    event_bus: EventBus,
+) -> OperationResult:
+    """Persist one extracted file; exceptions become failed results."""
+    try:
+        return import_file_source(
+            command=ImportFileSourceCommand(
+                file_path=extracted.path,
+                name=source_name_for(root, extracted.path, source_repo),
+                origin=command.origin,
+                memo=command.memo,
+                folder_id=mirror.folder_for(extracted.path) if mirror else None,
+                skip_duplicates=True,
+            ),
+            state=state,
+            source_repo=source_repo,
+            event_bus=event_bus,
+            text_extractor=(
+                None
+                if extracted.error or extracted.skipped
+                else (lambda _t, _p: extracted.fulltext)
+            ),
+            content_hash=extracted.content_hash,
+            page_starts=extracted.page_starts,
+            segment_repo=segment_repo,
+        )
+    except Exception as exc:
+        logger.warning("import_folder: failed %s: %s", extracted.path, exc)
+        return OperationResult.fail(
+            error=str(exc), error_code="SOURCE_NOT_IMPORTED/ERROR"
+        )
@@ -12,11 +12,13 @@ from src.contexts.projects.core.entities import (
     Folder,
     Source,
     SourceStatus,
+    SourceSummary,
     SourceType,
 )
 
 __all__ = [
     "Source",
+    "SourceSummary",
     "SourceType",
     "SourceStatus",
     "Folder",
@@ -33,8 +33,8 @@ def list_sources(
             suggestions=("Open a project first",),
         )
 
-    # Get sources from repo (source of truth)
-    sources = source_repo.get_all()
+    # Metadata only - source text is never needed for a listing
+    sources = source_repo.list_summaries()
 
     return OperationResult.ok(
         data={
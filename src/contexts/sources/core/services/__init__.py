@@ -4,14 +4,22 @@ Sources Domain Services
 Pure domain services for the Sources bounded context.
 """
 
+from src.contexts.sources.core.services.page_map import PageMap
 from src.contexts.sources.core.services.speaker_detector import (
     Speaker,
     SpeakerDetector,
     SpeakerSegment,
+    SpeakerTurn,
+    count_speakers,
+    iter_speaker_turns,
 )
 
 __all__ = [
+    "PageMap",
     "Speaker",
     "SpeakerDetector",
     "SpeakerSegment",
+    "SpeakerTurn",
+    "count_speakers",
+    "iter_speaker_turns",
 ]
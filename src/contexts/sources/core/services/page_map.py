@@ -0,0 +1,52 @@
+"""
+Page Map Domain Service
+
+Pure domain service mapping character positions in an extracted PDF's
+text to page numbers and back.
+
+Extraction records where each page starts in the source text, so a coded
+segment (a character range) can be placed on its page with a binary
+search instead of re-extracting the document. Pages without text start
+where the next page with text starts, so a position always maps to the
+page that holds its text.
+
+Usage:
+    pages = PageMap(starts=(0, 1200, 2400), length=3000)
+    pages.page_for_offset(1500)   # 1
+    pages.page_range(1)           # (1200, 2400)
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class PageMap:
+    """Character offset in the source text where each page starts (0-indexed)."""
+
+    starts: tuple[int, ...]
+    length: int  # Characters in the whole text
+
+    @property
+    def page_count(self) -> int:
+        return len(self.starts)
+
+    def page_for_offset(self, position: int) -> int:
+        """Page holding the character at ``position`` (0 when there are no pages)."""
+        return max(bisect_right(self.starts, position) - 1, 0)
+
+    def page_range(self, page: int) -> tuple[int, int]:
+        """Characters ``[start, end)`` of a page, up to the next page's start."""
+        if not 0 <= page < self.page_count:
+            raise IndexError(f"Page out of range: {page}")
+        start = min(self.starts[page], self.length)
+        end = self.starts[page + 1] if page + 1 < self.page_count else self.length
+        return start, max(start, min(end, self.length))
+
+    def pages_for_range(self, start: int, end: int) -> range:
+        """Pages overlapping characters ``[start, end)``, e.g. a segment."""
+        first = self.page_for_offset(start)
+        last = self.page_for_offset(max(start, end - 1))
+        return range(first, last + 1)
@@ -14,6 +14,12 @@ Supported patterns:
 - Title Case Name: format (e.g., "John Smith: Hello")
 - [Speaker] format (e.g., "[Moderator] Hello")
 
+The three patterns are combined into one expression and the text is
+scanned once; each speaker turn is reported as offsets
+(SpeakerTurn(start, end, speaker)) rather than a copy of its text.
+Turns can be stored and handed back to a detector, so a transcript that
+has not changed is never scanned again.
+
 Usage:
     detector = SpeakerDetector(transcript_text)
     speakers = detector.detect_speakers()
@@ -23,12 +29,64 @@ Usage:
     segments = detector.get_speaker_segments("INTERVIEWER")
     for seg in segments:
         print(f"At {seg.start}-{seg.end}: {seg.text}")
+
+    for turn in iter_speaker_turns(transcript_text):
+        print(turn.speaker, turn.start, turn.end)
 """
 
 from __future__ import annotations
 
 import re
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
+from typing import NamedTuple
+
+# One expression for the three speaker formats, tried in order at the start
+# of each line (after leading whitespace). Whitespace never crosses a line
+# break, and the turn text runs to the last non-blank character of the line.
+SPEAKER_LINE = re.compile(
+    r"^[^\S\n]*"
+    r"(?:"
+    r"(?P<upper>[A-Z](?:[A-Z]|[^\S\n])+):"  # UPPERCASE NAME:
+    r"|(?P<title>[A-Z][a-z]+(?:[^\S\n]+[A-Z][a-z]+)*):"  # Title Case Name:
+    r"|\[(?P<bracket>[^\]\n]+)\]"  # [Speaker Name]
+    r")"
+    r"[^\S\n](?P<turn>[^\n]*\S)",
+    re.MULTILINE,
+)
+
+
+class SpeakerTurn(NamedTuple):
+    """One speaker turn: the offsets of its text and the speaker's name."""
+
+    start: int
+    end: int
+    speaker: str
+
+
+def iter_speaker_turns(text: str) -> Iterator[SpeakerTurn]:
+    """
+    Scan text once and yield its speaker turns in order.
+
+    ``start`` is just after the speaker marker and ``end`` after the last
+    non-blank character of the line. Names of the same speaker share one
+    string object.
+    """
+    names: dict[str, str] = {}
+    for match in SPEAKER_LINE.finditer(text):
+        raw = match["upper"] or match["title"] or match["bracket"]
+        name = names.get(raw)
+        if name is None:
+            name = names[raw] = raw.strip()
+        yield SpeakerTurn(match.start("turn"), match.end("turn"), name)
+
+
+def count_speakers(turns: Iterable[SpeakerTurn]) -> dict[str, int]:
+    """Turns per speaker, in order of first appearance."""
+    counts: dict[str, int] = {}
+    for turn in turns:
+        counts[turn.speaker] = counts.get(turn.speaker, 0) + 1
+    return counts
 
 
 @dataclass(frozen=True)
@@ -58,17 +116,20 @@ class SpeakerDetector:
     """
     Pure domain service for detecting speakers in transcript text.
 
-    This is a stateless service that performs speaker detection operations.
-    All methods are pure functions that don't modify any state.
+    The text is scanned once, on first use; every query after that reads
+    the turns. Methods never modify the text.
 
     Example:
         detector = SpeakerDetector(transcript)
         speakers = detector.detect_speakers()
         # Returns [Speaker(name="JOHN", count=3), ...]
+
+        detector = SpeakerDetector(transcript, turns=stored_turns)  # No scan
     """
 
     # Speaker detection patterns (compiled for performance)
-    # Order matters - more specific patterns first
+    # Order matters - more specific patterns first. Kept for matching a
+    # single line; whole texts are scanned with SPEAKER_LINE.
     PATTERNS = [
         # UPPERCASE NAME: (with space after colon)
         re.compile(r"^([A-Z][A-Z\s]+):\s", re.MULTILINE),
@@ -78,15 +139,25 @@ class SpeakerDetector:
         re.compile(r"^\[([^\]]+)\]\s", re.MULTILINE),
     ]
 
-    def __init__(self, text: str) -> None:
+    def __init__(self, text: str, turns: Iterable[SpeakerTurn] | None = None) -> None:
         """
         Initialize the detector with text to analyze.
 
         Args:
             text: The transcript text to analyze
+            turns: Turns of ``text`` found earlier (e.g. from a stored
+                index); the text is scanned on first use otherwise
         """
         self._text = text
-        self._lines = text.split("\n") if text else []
+        self._turns: tuple[SpeakerTurn, ...] | None = (
+            tuple(turns) if turns is not None else None
+        )
+
+    def turns(self) -> tuple[SpeakerTurn, ...]:
+        """All speaker turns in the text, in order (scanned once)."""
+        if self._turns is None:
+            self._turns = tuple(iter_speaker_turns(self._text)) if self._text else ()
+        return self._turns
 
     def detect_speakers(self) -> list[Speaker]:
         """
@@ -96,24 +167,10 @@ class SpeakerDetector:
             List of Speaker objects with name and occurrence count.
             Empty list if no speakers found.
         """
-        if not self._text:
-            return []
-
-        speakers: dict[str, int] = {}
-
-        for line in self._lines:
-            stripped_line = line.strip()
-            if not stripped_line:
-                continue
-
-            for pattern in self.PATTERNS:
-                match = pattern.match(stripped_line)
-                if match:
-                    name = match.group(1).strip()
-                    speakers[name] = speakers.get(name, 0) + 1
-                    break  # Only match first pattern per line
-
-        return [Speaker(name=name, count=count) for name, count in speakers.items()]
+        return [
+            Speaker(name=name, count=count)
+            for name, count in count_speakers(self.turns()).items()
+        ]
 
     def get_speaker_segments(self, speaker_name: str) -> list[SpeakerSegment]:
         """
@@ -129,38 +186,12 @@ class SpeakerDetector:
         if not self._text or not speaker_name:
             return []
 
-        segments: list[SpeakerSegment] = []
-        current_pos = 0
-
-        for line in self._lines:
-            stripped_line = line.strip()
-            if not stripped_line:
-                current_pos += len(line) + 1  # +1 for newline
-                continue
-
-            # Find the actual position of the stripped line in the original text
-            line_start = self._text.find(stripped_line, current_pos)
-            if line_start == -1:
-                current_pos += len(line) + 1
-                continue
-
-            for pattern in self.PATTERNS:
-                match = pattern.match(stripped_line)
-                if match and match.group(1).strip() == speaker_name:
-                    # Found a segment for this speaker
-                    text_after_speaker = stripped_line[match.end() :].strip()
-                    text_start = line_start + match.end()
-                    text_end = line_start + len(stripped_line)
-
-                    segments.append(
-                        SpeakerSegment(
-                            start=text_start,
-                            end=text_end,
-                            text=text_after_speaker,
-                        )
-                    )
-                    break
-
-            current_pos = line_start + len(stripped_line)
-
-        return segments
+        return [
+            SpeakerSegment(
+                start=turn.start,
+                end=turn.end,
+                text=self._text[turn.start : turn.end].strip(),
+            )
+            for turn in self.turns()
+            if turn.speaker == speaker_name
+        ]
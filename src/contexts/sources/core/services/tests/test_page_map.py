@@ -0,0 +1,47 @@
+"""
+Tests for PageMap domain service.
+
+Maps character positions in extracted PDF text to pages.
+"""
+
+import allure
+import pytest
+
+from src.contexts.sources.core.services.page_map import PageMap
+
+pytestmark = [
+    pytest.mark.unit,
+    allure.epic("QualCoder v2"),
+    allure.feature("QC-027 Manage Sources"),
+]
+
+
+@allure.story("QC-027.02 Import PDF Document")
+class TestPageMap:
+    """Tests for mapping offsets to pages."""
+
+    @allure.title("Maps offsets to the page that holds them")
+    def test_page_for_offset(self):
+        """Offsets map to the last page starting at or before them."""
+        pages = PageMap(starts=(0, 100, 100, 250), length=300)
+
+        assert pages.page_count == 4
+        assert pages.page_for_offset(0) == 0
+        assert pages.page_for_offset(99) == 0
+        assert pages.page_for_offset(100) == 2  # Page 1 has no text
+        assert pages.page_for_offset(299) == 3
+        assert PageMap(starts=(), length=0).page_for_offset(10) == 0
+
+    @allure.title("Gives page ranges and the pages a segment spans")
+    def test_page_ranges(self):
+        """Page ranges end at the next page's start; segments span pages."""
+        pages = PageMap(starts=(0, 100, 100, 250), length=300)
+
+        assert pages.page_range(0) == (0, 100)
+        assert pages.page_range(1) == (100, 100)
+        assert pages.page_range(3) == (250, 300)
+        assert list(pages.pages_for_range(90, 110)) == [0, 1, 2]
+        assert list(pages.pages_for_range(120, 130)) == [2]
+        assert list(pages.pages_for_range(0, 100)) == [0]
+        with pytest.raises(IndexError):
+            pages.page_range(4)
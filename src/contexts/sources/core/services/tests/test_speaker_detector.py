@@ -10,6 +10,9 @@ import pytest
 
 from src.contexts.sources.core.services.speaker_detector import (
     SpeakerDetector,
+    SpeakerTurn,
+    count_speakers,
+    iter_speaker_turns,
 )
 
 pytestmark = [
@@ -180,3 +183,42 @@ class TestSpeakerDetectorImmutability:
         speakers2 = detector2.detect_speakers()
         assert len(speakers1) == len(speakers2)
         assert speakers1[0].name == speakers2[0].name
+
+
+@allure.story("QC-027.02 Speaker Detection")
+class TestSpeakerTurns:
+    """Tests for the single-pass turn scanner."""
+
+    @allure.title("Turns are offsets of each speaker's text, found in one pass")
+    def test_iter_speaker_turns(self):
+        text = "  JOHN: Hello there.  \r\n[Moderator] Next.\nJane Doe:   Fine\nJOHN:\n"
+        turns = list(iter_speaker_turns(text))
+
+        assert [t.speaker for t in turns] == ["JOHN", "Moderator", "Jane Doe"]
+        assert [text[t.start : t.end] for t in turns] == [
+            "Hello there.",
+            "Next.",
+            "  Fine",
+        ]
+        assert turns[0] == SpeakerTurn(8, 20, "JOHN")
+
+    @allure.title("Turns match the segments of every speaker")
+    def test_turns_match_segments(self):
+        text = "JOHN: One.\nJANE: Two.\n\nJOHN: Three.\nnot a speaker: four."
+        detector = SpeakerDetector(text)
+
+        assert count_speakers(detector.turns()) == {"JOHN": 2, "JANE": 1}
+        segments = detector.get_speaker_segments("JOHN")
+        assert [(s.start, s.end, s.text) for s in segments] == [
+            (6, 10, "One."),
+            (29, 35, "Three."),
+        ]
+
+    @allure.title("Stored turns are used instead of scanning")
+    def test_uses_given_turns(self):
+        text = "JOHN: One.\nJANE: Two."
+        stored = (SpeakerTurn(6, 10, "JOHN"),)
+        detector = SpeakerDetector(text, turns=stored)
+
+        assert detector.turns() == stored
+        assert [s.name for s in detector.detect_speakers()] == ["JOHN"]
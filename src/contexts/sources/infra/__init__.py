@@ -4,13 +4,47 @@ Sources Context - Infrastructure Layer
 Provides:
 - Source and folder repositories
 - Text extraction from various file formats
-- PDF extraction with multi-page support
+- PDF extraction with multi-page support, page offsets and a resumable page cache
 - Image metadata extraction
+- Reduced-resolution image decoding and a per-project thumbnail cache
 - Media (audio/video) metadata extraction
+- Image/media metadata cached per (path, size, mtime), batch extraction on threads
+- Process-pool extraction pipeline for batch imports
+- Lazy directory scanning for folder imports
+- Content fingerprints (size, mtime, BLAKE2b) for skip-unchanged re-imports
 - File loading and validation
+- Full-text search index (FTS5) over sources, segments and memos
+- Cached range/length reads of source text
+- Optional chunked zlib/zstd compression of stored source text
+- Trigger-maintained source counts per type and folder
+- Stored speaker turns per source, keyed on the hash of its text
 """
 
 from src.contexts.folders.infra.folder_repository import SQLiteFolderRepository
+from src.contexts.sources.infra.content_hash import (
+    FileFingerprint,
+    fingerprint_file,
+    hash_file,
+    hash_text,
+)
+from src.contexts.sources.infra.extraction_pool import (
+    ExtractedFile,
+    ExtractionPipeline,
+    extract_file,
+)
+from src.contexts.sources.infra.folder_scanner import (
+    FolderEstimate,
+    ScannedFile,
+    estimate_folder,
+    iter_source_files,
+)
+from src.contexts.sources.infra.fulltext_index import (
+    SearchHit,
+    SearchPage,
+    SQLiteFulltextIndex,
+    create_fulltext_index,
+    drop_fulltext_index,
+)
 from src.contexts.sources.infra.image_extractor import (
     ImageExtractionResult,
     ImageExtractor,
@@ -19,34 +53,110 @@ from src.contexts.sources.infra.media_extractor import (
     MediaExtractionResult,
     MediaExtractor,
 )
-from src.contexts.sources.infra.pdf_extractor import PdfExtractionResult, PdfExtractor
+from src.contexts.sources.infra.metadata_cache import (
+    SQLiteMetadataCache,
+    extract_metadata_batch,
+)
+from src.contexts.sources.infra.pdf_extractor import (
+    PageTextCache,
+    PdfExtractionResult,
+    PdfExtractor,
+    join_pages,
+)
 from src.contexts.sources.infra.schema import (
+    clear_speaker_turns,
     create_all,
     drop_all,
     metadata,
+    src_file_metadata,
     src_folder,
     src_source,
+    src_source_page,
+    src_source_text,
+    src_speaker_index,
+    src_speaker_turn,
+    upgrade_source_columns,
+)
+from src.contexts.sources.infra.source_counts import (
+    create_source_counts,
+    drop_source_counts,
 )
 from src.contexts.sources.infra.source_repository import SQLiteSourceRepository
+from src.contexts.sources.infra.source_text import (
+    SourceContentProvider,
+    SourceTextCache,
+)
+from src.contexts.sources.infra.speaker_index import SpeakerTurnIndex
+from src.contexts.sources.infra.text_compression import (
+    ChunkLayout,
+    available_codecs,
+    default_codec,
+)
 from src.contexts.sources.infra.text_extractor import ExtractionResult, TextExtractor
+from src.contexts.sources.infra.thumbnail_cache import ThumbnailCache
 
 __all__ = [
     # Repositories
     "SQLiteFolderRepository",
     "SQLiteSourceRepository",
+    # Full-text search
+    "SQLiteFulltextIndex",
+    "SearchHit",
+    "SearchPage",
+    "create_fulltext_index",
+    "drop_fulltext_index",
+    # Source text access
+    "SourceContentProvider",
+    "SourceTextCache",
+    # Speaker turns
+    "SpeakerTurnIndex",
+    # Image/media metadata
+    "SQLiteMetadataCache",
+    "extract_metadata_batch",
+    # Compressed source text
+    "ChunkLayout",
+    "available_codecs",
+    "default_codec",
+    # Maintained counts
+    "create_source_counts",
+    "drop_source_counts",
     # Schema
+    "clear_speaker_turns",
     "create_all",
     "drop_all",
     "metadata",
+    "src_file_metadata",
     "src_folder",
     "src_source",
+    "src_source_page",
+    "src_source_text",
+    "src_speaker_index",
+    "src_speaker_turn",
+    "upgrade_source_columns",
     # Extractors
     "ExtractionResult",
     "ImageExtractionResult",
     "ImageExtractor",
+    "ThumbnailCache",
     "MediaExtractionResult",
     "MediaExtractor",
+    "PageTextCache",
     "PdfExtractionResult",
     "PdfExtractor",
+    "join_pages",
     "TextExtractor",
+    # Batch extraction
+    "ExtractedFile",
+    "ExtractionPipeline",
+    "extract_file",
+    # Folder import
+    "FolderEstimate",
+    "ScannedFile",
+    "estimate_folder",
+    "iter_source_files",
+    # Content fingerprints
+    "FileFingerprint",
+    "fingerprint_file",
+    "hash_file",
+    "hash_text",
 ]
@@ -0,0 +1,367 @@
+"""
+Sources Context: Extraction Pool
+
+Runs text and metadata extraction for batch imports in worker processes.
+PDF and DOCX parsing is CPU bound and holds the GIL, so a thread pool does
+not help; a process pool scales with cores and keeps the Qt main thread
+free to persist results and repaint.
+
+    main thread                          worker processes
+    -----------                          ----------------
+    ExtractionPipeline.run(paths)  --->  extract_file(path)
+        bounded queue of futures   <---  ExtractedFile (picklable)
+    persist + commit every N files
+
+The queue bounds how many files are extracted ahead of persistence, so a
+2,000-file import holds at most ``queue_size`` extracted texts in memory.
+Results come back in input order.
+
+Re-imports avoid extraction twice over: files the caller reports as
+unchanged (``is_unchanged``, a stat check on the main thread) are never
+sent to a worker, and workers hash each file before parsing it and skip
+files whose content is already in the project (``known_hashes``).
+
+Usage:
+    pipeline = ExtractionPipeline(max_workers=4)
+    async for extracted in pipeline.run(paths):
+        persist(extracted)
+
+    # Without an event loop (MCP tools)
+    for extracted in ExtractionPipeline().iter_results(paths):
+        persist(extracted)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import functools
+import logging
+import os
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Collection, Iterable, Iterator
+from concurrent.futures import Executor, Future
+from dataclasses import dataclass
+from pathlib import Path
+
+from returns.result import Success
+
+from src.contexts.projects.core.entities import SourceType
+from src.contexts.projects.core.invariants import detect_source_type
+from src.contexts.sources.infra.content_hash import fingerprint_file
+from src.contexts.sources.infra.image_extractor import (
+    ImageExtractionResult,
+    ImageExtractor,
+)
+from src.contexts.sources.infra.media_extractor import (
+    MediaExtractionResult,
+    MediaExtractor,
+)
+from src.contexts.sources.infra.pdf_extractor import PdfExtractor
+from src.contexts.sources.infra.process_pool import spawn_pool
+from src.contexts.sources.infra.text_extractor import TextExtractor
+
+logger = logging.getLogger("qualcoder.sources.infra")
+
+# Default cap on worker processes; more rarely helps because persistence on
+# the main thread becomes the bottleneck
+MAX_DEFAULT_WORKERS = 8
+
+_TEXT_EXTRACTORS = {
+    SourceType.TEXT: TextExtractor,
+    SourceType.PDF: PdfExtractor,
+}
+
+_METADATA_EXTRACTORS = {
+    SourceType.IMAGE: ImageExtractor,
+    SourceType.AUDIO: MediaExtractor,
+    SourceType.VIDEO: MediaExtractor,
+}
+
+# Content hashes already in the project, set per worker process by the
+# pool initializer
+_known_hashes: frozenset[str] = frozenset()
+
+
+def extract_text(source_type: SourceType, file_path: Path) -> str | None:
+    """Extract text content from a file if the source type supports it."""
+    extractor_cls = _TEXT_EXTRACTORS.get(source_type)
+    if extractor_cls is None:
+        return None
+    extractor = extractor_cls()
+    if not extractor.supports(file_path):
+        return None
+    result = extractor.extract(file_path)
+    if isinstance(result, Success):
+        return result.unwrap().content
+    return None
+
+
+def extract_text_and_pages(
+    source_type: SourceType, file_path: Path
+) -> tuple[str | None, tuple[int, ...]]:
+    """Extract text plus, for PDFs, the offset where each page starts."""
+    if source_type != SourceType.PDF:
+        return extract_text(source_type, file_path), ()
+    extractor = PdfExtractor()
+    if not extractor.supports(file_path):
+        return None, ()
+    result = extractor.extract(file_path)
+    if isinstance(result, Success):
+        extracted = result.unwrap()
+        return extracted.content, extracted.page_starts
+    return None, ()
+
+
+def extract_metadata(
+    source_type: SourceType, file_path: Path
+) -> ImageExtractionResult | MediaExtractionResult | None:
+    """Extract image or media metadata if the source type supports it."""
+    extractor_cls = _METADATA_EXTRACTORS.get(source_type)
+    if extractor_cls is None:
+        return None
+    extractor = extractor_cls()
+    if not extractor.supports(file_path):
+        return None
+    result = extractor.extract(file_path)
+    if isinstance(result, Success):
+        return result.unwrap()
+    return None
+
+
+@dataclass(frozen=True)
+class ExtractedFile:
+    """Extraction output for one file, sent back from a worker process."""
+
+    path: str
+    source_type: SourceType
+    fulltext: str | None = None
+    metadata: ImageExtractionResult | MediaExtractionResult | None = None
+    error: str | None = None
+    content_hash: str | None = None
+    file_size: int | None = None
+    file_mtime_ns: int | None = None
+    skipped: bool = False  # Not extracted: unchanged or known content
+    page_starts: tuple[int, ...] = ()  # PDF: offset where each page starts
+
+
+def extract_file(path: str) -> ExtractedFile:
+    """
+    Hash, then extract text and metadata for one file (runs in a worker).
+
+    Files whose hash is already in the project are returned with
+    ``skipped`` set and no text. Never raises: errors are returned in
+    ``error`` so one bad file does not break the pool. Validation
+    (existence, duplicates) is left to the import command on the main
+    thread.
+    """
+    file_path = Path(path)
+    source_type = detect_source_type(file_path)
+    try:
+        fingerprint = fingerprint_file(file_path)
+        if fingerprint.content_hash in _known_hashes:
+            return ExtractedFile(
+                path=path,
+                source_type=source_type,
+                content_hash=fingerprint.content_hash,
+                file_size=fingerprint.file_size,
+                file_mtime_ns=fingerprint.file_mtime_ns,
+                skipped=True,
+            )
+        fulltext, page_starts = extract_text_and_pages(source_type, file_path)
+        return ExtractedFile(
+            path=path,
+            source_type=source_type,
+            fulltext=fulltext,
+            metadata=extract_metadata(source_type, file_path),
+            content_hash=fingerprint.content_hash,
+            file_size=fingerprint.file_size,
+            file_mtime_ns=fingerprint.file_mtime_ns,
+            page_starts=page_starts,
+        )
+    except Exception as exc:
+        return ExtractedFile(path=path, source_type=source_type, error=str(exc))
+
+
+def default_worker_count() -> int:
+    """Worker processes to use when none are configured."""
+    return max(1, min(os.cpu_count() or 1, MAX_DEFAULT_WORKERS))
+
+
+class ExtractionPipeline:
+    """
+    Bounded producer/consumer pipeline over a process pool.
+
+    A producer task submits files to the pool and puts the pending futures
+    on a bounded queue; ``run`` awaits them in order and yields each
+    result on the event loop thread. When the queue is full the producer
+    waits, which bounds both in-flight work and memory.
+
+    Example:
+        pipeline = ExtractionPipeline(
+            max_workers=4,
+            known_hashes=source_repo.content_hashes(),
+            is_unchanged=lambda path: file_unchanged(source_repo, path),
+        )
+        async for extracted in pipeline.run(paths):
+            ...
+            if cancelled:
+                pipeline.cancel()
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        queue_size: int | None = None,
+        executor_factory: Callable[[int], Executor] | None = None,
+        worker: Callable[[str], ExtractedFile] = extract_file,
+        known_hashes: Collection[str] = (),
+        is_unchanged: Callable[[str], bool] | None = None,
+    ) -> None:
+        self._max_workers = max_workers or default_worker_count()
+        self._queue_size = queue_size or self._max_workers * 2
+        self._executor_factory = executor_factory or functools.partial(
+            _process_pool, known_hashes=frozenset(known_hashes)
+        )
+        self._worker = worker
+        self._is_unchanged = is_unchanged
+        self._cancelled = False
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    def cancel(self) -> None:
+        """Stop submitting files; pending extractions are dropped."""
+        self._cancelled = True
+
+    async def run(self, paths: Iterable[str]) -> AsyncIterator[ExtractedFile]:
+        """
+        Extract ``paths`` in worker processes, yielding results in order.
+
+        ``paths`` may be a lazy iterable; it is consumed only as fast as
+        the queue drains. A worker that dies (e.g. a crashing parser) is
+        reported as an ``ExtractedFile`` with ``error`` set.
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue[tuple[str, asyncio.Future] | None] = asyncio.Queue(
+            maxsize=self._queue_size
+        )
+        executor = self._executor_factory(self._max_workers)
+
+        async def produce() -> None:
+            stopped = False
+            try:
+                for path in paths:
+                    if self._cancelled:
+                        break
+                    if self._skips(path):
+                        future = loop.create_future()
+                        future.set_result(_skipped(path))
+                        await queue.put((path, future))
+                        continue
+                    try:
+                        future = loop.run_in_executor(executor, self._worker, path)
+                    except Exception as exc:
+                        # Broken pool: report the failure for every remaining file
+                        future = loop.create_future()
+                        future.set_exception(exc)
+                    await queue.put((path, future))
+            except asyncio.CancelledError:
+                # The consumer has stopped reading; no end marker needed
+                stopped = True
+                raise
+            finally:
+                if not stopped:
+                    await queue.put(None)
+
+        producer = loop.create_task(produce())
+        try:
+            while (item := await queue.get()) is not None:
+                path, future = item
+                try:
+                    yield await future
+                except Exception as exc:
+                    logger.warning("extraction worker failed for %s: %s", path, exc)
+                    yield ExtractedFile(
+                        path=path,
+                        source_type=detect_source_type(Path(path)),
+                        error=str(exc),
+                    )
+                if self._cancelled:
+                    break
+        finally:
+            self._cancelled = True
+            producer.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await producer
+            while not queue.empty():
+                item = queue.get_nowait()
+                if item is not None:
+                    item[1].cancel()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def iter_results(self, paths: Iterable[str]) -> Iterator[ExtractedFile]:
+        """
+        Blocking variant of ``run`` for callers without an event loop.
+
+        Keeps at most ``queue_size`` files in flight and yields results in
+        input order, consuming ``paths`` lazily.
+        """
+        executor = self._executor_factory(self._max_workers)
+        window: deque[tuple[str, Future]] = deque()
+        remaining = iter(paths)
+        try:
+            while True:
+                while not self._cancelled and len(window) < self._queue_size:
+                    path = next(remaining, None)
+                    if path is None:
+                        break
+                    if self._skips(path):
+                        done: Future = Future()
+                        done.set_result(_skipped(path))
+                        window.append((path, done))
+                        continue
+                    window.append((path, executor.submit(self._worker, path)))
+                if not window or self._cancelled:
+                    return
+                path, future = window.popleft()
+                try:
+                    yield future.result()
+                except Exception as exc:
+                    logger.warning("extraction worker failed for %s: %s", path, exc)
+                    yield ExtractedFile(
+                        path=path,
+                        source_type=detect_source_type(Path(path)),
+                        error=str(exc),
+                    )
+        finally:
+            self._cancelled = True
+            for _path, future in window:
+                future.cancel()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _skips(self, path: str) -> bool:
+        if self._is_unchanged is None:
+            return False
+        try:
+            return self._is_unchanged(path)
+        except OSError:
+            return False  # Let the worker report the file
+
+
+def _skipped(path: str) -> ExtractedFile:
+    return ExtractedFile(
+        path=path, source_type=detect_source_type(Path(path)), skipped=True
+    )
+
+
+def _init_worker(known_hashes: frozenset[str]) -> None:
+    global _known_hashes
+    _known_hashes = known_hashes
+
+
+def _process_pool(
+    max_workers: int, known_hashes: frozenset[str] = frozenset()
+) -> Executor:
+    return spawn_pool(max_workers, initializer=_init_worker, initargs=(known_hashes,))
@@ -0,0 +1,536 @@
+"""
+Full-Text Index - SQLite FTS5 search over project text.
+
+Indexes source text (src_source.fulltext), coded segment text
+(cod_segment.seltext), code memos and segment memos in a single FTS5
+table so that search never has to pull every fulltext into Python.
+
+Layout:
+    source_fulltext_data     Map table: one row per indexed document
+                             (kind, ref_id, source_id). Its rowid is the
+                             FTS rowid.
+    source_fulltext_content  View resolving a map row to its current text.
+                             Used as the FTS5 external content table, so
+                             text is never stored twice.
+    source_fulltext_fts      FTS5 index (external content).
+
+SQLite triggers on src_source, cod_segment and cod_code keep the index
+current incrementally. A full rebuild only happens when the index is
+missing or its triggers were dropped (new project, older database, or a
+restored VCS snapshot).
+
+Compressed sources (see text_compression) have a NULL fulltext, which the
+content view and triggers see as an empty document. Their text is indexed
+from Python instead: the source repository swaps the empty document for
+the decompressed text after a write (fill_source_text) and back before the
+next write or delete (clear_source_text), so the triggers always find the
+document they expect. snippet() cannot read that text, so search builds
+those snippets from the compressed chunks.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from sqlalchemy import text
+
+from src.contexts.sources.infra.text_compression import (
+    iter_text_chunks,
+    load_layout,
+    read_text,
+)
+
+if TYPE_CHECKING:
+    from sqlalchemy import Connection
+
+logger = logging.getLogger("qualcoder.sources.infra")
+
+FTS_TABLE = "source_fulltext_fts"
+DATA_TABLE = "source_fulltext_data"
+CONTENT_VIEW = "source_fulltext_content"
+
+# FTS5 shadow tables (excluded from VCS dumps alongside the index itself)
+FTS_SHADOW_TABLES = (
+    f"{FTS_TABLE}_data",
+    f"{FTS_TABLE}_idx",
+    f"{FTS_TABLE}_docsize",
+    f"{FTS_TABLE}_config",
+)
+
+# Document kinds stored in the index
+KIND_SOURCE = "source"
+KIND_SEGMENT = "segment"
+KIND_CODE_MEMO = "code_memo"
+KIND_SEGMENT_MEMO = "segment_memo"
+
+ALL_KINDS = (KIND_SOURCE, KIND_SEGMENT, KIND_CODE_MEMO, KIND_SEGMENT_MEMO)
+
+_TRIGGERS = (
+    "trg_fts_src_source_ai",
+    "trg_fts_src_source_au",
+    "trg_fts_src_source_ad",
+    "trg_fts_cod_segment_ai",
+    "trg_fts_cod_segment_au",
+    "trg_fts_cod_segment_ad",
+    "trg_fts_cod_code_ai",
+    "trg_fts_cod_code_au",
+    "trg_fts_cod_code_ad",
+)
+
+
+def _rowid(kind: str, ref: str) -> str:
+    """SQL expression resolving the FTS rowid of a document."""
+    return f"(SELECT rowid FROM {DATA_TABLE} WHERE kind = '{kind}' AND ref_id = {ref})"
+
+
+def _index(kind: str, ref: str, body: str) -> str:
+    return f"INSERT INTO {FTS_TABLE}(rowid, body) VALUES ({_rowid(kind, ref)}, {body});"
+
+
+def _unindex(kind: str, ref: str, body: str) -> str:
+    return (
+        f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, body) "
+        f"VALUES ('delete', {_rowid(kind, ref)}, {body});"
+    )
+
+
+def _map(kind: str, ref: str, source_id: str) -> str:
+    return (
+        f"INSERT INTO {DATA_TABLE}(kind, ref_id, source_id) "
+        f"VALUES ('{kind}', {ref}, {source_id});"
+    )
+
+
+def _unmap(kind: str, ref: str) -> str:
+    return f"DELETE FROM {DATA_TABLE} WHERE kind = '{kind}' AND ref_id = {ref};"
+
+
+_DDL = (
+    f"""
+    CREATE TABLE IF NOT EXISTS {DATA_TABLE} (
+        rowid INTEGER PRIMARY KEY,
+        kind TEXT NOT NULL,
+        ref_id TEXT NOT NULL,
+        source_id TEXT,
+        UNIQUE (kind, ref_id)
+    )
+    """,
+    f"CREATE INDEX IF NOT EXISTS idx_{DATA_TABLE}_source ON {DATA_TABLE}(source_id)",
+    f"""
+    CREATE VIEW IF NOT EXISTS {CONTENT_VIEW} AS
+    SELECT d.rowid AS rowid,
+           CASE d.kind
+               WHEN '{KIND_SOURCE}'
+                   THEN (SELECT fulltext FROM src_source WHERE id = d.ref_id)
+               WHEN '{KIND_SEGMENT}'
+                   THEN (SELECT seltext FROM cod_segment WHERE ctid = d.ref_id)
+               WHEN '{KIND_SEGMENT_MEMO}'
+                   THEN (SELECT memo FROM cod_segment WHERE ctid = d.ref_id)
+               WHEN '{KIND_CODE_MEMO}'
+                   THEN (SELECT memo FROM cod_code WHERE cid = d.ref_id)
+           END AS body
+    FROM {DATA_TABLE} d
+    """,
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        body,
+        content='{CONTENT_VIEW}',
+        content_rowid='rowid',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    # -- src_source.fulltext ------------------------------------------------
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_fts_src_source_ai
+    AFTER INSERT ON src_source BEGIN
+        {_map(KIND_SOURCE, "new.id", "new.id")}
+        {_index(KIND_SOURCE, "new.id", "new.fulltext")}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_fts_src_source_au
+    AFTER UPDATE OF fulltext ON src_source
+    WHEN old.fulltext IS NOT new.fulltext BEGIN
+        {_unindex(KIND_SOURCE, "old.id", "old.fulltext")}
+        {_index(KIND_SOURCE, "new.id", "new.fulltext")}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_fts_src_source_ad
+    AFTER DELETE ON src_source BEGIN
+        {_unindex(KIND_SOURCE, "old.id", "old.fulltext")}
+        {_unmap(KIND_SOURCE, "old.id")}
+    END
+    """,
+    # -- cod_segment.seltext / cod_segment.memo -----------------------------
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_fts_cod_segment_ai
+    AFTER INSERT ON cod_segment BEGIN
+        {_map(KIND_SEGMENT, "new.ctid", "new.fid")}
+        {_map(KIND_SEGMENT_MEMO, "new.ctid", "new.fid")}
+        {_index(KIND_SEGMENT, "new.ctid", "new.seltext")}
+        {_index(KIND_SEGMENT_MEMO, "new.ctid", "new.memo")}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_fts_cod_segment_au
+    AFTER UPDATE OF seltext, memo, fid ON cod_segment BEGIN
+        {_unindex(KIND_SEGMENT, "old.ctid", "old.seltext")}
+        {_unindex(KIND_SEGMENT_MEMO, "old.ctid", "old.memo")}
+        UPDATE {DATA_TABLE} SET source_id = new.fid
+            WHERE kind IN ('{KIND_SEGMENT}', '{KIND_SEGMENT_MEMO}')
+            AND ref_id = new.ctid;
+        {_index(KIND_SEGMENT, "new.ctid", "new.seltext")}
+        {_index(KIND_SEGMENT_MEMO, "new.ctid", "new.memo")}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_fts_cod_segment_ad
+    AFTER DELETE ON cod_segment BEGIN
+        {_unindex(KIND_SEGMENT, "old.ctid", "old.seltext")}
+        {_unindex(KIND_SEGMENT_MEMO, "old.ctid", "old.memo")}
+        {_unmap(KIND_SEGMENT, "old.ctid")}
+        {_unmap(KIND_SEGMENT_MEMO, "old.ctid")}
+    END
+    """,
+    # -- cod_code.memo ------------------------------------------------------
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_fts_cod_code_ai
+    AFTER INSERT ON cod_code BEGIN
+        {_map(KIND_CODE_MEMO, "new.cid", "NULL")}
+        {_index(KIND_CODE_MEMO, "new.cid", "new.memo")}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_fts_cod_code_au
+    AFTER UPDATE OF memo ON cod_code
+    WHEN old.memo IS NOT new.memo BEGIN
+        {_unindex(KIND_CODE_MEMO, "old.cid", "old.memo")}
+        {_index(KIND_CODE_MEMO, "new.cid", "new.memo")}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_fts_cod_code_ad
+    AFTER DELETE ON cod_code BEGIN
+        {_unindex(KIND_CODE_MEMO, "old.cid", "old.memo")}
+        {_unmap(KIND_CODE_MEMO, "old.cid")}
+    END
+    """,
+)
+
+_RESYNC = (
+    f"DELETE FROM {DATA_TABLE}",
+    f"""
+    INSERT INTO {DATA_TABLE}(kind, ref_id, source_id)
+    SELECT '{KIND_SOURCE}', id, id FROM src_source
+    """,
+    f"""
+    INSERT INTO {DATA_TABLE}(kind, ref_id, source_id)
+    SELECT '{KIND_SEGMENT}', ctid, fid FROM cod_segment
+    """,
+    f"""
+    INSERT INTO {DATA_TABLE}(kind, ref_id, source_id)
+    SELECT '{KIND_SEGMENT_MEMO}', ctid, fid FROM cod_segment
+    """,
+    f"""
+    INSERT INTO {DATA_TABLE}(kind, ref_id, source_id)
+    SELECT '{KIND_CODE_MEMO}', cid, NULL FROM cod_code
+    """,
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')",
+)
+
+
+def create_fulltext_index(connection: Connection) -> None:
+    """
+    Create the FTS5 index, its map table, content view and triggers.
+
+    Idempotent. When the index or any of its triggers is missing (new or
+    older database, restored snapshot) the map table is re-populated and
+    the index rebuilt once; otherwise this is a cheap catalog check.
+
+    Args:
+        connection: SQLAlchemy connection with the context tables created
+    """
+    existing = {
+        row.name
+        for row in connection.execute(
+            text(
+                "SELECT name FROM sqlite_master "
+                "WHERE type IN ('table', 'trigger') AND name IN "
+                f"('{FTS_TABLE}', {', '.join(repr(t) for t in _TRIGGERS)})"
+            )
+        )
+    }
+    if FTS_TABLE in existing and existing.issuperset(_TRIGGERS):
+        return
+
+    logger.info("create_fulltext_index: building %s", FTS_TABLE)
+    for statement in _DDL:
+        connection.execute(text(statement))
+    for statement in _RESYNC:
+        connection.execute(text(statement))
+    _fill_compressed_sources(connection)
+
+
+def _fill_compressed_sources(connection: Connection) -> None:
+    """Index the text of compressed sources after a rebuild."""
+    rows = connection.execute(
+        text("SELECT id FROM src_source WHERE text_codec IS NOT NULL")
+    ).fetchall()
+    for row in rows:
+        layout = load_layout(connection, row.id)
+        if layout is not None:
+            fill_source_text(connection, row.id, read_text(connection, row.id, layout))
+
+
+_SOURCE_DOC = (
+    f"SELECT {{op}}rowid, :body FROM {DATA_TABLE} "
+    f"WHERE kind = '{KIND_SOURCE}' AND ref_id = :source_id"
+)
+
+
+def _replace_source_doc(
+    connection: Connection, source_id: str, old: str | None, new: str | None
+) -> None:
+    """Swap the indexed text of a source document (no-op when unmapped)."""
+    connection.execute(
+        text(
+            f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, body) "
+            + _SOURCE_DOC.format(op="'delete', ")
+        ),
+        {"source_id": source_id, "body": old},
+    )
+    connection.execute(
+        text(f"INSERT INTO {FTS_TABLE}(rowid, body) " + _SOURCE_DOC.format(op="")),
+        {"source_id": source_id, "body": new},
+    )
+
+
+def fill_source_text(connection: Connection, source_id: str, body: str) -> None:
+    """Index the text of a compressed source in place of its empty document."""
+    _replace_source_doc(connection, source_id, None, body)
+
+
+def clear_source_text(connection: Connection, source_id: str, body: str) -> None:
+    """Unindex the text of a compressed source, leaving the empty document."""
+    _replace_source_doc(connection, source_id, body, None)
+
+
+def drop_fulltext_index(connection: Connection) -> None:
+    """Drop the FTS5 index and everything supporting it (for testing)."""
+    for trigger in _TRIGGERS:
+        connection.execute(text(f"DROP TRIGGER IF EXISTS {trigger}"))
+    connection.execute(text(f"DROP TABLE IF EXISTS {FTS_TABLE}"))
+    connection.execute(text(f"DROP VIEW IF EXISTS {CONTENT_VIEW}"))
+    connection.execute(text(f"DROP TABLE IF EXISTS {DATA_TABLE}"))
+
+
+def to_match_query(query: str) -> str:
+    """
+    Convert free text typed by a user into a safe FTS5 MATCH expression.
+
+    Every whitespace-separated term is quoted (so punctuation and FTS5
+    operators are taken literally) and the terms are AND-ed. The last
+    term is a prefix match so results appear while the user is typing.
+
+    Returns an empty string when the query has no searchable terms.
+    """
+    terms = [t.replace('"', '""') for t in query.split() if t.strip('"')]
+    if not terms:
+        return ""
+    quoted = [f'"{t}"' for t in terms]
+    quoted[-1] += "*"
+    return " ".join(quoted)
+
+
+# ============================================================
+# Search Results
+# ============================================================
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    """A single ranked full-text match."""
+
+    kind: str  # One of ALL_KINDS
+    ref_id: str  # Source id, segment id or code id depending on kind
+    source_id: str | None
+    source_name: str | None
+    snippet: str
+    rank: float  # bm25 score, lower is better
+
+
+@dataclass(frozen=True)
+class SearchPage:
+    """A page of search hits plus the total number of matches."""
+
+    hits: tuple[SearchHit, ...]
+    total: int
+    offset: int
+    limit: int
+
+    @property
+    def has_more(self) -> bool:
+        return self.offset + len(self.hits) < self.total
+
+
+class SQLiteFulltextIndex:
+    """
+    Ranked, paged full-text search over the project.
+
+    Read-only: the index is maintained by SQLite triggers (and by the
+    source repository for compressed text), so other writers never need
+    to know it exists.
+    """
+
+    HIGHLIGHT_OPEN = "<mark>"
+    HIGHLIGHT_CLOSE = "</mark>"
+    ELLIPSIS = "…"
+    SNIPPET_TOKENS = 16
+    SNIPPET_CHARS = 60  # Context either side of a match in compressed text
+
+    def __init__(self, connection: Connection) -> None:
+        self._conn = connection
+
+    def search(
+        self,
+        query: str,
+        kinds: tuple[str, ...] | None = None,
+        offset: int = 0,
+        limit: int = 20,
+        source_id: str | None = None,
+    ) -> SearchPage:
+        """
+        Search indexed text, best matches first.
+
+        Args:
+            query: Free text typed by the user (see to_match_query)
+            kinds: Restrict to these document kinds (default: all)
+            offset: Number of hits to skip (paging)
+            limit: Maximum number of hits to return
+            source_id: Restrict to documents belonging to one source
+
+        Returns:
+            SearchPage with highlighted snippets and the total match count
+        """
+        match = to_match_query(query)
+        offset = max(0, offset)
+        limit = max(1, limit)
+        if not match:
+            return SearchPage(hits=(), total=0, offset=offset, limit=limit)
+
+        where, params = self._filters(match, kinds, source_id)
+        total = self._conn.execute(
+            text(
+                f"SELECT count(*) FROM {FTS_TABLE} "
+                f"JOIN {DATA_TABLE} d ON d.rowid = {FTS_TABLE}.rowid WHERE {where}"
+            ),
+            params,
+        ).scalar()
+
+        rows = self._conn.execute(
+            text(
+                f"SELECT d.kind, d.ref_id, d.source_id, s.name AS source_name, "
+                f"snippet({FTS_TABLE}, 0, :hl_open, :hl_close, :ellipsis, "
+                f":snippet_tokens) AS snippet, bm25({FTS_TABLE}) AS rank "
+                f"FROM {FTS_TABLE} "
+                f"JOIN {DATA_TABLE} d ON d.rowid = {FTS_TABLE}.rowid "
+                f"LEFT JOIN src_source s ON s.id = d.source_id "
+                f"WHERE {where} ORDER BY rank LIMIT :limit OFFSET :offset"
+            ),
+            {
+                **params,
+                "hl_open": self.HIGHLIGHT_OPEN,
+                "hl_close": self.HIGHLIGHT_CLOSE,
+                "ellipsis": self.ELLIPSIS,
+                "snippet_tokens": self.SNIPPET_TOKENS,
+                "limit": limit,
+                "offset": offset,
+            },
+        )
+        hits = tuple(
+            SearchHit(
+                kind=row.kind,
+                ref_id=row.ref_id,
+                source_id=row.source_id,
+                source_name=row.source_name,
+                snippet=(
+                    row.snippet
+                    if row.snippet or row.kind != KIND_SOURCE
+                    else self._compressed_snippet(row.ref_id, query)
+                ),
+                rank=row.rank,
+            )
+            for row in rows
+        )
+        logger.debug("search: %r total=%d returned=%d", query, total, len(hits))
+        return SearchPage(hits=hits, total=total or 0, offset=offset, limit=limit)
+
+    def matching_source_ids(self, query: str, limit: int = 1000) -> list[str]:
+        """
+        Return ids of sources whose text matches, best match first.
+
+        Only source fulltext is considered (not segments or memos).
+        """
+        match = to_match_query(query)
+        if not match:
+            return []
+        rows = self._conn.execute(
+            text(
+                f"SELECT d.ref_id FROM {FTS_TABLE} "
+                f"JOIN {DATA_TABLE} d ON d.rowid = {FTS_TABLE}.rowid "
+                f"WHERE {FTS_TABLE} MATCH :match AND d.kind = :kind "
+                f"ORDER BY bm25({FTS_TABLE}) LIMIT :limit"
+            ),
+            {"match": match, "kind": KIND_SOURCE, "limit": limit},
+        )
+        return [row.ref_id for row in rows]
+
+    def _compressed_snippet(self, source_id: str, query: str) -> str:
+        """
+        Snippet for a compressed source, whose text snippet() cannot see.
+
+        Highlights the first chunk-local match of any query term
+        (case-insensitive; approximates the FTS5 tokenizer).
+        """
+        layout = load_layout(self._conn, source_id)
+        terms = [t.strip('"') for t in query.split() if t.strip('"')]
+        if layout is None or not terms:
+            return ""
+        pattern = re.compile("|".join(map(re.escape, terms)), re.IGNORECASE)
+        for chunk in iter_text_chunks(self._conn, source_id, layout):
+            found = pattern.search(chunk)
+            if found is None:
+                continue
+            start = max(0, found.start() - self.SNIPPET_CHARS)
+            end = found.end() + self.SNIPPET_CHARS
+            return (
+                (self.ELLIPSIS if start > 0 else "")
+                + chunk[start : found.start()]
+                + self.HIGHLIGHT_OPEN
+                + found.group()
+                + self.HIGHLIGHT_CLOSE
+                + chunk[found.end() : end]
+                + (self.ELLIPSIS if end < len(chunk) else "")
+            )
+        return ""
+
+    @staticmethod
+    def _filters(
+        match: str, kinds: tuple[str, ...] | None, source_id: str | None
+    ) -> tuple[str, dict]:
+        clauses = [f"{FTS_TABLE} MATCH :match"]
+        params: dict = {"match": match}
+        if kinds:
+            names = []
+            for i, kind in enumerate(kinds):
+                params[f"kind_{i}"] = kind
+                names.append(f":kind_{i}")
+            clauses.append(f"d.kind IN ({', '.join(names)})")
+        if source_id is not None:
+            clauses.append("d.source_id = :source_id")
+            params["source_id"] = source_id
+        return " AND ".join(clauses), params
@@ -0,0 +1,241 @@
+"""
+Sources Context: Image and Media Metadata Cache
+
+Reading image metadata walks the whole EXIF block (PIL) and reading media
+metadata parses the container headers and tags (mutagen). Both are cheap
+per file but add up over a project, and the results never change while
+the file does not. This module keeps them:
+
+- SQLiteMetadataCache stores each file's extraction result in the project
+  database, keyed by its path, size and mtime, so an edited or replaced
+  file is extracted again and stale metadata is never returned
+- extract_metadata_batch extracts many files on a thread pool; PIL and
+  mutagen spend most of their time in file I/O, which releases the GIL
+
+Extraction runs on worker threads; the database is only touched on the
+calling thread.
+
+Usage:
+    cache = SQLiteMetadataCache(connection)
+    cache.put(path, file_size, file_mtime_ns, result)   # from an import
+    cache.lookup(path)                                  # extracts on a miss
+    cache.lookup_stored(path)                           # (result, stored)
+    cache.extract_many(paths, max_workers=8)            # {path: result}
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from sqlalchemy import select
+
+from src.contexts.projects.core.invariants import detect_source_type
+from src.contexts.sources.infra.extraction_pool import extract_metadata
+from src.contexts.sources.infra.image_extractor import ImageExtractionResult
+from src.contexts.sources.infra.media_extractor import MediaExtractionResult
+from src.contexts.sources.infra.schema import src_file_metadata
+from src.shared.infra.repositories.bulk import (
+    DELETE_CHUNK_SIZE,
+    chunked,
+    upsert_many,
+)
+
+if TYPE_CHECKING:
+    from sqlalchemy import Connection
+
+logger = logging.getLogger("qualcoder.sources.infra")
+
+MetadataResult = ImageExtractionResult | MediaExtractionResult
+
+# Threads for batch extraction when none are configured; mostly waiting
+# on disk, so more than the core count helps
+MAX_DEFAULT_THREADS = 16
+
+_KINDS: dict[str, type[MetadataResult]] = {
+    "image": ImageExtractionResult,
+    "media": MediaExtractionResult,
+}
+
+
+def _kind(result: MetadataResult) -> str:
+    return "image" if isinstance(result, ImageExtractionResult) else "media"
+
+
+def _extract_path(path: str) -> MetadataResult | None:
+    file_path = Path(path)
+    try:
+        return extract_metadata(detect_source_type(file_path), file_path)
+    except Exception as exc:
+        logger.warning("metadata_cache: extraction failed for %s: %s", path, exc)
+        return None
+
+
+def extract_metadata_batch(
+    paths: Iterable[str], max_workers: int | None = None
+) -> Iterator[tuple[str, MetadataResult | None]]:
+    """
+    Extract image or media metadata for many files on a thread pool.
+
+    Yields (path, result) in input order; the result is None for files
+    that are not images or media, or could not be read. Never raises for
+    a single bad file.
+    """
+    paths = list(paths)
+    if not paths:
+        return
+    workers = max_workers or min(MAX_DEFAULT_THREADS, (os.cpu_count() or 1) * 2)
+    with ThreadPoolExecutor(
+        max_workers=min(workers, len(paths)),
+        thread_name_prefix="metadata",
+    ) as executor:
+        yield from zip(paths, executor.map(_extract_path, paths), strict=True)
+
+
+class SQLiteMetadataCache:
+    """
+    Extracted image/media metadata per file, stored in the project database.
+
+    An entry is returned only while the file's size and mtime match the
+    ones it was extracted at.
+
+    Example:
+        cache = SQLiteMetadataCache(connection)
+        result = cache.get(path, file_size, file_mtime_ns)   # or None
+        result = cache.lookup(path)                          # stat + extract
+    """
+
+    def __init__(self, connection: Connection) -> None:
+        self._conn = connection
+
+    def get(
+        self, path: str | Path, file_size: int, file_mtime_ns: int
+    ) -> MetadataResult | None:
+        """Cached metadata of a file as it was at (size, mtime), or None."""
+        return self.get_many([(str(path), file_size, file_mtime_ns)]).get(str(path))
+
+    def get_many(
+        self, entries: Iterable[tuple[str, int, int]]
+    ) -> dict[str, MetadataResult]:
+        """
+        Cached metadata for many files in one query per chunk.
+
+        Args:
+            entries: (path, file_size, file_mtime_ns) per file
+
+        Returns:
+            Path -> result, for the files with a current entry only
+        """
+        wanted = {path: (size, mtime) for path, size, mtime in entries}
+        found: dict[str, MetadataResult] = {}
+        for chunk in chunked(list(wanted), DELETE_CHUNK_SIZE):
+            rows = self._conn.execute(
+                select(src_file_metadata).where(src_file_metadata.c.path.in_(chunk))
+            )
+            for row in rows:
+                if wanted[row.path] != (row.file_size, row.file_mtime_ns):
+                    continue  # File changed since it was extracted
+                result = self._from_row(row)
+                if result is not None:
+                    found[row.path] = result
+        return found
+
+    def put(
+        self,
+        path: str | Path,
+        file_size: int,
+        file_mtime_ns: int,
+        result: MetadataResult,
+    ) -> None:
+        """Store the metadata extracted from a file at (size, mtime)."""
+        self.put_many([(str(path), file_size, file_mtime_ns, result)])
+
+    def put_many(self, entries: Iterable[tuple[str, int, int, MetadataResult]]) -> int:
+        """Store many results in one statement, replacing older entries."""
+        rows = [
+            {
+                "path": path,
+                "file_size": size,
+                "file_mtime_ns": mtime,
+                "kind": _kind(result),
+                "data": json.dumps(asdict(result), default=str),
+            }
+            for path, size, mtime, result in entries
+        ]
+        return upsert_many(
+            self._conn,
+            src_file_metadata,
+            rows,
+            key="path",
+            update_columns=("file_size", "file_mtime_ns", "kind", "data"),
+        )
+
+    def lookup(self, path: str | Path) -> MetadataResult | None:
+        """Metadata of a file as it is now, extracting and storing it on a miss."""
+        return self.lookup_stored(path)[0]
+
+    def lookup_stored(self, path: str | Path) -> tuple[MetadataResult | None, bool]:
+        """Like lookup, also telling whether a fresh extraction was stored."""
+        found, stored = self._extract_many([str(path)], max_workers=1)
+        return found.get(str(path)), stored > 0
+
+    def extract_many(
+        self, paths: Iterable[str], max_workers: int | None = None
+    ) -> dict[str, MetadataResult]:
+        """
+        Metadata of many files as they are now.
+
+        Files are stat'ed, current entries read in one query, and only the
+        misses extracted, on a thread pool. New results are stored in one
+        statement.
+
+        Returns:
+            Path -> result; files that are missing, unreadable or not
+            images/media are left out
+        """
+        return self._extract_many(paths, max_workers)[0]
+
+    def _extract_many(
+        self, paths: Iterable[str], max_workers: int | None
+    ) -> tuple[dict[str, MetadataResult], int]:
+        """extract_many, plus the number of results stored."""
+        stats: dict[str, tuple[int, int]] = {}
+        for path in paths:
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            stats[path] = (st.st_size, st.st_mtime_ns)
+
+        found = self.get_many((p, *key) for p, key in stats.items())
+        misses = [path for path in stats if path not in found]
+        fresh = [
+            (path, *stats[path], result)
+            for path, result in extract_metadata_batch(misses, max_workers)
+            if result is not None
+        ]
+        self.put_many(fresh)
+        found.update((path, result) for path, _s, _m, result in fresh)
+        logger.debug(
+            "metadata_cache: %d files, %d cached, %d extracted",
+            len(stats),
+            len(stats) - len(misses),
+            len(fresh),
+        )
+        return found, len(fresh)
+
+    def _from_row(self, row) -> MetadataResult | None:
+        result_cls = _KINDS.get(row.kind)
+        if result_cls is None:
+            return None
+        try:
+            return result_cls(**json.loads(row.data))
+        except (TypeError, ValueError):
+            logger.debug("metadata_cache: unreadable entry for %s", row.path)
+            return None
@@ -0,0 +1,35 @@
+"""
+Sources Context: Worker Process Pools
+
+Extraction work that is CPU-bound (PDF pages, batch imports of many
+files) runs in worker processes. Workers are always spawned rather than
+forked: the GUI process runs Qt and database threads that must not be
+duplicated into workers.
+
+Usage:
+    with spawn_pool(max_workers=4) as pool:
+        results = list(pool.map(extract, paths))
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def spawn_pool(
+    max_workers: int,
+    initializer: Callable[..., object] | None = None,
+    initargs: tuple[Any, ...] = (),
+) -> ProcessPoolExecutor:
+    """A process pool whose workers are spawned, never forked."""
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=initializer,
+        initargs=initargs,
+    )
@@ -2,7 +2,8 @@
 Sources Context: SQLAlchemy Core Schema
 
 Table definitions for the Sources bounded context using SQLAlchemy Core.
-Defines src_source and src_folder tables.
+Defines src_source, src_source_text, src_source_page, src_speaker_index,
+src_speaker_turn, src_file_metadata and src_folder tables.
 
 These tables use the 'src_' prefix to identify them as belonging to
 the Sources bounded context.
@@ -13,11 +14,16 @@ from sqlalchemy import (
     DateTime,
     Index,
     Integer,
+    LargeBinary,
     MetaData,
+    PrimaryKeyConstraint,
     String,
     Table,
     Text,
+    delete,
+    text,
 )
+from sqlalchemy.schema import CreateTable
 
 # Metadata for Sources context tables
 metadata = MetaData()
@@ -51,10 +57,81 @@ src_source = Table(
     Column("file_size", Integer, default=0),  # Non-ID integer, kept
     Column("origin", String(255)),  # Where the source came from
     Column("folder_id", String(36)),  # Reference to src_folder
+    Column("content_hash", String(64)),  # BLAKE2b hex digest of the file
+    Column("file_mtime_ns", Integer),  # File mtime at import (nanoseconds)
+    # Compressed text (fulltext is NULL and the text is in src_source_text)
+    Column("text_codec", String(10)),  # zlib / zstd, NULL for plain fulltext
+    Column("text_length", Integer),  # Characters in the compressed text
+    Column("text_chunk_chars", Integer),  # Characters per compressed chunk
+    Column("text_hash", String(64)),  # BLAKE2b of the compressed text
     # Indexes
     Index("idx_src_source_name", "name"),
     Index("idx_src_source_type", "source_type"),
     Index("idx_src_source_folder", "folder_id"),
+    Index("idx_src_source_hash", "content_hash"),
+    Index("idx_src_source_mediapath", "mediapath"),
+)
+
+# src_source_text - Compressed source text, one row per chunk
+src_source_text = Table(
+    "src_source_text",
+    metadata,
+    Column("source_id", String(36), nullable=False),
+    Column("chunk_no", Integer, nullable=False),
+    Column("data", LargeBinary, nullable=False),
+    PrimaryKeyConstraint("source_id", "chunk_no"),
+)
+
+# src_source_page - Where each page of a PDF source starts in its text
+src_source_page = Table(
+    "src_source_page",
+    metadata,
+    Column("source_id", String(36), nullable=False),
+    Column("page_no", Integer, nullable=False),  # 0-indexed
+    Column("start_pos", Integer, nullable=False),  # Offset in fulltext
+    PrimaryKeyConstraint("source_id", "page_no"),
+)
+
+# src_speaker_index - Which text the stored speaker turns of a source belong to
+src_speaker_index = Table(
+    "src_speaker_index",
+    metadata,
+    Column("source_id", String(36), primary_key=True),
+    Column("text_hash", String(64), nullable=False),  # BLAKE2b of the text
+    Column("turn_count", Integer, nullable=False),
+)
+
+# src_speaker_turn - Speaker turns of a source, as offsets in its text
+src_speaker_turn = Table(
+    "src_speaker_turn",
+    metadata,
+    Column("source_id", String(36), nullable=False),
+    Column("turn_no", Integer, nullable=False),
+    Column("start_pos", Integer, nullable=False),
+    Column("end_pos", Integer, nullable=False),
+    Column("speaker", String(255), nullable=False),
+    PrimaryKeyConstraint("source_id", "turn_no"),
+)
+
+# src_file_metadata - Image/media metadata of a file, valid for its size and mtime
+src_file_metadata = Table(
+    "src_file_metadata",
+    metadata,
+    Column("path", String(500), primary_key=True),
+    Column("file_size", Integer, nullable=False),
+    Column("file_mtime_ns", Integer, nullable=False),
+    Column("kind", String(10), nullable=False),  # image, media
+    Column("data", Text, nullable=False),  # JSON of the extraction result
+)
+
+# Columns added after the first release, with their SQLite types
+_ADDED_COLUMNS = (
+    ("content_hash", "VARCHAR(64)"),
+    ("file_mtime_ns", "INTEGER"),
+    ("text_codec", "VARCHAR(10)"),
+    ("text_length", "INTEGER"),
+    ("text_chunk_chars", "INTEGER"),
+    ("text_hash", "VARCHAR(64)"),
 )
 
 
@@ -68,6 +145,54 @@ def create_all(engine) -> None:
     metadata.create_all(engine)
 
 
+def upgrade_source_columns(connection) -> None:
+    """
+    Add columns, indexes and tables missing from an older database.
+
+    Idempotent; the new columns stay NULL for existing rows until their
+    files are imported again (or their text is compressed).
+
+    Args:
+        connection: SQLAlchemy connection or Session
+    """
+    present = {
+        row[1] for row in connection.execute(text("PRAGMA table_info(src_source)"))
+    }
+    if not present:
+        return  # Table not created yet
+    for name, sql_type in _ADDED_COLUMNS:
+        if name not in present:
+            connection.execute(
+                text(f"ALTER TABLE src_source ADD COLUMN {name} {sql_type}")
+            )
+    for index in src_source.indexes:
+        columns = ", ".join(c.name for c in index.columns)
+        connection.execute(
+            text(f"CREATE INDEX IF NOT EXISTS {index.name} ON src_source ({columns})")
+        )
+    for table in (
+        src_source_text,
+        src_source_page,
+        src_speaker_index,
+        src_speaker_turn,
+        src_file_metadata,
+    ):
+        connection.execute(CreateTable(table, if_not_exists=True))
+
+
+def clear_speaker_turns(connection) -> None:
+    """
+    Delete all stored speaker turns, e.g. after the source texts were replaced.
+
+    The turns are derived data; SpeakerTurnIndex scans the texts again on demand.
+
+    Args:
+        connection: SQLAlchemy connection or Session
+    """
+    connection.execute(delete(src_speaker_turn))
+    connection.execute(delete(src_speaker_index))
+
+
 def drop_all(engine) -> None:
     """
     Drop all Sources context tables (for testing).
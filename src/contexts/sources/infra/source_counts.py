@@ -0,0 +1,166 @@
+"""
+Sources Context: Maintained Source Counts
+
+Source counts per type and per folder kept in small aggregate tables, so
+the project dashboard and folder badges read a handful of rows instead of
+running one COUNT over src_source per type.
+
+Layout:
+    src_source_count_type    (source_type, n)   '' for sources without a type
+    src_source_count_folder  (folder_id, n)     '' for the project root
+
+SQLite triggers on src_source keep the counts current. The tables are
+derived data and are rebuilt from src_source when missing or when a
+trigger was dropped (new project, older database, or a restored VCS
+snapshot).
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from sqlalchemy import text
+
+if TYPE_CHECKING:
+    from sqlalchemy import Connection
+
+logger = logging.getLogger("qualcoder.sources.infra")
+
+BY_TYPE_TABLE = "src_source_count_type"
+BY_FOLDER_TABLE = "src_source_count_folder"
+
+COUNT_TABLES = (BY_TYPE_TABLE, BY_FOLDER_TABLE)
+
+_TRIGGERS = (
+    "trg_cnt_src_source_ai",
+    "trg_cnt_src_source_au",
+    "trg_cnt_src_source_ad",
+)
+
+
+def _add(row: str) -> str:
+    return f"""
+        INSERT INTO {BY_TYPE_TABLE}(source_type, n)
+            VALUES (COALESCE({row}.source_type, ''), 1)
+            ON CONFLICT(source_type) DO UPDATE SET n = n + 1;
+        INSERT INTO {BY_FOLDER_TABLE}(folder_id, n)
+            VALUES (COALESCE({row}.folder_id, ''), 1)
+            ON CONFLICT(folder_id) DO UPDATE SET n = n + 1;
+    """
+
+
+def _sub(row: str) -> str:
+    return f"""
+        UPDATE {BY_TYPE_TABLE} SET n = n - 1
+            WHERE source_type = COALESCE({row}.source_type, '');
+        DELETE FROM {BY_TYPE_TABLE}
+            WHERE source_type = COALESCE({row}.source_type, '') AND n <= 0;
+        UPDATE {BY_FOLDER_TABLE} SET n = n - 1
+            WHERE folder_id = COALESCE({row}.folder_id, '');
+        DELETE FROM {BY_FOLDER_TABLE}
+            WHERE folder_id = COALESCE({row}.folder_id, '') AND n <= 0;
+    """
+
+
+_DDL = (
+    f"""
+    CREATE TABLE IF NOT EXISTS {BY_TYPE_TABLE} (
+        source_type VARCHAR(20) PRIMARY KEY,
+        n INTEGER NOT NULL
+    )
+    """,
+    f"""
+    CREATE TABLE IF NOT EXISTS {BY_FOLDER_TABLE} (
+        folder_id VARCHAR(36) PRIMARY KEY,
+        n INTEGER NOT NULL
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_cnt_src_source_ai
+    AFTER INSERT ON src_source BEGIN
+        {_add("new")}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_cnt_src_source_au
+    AFTER UPDATE OF source_type, folder_id ON src_source
+    WHEN old.source_type IS NOT new.source_type
+        OR old.folder_id IS NOT new.folder_id BEGIN
+        {_sub("old")}
+        {_add("new")}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_cnt_src_source_ad
+    AFTER DELETE ON src_source BEGIN
+        {_sub("old")}
+    END
+    """,
+)
+
+_RESYNC = (
+    f"DELETE FROM {BY_TYPE_TABLE}",
+    f"DELETE FROM {BY_FOLDER_TABLE}",
+    f"""
+    INSERT INTO {BY_TYPE_TABLE}(source_type, n)
+    SELECT COALESCE(source_type, ''), COUNT(*) FROM src_source
+    GROUP BY COALESCE(source_type, '')
+    """,
+    f"""
+    INSERT INTO {BY_FOLDER_TABLE}(folder_id, n)
+    SELECT COALESCE(folder_id, ''), COUNT(*) FROM src_source
+    GROUP BY COALESCE(folder_id, '')
+    """,
+)
+
+
+def create_source_counts(connection: Connection) -> None:
+    """
+    Create the source count tables and the triggers maintaining them.
+
+    Idempotent. When a table or trigger is missing the counts are rebuilt
+    from src_source once; otherwise this is a cheap catalog check.
+
+    Args:
+        connection: SQLAlchemy connection with the sources tables created
+    """
+    names = (*COUNT_TABLES, *_TRIGGERS)
+    existing = {
+        row.name
+        for row in connection.execute(
+            text(
+                "SELECT name FROM sqlite_master "
+                "WHERE type IN ('table', 'trigger') AND name IN "
+                f"({', '.join(repr(n) for n in names)})"
+            )
+        )
+    }
+    if existing.issuperset(names):
+        return
+
+    logger.info("create_source_counts: rebuilding source counts")
+    for statement in _DDL:
+        connection.execute(text(statement))
+    for statement in _RESYNC:
+        connection.execute(text(statement))
+
+
+def drop_source_counts(connection: Connection) -> None:
+    """Drop the source count tables and triggers (for testing)."""
+    for trigger in _TRIGGERS:
+        connection.execute(text(f"DROP TRIGGER IF EXISTS {trigger}"))
+    for table in COUNT_TABLES:
+        connection.execute(text(f"DROP TABLE IF EXISTS {table}"))
+
+
+def counts_by_type(connection: Connection) -> dict[str, int]:
+    """Source counts keyed by source type ('' for untyped sources)."""
+    rows = connection.execute(text(f"SELECT source_type, n FROM {BY_TYPE_TABLE}"))
+    return {row.source_type: row.n for row in rows}
+
+
+def counts_by_folder(connection: Connection) -> dict[str | None, int]:
+    """Source counts keyed by folder id (None for the project root)."""
+    rows = connection.execute(text(f"SELECT folder_id, n FROM {BY_FOLDER_TABLE}"))
+    return {(row.folder_id or None): row.n for row in rows}
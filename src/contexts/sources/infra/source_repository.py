@@ -2,20 +2,70 @@
 Source Repository - SQLAlchemy Core Implementation for Sources Context.
 
 Implements the repository for Source entities using the src_source table.
+
+Source text is stored plain in src_source.fulltext unless a text codec is
+set, in which case it is written as compressed chunks (see
+text_compression). Reads decompress transparently, so callers never see
+the difference; range reads decompress only the chunks they overlap.
+
+Speaker turns found in a source's text can be stored with the hash of that
+text. Saving a source whose text no longer matches the hash drops its
+turns, so stored turns are always current.
 """
 
 from __future__ import annotations
 
 import logging
+from collections import OrderedDict
+from collections.abc import Iterable, Sequence
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from sqlalchemy import delete, func, select, update
+from sqlalchemy import (
+    LargeBinary,
+    cast,
+    delete,
+    func,
+    insert,
+    or_,
+    select,
+    update,
+)
 
-from src.contexts.projects.core.entities import Source, SourceStatus, SourceType
-from src.contexts.sources.infra.schema import src_source
+from src.contexts.projects.core.entities import (
+    Source,
+    SourceStatus,
+    SourceSummary,
+    SourceType,
+)
+from src.contexts.sources.core.services.page_map import PageMap
+from src.contexts.sources.core.services.speaker_detector import SpeakerTurn
+from src.contexts.sources.infra.content_hash import hash_text
+from src.contexts.sources.infra.fulltext_index import (
+    clear_source_text,
+    fill_source_text,
+)
+from src.contexts.sources.infra.schema import (
+    src_source,
+    src_source_page,
+    src_source_text,
+    src_speaker_index,
+    src_speaker_turn,
+)
+from src.contexts.sources.infra.source_counts import counts_by_folder, counts_by_type
+from src.contexts.sources.infra.text_compression import (
+    DEFAULT_CHUNK_CHARS,
+    ChunkLayout,
+    compress_chunks,
+    delete_chunks,
+    load_layout,
+    read_text,
+    validate_codec,
+    write_chunks,
+)
 from src.shared.common.types import FolderId, SourceId
+from src.shared.infra.repositories.bulk import delete_many, upsert_many
 
 if TYPE_CHECKING:
     from sqlalchemy import Connection
@@ -24,6 +74,25 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("qualcoder.sources.infra")
 
+# Every column except fulltext - listings must not drag document text along
+_SUMMARY_COLUMNS = (
+    src_source.c.id,
+    src_source.c.name,
+    src_source.c.source_type,
+    src_source.c.status,
+    src_source.c.mediapath,
+    src_source.c.file_size,
+    src_source.c.memo,
+    src_source.c.origin,
+    src_source.c.folder_id,
+    src_source.c.date,
+    src_source.c.content_hash,
+    src_source.c.file_mtime_ns,
+)
+
+# Chunk layouts remembered per repository (range reads in long documents)
+LAYOUT_CACHE_SIZE = 256
+
 
 class SQLiteSourceRepository:
     """
@@ -31,16 +100,50 @@ class SQLiteSourceRepository:
 
     Maps between domain Source entities and the src_source table.
     Uses the prefixed table from the Sources bounded context.
+
+    With a ``text_codec`` set, text is written compressed; existing
+    sources keep their storage until they are saved again.
     """
 
     def __init__(
-        self, connection: Connection, outbox: OutboxWriter | None = None
+        self,
+        connection: Connection,
+        outbox: OutboxWriter | None = None,
+        text_codec: str | None = None,
+        chunk_chars: int = DEFAULT_CHUNK_CHARS,
     ) -> None:
         self._conn = connection
         self._outbox = outbox
+        self._text_codec: str | None = None
+        self._chunk_chars = chunk_chars
+        # source id -> layout, None for plain text
+        self._layouts: OrderedDict[str, ChunkLayout | None] = OrderedDict()
+        self.set_text_codec(text_codec)
+
+    @property
+    def text_codec(self) -> str | None:
+        """Codec for newly written text (None stores it plain)."""
+        return self._text_codec
+
+    def clear_layout_cache(self) -> None:
+        """Forget cached chunk layouts (the stored texts were replaced)."""
+        self._layouts.clear()
+
+    def set_text_codec(self, codec: str | None) -> None:
+        """Change the codec for newly written text.
+
+        Raises:
+            ValueError: If the codec is not available in this installation
+        """
+        if codec is not None:
+            validate_codec(codec)
+        self._text_codec = codec
 
     def get_all(self) -> list[Source]:
-        """Get all sources in the project."""
+        """Get all sources in the project, including their fulltext.
+
+        Prefer list_summaries() when the text content is not needed.
+        """
         stmt = select(src_source).order_by(src_source.c.name)
         result = self._conn.execute(stmt)
         sources = [self._row_to_source(row) for row in result]
@@ -82,46 +185,258 @@ class SQLiteSourceRepository:
         result = self._conn.execute(stmt)
         return [self._row_to_source(row) for row in result]
 
-    def save(self, src: Source) -> None:
-        """Save a source (insert or update)."""
-        logger.debug("save: %s (name=%s)", src.id.value, src.name)
-        exists = self.exists(src.id)
-        folder_id_value = src.folder_id.value if src.folder_id else None
-
-        if exists:
-            stmt = (
-                update(src_source)
-                .where(src_source.c.id == src.id.value)
-                .values(
-                    name=src.name,
-                    fulltext=src.fulltext,
-                    source_type=src.source_type.value,
-                    status=src.status.value,
-                    memo=src.memo,
-                    mediapath=str(src.file_path) if src.file_path else None,
-                    file_size=src.file_size,
-                    origin=src.origin,
-                    folder_id=folder_id_value,
-                    owner=None,  # Would come from context
-                )
+    def list_summaries(
+        self,
+        source_type: SourceType | None = None,
+        folder_id: FolderId | None = None,
+    ) -> list[SourceSummary]:
+        """Get metadata for all sources, optionally filtered, without fulltext."""
+        stmt = select(*_SUMMARY_COLUMNS).order_by(src_source.c.name)
+        if source_type is not None:
+            stmt = stmt.where(src_source.c.source_type == source_type.value)
+        if folder_id is not None:
+            stmt = stmt.where(src_source.c.folder_id == folder_id.value)
+        result = self._conn.execute(stmt)
+        summaries = [self._row_to_summary(row) for row in result]
+        logger.debug("list_summaries: count=%d", len(summaries))
+        return summaries
+
+    def get_summary(self, source_id: SourceId) -> SourceSummary | None:
+        """Get metadata for a single source without loading its fulltext."""
+        stmt = select(*_SUMMARY_COLUMNS).where(src_source.c.id == source_id.value)
+        row = self._conn.execute(stmt).fetchone()
+        return self._row_to_summary(row) if row else None
+
+    def get_summary_by_path(self, file_path: str | Path) -> SourceSummary | None:
+        """Get metadata for the source imported from ``file_path`` (indexed)."""
+        stmt = (
+            select(*_SUMMARY_COLUMNS)
+            .where(src_source.c.mediapath == str(file_path))
+            .limit(1)
+        )
+        row = self._conn.execute(stmt).fetchone()
+        return self._row_to_summary(row) if row else None
+
+    def get_summary_by_content_hash(self, content_hash: str) -> SourceSummary | None:
+        """Get metadata for a source with the given content hash (indexed)."""
+        stmt = (
+            select(*_SUMMARY_COLUMNS)
+            .where(src_source.c.content_hash == content_hash)
+            .order_by(src_source.c.name)
+            .limit(1)
+        )
+        row = self._conn.execute(stmt).fetchone()
+        return self._row_to_summary(row) if row else None
+
+    def content_hashes(self) -> set[str]:
+        """Content hashes of all sources imported from files."""
+        stmt = (
+            select(src_source.c.content_hash)
+            .distinct()
+            .where(src_source.c.content_hash.is_not(None))
+        )
+        return set(self._conn.execute(stmt).scalars())
+
+    def update_file_stat(
+        self,
+        source_id: SourceId,
+        file_size: int,
+        file_mtime_ns: int,
+        content_hash: str | None = None,
+    ) -> None:
+        """Record a new size/mtime (and hash) for a source whose text is current."""
+        values = {"file_size": file_size, "file_mtime_ns": file_mtime_ns}
+        if content_hash is not None:
+            values["content_hash"] = content_hash
+        stmt = (
+            update(src_source)
+            .where(src_source.c.id == source_id.value)
+            .values(**values)
+        )
+        self._conn.execute(stmt)
+
+    def get_fulltext(self, source_id: SourceId) -> str | None:
+        """Load only the text content of a source."""
+        layout = self._layout(source_id.value)
+        if layout is not None:
+            return read_text(self._conn, source_id.value, layout)
+        stmt = select(src_source.c.fulltext).where(src_source.c.id == source_id.value)
+        return self._conn.execute(stmt).scalar()
+
+    def get_text_range(self, source_id: SourceId, start: int, end: int) -> str | None:
+        """Load characters ``[start, end)`` of a source's text.
+
+        Plain text is sliced with SQL substr(); compressed text decompresses
+        only the chunks overlapping the range. Returns None if the source
+        does not exist or has no text.
+        """
+        start = max(start, 0)
+        layout = self._layout(source_id.value)
+        if layout is not None:
+            chunk_nos = layout.chunks_for(start, end)
+            if not chunk_nos:
+                return ""
+            text = read_text(self._conn, source_id.value, layout, chunk_nos)
+            offset = layout.chunk_start(chunk_nos.start)
+            return text[start - offset : end - offset]
+        stmt = select(
+            func.substr(src_source.c.fulltext, start + 1, max(end - start, 0))
+        ).where(src_source.c.id == source_id.value)
+        return self._conn.execute(stmt).scalar()
+
+    def get_length(self, source_id: SourceId) -> int | None:
+        """Character length of a source's text, without loading it."""
+        stmt = select(
+            func.coalesce(src_source.c.text_length, func.length(src_source.c.fulltext))
+        ).where(src_source.c.id == source_id.value)
+        return self._conn.execute(stmt).scalar()
+
+    def get_page_map(self, source_id: SourceId) -> PageMap | None:
+        """Page start offsets of a PDF source, or None if none were recorded."""
+        stmt = (
+            select(src_source_page.c.start_pos)
+            .where(src_source_page.c.source_id == source_id.value)
+            .order_by(src_source_page.c.page_no)
+        )
+        starts = tuple(self._conn.execute(stmt).scalars())
+        if not starts:
+            return None
+        return PageMap(starts=starts, length=self.get_length(source_id) or 0)
+
+    def get_speaker_turns(
+        self, source_id: SourceId, text_hash: str | None = None
+    ) -> tuple[SpeakerTurn, ...] | None:
+        """Stored speaker turns of a source, or None if none are stored.
+
+        With ``text_hash``, turns stored for a different text are ignored.
+        """
+        stmt = select(src_speaker_index.c.text_hash).where(
+            src_speaker_index.c.source_id == source_id.value
+        )
+        stored_hash = self._conn.execute(stmt).scalar()
+        if stored_hash is None or text_hash not in (None, stored_hash):
+            return None
+        stmt = (
+            select(
+                src_speaker_turn.c.start_pos,
+                src_speaker_turn.c.end_pos,
+                src_speaker_turn.c.speaker,
             )
-        else:
-            stmt = src_source.insert().values(
-                id=src.id.value,
-                name=src.name,
-                fulltext=src.fulltext,
-                source_type=src.source_type.value,
-                status=src.status.value,
-                memo=src.memo,
-                mediapath=str(src.file_path) if src.file_path else None,
-                file_size=src.file_size,
-                origin=src.origin,
-                folder_id=folder_id_value,
-                owner=None,
-                date=src.created_at.isoformat(),
+            .where(src_speaker_turn.c.source_id == source_id.value)
+            .order_by(src_speaker_turn.c.turn_no)
+        )
+        return tuple(SpeakerTurn(*row) for row in self._conn.execute(stmt))
+
+    def save_speaker_turns(
+        self, source_id: SourceId, text_hash: str, turns: Sequence[SpeakerTurn]
+    ) -> None:
+        """Replace the stored speaker turns of a source."""
+        self._delete_speaker_turns([source_id.value])
+        self._conn.execute(
+            insert(src_speaker_index),
+            {
+                "source_id": source_id.value,
+                "text_hash": text_hash,
+                "turn_count": len(turns),
+            },
+        )
+        if turns:
+            self._conn.execute(
+                insert(src_speaker_turn),
+                [
+                    {
+                        "source_id": source_id.value,
+                        "turn_no": turn_no,
+                        "start_pos": turn.start,
+                        "end_pos": turn.end,
+                        "speaker": turn.speaker,
+                    }
+                    for turn_no, turn in enumerate(turns)
+                ],
             )
 
-        self._conn.execute(stmt)
+    def speaker_counts(self) -> dict[str, dict[str, int]]:
+        """Turns per speaker of every source with stored turns, in one query.
+
+        Keyed by source ID; speakers in order of first appearance. Sources
+        whose turns are stored but have none map to an empty dict.
+        """
+        counts: dict[str, dict[str, int]] = {
+            source_id: {}
+            for source_id in self._conn.execute(
+                select(src_speaker_index.c.source_id)
+            ).scalars()
+        }
+        stmt = (
+            select(
+                src_speaker_turn.c.source_id,
+                src_speaker_turn.c.speaker,
+                func.count(),
+            )
+            .group_by(src_speaker_turn.c.source_id, src_speaker_turn.c.speaker)
+            .order_by(
+                src_speaker_turn.c.source_id, func.min(src_speaker_turn.c.turn_no)
+            )
+        )
+        for source_id, speaker, count in self._conn.execute(stmt):
+            counts.setdefault(source_id, {})[speaker] = count
+        return counts
+
+    def sources_without_speaker_turns(self) -> list[SourceId]:
+        """IDs of sources with text whose speaker turns are not stored."""
+        has_text = or_(
+            src_source.c.fulltext.is_not(None), src_source.c.text_codec.is_not(None)
+        )
+        stmt = select(src_source.c.id).where(
+            has_text, src_source.c.id.not_in(select(src_speaker_index.c.source_id))
+        )
+        return [SourceId(value=row) for row in self._conn.execute(stmt).scalars()]
+
+    def stored_text_bytes(self) -> int:
+        """Bytes of source text on disk (plain text plus compressed chunks)."""
+        plain = select(
+            func.coalesce(
+                func.sum(func.length(cast(src_source.c.fulltext, LargeBinary))), 0
+            )
+        )
+        chunks = select(func.coalesce(func.sum(func.length(src_source_text.c.data)), 0))
+        return self._conn.execute(plain).scalar() + self._conn.execute(chunks).scalar()
+
+    def rewrite_text(self, source_id: SourceId) -> bool:
+        """Re-store a source's text with the current codec.
+
+        Returns True if the storage changed, False if the source is missing
+        or already stored with the current codec.
+        """
+        layout = self._layout(source_id.value)
+        if (layout.codec if layout else None) == self._text_codec:
+            return False
+        source = self.get_by_id(source_id)
+        if source is None:
+            return False
+        self._upsert((source,))
+        return True
+
+    def count(self) -> int:
+        """Count sources in the project (maintained aggregate)."""
+        return sum(counts_by_type(self._conn).values())
+
+    def count_by_type(self) -> dict[SourceType, int]:
+        """Count sources per source type (maintained aggregate)."""
+        counts: dict[SourceType, int] = {}
+        for type_value, n in counts_by_type(self._conn).items():
+            source_type = SourceType(type_value) if type_value else SourceType.TEXT
+            counts[source_type] = counts.get(source_type, 0) + n
+        return counts
+
+    def count_by_folder(self) -> dict[str | None, int]:
+        """Count sources per folder ID, None for root level (maintained aggregate)."""
+        return counts_by_folder(self._conn)
+
+    def save(self, src: Source) -> None:
+        """Save a source (insert or update)."""
+        logger.debug("save: %s (name=%s)", src.id.value, src.name)
+        self._upsert((src,))
         if self._outbox:
             self._outbox.write_upsert(
                 "source",
@@ -129,14 +444,43 @@ class SQLiteSourceRepository:
                 {"name": src.name, "source_type": src.source_type.value},
             )
 
+    def save_many(self, sources: Sequence[Source]) -> int:
+        """Insert or update sources in one statement, returns count written."""
+        count = self._upsert(sources)
+        logger.debug("save_many: count=%d", count)
+        if self._outbox:
+            for s in sources:
+                self._outbox.write_upsert(
+                    "source",
+                    s.id.value,
+                    {"name": s.name, "source_type": s.source_type.value},
+                )
+        return count
+
     def delete(self, source_id: SourceId) -> None:
         """Delete a source by ID."""
         logger.debug("delete: %s", source_id.value)
+        self._drop_compressed(self._compressed_layouts([source_id.value]))
+        self._delete_pages([source_id.value])
+        self._delete_speaker_turns([source_id.value])
         stmt = delete(src_source).where(src_source.c.id == source_id.value)
         self._conn.execute(stmt)
         if self._outbox:
             self._outbox.write_delete("source", source_id.value)
 
+    def delete_many(self, source_ids: Iterable[SourceId]) -> int:
+        """Delete sources by ID, returns count deleted."""
+        ids = [source_id.value for source_id in source_ids]
+        self._drop_compressed(self._compressed_layouts(ids))
+        self._delete_pages(ids)
+        self._delete_speaker_turns(ids)
+        count = delete_many(self._conn, src_source.c.id, ids)
+        logger.debug("delete_many: count=%d", count)
+        if self._outbox:
+            for entity_id in ids:
+                self._outbox.write_delete("source", entity_id)
+        return count
+
     def exists(self, source_id: SourceId) -> bool:
         """Check if a source exists."""
         stmt = select(func.count()).where(src_source.c.id == source_id.value)
@@ -167,21 +511,259 @@ class SQLiteSourceRepository:
 
         Returns the number of sources unassigned.
         """
-        count_stmt = select(func.count()).where(
-            src_source.c.folder_id == folder_id.value
+        stmt = (
+            update(src_source)
+            .where(src_source.c.folder_id == folder_id.value)
+            .values(folder_id=None)
         )
-        count = self._conn.execute(count_stmt).scalar()
+        return self._conn.execute(stmt).rowcount or 0
+
+    def _upsert(self, sources: Sequence[Source]) -> int:
+        """Write sources with INSERT ... ON CONFLICT DO UPDATE (no probe).
 
-        if count > 0:
-            stmt = (
-                update(src_source)
-                .where(src_source.c.folder_id == folder_id.value)
-                .values(folder_id=None)
+        Compressed text that is unchanged keeps its chunks; otherwise old
+        chunks are dropped and the text is written with the current codec.
+        Unchanged text is recognised by its stored hash, so saving metadata
+        does not decompress it.
+        """
+        by_id = {src.id.value: src for src in sources}
+        stored = self._compressed_layouts(list(by_id))
+        kept = {
+            source_id
+            for source_id, (layout, text_hash) in stored.items()
+            if self._text_unchanged(
+                source_id, layout, text_hash, by_id[source_id].fulltext
             )
-            self._conn.execute(stmt)
+        }
+        self._drop_compressed({k: v for k, v in stored.items() if k not in kept})
+        self._drop_stale_speaker_turns(by_id)
+
+        chunks: dict[str, tuple[str, list[bytes]]] = {}
+        rows = []
+        for src in sources:
+            if src.id.value in kept:
+                layout, text_hash = stored[src.id.value]
+                text_columns = self._layout_columns(
+                    layout, text_hash or hash_text(src.fulltext)
+                )
+            elif self._text_codec and src.fulltext:
+                packed = compress_chunks(
+                    src.fulltext, self._text_codec, self._chunk_chars
+                )
+                chunks[src.id.value] = (src.fulltext, packed)
+                text_columns = self._layout_columns(
+                    ChunkLayout(self._text_codec, self._chunk_chars, len(src.fulltext)),
+                    hash_text(src.fulltext),
+                )
+            else:
+                text_columns = {"fulltext": src.fulltext, **self._layout_columns(None)}
+            rows.append(self._source_row(src, text_columns))
 
+        count = upsert_many(
+            self._conn,
+            src_source,
+            rows,
+            key="id",
+            update_columns=(
+                "name",
+                "fulltext",
+                "text_codec",
+                "text_length",
+                "text_chunk_chars",
+                "text_hash",
+                "source_type",
+                "status",
+                "memo",
+                "mediapath",
+                "file_size",
+                "origin",
+                "folder_id",
+                "content_hash",
+                "file_mtime_ns",
+                "owner",
+            ),
+        )
+        for source_id, (text, packed) in chunks.items():
+            write_chunks(self._conn, source_id, packed)
+            fill_source_text(self._conn, source_id, text)
+        self._write_pages([src for src in sources if src.page_starts])
+        for source_id in by_id:
+            self._layouts.pop(source_id, None)
         return count
 
+    def _write_pages(self, sources: Sequence[Source]) -> None:
+        """Replace the page start rows of sources that carry them."""
+        if not sources:
+            return
+        self._delete_pages([src.id.value for src in sources])
+        self._conn.execute(
+            insert(src_source_page),
+            [
+                {"source_id": src.id.value, "page_no": page_no, "start_pos": start}
+                for src in sources
+                for page_no, start in enumerate(src.page_starts)
+            ],
+        )
+
+    def _drop_stale_speaker_turns(self, by_id: dict[str, Source]) -> None:
+        """Drop stored speaker turns of sources whose text is changing."""
+        if not by_id:
+            return
+        index = src_speaker_index
+        rows = self._conn.execute(
+            select(index.c.source_id, index.c.text_hash).where(
+                index.c.source_id.in_(list(by_id))
+            )
+        )
+        stale = [
+            source_id
+            for source_id, text_hash in rows
+            if not by_id[source_id].fulltext
+            or hash_text(by_id[source_id].fulltext) != text_hash
+        ]
+        self._delete_speaker_turns(stale)
+
+    def _delete_speaker_turns(self, source_ids: Sequence[str]) -> None:
+        if source_ids:
+            for table in (src_speaker_turn, src_speaker_index):
+                self._conn.execute(
+                    delete(table).where(table.c.source_id.in_(source_ids))
+                )
+
+    def _delete_pages(self, source_ids: Sequence[str]) -> None:
+        if source_ids:
+            self._conn.execute(
+                delete(src_source_page).where(
+                    src_source_page.c.source_id.in_(source_ids)
+                )
+            )
+
+    @staticmethod
+    def _layout_columns(
+        layout: ChunkLayout | None, text_hash: str | None = None
+    ) -> dict:
+        """src_source text columns describing a layout (plain when None)."""
+        if layout is None:
+            return {
+                "text_codec": None,
+                "text_length": None,
+                "text_chunk_chars": None,
+                "text_hash": None,
+            }
+        return {
+            "fulltext": None,
+            "text_codec": layout.codec,
+            "text_length": layout.length,
+            "text_chunk_chars": layout.chunk_chars,
+            "text_hash": text_hash,
+        }
+
+    @staticmethod
+    def _source_row(src: Source, text_columns: dict) -> dict:
+        """Map a Source to a src_source row with the given text columns."""
+        return {
+            "id": src.id.value,
+            "name": src.name,
+            **text_columns,
+            "source_type": src.source_type.value,
+            "status": src.status.value,
+            "memo": src.memo,
+            "mediapath": str(src.file_path) if src.file_path else None,
+            "file_size": src.file_size,
+            "origin": src.origin,
+            "folder_id": src.folder_id.value if src.folder_id else None,
+            "content_hash": src.content_hash,
+            "file_mtime_ns": src.file_mtime_ns,
+            "owner": None,  # Would come from context
+            "date": src.created_at.isoformat(),
+        }
+
+    def _layout(self, source_id: str) -> ChunkLayout | None:
+        """Chunk layout of a source (None for plain text), cached."""
+        if source_id in self._layouts:
+            self._layouts.move_to_end(source_id)
+            return self._layouts[source_id]
+        layout = load_layout(self._conn, source_id)
+        self._layouts[source_id] = layout
+        if len(self._layouts) > LAYOUT_CACHE_SIZE:
+            self._layouts.popitem(last=False)
+        return layout
+
+    def _compressed_layouts(
+        self, source_ids: Sequence[str]
+    ) -> dict[str, tuple[ChunkLayout, str | None]]:
+        """Layout and stored text hash of the compressed sources among ids."""
+        if not source_ids:
+            return {}
+        rows = self._conn.execute(
+            select(
+                src_source.c.id,
+                src_source.c.text_codec,
+                src_source.c.text_chunk_chars,
+                src_source.c.text_length,
+                src_source.c.text_hash,
+            ).where(
+                src_source.c.id.in_(source_ids),
+                src_source.c.text_codec.is_not(None),
+            )
+        ).fetchall()
+        return {
+            row.id: (
+                ChunkLayout(row.text_codec, row.text_chunk_chars, row.text_length),
+                row.text_hash,
+            )
+            for row in rows
+        }
+
+    def _text_unchanged(
+        self,
+        source_id: str,
+        layout: ChunkLayout,
+        text_hash: str | None,
+        text: str | None,
+    ) -> bool:
+        """Whether stored compressed text equals ``text`` and can be kept."""
+        if layout.codec != self._text_codec or text is None:
+            return False
+        if len(text) != layout.length:
+            return False
+        if text_hash is not None:
+            return hash_text(text) == text_hash
+        # Compressed before text hashes were stored
+        return read_text(self._conn, source_id, layout) == text
+
+    def _drop_compressed(
+        self, stored: dict[str, tuple[ChunkLayout, str | None]]
+    ) -> None:
+        """Unindex and delete the chunks of compressed sources before a write."""
+        for source_id, (layout, _text_hash) in stored.items():
+            # The index needs the old text to remove it
+            text = read_text(self._conn, source_id, layout)
+            clear_source_text(self._conn, source_id, text)
+            self._layouts.pop(source_id, None)
+        delete_chunks(self._conn, stored)
+
+    def _row_to_summary(self, row) -> SourceSummary:
+        """Map a metadata-only row to a SourceSummary."""
+        return SourceSummary(
+            id=SourceId(value=row.id),
+            name=row.name,
+            source_type=(
+                SourceType(row.source_type) if row.source_type else SourceType.TEXT
+            ),
+            status=SourceStatus(row.status) if row.status else SourceStatus.IMPORTED,
+            file_path=Path(row.mediapath) if row.mediapath else None,
+            file_size=row.file_size or 0,
+            memo=row.memo,
+            origin=row.origin,
+            folder_id=FolderId(value=row.folder_id) if row.folder_id else None,
+            content_hash=row.content_hash,
+            file_mtime_ns=row.file_mtime_ns,
+            created_at=(
+                datetime.fromisoformat(row.date) if row.date else datetime.now(UTC)
+            ),
+        )
+
     def _row_to_source(self, row) -> Source:
         """Map database row to domain Source entity."""
         source_type = (
@@ -202,6 +784,16 @@ class SQLiteSourceRepository:
             memo=row.memo,
             origin=row.origin,
             folder_id=folder_id,
-            fulltext=row.fulltext,
+            fulltext=(
+                row.fulltext
+                if row.text_codec is None
+                else read_text(
+                    self._conn,
+                    row.id,
+                    ChunkLayout(row.text_codec, row.text_chunk_chars, row.text_length),
+                )
+            ),
+            content_hash=row.content_hash,
+            file_mtime_ns=row.file_mtime_ns,
             created_at=created_at,
         )
@@ -0,0 +1,201 @@
+"""
+Sources Context: Source Text Access
+
+Reading a few hundred characters of a source should not mean loading its
+whole fulltext. This module provides:
+
+- SourceTextCache: size-bounded LRU cache of decoded source texts, shared by
+  every reader in an open project and invalidated by source events
+- SourceContentProvider: the content provider used by coding handlers and
+  MCP tools. Ranges and lengths come from the cache when the text is already
+  loaded, otherwise from SQL substr()/length() without loading the text.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.shared.common.types import SourceId
+    from src.shared.infra.event_bus import EventBus, Subscription
+    from src.shared.infra.repositories import SourceRepositoryProtocol
+
+logger = logging.getLogger("qualcoder.sources.infra")
+
+# Events after which a cached text may be stale
+INVALIDATING_EVENTS: tuple[str, ...] = (
+    "projects.source_added",
+    "projects.source_updated",
+    "projects.source_removed",
+)
+
+# Events after which every cached text may be stale
+CLEARING_EVENTS: tuple[str, ...] = ("projects.snapshot_restored",)
+
+DEFAULT_MAX_CHARS = 32 * 1024 * 1024
+
+
+def _key(source_id: SourceId) -> str:
+    # IDs arrive as str or int depending on the caller
+    return str(source_id.value)
+
+
+class SourceTextCache:
+    """
+    Thread-safe LRU cache of source texts, bounded by total characters.
+
+    Texts longer than the whole budget are never cached. Lengths are kept
+    separately (they are tiny) and dropped together with the text.
+
+    Example:
+        cache = SourceTextCache(max_chars=8_000_000)
+        cache.enable(event_bus)   # invalidate on source events
+        cache.put(source_id, text)
+        cache.get(source_id)
+    """
+
+    def __init__(self, max_chars: int = DEFAULT_MAX_CHARS) -> None:
+        self._max_chars = max_chars
+        self._texts: OrderedDict[str, str] = OrderedDict()
+        self._lengths: dict[str, int | None] = {}
+        self._size = 0
+        self._lock = threading.Lock()
+        self._subscriptions: list[Subscription] = []
+
+    @property
+    def size(self) -> int:
+        """Total characters currently cached."""
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def get(self, source_id: SourceId) -> str | None:
+        """Cached text of a source (marking it recently used), or None."""
+        key = _key(source_id)
+        with self._lock:
+            text = self._texts.get(key)
+            if text is not None:
+                self._texts.move_to_end(key)
+            return text
+
+    def put(self, source_id: SourceId, text: str) -> None:
+        """Cache a source's text, evicting least recently used texts."""
+        key = _key(source_id)
+        with self._lock:
+            self._lengths[key] = len(text)
+            if len(text) > self._max_chars:
+                return
+            old = self._texts.pop(key, None)
+            if old is not None:
+                self._size -= len(old)
+            self._texts[key] = text
+            self._size += len(text)
+            while self._size > self._max_chars:
+                evicted_key, evicted = self._texts.popitem(last=False)
+                self._size -= len(evicted)
+                logger.debug("source text evicted: %s", evicted_key)
+
+    def get_length(self, source_id: SourceId) -> int | None:
+        """Cached length, or None if unknown."""
+        with self._lock:
+            return self._lengths.get(_key(source_id))
+
+    def has_length(self, source_id: SourceId) -> bool:
+        with self._lock:
+            return _key(source_id) in self._lengths
+
+    def put_length(self, source_id: SourceId, length: int | None) -> None:
+        with self._lock:
+            self._lengths[_key(source_id)] = length
+
+    def invalidate(self, source_id: SourceId) -> None:
+        """Forget everything cached for a source."""
+        key = _key(source_id)
+        with self._lock:
+            text = self._texts.pop(key, None)
+            if text is not None:
+                self._size -= len(text)
+            self._lengths.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._texts.clear()
+            self._lengths.clear()
+            self._size = 0
+
+    # =========================================================================
+    # Event wiring
+    # =========================================================================
+
+    def enable(self, event_bus: EventBus) -> None:
+        """Subscribe to source events so stale texts are dropped."""
+        if self._subscriptions:
+            return
+        for event_type in INVALIDATING_EVENTS:
+            self._subscriptions.append(
+                event_bus.subscribe(event_type, self._on_source_changed)
+            )
+        for event_type in CLEARING_EVENTS:
+            self._subscriptions.append(
+                event_bus.subscribe(event_type, self._on_project_replaced)
+            )
+
+    def disable(self) -> None:
+        """Cancel event subscriptions and drop all cached texts."""
+        for subscription in self._subscriptions:
+            subscription.cancel()
+        self._subscriptions.clear()
+        self.clear()
+
+    def _on_source_changed(self, event) -> None:
+        self.invalidate(event.source_id)
+
+    def _on_project_replaced(self, _event) -> None:
+        self.clear()
+
+
+class SourceContentProvider:
+    """
+    Content provider backed by the source repository and a SourceTextCache.
+
+    Implements the provider interface expected by coding handlers
+    (``get_content``, ``get_length``) plus ``get_text_range``.
+    """
+
+    def __init__(
+        self,
+        source_repo: SourceRepositoryProtocol,
+        cache: SourceTextCache | None = None,
+    ) -> None:
+        self._source_repo = source_repo
+        self._cache = cache if cache is not None else SourceTextCache()
+
+    @property
+    def cache(self) -> SourceTextCache:
+        return self._cache
+
+    def get_content(self, source_id: SourceId) -> str | None:
+        """Full text of a source, loaded once and then served from the cache."""
+        text = self._cache.get(source_id)
+        if text is None:
+            text = self._source_repo.get_fulltext(source_id)
+            if text is not None:
+                self._cache.put(source_id, text)
+        return text
+
+    def get_text_range(self, source_id: SourceId, start: int, end: int) -> str | None:
+        """Characters ``[start, end)`` of a source, or None if it has no text."""
+        text = self._cache.get(source_id)
+        if text is not None:
+            return text[max(start, 0) : max(end, 0)]
+        return self._source_repo.get_text_range(source_id, start, end)
+
+    def get_length(self, source_id: SourceId) -> int | None:
+        """Character length of a source's text, or None if it has no text."""
+        if not self._cache.has_length(source_id):
+            self._cache.put_length(source_id, self._source_repo.get_length(source_id))
+        return self._cache.get_length(source_id)
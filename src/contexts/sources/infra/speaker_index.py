@@ -0,0 +1,104 @@
+"""
+Sources Context: Speaker Turn Index
+
+Speaker turns are found by scanning a transcript (see SpeakerDetector).
+Auto-coding by speaker and converting speakers to codes ask for the same
+turns again and again, so they are stored per source together with the
+hash of the text they were found in, and the scan only runs for text that
+has not been scanned before.
+
+The repository drops stored turns when a source is saved with different
+text, so turns read back are current.
+
+Usage:
+    index = SpeakerTurnIndex(source_repo)
+    detector = index.detector(source_id)            # Scans at most once
+    counts = index.corpus_speaker_counts()          # {source_id: {name: n}}
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from src.contexts.sources.core.services.speaker_detector import (
+    SpeakerDetector,
+    SpeakerTurn,
+    iter_speaker_turns,
+)
+from src.contexts.sources.infra.content_hash import hash_text
+
+if TYPE_CHECKING:
+    from src.contexts.sources.infra.source_repository import SQLiteSourceRepository
+    from src.shared.common.types import SourceId
+
+logger = logging.getLogger("qualcoder.sources.infra")
+
+
+class SpeakerTurnIndex:
+    """
+    Stored speaker turns of the sources in a project.
+
+    Example:
+        index = SpeakerTurnIndex(source_repo)
+        for turn in index.turns(source_id):
+            print(turn.speaker, turn.start, turn.end)
+    """
+
+    def __init__(self, source_repo: SQLiteSourceRepository) -> None:
+        self._repo = source_repo
+
+    def turns(
+        self, source_id: SourceId, text: str | None = None
+    ) -> tuple[SpeakerTurn, ...]:
+        """
+        Speaker turns of a source, scanning and storing them if needed.
+
+        Args:
+            source_id: Source whose turns are wanted
+            text: The source's text if the caller already has it; turns
+                stored for a different text are then replaced
+
+        Returns:
+            Turns in text order; empty for sources without text
+        """
+        text_hash = hash_text(text) if text is not None else None
+        stored = self._repo.get_speaker_turns(source_id, text_hash)
+        if stored is not None:
+            return stored
+        if text is None:
+            text = self._repo.get_fulltext(source_id)
+            if text is None:
+                return ()
+            text_hash = hash_text(text)
+        return self._index(source_id, text, text_hash)
+
+    def detector(self, source_id: SourceId) -> SpeakerDetector:
+        """SpeakerDetector over a source's text, backed by its stored turns."""
+        text = self._repo.get_fulltext(source_id) or ""
+        return SpeakerDetector(text, turns=self.turns(source_id, text))
+
+    def corpus_speaker_counts(self) -> dict[str, dict[str, int]]:
+        """
+        Turns per speaker for every source with text.
+
+        Sources without stored turns are scanned first, one text at a time;
+        the counts are then read in one query.
+
+        Returns:
+            Source ID -> {speaker name: turn count}, speakers in order of
+            first appearance
+        """
+        for source_id in self._repo.sources_without_speaker_turns():
+            text = self._repo.get_fulltext(source_id)
+            if text is not None:
+                self._index(source_id, text, hash_text(text))
+        return self._repo.speaker_counts()
+
+    def _index(
+        self, source_id: SourceId, text: str, text_hash: str
+    ) -> tuple[SpeakerTurn, ...]:
+        turns = tuple(iter_speaker_turns(text))
+        self._repo.save_speaker_turns(source_id, text_hash, turns)
+        logger.debug("speaker_index: %s scanned, %d turns", source_id.value, len(turns))
+        return turns
@@ -4,6 +4,7 @@ Tests for PdfExtractor - Infrastructure Layer.
 Implements QC-027.02: Import PDF Document
 - AC #2: Text is extracted from PDF pages
 - AC #4: Multi-page PDFs are handled correctly
+- Page start offsets and resumable page extraction
 """
 
 from pathlib import Path
@@ -12,7 +13,12 @@ import allure
 import pytest
 from returns.result import Failure
 
-from src.contexts.sources.infra.pdf_extractor import PdfExtractionResult, PdfExtractor
+from src.contexts.sources.infra.pdf_extractor import (
+    PageTextCache,
+    PdfExtractionResult,
+    PdfExtractor,
+    join_pages,
+)
 
 pytestmark = [
     allure.epic("QualCoder v2"),
@@ -70,3 +76,68 @@ class TestPdfExtractionResult:
         assert multi.page_count == 2
         assert "Page 1" in multi.content
         assert "Page 2" in multi.content
+
+
+@allure.story("QC-027.02 Import PDF Document")
+class TestPageOffsets:
+    """Tests for page start offsets and the resumable page cache."""
+
+    @allure.title("join_pages records where each page starts, skipping empty pages")
+    def test_join_pages_records_starts(self):
+        """Empty pages start where the next page with text starts."""
+        content, starts = join_pages(["first", "", "second", "third"])
+
+        assert content == "first\n\nsecond\n\nthird"
+        assert starts == (0, 7, 7, 15)
+        assert content[starts[2] : starts[2] + 6] == "second"
+        assert content[starts[3] :] == "third"
+
+    @allure.title("PageTextCache stores pages per file version and clears")
+    def test_page_cache_roundtrip(self, tmp_path: Path):
+        """Cached pages are keyed by the file's path, size and mtime."""
+        pdf = tmp_path / "doc.pdf"
+        pdf.write_bytes(b"%PDF-1.4 test")
+        cache = PageTextCache.for_file(tmp_path / "cache", pdf)
+
+        assert cache.get(0) is None
+        cache.put(0, "page one")
+        cache.put(3, "")
+        assert cache.get(0) == "page one"
+        assert cache.get(3) == ""
+        assert PageTextCache.for_file(tmp_path / "cache", pdf).get(0) == "page one"
+
+        pdf.write_bytes(b"%PDF-1.4 edited file")
+        assert PageTextCache.for_file(tmp_path / "cache", pdf).get(0) is None
+
+        cache.clear()
+        assert cache.get(0) is None
+
+    @allure.title("Resumed extraction only extracts pages missing from the cache")
+    def test_resume_extracts_missing_pages(self, tmp_path: Path):
+        """Cached pages are reused after an interrupted extraction."""
+        pdf = tmp_path / "doc.pdf"
+        pdf.write_bytes(b"%PDF-1.4 test")
+        cache_dir = tmp_path / "cache"
+        cache = PageTextCache.for_file(cache_dir, pdf)
+        cache.put(0, "cached zero")
+        cache.put(1, "cached one")
+
+        extracted: list[int] = []
+
+        class _Page:
+            def __init__(self, n: int):
+                self.n = n
+
+            def extract_text(self):
+                extracted.append(self.n)
+                return f"page {self.n}"
+
+        class _Reader:
+            pages = [_Page(n) for n in range(4)]
+
+        extractor = PdfExtractor(max_workers=1, cache_dir=cache_dir)
+        texts = extractor._extract_resumable(pdf, _Reader(), 4)
+
+        assert texts == ["cached zero", "cached one", "page 2", "page 3"]
+        assert extracted == [2, 3]
+        assert not cache.directory.exists()
@@ -0,0 +1,118 @@
+"""
+Tests for reduced image decoding and ThumbnailCache - Infrastructure Layer.
+"""
+
+import os
+from pathlib import Path
+
+import allure
+import pytest
+from PIL import Image, JpegImagePlugin
+
+from src.contexts.sources.infra.thumbnail_cache import (
+    THUMBNAIL_DIR_NAME,
+    ThumbnailCache,
+)
+from src.shared.infra.image_decoding import decode_reduced
+
+pytestmark = [
+    allure.epic("QualCoder v2"),
+    allure.feature("QC-027 Manage Sources"),
+]
+
+
+@pytest.fixture
+def large_jpeg(tmp_path: Path) -> Path:
+    """A 4000x3000 JPEG photo."""
+    img_path = tmp_path / "field_photo.jpg"
+    Image.new("RGB", (4000, 3000), color=(0, 128, 255)).save(img_path, "JPEG")
+    return img_path
+
+
+@pytest.fixture
+def transparent_png(tmp_path: Path) -> Path:
+    """A 1000x500 PNG with an alpha channel."""
+    img_path = tmp_path / "diagram.png"
+    Image.new("RGBA", (1000, 500), color=(255, 0, 0, 128)).save(img_path, "PNG")
+    return img_path
+
+
+@allure.story("QC-027.03 Import Image Files")
+class TestDecodeReduced:
+    """Tests for decoding at reduced resolution."""
+
+    @allure.title("Images are decoded to fit the requested size")
+    def test_fits_requested_size(self, large_jpeg: Path, transparent_png: Path):
+        image = decode_reduced(large_jpeg, (800, 800))
+        assert image.size == (800, 600)
+        assert image.mode == "RGB"
+
+        image = decode_reduced(transparent_png, (250, 250))
+        assert image.size == (250, 125)
+        assert image.mode == "RGBA"
+
+    @allure.title("JPEG is decoded through draft mode")
+    def test_jpeg_uses_draft(self, large_jpeg: Path, monkeypatch):
+        drafts = []
+        original = JpegImagePlugin.JpegImageFile.draft
+        monkeypatch.setattr(
+            JpegImagePlugin.JpegImageFile,
+            "draft",
+            lambda self, mode, size: drafts.append(size) or original(self, mode, size),
+        )
+        decode_reduced(large_jpeg, (500, 500))
+        assert drafts == [(500, 375)]
+
+    @allure.title("Small images are not enlarged")
+    def test_small_image_unchanged(self, tmp_path: Path):
+        path = tmp_path / "icon.gif"
+        Image.new("P", (40, 30)).save(path, "GIF")
+        image = decode_reduced(path, (800, 800))
+        assert image.size == (40, 30)
+        assert image.mode == "RGB"
+
+
+@allure.story("QC-027.03 Import Image Files")
+class TestThumbnailCache:
+    """Tests for the on-disk thumbnail cache."""
+
+    @allure.title("Thumbnails are created once and reused")
+    def test_create_and_reuse(self, tmp_path: Path, large_jpeg: Path):
+        cache = ThumbnailCache.for_project(tmp_path)
+        assert cache.directory == tmp_path.resolve() / THUMBNAIL_DIR_NAME
+        assert cache.get(large_jpeg) is None
+
+        thumbnail = cache.get_or_create(large_jpeg)
+        assert thumbnail.suffix == ".jpg"
+        with Image.open(thumbnail) as image:
+            assert image.size == (256, 192)
+
+        mtime = thumbnail.stat().st_mtime_ns
+        assert cache.get(large_jpeg) == thumbnail
+        assert cache.get_or_create(large_jpeg) == thumbnail
+        assert thumbnail.stat().st_mtime_ns == mtime
+
+    @allure.title("Transparent images keep their alpha channel")
+    def test_png_for_alpha(self, tmp_path: Path, transparent_png: Path):
+        thumbnail = ThumbnailCache(tmp_path / "thumbs").get_or_create(transparent_png)
+        assert thumbnail.suffix == ".png"
+        with Image.open(thumbnail) as image:
+            assert image.mode == "RGBA"
+
+    @allure.title("A modified image gets a new thumbnail")
+    def test_modified_image(self, tmp_path: Path, large_jpeg: Path):
+        cache = ThumbnailCache(tmp_path / "thumbs")
+        first = cache.get_or_create(large_jpeg)
+
+        Image.new("RGB", (300, 300), color=(0, 0, 0)).save(large_jpeg, "JPEG")
+        st = large_jpeg.stat()
+        os.utime(large_jpeg, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        assert cache.get(large_jpeg) is None
+        second = cache.get_or_create(large_jpeg)
+        assert second != first
+        with Image.open(second) as image:
+            assert image.size == (256, 256)
+
+        cache.clear()
+        assert not cache.directory.exists()
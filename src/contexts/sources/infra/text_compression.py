@@ -0,0 +1,231 @@
+"""
+Sources Context: Compressed Source Text
+
+Optional compressed storage for source text. A compressed text is split
+into fixed-size character chunks and each chunk is compressed on its own,
+so reading characters ``[start, end)`` only decompresses the chunks that
+overlap the range:
+
+    chunk_no = position // chunk_chars
+
+The chunk layout of a source (codec, chunk size, length) is all a reader
+needs to locate a range; repositories cache it per source. Chunks are
+stored in src_source_text, one row per chunk, and the src_source row keeps
+the layout with ``fulltext`` NULL.
+
+Codecs:
+    zlib   Always available (standard library)
+    zstd   Used when the ``zstandard`` package is installed; faster and
+           smaller than zlib at comparable levels
+
+Usage:
+    chunks = compress_chunks(text, CODEC_ZLIB)
+    layout = ChunkLayout(CODEC_ZLIB, DEFAULT_CHUNK_CHARS, len(text))
+    for chunk_no in layout.chunks_for(start, end):
+        ...
+
+    write_chunks(conn, source_id, chunks)
+    text = read_text(conn, source_id, layout)
+"""
+
+from __future__ import annotations
+
+import zlib
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from sqlalchemy import delete, insert, select
+
+from src.contexts.sources.infra.schema import src_source, src_source_text
+
+if TYPE_CHECKING:
+    from sqlalchemy import Connection
+
+CODEC_ZLIB = "zlib"
+CODEC_ZSTD = "zstd"
+
+# Characters per compressed chunk: large enough to compress well, small
+# enough that a range read decompresses little more than it returns
+DEFAULT_CHUNK_CHARS = 32 * 1024
+
+# Project setting holding the codec for newly written source text
+TEXT_CODEC_SETTING = "source_text_codec"
+
+ZLIB_LEVEL = 6
+ZSTD_LEVEL = 9
+
+_CODECS: dict[str, tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]] = {
+    CODEC_ZLIB: (
+        lambda data: zlib.compress(data, ZLIB_LEVEL),
+        zlib.decompress,
+    ),
+}
+
+try:
+    import zstandard
+
+    _zstd_compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL)
+    _zstd_decompressor = zstandard.ZstdDecompressor()
+    _CODECS[CODEC_ZSTD] = (
+        _zstd_compressor.compress,
+        _zstd_decompressor.decompress,
+    )
+except ImportError:
+    pass
+
+
+@dataclass(frozen=True)
+class ChunkLayout:
+    """Where the characters of a compressed source text live."""
+
+    codec: str
+    chunk_chars: int
+    length: int  # Characters in the whole text
+
+    @property
+    def chunk_count(self) -> int:
+        return -(-self.length // self.chunk_chars)
+
+    def chunks_for(self, start: int, end: int) -> range:
+        """Chunk numbers overlapping characters ``[start, end)``."""
+        start = max(start, 0)
+        end = min(end, self.length)
+        if end <= start:
+            return range(0)
+        return range(start // self.chunk_chars, (end - 1) // self.chunk_chars + 1)
+
+    def chunk_start(self, chunk_no: int) -> int:
+        """Position of the first character of a chunk."""
+        return chunk_no * self.chunk_chars
+
+
+def available_codecs() -> tuple[str, ...]:
+    """Codecs usable in this installation."""
+    return tuple(_CODECS)
+
+
+def default_codec() -> str:
+    """Best available codec (zstd when installed, else zlib)."""
+    return CODEC_ZSTD if CODEC_ZSTD in _CODECS else CODEC_ZLIB
+
+
+def codec_from_setting(value: str | None) -> str | None:
+    """
+    Codec to write with for a stored project setting.
+
+    A codec that is not installed here (zstd set on another machine) falls
+    back to the best available one, so text is still stored compressed.
+    """
+    if not value:
+        return None
+    return value if value in _CODECS else default_codec()
+
+
+def validate_codec(codec: str) -> None:
+    """Raise ValueError if ``codec`` is not available in this installation."""
+    _codec(codec)
+
+
+def compress_chunks(
+    text: str, codec: str, chunk_chars: int = DEFAULT_CHUNK_CHARS
+) -> list[bytes]:
+    """Split ``text`` into ``chunk_chars`` chunks and compress each one."""
+    compress, _ = _codec(codec)
+    return [
+        compress(text[i : i + chunk_chars].encode("utf-8"))
+        for i in range(0, len(text), chunk_chars)
+    ]
+
+
+def decompress_chunk(codec: str, data: bytes) -> str:
+    """Decompress one chunk back to text."""
+    _, decompress = _codec(codec)
+    return decompress(data).decode("utf-8")
+
+
+def _codec(codec: str) -> tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]:
+    try:
+        return _CODECS[codec]
+    except KeyError:
+        raise ValueError(
+            f"Text codec not available: {codec} "
+            f"(available: {', '.join(available_codecs())})"
+        ) from None
+
+
+# ============================================================
+# Chunk storage (src_source_text)
+# ============================================================
+
+
+def load_layout(connection: Connection, source_id: str) -> ChunkLayout | None:
+    """Chunk layout of a source, or None if its text is stored plain."""
+    row = connection.execute(
+        select(
+            src_source.c.text_codec,
+            src_source.c.text_chunk_chars,
+            src_source.c.text_length,
+        ).where(src_source.c.id == source_id)
+    ).fetchone()
+    if row is None or row.text_codec is None:
+        return None
+    return ChunkLayout(row.text_codec, row.text_chunk_chars, row.text_length or 0)
+
+
+def iter_text_chunks(
+    connection: Connection,
+    source_id: str,
+    layout: ChunkLayout,
+    chunk_nos: range | None = None,
+) -> Iterator[str]:
+    """Decompressed chunks of a source in order (all, or ``chunk_nos``)."""
+    stmt = (
+        select(src_source_text.c.data)
+        .where(src_source_text.c.source_id == source_id)
+        .order_by(src_source_text.c.chunk_no)
+    )
+    if chunk_nos is not None:
+        if not chunk_nos:
+            return
+        stmt = stmt.where(
+            src_source_text.c.chunk_no.between(chunk_nos.start, chunk_nos.stop - 1)
+        )
+    for data in connection.execute(stmt).scalars():
+        yield decompress_chunk(layout.codec, data)
+
+
+def read_text(
+    connection: Connection,
+    source_id: str,
+    layout: ChunkLayout,
+    chunk_nos: range | None = None,
+) -> str:
+    """Decompress and join the chunks of a source (all, or ``chunk_nos``)."""
+    return "".join(iter_text_chunks(connection, source_id, layout, chunk_nos))
+
+
+def write_chunks(
+    connection: Connection, source_id: str, chunks: Sequence[bytes]
+) -> None:
+    """Insert the compressed chunks of one source.
+
+    Callers delete the old chunks first (see delete_chunks).
+    """
+    if chunks:
+        connection.execute(
+            insert(src_source_text),
+            [
+                {"source_id": source_id, "chunk_no": i, "data": data}
+                for i, data in enumerate(chunks)
+            ],
+        )
+
+
+def delete_chunks(connection: Connection, source_ids: Iterable[str]) -> None:
+    """Delete the compressed chunks of the given sources."""
+    ids = list(source_ids)
+    if ids:
+        connection.execute(
+            delete(src_source_text).where(src_source_text.c.source_id.in_(ids))
+        )
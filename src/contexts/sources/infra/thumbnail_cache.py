@@ -0,0 +1,107 @@
+"""
+Sources Context: Thumbnail Cache
+
+Thumbnails are decoded at reduced resolution (see decode_reduced) and
+cached on disk under the project directory, one file per image, keyed by
+the image's path, size and mtime: an edited or replaced file gets a new
+thumbnail and stale ones are never shown.
+
+Usage:
+    cache = ThumbnailCache.for_project(project_path)
+    thumbnail_path = cache.get_or_create(Path("field_photo.jpg"))
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import shutil
+from pathlib import Path
+
+from src.shared.infra.image_decoding import decode_reduced
+
+logger = logging.getLogger("qualcoder.sources.infra")
+
+THUMBNAIL_DIR_NAME = ".qualcoder-thumbnails"
+
+# Longest side of cached thumbnails, in pixels
+THUMBNAIL_SIZE = 256
+
+
+class ThumbnailCache:
+    """
+    Disk cache of image thumbnails, one file per (path, size, mtime).
+
+    Example:
+        cache = ThumbnailCache.for_project(project_path)
+        cache.get(photo)             # Path of a current thumbnail, or None
+        cache.get_or_create(photo)   # Decodes and stores it if needed
+    """
+
+    def __init__(self, directory: Path, max_size: int = THUMBNAIL_SIZE) -> None:
+        self.directory = directory
+        self._max_size = max_size
+
+    @classmethod
+    def for_project(cls, project_path: str | Path, **kwargs) -> ThumbnailCache:
+        """Cache in the directory holding a project file (or in a project directory)."""
+        project_path = Path(project_path).resolve()
+        root = project_path.parent if project_path.is_file() else project_path
+        return cls(root / THUMBNAIL_DIR_NAME, **kwargs)
+
+    def key(self, path: str | Path) -> str:
+        """Cache key of an image file: its resolved path, size and mtime."""
+        path = Path(path)
+        st = path.stat()
+        return hashlib.blake2b(
+            f"{path.resolve()}|{st.st_size}|{st.st_mtime_ns}|{self._max_size}".encode(),
+            digest_size=16,
+        ).hexdigest()
+
+    def get(self, path: str | Path) -> Path | None:
+        """Thumbnail of the image as it is now, or None if not cached."""
+        try:
+            key = self.key(path)
+        except OSError:
+            return None
+        for candidate in self._candidates(key):
+            if candidate.exists():
+                return candidate
+        return None
+
+    def get_or_create(self, path: str | Path) -> Path:
+        """
+        Thumbnail of the image, decoding and storing it if not cached.
+
+        Raises:
+            OSError: If the image cannot be read
+        """
+        key = self.key(path)
+        for candidate in self._candidates(key):
+            if candidate.exists():
+                return candidate
+
+        image = decode_reduced(path, (self._max_size, self._max_size))
+        jpeg_path, png_path = self._candidates(key)
+        if image.mode in ("LA", "RGBA"):
+            target, save_format = png_path, "PNG"
+        else:
+            target, save_format = jpeg_path, "JPEG"
+
+        target.parent.mkdir(parents=True, exist_ok=True)
+        # Atomic, so a concurrent reader never sees a partial thumbnail
+        partial = target.with_suffix(".part")
+        image.save(partial, format=save_format)
+        os.replace(partial, target)
+        logger.debug("thumbnail_cache: created %s for %s", target.name, path)
+        return target
+
+    def clear(self) -> None:
+        """Remove all cached thumbnails."""
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def _candidates(self, key: str) -> tuple[Path, Path]:
+        # Two-level fan-out keeps directories small for large projects
+        base = self.directory / key[:2] / key
+        return base.with_suffix(".jpg"), base.with_suffix(".png")
@@ -10,7 +10,11 @@ Implements:
 - QC-027.12: Agent can add text sources
 - QC-027.14: Agent can remove sources
 - QC-027.15: Agent can import file-based sources
+- QC-027.11: Agent can bulk-import a folder tree
+- QC-027.18: Agent can compress stored source text
 - QC-026.06: Agent can navigate to a segment
+- QC-033.01: Agent can run ranked full-text search
+- QC-027.19: Agent can list transcript speakers
 """
 
 from __future__ import annotations
@@ -39,12 +43,18 @@ class SourceToolsContext(Protocol):
     @property
     def sources_context(self): ...
 
+    @property
+    def folders_context(self): ...
+
     @property
     def coding_context(self): ...
 
     @property
     def cases_context(self): ...
 
+    @property
+    def session(self): ...
+
 
 # ============================================================
 # Tool Definitions
@@ -245,7 +255,9 @@ import_file_source_tool = ToolDefinition(
     description=(
         "Import a file-based source (document, PDF, image, audio, video) "
         "into the current project by providing its absolute file path. "
-        "The file type is auto-detected from the extension."
+        "The file type is auto-detected from the extension. Importing a file "
+        "again is a no-op if it is unchanged; if it changed, its text is "
+        "re-extracted into the existing source."
     ),
     parameters=(
         ToolParameter(
@@ -282,6 +294,158 @@ import_file_source_tool = ToolDefinition(
             required=False,
             default=False,
         ),
+        ToolParameter(
+            name="skip_duplicates",
+            type="boolean",
+            description=(
+                "If true, reject the file when a source with identical content "
+                "already exists (e.g. a renamed copy). Default false."
+            ),
+            required=False,
+            default=False,
+        ),
+    ),
+)
+
+import_folder_tool = ToolDefinition(
+    name="import_folder",
+    description=(
+        "Import every supported file (documents, PDFs, images, audio, video) "
+        "under a directory into the current project. Subdirectories are "
+        "recreated as project folders. Use dry_run first to see how many "
+        "files and bytes would be imported. Re-importing a folder skips "
+        "unchanged files and copies of already imported content."
+    ),
+    parameters=(
+        ToolParameter(
+            name="folder_path",
+            type="string",
+            description="Absolute path to the directory on the local filesystem.",
+            required=True,
+        ),
+        ToolParameter(
+            name="recursive",
+            type="boolean",
+            description="Include files in subdirectories. Default true.",
+            required=False,
+            default=True,
+        ),
+        ToolParameter(
+            name="mirror_folders",
+            type="boolean",
+            description="Recreate the directory structure as project folders. Default true.",
+            required=False,
+            default=True,
+        ),
+        ToolParameter(
+            name="origin",
+            type="string",
+            description="Optional origin description applied to every imported source.",
+            required=False,
+            default=None,
+        ),
+        ToolParameter(
+            name="memo",
+            type="string",
+            description="Optional memo applied to every imported source.",
+            required=False,
+            default=None,
+        ),
+        ToolParameter(
+            name="dry_run",
+            type="boolean",
+            description="If true, return file count and total size without importing. Default false.",
+            required=False,
+            default=False,
+        ),
+    ),
+)
+
+compress_source_texts_tool = ToolDefinition(
+    name="compress_source_texts",
+    description=(
+        "Store the text of every source compressed (zlib, or zstd when "
+        "installed) to shrink large projects, or back as plain text. Reading, "
+        "coding and search work the same either way; sources imported later "
+        "use the same storage."
+    ),
+    parameters=(
+        ToolParameter(
+            name="codec",
+            type="string",
+            description="'zlib' or 'zstd'. Omit or null to store text uncompressed.",
+            required=False,
+            default=None,
+        ),
+    ),
+)
+
+search_text_tool = ToolDefinition(
+    name="search_text",
+    description=(
+        "Full-text search across source documents, coded segment text, "
+        "code memos and segment memos. Results are ranked by relevance and "
+        "include a highlighted snippet (matches wrapped in <mark></mark>). "
+        "Use offset/limit to page through large result sets."
+    ),
+    parameters=(
+        ToolParameter(
+            name="query",
+            type="string",
+            description="Words to search for. All words must match; the last word matches as a prefix.",
+            required=True,
+        ),
+        ToolParameter(
+            name="scope",
+            type="array",
+            description=(
+                "Restrict to document kinds: 'source', 'segment', 'code_memo', "
+                "'segment_memo'. Leave empty for all."
+            ),
+            required=False,
+            default=None,
+        ),
+        ToolParameter(
+            name="source_id",
+            type="string",
+            description="Restrict results to a single source.",
+            required=False,
+            default=None,
+        ),
+        ToolParameter(
+            name="offset",
+            type="integer",
+            description="Number of results to skip. Default 0.",
+            required=False,
+            default=0,
+        ),
+        ToolParameter(
+            name="limit",
+            type="integer",
+            description="Maximum results to return (1-100). Default 20.",
+            required=False,
+            default=20,
+        ),
+    ),
+)
+
+detect_speakers_tool = ToolDefinition(
+    name="detect_speakers",
+    description=(
+        "List the speakers of transcript sources ('INTERVIEWER:', "
+        "'John Smith:' or '[Moderator]' at the start of a line) with their "
+        "number of turns. Give a source_id to also get that source's turns "
+        "as text offsets. Turns are stored per source, so unchanged text is "
+        "not scanned again."
+    ),
+    parameters=(
+        ToolParameter(
+            name="source_id",
+            type="string",
+            description="Source to list speakers and turns for. Omit for all sources.",
+            required=False,
+            default=None,
+        ),
     ),
 )
 
@@ -293,6 +457,10 @@ ALL_SOURCE_TOOLS = {
     "add_text_source": add_text_source_tool,
     "remove_source": remove_source_tool,
     "import_file_source": import_file_source_tool,
+    "import_folder": import_folder_tool,
+    "compress_source_texts": compress_source_texts_tool,
+    "search_text": search_text_tool,
+    "detect_speakers": detect_speakers_tool,
 }
 
 
@@ -315,6 +483,10 @@ class SourceTools:
             "add_text_source": self._execute_add_text_source,
             "remove_source": self._execute_remove_source,
             "import_file_source": self._execute_import_file_source,
+            "import_folder": self._execute_import_folder,
+            "compress_source_texts": self._execute_compress_source_texts,
+            "search_text": self._execute_search_text,
+            "detect_speakers": self._execute_detect_speakers,
         }
 
     @property
@@ -326,6 +498,11 @@ class SourceTools:
         ctx = self._ctx.sources_context
         return ctx.source_repo if ctx else None
 
+    @property
+    def _segment_repo(self):
+        ctx = self._ctx.coding_context
+        return ctx.segment_repo if ctx else None
+
     def get_tool_schemas(self) -> list[dict[str, Any]]:
         return [tool.to_schema() for tool in self._tools.values()]
 
@@ -350,7 +527,7 @@ class SourceTools:
         sources_ctx = self._ctx.sources_context
         if not sources_ctx:
             return Failure("No project is currently open")
-        all_sources = sources_ctx.source_repo.get_all()
+        all_sources = sources_ctx.source_repo.list_summaries()
 
         if source_type:
             sources = [s for s in all_sources if s.source_type.value == source_type]
@@ -388,12 +565,14 @@ class SourceTools:
         if not sources_ctx:
             return Failure("No project open")
 
-        source = sources_ctx.source_repo.get_by_id(SourceId(value=str(source_id)))
+        sid = SourceId(value=str(source_id))
+        source = sources_ctx.source_repo.get_summary(sid)
         if source is None:
             return Failure(f"Source not found: {source_id}")
 
-        content = source.fulltext or ""
-        total_length = len(content)
+        # Read only the requested page, not the whole text
+        provider = sources_ctx.content_provider
+        total_length = provider.get_length(sid) or 0
         start_pos = arguments.get("start_pos", 0) or 0
         end_pos = arguments.get("end_pos")
         max_length = arguments.get("max_length", 50000) or 50000
@@ -402,7 +581,11 @@ class SourceTools:
             end_pos = total_length
 
         actual_end = min(end_pos, start_pos + max_length)
-        extracted_content = content[start_pos:actual_end]
+        extracted_content = (
+            provider.get_text_range(sid, start_pos, actual_end) or ""
+            if total_length
+            else ""
+        )
         has_more = actual_end < total_length
 
         return Success(
@@ -619,6 +802,7 @@ class SourceTools:
             memo=arguments.get("memo"),
             origin=arguments.get("origin"),
             dry_run=arguments.get("dry_run", False),
+            skip_duplicates=arguments.get("skip_duplicates", False),
         )
 
         result = import_file_source(
@@ -626,6 +810,7 @@ class SourceTools:
             state=self._state,
             source_repo=self._source_repo,
             event_bus=self._ctx.event_bus,
+            segment_repo=self._segment_repo,
         )
 
         if result.is_failure:
@@ -645,3 +830,178 @@ class SourceTools:
                 "file_size": source.file_size,
             }
         )
+
+    def _execute_import_folder(
+        self, arguments: dict[str, Any]
+    ) -> Result[dict[str, Any], str]:
+        from src.contexts.projects.core.commands import ImportFolderCommand
+        from src.contexts.sources.core.commandHandlers.import_folder import (
+            import_folder,
+        )
+
+        folder_path = arguments.get("folder_path")
+        if folder_path is None:
+            return Failure("Missing required parameter: folder_path")
+        if not self._ctx.sources_context:
+            return Failure("No project is currently open")
+
+        command = ImportFolderCommand(
+            folder_path=str(folder_path),
+            recursive=arguments.get("recursive", True),
+            mirror_folders=arguments.get("mirror_folders", True),
+            origin=arguments.get("origin"),
+            memo=arguments.get("memo"),
+            dry_run=arguments.get("dry_run", False),
+        )
+        folders_ctx = self._ctx.folders_context
+
+        result = import_folder(
+            command=command,
+            state=self._state,
+            source_repo=self._source_repo,
+            folder_repo=folders_ctx.folder_repo if folders_ctx else None,
+            event_bus=self._ctx.event_bus,
+            session=self._ctx.session,
+            segment_repo=self._segment_repo,
+            metadata_cache=self._ctx.sources_context.metadata_cache,
+        )
+
+        if result.is_failure:
+            return Failure(result.error or "Failed to import folder")
+
+        if command.dry_run:
+            return Success(result.data)
+        return Success({"success": True, **result.data})
+
+    def _execute_compress_source_texts(
+        self, arguments: dict[str, Any]
+    ) -> Result[dict[str, Any], str]:
+        from src.contexts.projects.core.commands import CompressSourceTextsCommand
+        from src.contexts.sources.core.commandHandlers.compress_source_texts import (
+            compress_source_texts,
+        )
+
+        projects_ctx = getattr(self._ctx, "projects_context", None)
+        result = compress_source_texts(
+            command=CompressSourceTextsCommand(codec=arguments.get("codec") or None),
+            state=self._state,
+            source_repo=self._source_repo,
+            settings_repo=projects_ctx.settings_repo if projects_ctx else None,
+            session=self._ctx.session,
+        )
+
+        if result.is_failure:
+            return Failure(result.error or "Failed to compress source texts")
+        return Success({"success": True, **result.data})
+
+    def _execute_search_text(
+        self, arguments: dict[str, Any]
+    ) -> Result[dict[str, Any], str]:
+        from src.contexts.sources.infra.fulltext_index import ALL_KINDS
+
+        query = arguments.get("query")
+        if not query or not str(query).strip():
+            return Failure("Missing required parameter: query")
+
+        sources_ctx = self._ctx.sources_context
+        if not sources_ctx or sources_ctx.fulltext_index is None:
+            return Failure("No project open")
+
+        scope = arguments.get("scope") or None
+        if scope is not None:
+            unknown = [k for k in scope if k not in ALL_KINDS]
+            if unknown:
+                return Failure(
+                    f"Unknown scope: {', '.join(unknown)}. "
+                    f"Valid scopes: {', '.join(ALL_KINDS)}"
+                )
+            scope = tuple(scope)
+
+        offset = max(0, int(arguments.get("offset", 0) or 0))
+        limit = min(100, max(1, int(arguments.get("limit", 20) or 20)))
+        source_id = arguments.get("source_id")
+
+        page = sources_ctx.fulltext_index.search(
+            str(query),
+            kinds=scope,
+            offset=offset,
+            limit=limit,
+            source_id=str(source_id) if source_id is not None else None,
+        )
+
+        return Success(
+            {
+                "query": query,
+                "total": page.total,
+                "offset": page.offset,
+                "limit": page.limit,
+                "has_more": page.has_more,
+                "results": [
+                    {
+                        "kind": hit.kind,
+                        "id": hit.ref_id,
+                        "source_id": hit.source_id,
+                        "source_name": hit.source_name,
+                        "snippet": hit.snippet,
+                        "rank": hit.rank,
+                    }
+                    for hit in page.hits
+                ],
+            }
+        )
+
+    def _execute_detect_speakers(
+        self, arguments: dict[str, Any]
+    ) -> Result[dict[str, Any], str]:
+        from src.contexts.sources.core.services.speaker_detector import count_speakers
+        from src.contexts.sources.infra.speaker_index import SpeakerTurnIndex
+
+        sources_ctx = self._ctx.sources_context
+        if not sources_ctx:
+            return Failure("No project open")
+
+        index = SpeakerTurnIndex(sources_ctx.source_repo)
+        source_id = arguments.get("source_id")
+        if source_id is None:
+            counts = index.corpus_speaker_counts()
+            self._keep_speaker_turns()
+            return Success(
+                {
+                    "sources": [
+                        {
+                            "source_id": sid,
+                            "speakers": [
+                                {"name": name, "turns": n}
+                                for name, n in speakers.items()
+                            ],
+                        }
+                        for sid, speakers in counts.items()
+                        if speakers
+                    ]
+                }
+            )
+
+        sid = SourceId(value=str(source_id))
+        if sources_ctx.source_repo.get_summary(sid) is None:
+            return Failure(f"Source not found: {source_id}")
+
+        turns = index.turns(sid)
+        self._keep_speaker_turns()
+        return Success(
+            {
+                "source_id": source_id,
+                "speakers": [
+                    {"name": name, "turns": n}
+                    for name, n in count_speakers(turns).items()
+                ],
+                "turns": [
+                    {"speaker": t.speaker, "start": t.start, "end": t.end}
+                    for t in turns
+                ],
+            }
+        )
+
+    def _keep_speaker_turns(self) -> None:
+        """Commit turns stored by a scan so later calls read them back."""
+        if self._ctx.session is not None:
+            self._ctx.session.commit()
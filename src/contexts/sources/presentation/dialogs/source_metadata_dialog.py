@@ -2,7 +2,8 @@
 Source Metadata Dialog
 
 Implements QC-027.06 View Source Metadata:
-- AC #1: Display file name, type, size, and date
+- AC #1: Display file name, type, size, and date (plus cached image/media
+  properties such as dimensions and duration)
 - AC #2: Edit memo/notes for a source
 - AC #3: Display coding statistics
 - AC #4: Edit source properties
@@ -48,6 +49,7 @@ class SourceMetadata:
     memo: str | None = None
     origin: str | None = None
     modified_at: str | None = None
+    properties: tuple[tuple[str, str], ...] = ()  # (label, value), e.g. Duration
 
 
 class SourceMetadataDialog(QDialog):
@@ -200,6 +202,12 @@ class SourceMetadataDialog(QDialog):
         modified_label = self._create_value_label(modified)
         form.addRow(self._create_field_label("Modified:"), modified_label)
 
+        # Image/media properties
+        for label, value in self._metadata.properties:
+            form.addRow(
+                self._create_field_label(f"{label}:"), self._create_value_label(value)
+            )
+
         section.layout().addLayout(form)
         parent_layout.addWidget(section)
 
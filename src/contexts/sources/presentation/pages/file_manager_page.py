@@ -65,6 +65,7 @@ class FileManagerPage(QWidget):
 
     Signals:
         import_clicked: User clicked import files
+        import_folder_clicked: User clicked import folder
         link_clicked: User clicked link external files
         create_text_clicked: User clicked create new text
         export_clicked: User clicked export
@@ -85,6 +86,7 @@ class FileManagerPage(QWidget):
 
     # Toolbar actions
     import_clicked = Signal()
+    import_folder_clicked = Signal()
     import_from_s3_clicked = Signal()
     link_clicked = Signal()
     create_text_clicked = Signal()
@@ -202,6 +204,7 @@ class FileManagerPage(QWidget):
         """Connect internal signals."""
         # Toolbar signals
         self._toolbar.import_clicked.connect(self.import_clicked.emit)
+        self._toolbar.import_folder_clicked.connect(self.import_folder_clicked.emit)
         self._toolbar.import_from_s3_clicked.connect(self.import_from_s3_clicked.emit)
         self._toolbar.link_clicked.connect(self.link_clicked.emit)
         self._toolbar.create_text_clicked.connect(self.create_text_clicked.emit)
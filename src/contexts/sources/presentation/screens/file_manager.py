@@ -133,6 +133,7 @@ class FileManagerScreen(QWidget):
         """Connect page signals to screen handlers."""
         # Toolbar actions
         self._page.import_clicked.connect(self._on_import_clicked)
+        self._page.import_folder_clicked.connect(self._on_import_folder_clicked)
         self._page.import_from_s3_clicked.connect(self._on_import_from_s3_clicked)
         self._page.link_clicked.connect(self._on_link_clicked)
         self._page.create_text_clicked.connect(self._on_create_text_clicked)
@@ -270,6 +271,50 @@ class FileManagerScreen(QWidget):
         total = len(file_paths)
         logger.info("_on_import_clicked: user selected %d file(s)", total)
 
+        self._show_import_progress(total)
+        self._viewmodel.import_sources_batch(file_paths)
+
+    def _on_import_folder_clicked(self):
+        """Handle import folder action.
+
+        Shows a dry-run estimate (files, size) for confirmation, then
+        streams the folder tree into the batch import with the same
+        progress modal as file imports.
+        """
+        if not self._viewmodel:
+            return
+
+        folder = QFileDialog.getExistingDirectory(self, "Import Folder")
+        if not folder:
+            return
+
+        estimate = self._viewmodel.estimate_folder_import(folder)
+        if estimate is None:
+            return
+
+        total = estimate["file_count"]
+        if total == 0:
+            QMessageBox.information(
+                self, "Import Folder", "No supported files found in this folder."
+            )
+            return
+
+        size_mb = estimate["total_bytes"] / (1024 * 1024)
+        answer = QMessageBox.question(
+            self,
+            "Import Folder",
+            f"Import {total} file(s) ({size_mb:.1f} MB) from "
+            f"{estimate['directory_count']} folder(s)?",
+        )
+        if answer != QMessageBox.StandardButton.Yes:
+            return
+
+        logger.info("_on_import_folder_clicked: importing %d file(s)", total)
+        self._show_import_progress(total)
+        self._viewmodel.import_folder(folder, total=total)
+
+    def _show_import_progress(self, total: int) -> None:
+        """Show the progress modal and connect the batch import signals."""
         # --- Set up design-system progress modal ---
         self._import_progress = Modal(
             title="Importing Files",
@@ -293,9 +338,6 @@ class FileManagerScreen(QWidget):
         self._viewmodel.batch_import_progress.connect(self._on_batch_progress)
         self._viewmodel.batch_import_finished.connect(self._on_batch_finished)
 
-        # --- Start background import ---
-        self._viewmodel.import_sources_batch(file_paths)
-
     def _on_import_canceled(self):
         """User clicked Cancel on the progress modal."""
         logger.info("_on_import_canceled: user requested cancel")
@@ -510,6 +552,7 @@ class FileManagerScreen(QWidget):
                     code_count=source.code_count or 0,
                     memo=source.memo,
                     origin=source.origin,
+                    properties=tuple(self._viewmodel.get_source_properties(source_id)),
                 )
                 dialog = SourceMetadataDialog(metadata, self._colors, self)
                 dialog.save_clicked.connect(
@@ -18,7 +18,7 @@ import asyncio
 import contextlib
 import logging
 import time
-from collections.abc import Generator
+from collections.abc import Callable, Generator, Iterable
 from pathlib import Path
 from typing import TYPE_CHECKING, Protocol
 
@@ -40,7 +40,12 @@ from src.contexts.projects.core.commands import (
     RenameFolderCommand,
     UpdateSourceCommand,
 )
-from src.contexts.projects.core.entities import Folder, Source
+from src.contexts.projects.core.entities import (
+    Folder,
+    Source,
+    SourceSummary,
+    SourceType,
+)
 from src.contexts.sources.core.commandHandlers import (
     add_source,
     open_source,
@@ -53,23 +58,34 @@ from src.shared.infra.signal_bridge.projects import (
     ProjectSignalBridge,
     SourceMovedPayload,
     SourcePayload,
+    SourcesImportedPayload,
 )
 from src.shared.presentation.dto import FolderDTO, ProjectSummaryDTO, SourceDTO
 
 if TYPE_CHECKING:
     from src.contexts.cases.core.entities import Case
+    from src.contexts.sources.infra.extraction_pool import ExtractionPipeline
+    from src.contexts.sources.infra.metadata_cache import MetadataResult
     from src.shared.infra.event_bus import EventBus
     from src.shared.infra.session import Session
     from src.shared.infra.state import ProjectState
 
 logger = logging.getLogger("qualcoder.sources.viewmodel")
 
+# Sources persisted per commit during a batch import
+DEFAULT_IMPORT_COMMIT_EVERY = 50
+
+# Source types with image/media metadata
+_MEDIA_TYPES = frozenset({SourceType.IMAGE, SourceType.AUDIO, SourceType.VIDEO})
+
 
 class SourceRepository(Protocol):
     """Protocol for source repository - allows mock injection for testing."""
 
-    def get_all(self) -> list[Source]: ...
+    def list_summaries(self) -> list[SourceSummary]: ...
     def get_by_id(self, source_id) -> Source | None: ...
+    def count_by_type(self) -> dict[SourceType, int]: ...
+    def count_by_folder(self) -> dict[str | None, int]: ...
 
 
 class FolderRepository(Protocol):
@@ -90,6 +106,27 @@ class SegmentRepository(Protocol):
     def count_by_source(self, source_id) -> int: ...
 
 
+class FulltextIndex(Protocol):
+    """Protocol for the full-text index - ranked content search."""
+
+    def matching_source_ids(self, query: str, limit: int = 1000) -> list[str]: ...
+
+
+class MetadataCache(Protocol):
+    """Protocol for the image/media metadata cache - keyed by path, size, mtime."""
+
+    def get(
+        self, path: str, file_size: int, file_mtime_ns: int
+    ) -> MetadataResult | None: ...
+    def get_many(
+        self, entries: Iterable[tuple[str, int, int]]
+    ) -> dict[str, MetadataResult]: ...
+    def put_many(
+        self, entries: Iterable[tuple[str, int, int, MetadataResult]]
+    ) -> int: ...
+    def lookup_stored(self, path: str) -> tuple[MetadataResult | None, bool]: ...
+
+
 class FileManagerViewModel(QObject):
     """
     ViewModel for the File Manager screen.
@@ -141,6 +178,10 @@ class FileManagerViewModel(QObject):
         segment_repo: SegmentRepository | None = None,
         signal_bridge: ProjectSignalBridge | None = None,
         session: Session | None = None,
+        fulltext_index: FulltextIndex | None = None,
+        metadata_cache: MetadataCache | None = None,
+        extraction_workers: int | None = None,
+        import_commit_every: int = DEFAULT_IMPORT_COMMIT_EVERY,
         parent: QObject | None = None,
     ) -> None:
         """
@@ -155,6 +196,11 @@ class FileManagerViewModel(QObject):
             segment_repo: Segment repository for cascade deletion on source removal
             signal_bridge: Signal bridge for reactive updates (optional)
             session: Session for tracking user actions (optional)
+            fulltext_index: Full-text index for content search (optional)
+            metadata_cache: Cache of image/media metadata (optional)
+            extraction_workers: Worker processes for batch import extraction
+                (default: one per core, capped)
+            import_commit_every: Files persisted per commit during batch import
             parent: Qt parent object
         """
         super().__init__(parent)
@@ -166,6 +212,10 @@ class FileManagerViewModel(QObject):
         self._segment_repo = segment_repo
         self._signal_bridge = signal_bridge
         self._session = session
+        self._fulltext_index = fulltext_index
+        self._metadata_cache = metadata_cache
+        self._extraction_workers = extraction_workers
+        self._import_commit_every = max(1, import_commit_every)
 
         # Selection state
         self._selected_source_ids: set[str] = set()
@@ -179,6 +229,7 @@ class FileManagerViewModel(QObject):
         # Batch import state (async)
         self._import_task: asyncio.Task | None = None
         self._import_cancelled: bool = False
+        self._import_pipeline: ExtractionPipeline | None = None
 
         # Connect to signal bridge if provided
         if self._signal_bridge is not None:
@@ -197,6 +248,7 @@ class FileManagerViewModel(QObject):
         self._signal_bridge.source_status_changed.connect(
             self._on_source_status_changed
         )
+        self._signal_bridge.sources_imported.connect(self._on_sources_imported)
 
         # Folder events
         self._signal_bridge.folder_created.connect(self._on_folder_created)
@@ -216,6 +268,7 @@ class FileManagerViewModel(QObject):
         self._signal_bridge.source_status_changed.disconnect(
             self._on_source_status_changed
         )
+        self._signal_bridge.sources_imported.disconnect(self._on_sources_imported)
         self._signal_bridge.folder_created.disconnect(self._on_folder_created)
         self._signal_bridge.folder_renamed.disconnect(self._on_folder_renamed)
         self._signal_bridge.folder_deleted.disconnect(self._on_folder_deleted)
@@ -265,6 +318,14 @@ class FileManagerViewModel(QObject):
         self.sources_changed.emit()
         self.summary_changed.emit()
 
+    def _on_sources_imported(self, _payload: SourcesImportedPayload) -> None:
+        """Handle a project import, which publishes no per-source events."""
+        if self._suppress_reloads:
+            logger.debug("_on_sources_imported: suppressed (batch in progress)")
+            return
+        self.sources_changed.emit()
+        self.summary_changed.emit()
+
     def _on_source_removed(self, payload: SourcePayload) -> None:
         """Handle source removed event.
 
@@ -332,13 +393,18 @@ class FileManagerViewModel(QObject):
         Load all sources and return as DTOs.
 
         Fetches cases once to avoid N+1 queries during DTO conversion.
+        Only source metadata is read; document text stays in the database.
 
         Returns:
             List of SourceDTO objects for UI display
         """
-        sources = self._source_repo.get_all()
+        sources = self._source_repo.list_summaries()
         cases = self._case_repo.get_all() if self._case_repo else []
-        return [self._source_to_dto(s, cases=cases) for s in sources]
+        media = self._cached_metadata(sources)
+        return [
+            self._source_to_dto(s, cases=cases, metadata=media.get(s.id.value))
+            for s in sources
+        ]
 
     def get_summary(self) -> ProjectSummaryDTO:
         """
@@ -347,33 +413,22 @@ class FileManagerViewModel(QObject):
         Returns:
             ProjectSummaryDTO with counts by type
         """
-        sources = self._source_repo.get_all()
+        type_counts = self._source_repo.count_by_type()
+        total_sources = sum(type_counts.values())
 
-        if not sources:
+        if not total_sources:
             return ProjectSummaryDTO()
 
-        # Single pass over sources
-        type_counts: dict[str, int] = {}
-        total_segments = 0
-        for s in sources:
-            type_counts[s.source_type.value] = (
-                type_counts.get(s.source_type.value, 0) + 1
-            )
-            total_segments += s.code_count
-
         total_codes = len(self._case_repo.get_all()) if self._case_repo else 0
 
-        from src.contexts.projects.core.entities import SourceType
-
         return ProjectSummaryDTO(
-            total_sources=len(sources),
-            text_count=type_counts.get(SourceType.TEXT.value, 0),
-            audio_count=type_counts.get(SourceType.AUDIO.value, 0),
-            video_count=type_counts.get(SourceType.VIDEO.value, 0),
-            image_count=type_counts.get(SourceType.IMAGE.value, 0),
-            pdf_count=type_counts.get(SourceType.PDF.value, 0),
+            total_sources=total_sources,
+            text_count=type_counts.get(SourceType.TEXT, 0),
+            audio_count=type_counts.get(SourceType.AUDIO, 0),
+            video_count=type_counts.get(SourceType.VIDEO, 0),
+            image_count=type_counts.get(SourceType.IMAGE, 0),
+            pdf_count=type_counts.get(SourceType.PDF, 0),
             total_codes=total_codes,
-            total_segments=total_segments,
         )
 
     def get_current_source(self) -> SourceDTO | None:
@@ -402,6 +457,39 @@ class FileManagerViewModel(QObject):
         source = self._source_repo.get_by_id(SourceId(value=source_id))
         return self._source_to_dto(source) if source else None
 
+    def get_source_properties(self, source_id: str) -> list[tuple[str, str]]:
+        """
+        Image or media properties of a source, for the metadata dialog.
+
+        Read from the metadata cache; the file is only probed if it changed
+        since its metadata was cached (or was never cached).
+
+        Returns:
+            (label, value) rows, e.g. ("Duration", "1:02:03"); empty for
+            text sources and when no metadata is available
+        """
+        if self._metadata_cache is None:
+            return []
+        source = self._source_repo.get_by_id(SourceId(value=source_id))
+        if (
+            source is None
+            or source.file_path is None
+            or source.source_type not in _MEDIA_TYPES
+        ):
+            return []
+        path = str(source.file_path)
+        result, stored = self._metadata_cache.lookup_stored(path)
+        if stored and self._session is not None and not self.is_importing:
+            # Keep the fresh extraction; during a batch import the batch's
+            # own commit does, so its half-persisted sources stay pending
+            self._session.commit()
+        if result is None and source.file_mtime_ns is not None:
+            # File moved or unreadable: show what was read at import
+            result = self._metadata_cache.get(
+                path, source.file_size, source.file_mtime_ns
+            )
+        return _metadata_properties(result) if result is not None else []
+
     # =========================================================================
     # Source Commands - Commands go through use cases
     # =========================================================================
@@ -456,8 +544,9 @@ class FileManagerViewModel(QObject):
     ) -> None:
         """Start an async batch import.
 
-        Extraction runs in a thread-pool executor; persistence and event
-        publishing resume on the main thread after each ``await``.
+        Text and metadata extraction run in a process pool; persistence
+        and event publishing stay on the main thread, which only awaits
+        finished extractions and so keeps the UI responsive.
 
         Args:
             file_paths: Absolute paths to import.
@@ -481,72 +570,248 @@ class FileManagerViewModel(QObject):
             self._import_sources_async(file_paths, origin, memo)
         )
 
+    def estimate_folder_import(
+        self, folder_path: str, recursive: bool = True
+    ) -> dict | None:
+        """Dry-run a folder import: file count, bytes and folders to create.
+
+        Returns None (and emits ``error_occurred``) if the folder is invalid.
+        """
+        from src.contexts.projects.core.commands import ImportFolderCommand
+        from src.contexts.sources.core.commandHandlers.import_folder import (
+            import_folder,
+        )
+
+        result = import_folder(
+            command=ImportFolderCommand(
+                folder_path=folder_path, recursive=recursive, dry_run=True
+            ),
+            state=self._state,
+            source_repo=self._source_repo,
+            folder_repo=self._folder_repo,
+            event_bus=self._event_bus,
+        )
+        if result.is_failure:
+            self.error_occurred.emit(result.error or "Cannot import folder")
+            return None
+        return result.data
+
+    def import_folder(
+        self,
+        folder_path: str,
+        origin: str | None = None,
+        memo: str | None = None,
+        recursive: bool = True,
+        total: int = 0,
+    ) -> None:
+        """Start an async import of every supported file under a directory.
+
+        Files are discovered lazily while earlier ones are extracted, so the
+        import starts immediately and memory stays flat on large trees.
+        Subdirectories are mirrored as project folders. Progress and
+        completion are reported through the batch import signals.
+
+        Args:
+            folder_path: Absolute path of the directory to import.
+            origin: Optional origin tag for all imported sources.
+            memo: Optional memo for all imported sources.
+            recursive: Descend into subdirectories.
+            total: Expected file count for progress (from
+                ``estimate_folder_import``; 0 if unknown).
+        """
+        from src.contexts.sources.core.commandHandlers.import_file_source import (
+            ALL_SUPPORTED_EXTENSIONS,
+        )
+        from src.contexts.sources.core.commandHandlers.import_folder import (
+            FolderMirror,
+            source_name_for,
+        )
+        from src.contexts.sources.infra.folder_scanner import iter_source_files
+
+        if self.is_importing:
+            logger.warning("import_folder: import already in progress, ignoring")
+            return
+
+        self._import_cancelled = False
+        logger.info("import_folder: starting async import of %s", folder_path)
+
+        mirror = FolderMirror(
+            folder_path, self._state, self._folder_repo, self._event_bus
+        )
+        paths = (
+            scanned.path
+            for scanned in iter_source_files(
+                folder_path, ALL_SUPPORTED_EXTENSIONS, recursive
+            )
+        )
+
+        def _placement(path: str) -> tuple[str, str | None]:
+            return (
+                source_name_for(folder_path, path, self._source_repo),
+                mirror.folder_for(path),
+            )
+
+        loop = asyncio.get_event_loop()
+        self._import_task = loop.create_task(
+            self._import_sources_async(
+                paths, origin, memo, total=total, placement=_placement
+            )
+        )
+
     def cancel_import(self) -> None:
         """Request cancellation of the running batch import."""
         if self.is_importing:
             logger.info("cancel_import: setting cancellation flag")
             self._import_cancelled = True
+            if self._import_pipeline is not None:
+                self._import_pipeline.cancel()
 
     async def _import_sources_async(
         self,
-        file_paths: list[str],
+        file_paths: Iterable[str],
         origin: str | None,
         memo: str | None,
+        total: int | None = None,
+        placement: Callable[[str], tuple[str | None, str | None]] | None = None,
     ) -> None:
-        """Async coroutine that imports files one at a time.
-
-        Delegates each file to the ``import_file_source`` command handler,
-        which handles validation, text extraction, persistence, and event
-        publishing.  An ``await asyncio.sleep(0)`` after each file yields
-        to the event loop so the UI stays responsive.
+        """Async coroutine that imports a batch of files.
+
+        An ``ExtractionPipeline`` extracts text and metadata in worker
+        processes and hands results back in input order through a bounded
+        queue. Each result is persisted by the ``import_file_source`` command
+        handler (validation, persistence, event publishing) with the text
+        already extracted, and the session is committed once per
+        ``import_commit_every`` files instead of once per file. Files that
+        are unchanged since their last import, or whose content is already
+        in the project, are skipped without extraction.
+
+        ``file_paths`` may be a lazy iterable (folder imports); pass
+        ``total`` for progress reporting. ``placement`` maps a path to the
+        source name and folder id to use (defaults: file name, root).
         """
         from src.contexts.projects.core.commands import ImportFileSourceCommand
         from src.contexts.sources.core.commandHandlers.import_file_source import (
+            SKIPPED_ERROR_CODES,
+            file_unchanged,
             import_file_source,
         )
+        from src.contexts.sources.infra.extraction_pool import ExtractionPipeline
 
-        total = len(file_paths)
+        if total is None:
+            total = len(file_paths)  # type: ignore[arg-type]
         imported = 0
+        skipped = 0
         failed = 0
+        pending_commit = 0
+        pending_metadata: list[tuple[str, int, int, MetadataResult]] = []
         imported_paths: list[str] = []
         batch_start = time.perf_counter()
+        source_repo = self._source_repo
+        pipeline = ExtractionPipeline(
+            max_workers=self._extraction_workers,
+            known_hashes=source_repo.content_hashes() if source_repo else (),
+            is_unchanged=lambda path: file_unchanged(source_repo, path),
+        )
+        self._import_pipeline = pipeline
 
         self._suppress_reloads += 1
         try:
-            for idx, raw_path in enumerate(file_paths):
-                if self._import_cancelled:
-                    logger.info("batch_import: cancelled after %d/%d files", idx, total)
-                    break
-
-                file_path = Path(raw_path)
-                file_start = time.perf_counter()
-
-                try:
-                    command = ImportFileSourceCommand(
-                        file_path=raw_path,
-                        origin=origin,
-                        memo=memo,
-                    )
-                    result = import_file_source(
-                        command=command,
-                        state=self._state,
-                        source_repo=self._source_repo,
-                        event_bus=self._event_bus,
-                        session=self._session,
-                    )
-
-                    if result.is_success:
-                        imported += 1
-                        imported_paths.append(raw_path)
-                        elapsed_ms = (time.perf_counter() - file_start) * 1000
+            async with contextlib.aclosing(pipeline.run(file_paths)) as results:
+                idx = 0
+                async for extracted in results:
+                    if self._import_cancelled:
                         logger.info(
-                            "batch_import: [%d/%d] imported %s (%.1fms)",
-                            idx + 1,
-                            total,
+                            "batch_import: cancelled after %d/%d files", idx, total
+                        )
+                        break
+
+                    raw_path = extracted.path
+                    file_path = Path(raw_path)
+                    file_start = time.perf_counter()
+                    text_extractor = lambda _t, _p, e=extracted: e.fulltext  # noqa: E731
+                    if extracted.skipped:
+                        # Not extracted; only needed if the file changed since
+                        text_extractor = None
+                    elif extracted.error:
+                        # Worker crashed or pool broke: retry in-process
+                        logger.warning(
+                            "batch_import: worker extraction failed for %s: %s",
                             file_path.name,
-                            elapsed_ms,
+                            extracted.error,
+                        )
+                        text_extractor = None
+
+                    try:
+                        name, folder_id = (
+                            placement(raw_path) if placement else (None, None)
+                        )
+                        command = ImportFileSourceCommand(
+                            file_path=raw_path,
+                            name=name,
+                            origin=origin,
+                            memo=memo,
+                            folder_id=folder_id,
+                            skip_duplicates=True,
+                        )
+                        result = import_file_source(
+                            command=command,
+                            state=self._state,
+                            source_repo=self._source_repo,
+                            event_bus=self._event_bus,
+                            text_extractor=text_extractor,
+                            content_hash=extracted.content_hash,
+                            page_starts=extracted.page_starts,
+                            segment_repo=self._segment_repo,
                         )
-                    else:
+
+                        if result.is_success:
+                            imported += 1
+                            pending_commit += 1
+                            imported_paths.append(raw_path)
+                            if (
+                                extracted.metadata is not None
+                                and extracted.file_mtime_ns is not None
+                            ):
+                                # Probed once in the worker; never again
+                                pending_metadata.append(
+                                    (
+                                        str(file_path),
+                                        extracted.file_size,
+                                        extracted.file_mtime_ns,
+                                        extracted.metadata,
+                                    )
+                                )
+                            elapsed_ms = (time.perf_counter() - file_start) * 1000
+                            logger.info(
+                                "batch_import: [%d/%d] imported %s (%.1fms)",
+                                idx + 1,
+                                total,
+                                file_path.name,
+                                elapsed_ms,
+                            )
+                        elif result.error_code in SKIPPED_ERROR_CODES:
+                            skipped += 1
+                            pending_commit += 1  # May have refreshed the mtime
+                            logger.debug(
+                                "batch_import: [%d/%d] skipped %s: %s",
+                                idx + 1,
+                                total,
+                                file_path.name,
+                                result.error,
+                            )
+                        else:
+                            failed += 1
+                            elapsed_ms = (time.perf_counter() - file_start) * 1000
+                            logger.warning(
+                                "batch_import: [%d/%d] failed %s: %s (%.1fms)",
+                                idx + 1,
+                                total,
+                                file_path.name,
+                                result.error,
+                                elapsed_ms,
+                            )
+
+                    except Exception as exc:
                         failed += 1
                         elapsed_ms = (time.perf_counter() - file_start) * 1000
                         logger.warning(
@@ -554,32 +819,31 @@ class FileManagerViewModel(QObject):
                             idx + 1,
                             total,
                             file_path.name,
-                            result.error,
+                            exc,
                             elapsed_ms,
                         )
 
-                except Exception as exc:
-                    failed += 1
-                    elapsed_ms = (time.perf_counter() - file_start) * 1000
-                    logger.warning(
-                        "batch_import: [%d/%d] failed %s: %s (%.1fms)",
-                        idx + 1,
-                        total,
-                        file_path.name,
-                        exc,
-                        elapsed_ms,
-                    )
-
-                self.batch_import_progress.emit(idx + 1, total, file_path.name)
-                await asyncio.sleep(0)  # Yield to event loop for UI responsiveness
+                    if pending_commit >= self._import_commit_every:
+                        self._store_metadata(pending_metadata)
+                        self._commit_import()
+                        pending_commit = 0
+
+                    idx += 1
+                    self.batch_import_progress.emit(idx, total, file_path.name)
+                    await asyncio.sleep(0)  # Yield to event loop for UI responsiveness
 
         finally:
+            if pending_commit:
+                self._store_metadata(pending_metadata)
+                self._commit_import()
+            self._import_pipeline = None
             self._suppress_reloads = max(0, self._suppress_reloads - 1)
 
         batch_ms = (time.perf_counter() - batch_start) * 1000
         logger.info(
-            "batch_import: done — %d imported, %d failed (%.1fms total)",
+            "batch_import: done — %d imported, %d unchanged, %d failed (%.1fms total)",
             imported,
+            skipped,
             failed,
             batch_ms,
         )
@@ -587,6 +851,24 @@ class FileManagerViewModel(QObject):
         self.batch_import_finished.emit(imported, failed, imported_paths)
         self.sources_changed.emit()
         self.summary_changed.emit()
+        if placement is not None:
+            self.folders_changed.emit()  # Folder source counts changed
+
+    def _commit_import(self) -> None:
+        """Commit the sources persisted since the last batch-import commit."""
+        if self._session is not None:
+            self._session.commit()
+
+    def _store_metadata(
+        self, pending: list[tuple[str, int, int, MetadataResult]]
+    ) -> None:
+        """Cache metadata extracted during a batch import, then clear ``pending``."""
+        if self._metadata_cache is not None and pending:
+            try:
+                self._metadata_cache.put_many(pending)
+            except Exception as exc:
+                logger.warning("batch_import: metadata not cached: %s", exc)
+        pending.clear()
 
     def remove_source(self, source_id: str) -> bool:
         """
@@ -755,7 +1037,7 @@ class FileManagerViewModel(QObject):
         Returns:
             List of selected SourceDTO objects
         """
-        sources = self._source_repo.get_all()
+        sources = self._source_repo.list_summaries()
         return [
             self._source_to_dto(s)
             for s in sources
@@ -785,7 +1067,7 @@ class FileManagerViewModel(QObject):
         Returns:
             Filtered list of SourceDTO objects
         """
-        sources = self._source_repo.get_all()
+        sources = self._source_repo.list_summaries()
 
         if source_type:
             sources = [s for s in sources if s.source_type.value == source_type]
@@ -797,7 +1079,10 @@ class FileManagerViewModel(QObject):
 
     def search_sources(self, query: str) -> list[SourceDTO]:
         """
-        Search sources by name.
+        Search sources by name and, when indexed, by content.
+
+        Name matches come first, followed by sources whose text matches
+        the query in full-text rank order.
 
         Args:
             query: Search query (case-insensitive)
@@ -805,11 +1090,19 @@ class FileManagerViewModel(QObject):
         Returns:
             List of matching SourceDTO objects
         """
-        sources = self._source_repo.get_all()
+        sources = self._source_repo.list_summaries()
         query_lower = query.lower()
 
         matching = [s for s in sources if query_lower in s.name.lower()]
 
+        if self._fulltext_index is not None:
+            by_id = {s.id.value: s for s in sources}
+            seen = {s.id.value for s in matching}
+            for source_id in self._fulltext_index.matching_source_ids(query):
+                if source_id in by_id and source_id not in seen:
+                    matching.append(by_id[source_id])
+                    seen.add(source_id)
+
         return [self._source_to_dto(s) for s in matching]
 
     # =========================================================================
@@ -915,19 +1208,13 @@ class FileManagerViewModel(QObject):
         """
         Get all folders as DTOs.
 
-        Fetches sources once to avoid N+1 queries during folder count.
+        Counts sources per folder in one grouped query to avoid N+1 lookups.
 
         Returns:
             List of FolderDTO objects for UI display
         """
         folders = self._folder_repo.get_all()
-        sources = self._source_repo.get_all()
-        # Pre-compute folder → source count map
-        folder_counts: dict[str, int] = {}
-        for s in sources:
-            if s.folder_id:
-                fid = s.folder_id.value
-                folder_counts[fid] = folder_counts.get(fid, 0) + 1
+        folder_counts = self._source_repo.count_by_folder()
         return [
             self._folder_to_dto(f, folder_source_count=folder_counts.get(f.id.value, 0))
             for f in folders
@@ -937,12 +1224,40 @@ class FileManagerViewModel(QObject):
     # Private Helpers
     # =========================================================================
 
-    def _source_to_dto(self, source: Source, cases: list | None = None) -> SourceDTO:
-        """Convert a Source entity to DTO.
+    def _cached_metadata(
+        self, sources: list[SourceSummary]
+    ) -> dict[str, MetadataResult]:
+        """Cached image/media metadata per source ID, without touching files."""
+        if self._metadata_cache is None:
+            return {}
+        keys = {
+            str(s.file_path): s.id.value
+            for s in sources
+            if s.source_type in _MEDIA_TYPES
+            and s.file_path is not None
+            and s.file_mtime_ns is not None
+        }
+        if not keys:
+            return {}
+        by_path = self._metadata_cache.get_many(
+            (str(s.file_path), s.file_size, s.file_mtime_ns)
+            for s in sources
+            if str(s.file_path) in keys
+        )
+        return {keys[path]: result for path, result in by_path.items()}
+
+    def _source_to_dto(
+        self,
+        source: Source | SourceSummary,
+        cases: list | None = None,
+        metadata: MetadataResult | None = None,
+    ) -> SourceDTO:
+        """Convert a Source entity or summary to DTO.
 
         Args:
             source: The source entity to convert.
             cases: Pre-fetched case list to avoid N+1 queries. If None, fetches from repo.
+            metadata: Cached image/media metadata, summarised in ``media_info``.
         """
         source_id_value = source.id.value
         if cases is None:
@@ -960,6 +1275,7 @@ class FileManagerViewModel(QObject):
             origin=source.origin,
             cases=case_names,
             modified_at=source.modified_at.isoformat() if source.modified_at else None,
+            media_info=_metadata_summary(metadata) if metadata else None,
         )
 
     def _folder_to_dto(
@@ -972,12 +1288,8 @@ class FileManagerViewModel(QObject):
             folder_source_count: Pre-computed source count. If None, fetches from repo.
         """
         if folder_source_count is None:
-            sources = self._source_repo.get_all()
-            folder_source_count = sum(
-                1
-                for s in sources
-                if s.folder_id and s.folder_id.value == folder.id.value
-            )
+            counts = self._source_repo.count_by_folder()
+            folder_source_count = counts.get(folder.id.value, 0)
 
         return FolderDTO(
             id=str(folder.id.value),
@@ -985,3 +1297,52 @@ class FileManagerViewModel(QObject):
             parent_id=str(folder.parent_id.value) if folder.parent_id else None,
             source_count=folder_source_count,
         )
+
+
+# =============================================================================
+# Metadata formatting
+# =============================================================================
+
+
+def _format_duration(seconds: float) -> str:
+    total = round(seconds)
+    hours, rest = divmod(total, 3600)
+    minutes, secs = divmod(rest, 60)
+    if hours:
+        return f"{hours}:{minutes:02}:{secs:02}"
+    return f"{minutes}:{secs:02}"
+
+
+def _metadata_summary(result: MetadataResult) -> str:
+    """One-line description for the source list, e.g. "1920 × 1080 · JPEG"."""
+    duration = getattr(result, "duration_seconds", None)
+    if duration is not None:
+        return f"{_format_duration(duration)} · {result.format}"
+    return f"{result.width} × {result.height} · {result.format}"
+
+
+def _metadata_properties(result: MetadataResult) -> list[tuple[str, str]]:
+    """(label, value) rows describing image or media metadata."""
+    rows: list[tuple[str, str]] = []
+    duration = getattr(result, "duration_seconds", None)
+    if duration is not None:
+        rows.append(("Duration", _format_duration(duration)))
+    if result.width and result.height:
+        rows.append(("Dimensions", f"{result.width} × {result.height}"))
+    rows.append(("Format", result.format))
+    if duration is not None:
+        if result.codec:
+            rows.append(("Codec", result.codec))
+        if result.bitrate:
+            rows.append(("Bitrate", f"{result.bitrate // 1000} kbps"))
+        if result.sample_rate:
+            rows.append(("Sample rate", f"{result.sample_rate} Hz"))
+    else:
+        exif = result.metadata.get("exif", {})
+        camera = " ".join(str(exif[k]) for k in ("Make", "Model") if exif.get(k))
+        if camera:
+            rows.append(("Camera", camera))
+        taken = exif.get("DateTimeOriginal") or exif.get("DateTime")
+        if taken:
+            rows.append(("Taken", str(taken)))
+    return rows
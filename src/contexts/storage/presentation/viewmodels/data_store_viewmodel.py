@@ -34,7 +34,7 @@ logger = logging.getLogger("qualcoder.storage.presentation")
 class SourceRepoProtocol(Protocol):
     """Minimal protocol for cross-referencing imported sources."""
 
-    def get_all(self) -> list: ...
+    def list_summaries(self) -> list: ...
 
 
 class DataStoreViewModel:
@@ -155,7 +155,7 @@ class DataStoreViewModel:
     def get_imported_filenames(self) -> set[str]:
         """Get set of filenames already imported as sources."""
         try:
-            sources = self._source_repo.get_all()
+            sources = self._source_repo.list_summaries()
             return {s.name for s in sources}
         except Exception:
             return set()
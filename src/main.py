@@ -196,6 +196,8 @@ class QualCoderApp:
             ),
             signal_bridge=self._project_signal_bridge,
             session=self._ctx.session,
+            fulltext_index=self._ctx.sources_context.fulltext_index,
+            metadata_cache=self._ctx.sources_context.metadata_cache,
         )
         self._screens["files"].set_viewmodel(file_manager_viewmodel)
 
@@ -245,12 +247,24 @@ class QualCoderApp:
                 segment_repo=self._ctx.coding_context.segment_repo,
                 event_bus=self._ctx.event_bus,
                 session=self._ctx.session,
+                source_content_provider=(
+                    self._ctx.sources_context.content_provider
+                    if self._ctx.sources_context
+                    else None
+                ),
+                codebook=self._ctx.coding_context.codebook,
             )
             text_coding_viewmodel = TextCodingViewModel(
                 controller=coding_coordinator,
                 signal_bridge=self._coding_signal_bridge,
             )
             self._screens["coding"].set_viewmodel(text_coding_viewmodel)
+            if self._ctx.sources_context:
+                from src.contexts.sources.infra import SpeakerTurnIndex
+
+                self._screens["coding"].set_speaker_index(
+                    SpeakerTurnIndex(self._ctx.sources_context.source_repo)
+                )
 
             # Connect "N" key (new code) to show CreateCodeDialog
             self._screens["coding"].code_created.connect(
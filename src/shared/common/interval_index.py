@@ -0,0 +1,160 @@
+"""
+Shared Domain: Interval Index
+
+Static index over half-open ``[start, end)`` intervals, used to answer
+"which items cover this position / overlap this range" without a linear
+scan (coded segments, editor highlights).
+
+The intervals are sorted by start and treated as an implicit balanced
+binary tree (the middle element of each slice is the node), with each node
+storing the largest end in its subtree. Queries descend only into subtrees
+that can still contain a match, so stab and overlap queries cost
+O(log n + k) for k results. Building is O(n log n).
+
+Indexes are immutable: rebuild (or use ``with_added`` / ``without``) when
+the underlying segments change.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Iterator
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class IntervalIndex(Generic[T]):
+    """
+    Immutable interval index over arbitrary items.
+
+    Args:
+        items: Items to index
+        bounds: Returns ``(start, end)`` for an item; intervals are half-open
+
+    Example:
+        index = IntervalIndex(segments, lambda s: (s.pos0, s.pos1))
+        index.stab(42)            # items with start <= 42 < end
+        index.overlapping(10, 20) # items with start < 20 and 10 < end
+    """
+
+    __slots__ = ("_bounds", "_ends", "_items", "_max_end", "_starts")
+
+    def __init__(
+        self,
+        items: Iterable[T],
+        bounds: Callable[[T], tuple[int, int]],
+    ) -> None:
+        keyed = sorted(
+            ((*bounds(item), n, item) for n, item in enumerate(items)),
+            key=lambda k: (k[0], k[1], k[2]),
+        )
+        self._bounds = bounds
+        self._starts = [k[0] for k in keyed]
+        self._ends = [k[1] for k in keyed]
+        self._items = [k[3] for k in keyed]
+        self._max_end = list(self._ends)
+        self._build(0, len(keyed))
+
+    def _build(self, lo: int, hi: int) -> int:
+        """Fill _max_end for the subtree over [lo, hi); return its max end."""
+        if lo >= hi:
+            return -1
+        mid = (lo + hi) // 2
+        best = max(self._ends[mid], self._build(lo, mid), self._build(mid + 1, hi))
+        self._max_end[mid] = best
+        return best
+
+    # =========================================================================
+    # Queries
+    # =========================================================================
+
+    def overlapping(self, start: int, end: int) -> list[T]:
+        """Items with ``item_start < end and start < item_end``, ordered by start."""
+        return [self._items[i] for i in self._search(start, end)]
+
+    def stab(self, pos: int) -> list[T]:
+        """Items whose interval contains ``pos``, ordered by start."""
+        return [self._items[i] for i in self._search(pos, pos + 1)]
+
+    def within(self, start: int, end: int) -> list[T]:
+        """Items whose interval lies entirely inside ``[start, end)``."""
+        return [
+            self._items[i]
+            for i in self._search(start, end)
+            if self._starts[i] >= start and self._ends[i] <= end
+        ]
+
+    def any_overlapping(self, start: int, end: int) -> bool:
+        """Whether any item overlaps ``[start, end)``."""
+        return next(iter(self._search(start, end)), None) is not None
+
+    def overlap_regions(self) -> list[tuple[int, int]]:
+        """
+        Ranges covered by two or more intervals.
+
+        Touching or overlapping ranges are merged. Empty intervals are ignored.
+        """
+        events: list[tuple[int, int]] = []
+        for s, e in zip(self._starts, self._ends, strict=True):
+            if s < e:
+                events.append((s, 1))
+                events.append((e, -1))
+        # Ends sort before starts at the same position (half-open intervals)
+        events.sort()
+
+        regions: list[tuple[int, int]] = []
+        depth = 0
+        region_start = 0
+        for pos, delta in events:
+            previous = depth
+            depth += delta
+            if previous < 2 <= depth:
+                region_start = pos
+            elif depth < 2 <= previous and pos > region_start:
+                if regions and region_start <= regions[-1][1]:
+                    regions[-1] = (regions[-1][0], pos)
+                else:
+                    regions.append((region_start, pos))
+        return regions
+
+    def _search(self, start: int, end: int) -> Iterator[int]:
+        """Yield indexes of intervals overlapping [start, end) in start order."""
+        # In-order traversal with pruning: skip subtrees whose max end is at
+        # or before ``start``; stop going right once starts reach ``end``.
+        stack: list[tuple[int, int]] = []
+        lo, hi = 0, len(self._items)
+        while stack or lo < hi:
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if self._max_end[mid] <= start:
+                    break
+                stack.append((mid, hi))
+                hi = mid
+            if not stack:
+                return
+            mid, hi = stack.pop()
+            if self._starts[mid] >= end:
+                return
+            if self._ends[mid] > start:
+                yield mid
+            lo = mid + 1
+
+    # =========================================================================
+    # Derived indexes
+    # =========================================================================
+
+    def with_added(self, items: Iterable[T]) -> IntervalIndex[T]:
+        """Return a new index that also contains ``items``."""
+        return IntervalIndex([*self._items, *items], self._bounds)
+
+    def without(self, predicate: Callable[[T], bool]) -> IntervalIndex[T]:
+        """Return a new index without the items matching ``predicate``."""
+        return IntervalIndex(
+            [item for item in self._items if not predicate(item)], self._bounds
+        )
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._items)
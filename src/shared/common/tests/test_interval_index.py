@@ -0,0 +1,103 @@
+"""
+Tests for the shared interval index.
+
+Results are checked against brute-force scans over random intervals.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+
+import allure
+import pytest
+
+from src.shared.common.interval_index import IntervalIndex
+
+pytestmark = [
+    pytest.mark.unit,
+    allure.epic("QualCoder v2"),
+    allure.feature("QC-029 Apply Codes to Text"),
+]
+
+
+def _brute_regions(intervals: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    """Pairwise overlap regions, merged when touching (reference logic)."""
+    pairs = set()
+    for i, (si, ei) in enumerate(intervals):
+        for sj, ej in intervals[i + 1 :]:
+            lo, hi = max(si, sj), min(ei, ej)
+            if lo < hi:
+                pairs.add((lo, hi))
+    merged: list[tuple[int, int]] = []
+    for lo, hi in sorted(pairs):
+        if merged and lo <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], hi))
+        else:
+            merged.append((lo, hi))
+    return merged
+
+
+@allure.story("QC-029.05 Segment Interval Index")
+class TestIntervalIndex:
+    """Tests for IntervalIndex queries."""
+
+    @allure.title("Stab, overlap and containment queries match a linear scan")
+    def test_queries_match_brute_force(self):
+        rng = random.Random(7)
+        for _ in range(200):
+            intervals = []
+            for _ in range(rng.randint(0, 40)):
+                start = rng.randint(0, 100)
+                intervals.append((start, start + rng.randint(0, 30)))
+            index = IntervalIndex(intervals, lambda iv: iv)
+
+            for _ in range(20):
+                a = rng.randint(-5, 130)
+                b = a + rng.randint(0, 40)
+                overlapping = [iv for iv in intervals if iv[0] < b and a < iv[1]]
+                result = index.overlapping(a, b)
+                assert sorted(result) == sorted(overlapping)
+                assert [iv[0] for iv in result] == sorted(iv[0] for iv in result)
+                assert index.any_overlapping(a, b) == bool(overlapping)
+                assert sorted(index.stab(a)) == sorted(
+                    iv for iv in intervals if iv[0] <= a < iv[1]
+                )
+                assert sorted(index.within(a, b)) == sorted(
+                    iv for iv in overlapping if iv[0] >= a and iv[1] <= b
+                )
+
+            assert index.overlap_regions() == _brute_regions(intervals)
+
+    @allure.title("Intervals are half-open and empty ones never overlap")
+    def test_boundaries(self):
+        index = IntervalIndex([(10, 20), (20, 30), (25, 25)], lambda iv: iv)
+
+        assert index.stab(20) == [(20, 30)]
+        assert index.stab(9) == []
+        assert index.overlapping(0, 10) == []
+        assert index.overlap_regions() == []
+        assert len(index) == 3
+
+    @allure.title("Derived indexes add and remove items")
+    def test_with_added_and_without(self):
+        index = IntervalIndex([(0, 10)], lambda iv: iv)
+
+        grown = index.with_added([(5, 15)])
+        assert grown.overlap_regions() == [(5, 10)]
+        assert grown.without(lambda iv: iv == (0, 10)).stab(5) == [(5, 15)]
+        assert len(index) == 1
+
+    @allure.title("Queries over 20k segments stay under a millisecond")
+    def test_large_transcript(self):
+        rng = random.Random(1)
+        intervals = [(i * 50, i * 50 + rng.randint(1, 400)) for i in range(20_000)]
+        index = IntervalIndex(intervals, lambda iv: iv)
+
+        started = time.perf_counter()
+        for pos in range(0, 1_000_000, 1_000):
+            index.stab(pos)
+            index.overlapping(pos, pos + 200)
+        per_query = (time.perf_counter() - started) / 2_000
+
+        assert per_query < 0.001
@@ -34,9 +34,15 @@ class SourcesContext:
 
     Provides access to:
     - SourceRepository: CRUD for source files
+    - FulltextIndex: Ranked search over source text, segments and memos
+    - ContentProvider: Cached range/length reads of source text
+    - MetadataCache: Image/media metadata per file, kept in the project DB
     """
 
     source_repo: SourceRepositoryProtocol
+    fulltext_index: Any = None  # SQLiteFulltextIndex
+    content_provider: Any = None  # SourceContentProvider
+    metadata_cache: Any = None  # SQLiteMetadataCache
 
     @classmethod
     def create(
@@ -46,12 +52,29 @@ class SourcesContext:
         """Create a SourcesContext with all repositories."""
         if connection is None:
             raise ValueError("Connection required")
+        from src.contexts.projects.infra.settings_repository import (
+            SQLiteProjectSettingsRepository,
+        )
+        from src.contexts.sources.infra.fulltext_index import SQLiteFulltextIndex
+        from src.contexts.sources.infra.metadata_cache import SQLiteMetadataCache
         from src.contexts.sources.infra.source_repository import (
             SQLiteSourceRepository,
         )
+        from src.contexts.sources.infra.source_text import SourceContentProvider
+        from src.contexts.sources.infra.text_compression import (
+            TEXT_CODEC_SETTING,
+            codec_from_setting,
+        )
 
+        codec = SQLiteProjectSettingsRepository(connection).get(TEXT_CODEC_SETTING)
+        source_repo = SQLiteSourceRepository(
+            connection, text_codec=codec_from_setting(codec)
+        )
         return cls(
-            source_repo=SQLiteSourceRepository(connection),
+            source_repo=source_repo,
+            fulltext_index=SQLiteFulltextIndex(connection),
+            content_provider=SourceContentProvider(source_repo),
+            metadata_cache=SQLiteMetadataCache(connection),
         )
 
 
@@ -116,11 +139,13 @@ class CodingContext:
     - CodeRepository: CRUD for codes
     - CategoryRepository: CRUD for code categories
     - SegmentRepository: CRUD for coded text segments
+    - Codebook: In-memory codes, categories and segment counts
     """
 
     code_repo: CodeRepositoryProtocol
     category_repo: CategoryRepositoryProtocol
     segment_repo: SegmentRepositoryProtocol
+    codebook: Any = None  # CodebookReadModel
 
     @classmethod
     def create(
@@ -130,16 +155,29 @@ class CodingContext:
         """Create a CodingContext with all repositories."""
         if connection is None:
             raise ValueError("Connection required")
+        from src.contexts.coding.infra.codebook_read_model import (
+            CodebookReadModel,
+        )
+        from src.contexts.coding.infra.codebook_version import codebook_version
         from src.contexts.coding.infra.repositories import (
             SQLiteCategoryRepository,
             SQLiteCodeRepository,
             SQLiteSegmentRepository,
         )
 
+        code_repo = SQLiteCodeRepository(connection)
+        category_repo = SQLiteCategoryRepository(connection)
+        segment_repo = SQLiteSegmentRepository(connection)
         return cls(
-            code_repo=SQLiteCodeRepository(connection),
-            category_repo=SQLiteCategoryRepository(connection),
-            segment_repo=SQLiteSegmentRepository(connection),
+            code_repo=code_repo,
+            category_repo=category_repo,
+            segment_repo=segment_repo,
+            codebook=CodebookReadModel(
+                code_repo,
+                category_repo,
+                segment_repo,
+                version=lambda: codebook_version(connection),
+            ),
         )
 
 
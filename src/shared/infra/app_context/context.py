@@ -86,6 +86,9 @@ class AppContext:
     # VCS auto-commit listener (enabled per-project)
     _vcs_listener: Any = field(default=None, init=False, repr=False)
 
+    # Snapshot-restore subscription of the source repository (per-project)
+    _restore_subscription: Any = field(default=None, init=False, repr=False)
+
     # Bounded contexts (None when no project is open)
     sources_context: SourcesContext | None = None
     cases_context: CasesContext | None = None
@@ -276,6 +279,19 @@ class AppContext:
             project_path=project_path,
         )
 
+        # Drop cached source texts when sources change
+        self.sources_context.content_provider.cache.enable(self.event_bus)
+
+        # A restored snapshot replaces every stored text and its chunk layout
+        source_repo = self.sources_context.source_repo
+        self._restore_subscription = self.event_bus.subscribe(
+            "projects.snapshot_restored",
+            lambda _event: source_repo.clear_layout_cache(),
+        )
+
+        # Load the codebook once and keep it current from coding events
+        self.coding_context.codebook.enable(self.event_bus)
+
         # Enable VCS auto-commit listener if adapters are available
         if (
             self.projects_context
@@ -317,6 +333,16 @@ class AppContext:
             self._vcs_listener = None
             logger.debug("VCS auto-commit listener disabled")
 
+        if self._restore_subscription is not None:
+            self._restore_subscription.cancel()
+            self._restore_subscription = None
+
+        if self.sources_context and self.sources_context.content_provider:
+            self.sources_context.content_provider.cache.disable()
+
+        if self.coding_context and self.coding_context.codebook:
+            self.coding_context.codebook.disable()
+
         self.sources_context = None
         self.cases_context = None
         self.coding_context = None
@@ -130,6 +130,8 @@ class EventBus:
         self,
         event_type: str,
         handler: Handler,
+        *,
+        first: bool = False,
     ) -> Subscription:
         """
         Subscribe to events of a specific type.
@@ -137,6 +139,8 @@ class EventBus:
         Args:
             event_type: Event type string (e.g., "coding.code_created")
             handler: Callback function to invoke
+            first: Run before handlers already subscribed (read models that
+                other subscribers query while handling the same event)
 
         Returns:
             Subscription handle for cancellation
@@ -146,7 +150,10 @@ class EventBus:
                 self._handlers[event_type] = []
 
             if handler not in self._handlers[event_type]:
-                self._handlers[event_type].append(handler)
+                if first:
+                    self._handlers[event_type].insert(0, handler)
+                else:
+                    self._handlers[event_type].append(handler)
 
         logger.debug(
             "Subscribed to %s (%s)",
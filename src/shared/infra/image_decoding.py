@@ -0,0 +1,60 @@
+"""
+Reduced Image Decoding
+
+A 40-megapixel photo takes seconds and over a hundred megabytes to decode
+at full resolution, yet is mostly shown a few hundred pixels wide. This
+module decodes images at reduced resolution:
+
+- JPEG is decoded at 1/2, 1/4 or 1/8 scale by the decoder itself
+  (``Image.draft``), without ever holding the full-size pixels
+- Other formats are reduced by an integer factor (``Image.reduce``), then
+  resampled to the requested size
+
+Used by the image viewer and by the sources thumbnail cache.
+
+Usage:
+    image = decode_reduced(Path("field_photo.jpg"), (1280, 800))
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from PIL import Image
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def decode_reduced(path: str | Path, max_size: tuple[int, int]) -> Image.Image:
+    """
+    Decode an image at no more than ``max_size`` (width, height).
+
+    The aspect ratio is kept and images already small enough are decoded
+    as they are. The result is loaded, in L, LA, RGB or RGBA mode, and the
+    file is closed.
+
+    Raises:
+        OSError: If the file cannot be read or is not an image
+    """
+    with Image.open(path) as image:
+        width, height = image.size
+        scale = min(max_size[0] / width, max_size[1] / height, 1.0)
+        target = (max(1, round(width * scale)), max(1, round(height * scale)))
+        # JPEG: let the decoder skip detail (DCT scaling); no-op otherwise
+        image.draft("RGB", target)
+        image = _displayable(image)
+        factor = min(image.width // target[0], image.height // target[1])
+        reduced = image.reduce(factor) if factor >= 2 else image.copy()
+        if reduced.size != target:
+            reduced = reduced.resize(target, Image.Resampling.LANCZOS)
+        return reduced
+
+
+def _displayable(image: Image.Image) -> Image.Image:
+    """The image in a mode that can be averaged and shown (L, LA, RGB, RGBA)."""
+    if image.mode in ("L", "LA", "RGB", "RGBA"):
+        return image
+    if image.mode == "P" and "transparency" in image.info:
+        return image.convert("RGBA")
+    return image.convert("RGB")
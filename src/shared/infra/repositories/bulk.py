@@ -0,0 +1,79 @@
+"""
+Bulk write helpers shared by the SQLAlchemy Core repositories.
+
+Repositories expose ``save_many`` / ``delete_many`` on top of these so that
+imports and batch commands write N rows in one executemany round-trip
+instead of N existence probes followed by N INSERT/UPDATE statements.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import delete
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+if TYPE_CHECKING:
+    from sqlalchemy import Column, Connection, Table
+
+# Stay well below SQLITE_MAX_VARIABLE_NUMBER (999 on older builds)
+DELETE_CHUNK_SIZE = 500
+
+
+def upsert_many(
+    connection: Connection,
+    table: Table,
+    rows: Sequence[Mapping[str, Any]],
+    key: str,
+    update_columns: Iterable[str],
+    update_values: Mapping[str, Any] | None = None,
+) -> int:
+    """
+    Insert rows, updating existing ones, in a single executemany statement.
+
+    Uses ``INSERT ... ON CONFLICT(key) DO UPDATE`` so no existence probe is
+    needed. Columns not listed in ``update_columns`` (e.g. creation dates)
+    keep their stored value when the row already exists.
+
+    Args:
+        connection: Connection or Session to execute on
+        table: Target table
+        rows: Column values per row; every row must have the same keys
+        key: Primary key column used as the conflict target
+        update_columns: Columns copied from the incoming row on conflict
+        update_values: Fixed values applied on conflict (e.g. updated_at)
+
+    Returns:
+        Number of rows written
+    """
+    if not rows:
+        return 0
+    stmt = sqlite_insert(table)
+    set_: dict[str, Any] = {col: stmt.excluded[col] for col in update_columns}
+    set_.update(update_values or {})
+    stmt = stmt.on_conflict_do_update(index_elements=[table.c[key]], set_=set_)
+    connection.execute(stmt, list(rows))
+    return len(rows)
+
+
+def delete_many(connection: Connection, column: Column, ids: Iterable[Any]) -> int:
+    """
+    Delete all rows whose ``column`` value is in ``ids``.
+
+    Runs one ``DELETE ... WHERE column IN (...)`` per chunk of ids.
+
+    Returns:
+        Number of rows deleted
+    """
+    deleted = 0
+    for chunk in chunked(list(dict.fromkeys(ids)), DELETE_CHUNK_SIZE):
+        result = connection.execute(delete(column.table).where(column.in_(chunk)))
+        deleted += result.rowcount or 0
+    return deleted
+
+
+def chunked(items: Sequence[Any], size: int) -> Iterator[Sequence[Any]]:
+    """Yield successive slices of at most ``size`` items."""
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
@@ -10,9 +10,16 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Protocol, runtime_checkable
 
 if TYPE_CHECKING:
-    from src.contexts.cases.core.entities import Case, CaseAttribute
+    from collections.abc import Iterable, Iterator, Sequence
+
+    from src.contexts.cases.core.entities import (
+        Case,
+        CaseAttribute,
+        CaseFilter,
+        CasePage,
+    )
     from src.contexts.coding.core.entities import Category, Code, TextSegment
-    from src.contexts.sources.core.entities import Folder, Source
+    from src.contexts.sources.core.entities import Folder, Source, SourceSummary
     from src.shared.common.types import (
         CaseId,
         CategoryId,
@@ -51,6 +58,14 @@ class CodeRepositoryProtocol(Protocol):
         """Delete a code by ID."""
         ...
 
+    def save_many(self, codes: Sequence[Code]) -> int:
+        """Insert or update several codes in one statement."""
+        ...
+
+    def delete_many(self, code_ids: Iterable[CodeId]) -> int:
+        """Delete several codes by ID."""
+        ...
+
     def exists(self, code_id: CodeId) -> bool:
         """Check if a code exists."""
         ...
@@ -84,6 +99,14 @@ class CategoryRepositoryProtocol(Protocol):
         """Delete a category."""
         ...
 
+    def save_many(self, categories: Sequence[Category]) -> int:
+        """Insert or update several categories in one statement."""
+        ...
+
+    def delete_many(self, category_ids: Iterable[CategoryId]) -> int:
+        """Delete several categories by ID."""
+        ...
+
     def name_exists(self, name: str, exclude_id: CategoryId | None = None) -> bool:
         """Check if a category name is already taken."""
         ...
@@ -105,6 +128,12 @@ class SegmentRepositoryProtocol(Protocol):
         """Get all segments for a source."""
         ...
 
+    def iter_pages_by_source(
+        self, source_id: SourceId, page_size: int = ...
+    ) -> Iterator[list[TextSegment]]:
+        """Segments of a source in position order, one page at a time."""
+        ...
+
     def get_by_code(self, code_id: CodeId) -> list[TextSegment]:
         """Get all segments with a specific code."""
         ...
@@ -123,6 +152,14 @@ class SegmentRepositoryProtocol(Protocol):
         """Delete a segment by ID."""
         ...
 
+    def save_many(self, segments: Sequence[TextSegment]) -> int:
+        """Insert or update several segments in one statement."""
+        ...
+
+    def delete_many(self, segment_ids: Iterable[SegmentId]) -> int:
+        """Delete several segments by ID."""
+        ...
+
     def delete_by_code(self, code_id: CodeId) -> int:
         """Delete all segments with a code, returns count deleted."""
         ...
@@ -176,6 +213,26 @@ class SourceRepositoryProtocol(Protocol):
         """Get all sources in a folder (None for root)."""
         ...
 
+    def list_summaries(self) -> list[SourceSummary]:
+        """Get metadata for all sources without loading fulltext."""
+        ...
+
+    def get_fulltext(self, source_id: SourceId) -> str | None:
+        """Load only the text content of a source."""
+        ...
+
+    def get_text_range(self, source_id: SourceId, start: int, end: int) -> str | None:
+        """Load characters [start, end) of a source's text."""
+        ...
+
+    def get_length(self, source_id: SourceId) -> int | None:
+        """Character length of a source's text."""
+        ...
+
+    def name_exists(self, name: str, exclude_id: SourceId | None = None) -> bool:
+        """Check if a source name is already taken."""
+        ...
+
     def save(self, source: Source) -> None:
         """Save a source (insert or update)."""
         ...
@@ -184,6 +241,14 @@ class SourceRepositoryProtocol(Protocol):
         """Delete a source by ID."""
         ...
 
+    def save_many(self, sources: Sequence[Source]) -> int:
+        """Insert or update several sources in one statement."""
+        ...
+
+    def delete_many(self, source_ids: Iterable[SourceId]) -> int:
+        """Delete several sources by ID."""
+        ...
+
     def exists(self, source_id: SourceId) -> bool:
         """Check if a source exists."""
         ...
@@ -221,6 +286,14 @@ class FolderRepositoryProtocol(Protocol):
         """Delete a folder by ID."""
         ...
 
+    def save_many(self, folders: Sequence[Folder]) -> int:
+        """Insert or update several folders in one statement."""
+        ...
+
+    def delete_many(self, folder_ids: Iterable[FolderId]) -> int:
+        """Delete several folders by ID."""
+        ...
+
     def update_parent(
         self, folder_id: FolderId, new_parent_id: FolderId | None
     ) -> None:
@@ -244,6 +317,19 @@ class CaseRepositoryProtocol(Protocol):
         """Get a case by name."""
         ...
 
+    def get_by_ids(self, case_ids: Iterable[CaseId]) -> list[Case]:
+        """Get several cases by ID in one batch."""
+        ...
+
+    def list_cases(
+        self,
+        offset: int = 0,
+        limit: int | None = None,
+        case_filter: CaseFilter | None = None,
+    ) -> CasePage:
+        """Get one filtered page of cases plus the total match count."""
+        ...
+
     def save(self, case: Case) -> None:
         """Save a case (insert or update)."""
         ...
@@ -252,6 +338,18 @@ class CaseRepositoryProtocol(Protocol):
         """Delete a case by ID."""
         ...
 
+    def save_many(self, cases: Sequence[Case]) -> int:
+        """Insert or update several cases in one statement."""
+        ...
+
+    def insert_many(self, cases: Sequence[Case]) -> int:
+        """Insert several new cases with their attributes."""
+        ...
+
+    def delete_many(self, case_ids: Iterable[CaseId]) -> int:
+        """Delete several cases by ID."""
+        ...
+
     def get_cases_for_source(self, source_id: SourceId) -> list[Case]:
         """Get all cases linked to a source."""
         ...
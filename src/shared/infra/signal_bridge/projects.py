@@ -17,6 +17,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from typing import TYPE_CHECKING
 
 from PySide6.QtCore import Signal
 
@@ -46,6 +47,9 @@ from src.contexts.projects.core.vcs_events import (
 )
 from src.shared.infra.signal_bridge.base import BaseSignalBridge, EventConverter
 
+if TYPE_CHECKING:
+    from src.contexts.exchange.core.events import RefiQdaImported, RqdaImported
+
 # =============================================================================
 # Payloads - Data transferred via signals
 # =============================================================================
@@ -86,6 +90,18 @@ class SourcePayload:
     is_ai_action: bool = False
 
 
+@dataclass(frozen=True)
+class SourcesImportedPayload:
+    """Payload for sources imported in bulk from another tool (REFI-QDA, RQDA)."""
+
+    event_type: str
+    source_path: str
+    sources_created: int
+    timestamp: datetime = field(default_factory=_now)
+    session_id: str = "local"
+    is_ai_action: bool = False
+
+
 @dataclass(frozen=True)
 class NavigationPayload:
     """Payload for navigation-related signals."""
@@ -207,6 +223,17 @@ class SourceAddedConverter(EventConverter):
         )
 
 
+class SourcesImportedConverter(EventConverter):
+    """Convert a REFI-QDA or RQDA import summary to payload."""
+
+    def convert(self, event: RefiQdaImported | RqdaImported) -> SourcesImportedPayload:
+        return SourcesImportedPayload(
+            event_type="projects.sources_imported",
+            source_path=event.source_path,
+            sources_created=event.sources_created,
+        )
+
+
 class SourceRemovedConverter(EventConverter):
     """Convert SourceRemoved event to payload."""
 
@@ -384,6 +411,7 @@ class ProjectSignalBridge(BaseSignalBridge):
         source_renamed: Emitted when a source is renamed
         source_opened: Emitted when a source is opened for viewing
         source_status_changed: Emitted when a source's status changes
+        sources_imported: Emitted once when a project import adds sources
         folder_created: Emitted when a folder is created
         folder_renamed: Emitted when a folder is renamed
         folder_deleted: Emitted when a folder is deleted
@@ -412,6 +440,7 @@ class ProjectSignalBridge(BaseSignalBridge):
     source_renamed = Signal(object)
     source_opened = Signal(object)
     source_status_changed = Signal(object)
+    sources_imported = Signal(object)
 
     # Navigation signals
     screen_changed = Signal(object)
@@ -482,6 +511,16 @@ class ProjectSignalBridge(BaseSignalBridge):
             SourceStatusChangedConverter(),
             "source_status_changed",
         )
+        self.register_converter(
+            "exchange.refi_qda_imported",
+            SourcesImportedConverter(),
+            "sources_imported",
+        )
+        self.register_converter(
+            "exchange.rqda_imported",
+            SourcesImportedConverter(),
+            "sources_imported",
+        )
 
         # Navigation events
         self.register_converter(
@@ -108,6 +108,7 @@ class SourceDTO:
     origin: str | None = None
     cases: list[str] = field(default_factory=list)
     modified_at: str | None = None
+    media_info: str | None = None  # e.g. "1920 × 1080 · JPEG", "12:04 · MP3"
 
 
 @dataclass
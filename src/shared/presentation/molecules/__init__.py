@@ -14,6 +14,7 @@ Following Atomic Design methodology:
 Molecules in this module:
 - SearchBar: Search input with navigation and options
 - LineNumberGutter: Line numbers for text editors
+- WindowedFormatter: Block-wise loading and formatting of large documents
 - OverlapDetector: Detect and merge overlapping ranges
 - SelectionPopupController: Timer-based popup management
 - MemoListItem: Clickable memo preview card
@@ -24,7 +25,7 @@ Molecules in this module:
 """
 
 from .ai import AISuggestionCard, AISuggestionsPanel
-from .editor import LineNumberGutter
+from .editor import LineNumberGutter, WindowedFormatter
 from .highlighting import OverlapDetector
 from .memo import MemoListItem
 from .preview import MatchPreviewItem, MatchPreviewPanel
@@ -41,4 +42,5 @@ __all__ = [
     "OverlapDetector",
     "SearchBar",
     "SelectionPopupController",
+    "WindowedFormatter",
 ]
@@ -3,8 +3,10 @@ Editor molecules.
 
 Provides reusable editor UI components:
 - LineNumberGutter: Line number display for text editors
+- WindowedFormatter: Block-wise loading and viewport-driven formatting
 """
 
 from .line_number_gutter import LineNumberGutter
+from .windowed_formatter import WINDOWED_MIN_CHARS, WindowedFormatter
 
-__all__ = ["LineNumberGutter"]
+__all__ = ["WINDOWED_MIN_CHARS", "LineNumberGutter", "WindowedFormatter"]
@@ -0,0 +1,285 @@
+"""
+Windowed Formatter Molecule
+
+Loads a large document into a QTextEdit in blocks and formats only the
+part of it around the viewport.
+
+Formatting every coded segment of a multi-megabyte transcript up front
+takes seconds. Instead the document is split into fixed-size character
+blocks:
+
+    block_no = position // block_chars
+
+The first blocks are loaded immediately and the rest are appended from
+the event loop, so the editor is usable at once. Blocks are formatted
+(through a callback) when they come within ``margin_blocks`` of the
+viewport, and again only when they are invalidated. Positions are always
+document positions; the whole text ends up in the document, so selections
+need no translation.
+
+Documents shorter than ``min_chars`` are loaded at once and never
+formatted by the formatter (``active`` is False): callers format them as
+before.
+"""
+
+import logging
+from collections.abc import Callable
+
+from PySide6.QtCore import QObject, QPoint, QTimer, Signal
+from PySide6.QtGui import QTextCharFormat, QTextCursor
+from PySide6.QtWidgets import QTextEdit
+
+logger = logging.getLogger("qualcoder.shared.presentation.windowed_formatter")
+
+# Documents at least this long are loaded and formatted in blocks
+WINDOWED_MIN_CHARS = 200_000
+
+# Characters per block
+BLOCK_CHARS = 16_384
+
+# Blocks formatted beyond each edge of the viewport
+MARGIN_BLOCKS = 2
+
+# Blocks appended per event loop turn while loading
+LOAD_BLOCKS_PER_TICK = 8
+
+
+class WindowedFormatter(QObject):
+    """
+    Block-wise loading and viewport-driven formatting for a QTextEdit.
+
+    Example:
+        formatter = WindowedFormatter(text_edit, format_range=self._format_window)
+        formatter.load(text)          # Active for large texts
+        formatter.invalidate()        # Formats changed: redo visible blocks
+        formatter.refresh(start, end) # Redo blocks touching a range
+
+    ``format_range(start, end)`` is called with the range of one block,
+    already reset to the plain format, and applies the formats that fall
+    inside it.
+
+    Signals:
+        loaded: Emitted when the whole text is in the document
+    """
+
+    loaded = Signal()
+
+    def __init__(
+        self,
+        text_edit: QTextEdit,
+        format_range: Callable[[int, int], None],
+        min_chars: int = WINDOWED_MIN_CHARS,
+        block_chars: int = BLOCK_CHARS,
+        margin_blocks: int = MARGIN_BLOCKS,
+        parent: QObject = None,
+    ):
+        """
+        Initialize the formatter.
+
+        Args:
+            text_edit: Editor whose document is loaded and formatted
+            format_range: Applies the formats inside ``[start, end)``
+            min_chars: Shorter documents are loaded at once, unformatted
+            block_chars: Characters per block
+            margin_blocks: Blocks formatted beyond each edge of the viewport
+            parent: Parent QObject
+        """
+        super().__init__(parent)
+        self._edit = text_edit
+        self._format_range = format_range
+        self._min_chars = min_chars
+        self._block_chars = block_chars
+        self._margin_blocks = margin_blocks
+
+        self._text = ""
+        self._active = False
+        self._loaded_chars = 0
+        self._formatted: set[int] = set()
+
+        self._load_timer = QTimer(self)
+        self._load_timer.setInterval(0)
+        self._load_timer.timeout.connect(self._load_next)
+
+        # Coalesce scroll events into one formatting pass per event loop turn
+        self._format_timer = QTimer(self)
+        self._format_timer.setSingleShot(True)
+        self._format_timer.setInterval(0)
+        self._format_timer.timeout.connect(self.format_visible)
+
+        scrollbar = self._edit.verticalScrollBar()
+        scrollbar.valueChanged.connect(self._schedule)
+        scrollbar.rangeChanged.connect(self._schedule)
+
+    # =========================================================================
+    # Public API
+    # =========================================================================
+
+    @property
+    def active(self) -> bool:
+        """Whether the current document is loaded and formatted in blocks."""
+        return self._active
+
+    @property
+    def is_loading(self) -> bool:
+        """Whether blocks remain to be appended."""
+        return self._active and self._loaded_chars < len(self._text)
+
+    def load(self, text: str):
+        """
+        Show ``text`` in the editor.
+
+        Large texts get their first blocks now and the rest from the event
+        loop; shorter texts are set at once.
+        """
+        self._load_timer.stop()
+        self._formatted.clear()
+        self._text = text
+        self._active = len(text) >= self._min_chars
+        if not self._active:
+            self._loaded_chars = len(text)
+            self._edit.setPlainText(text)
+            return
+
+        document = self._edit.document()
+        document.setUndoRedoEnabled(False)
+        self._loaded_chars = min(
+            len(text), self._block_chars * (self._margin_blocks + 1)
+        )
+        self._edit.setPlainText(text[: self._loaded_chars])
+        logger.debug("load: %d chars in %d-char blocks", len(text), self._block_chars)
+        if self.is_loading:
+            self._load_timer.start()
+        else:
+            self.loaded.emit()
+        self.format_visible()
+
+    def ensure_loaded(self, position: int):
+        """Append blocks now until ``position`` is in the document."""
+        if self.is_loading and position > self._loaded_chars:
+            self._append(position - self._loaded_chars)
+
+    def ensure_formatted(self, start: int, end: int):
+        """Format the blocks touching ``[start, end)`` now (e.g. before reading formats)."""
+        if not self._active:
+            return
+        self.ensure_loaded(end)
+        self._format_blocks(self._blocks_for(start, end))
+
+    def format_visible(self):
+        """Format the blocks around the viewport that are not formatted yet."""
+        if not self._active:
+            return
+        start, end = self._visible_range()
+        margin = self._margin_blocks * self._block_chars
+        self._format_blocks(self._blocks_for(start - margin, end + margin))
+
+    def refresh(self, start: int, end: int):
+        """Re-format the already formatted blocks touching ``[start, end)``."""
+        if not self._active:
+            return
+        stale = [b for b in self._blocks_for(start, end) if b in self._formatted]
+        self._formatted.difference_update(stale)
+        self._format_blocks(stale)
+
+    def invalidate(self):
+        """
+        Formats changed everywhere: reset the formatted blocks and format
+        the visible ones again.
+        """
+        if not self._active:
+            return
+        stale = sorted(self._formatted)
+        self._formatted.clear()
+        was_blocked = self._edit.blockSignals(True)
+        try:
+            # One reset per run of consecutive blocks
+            run_start = None
+            for i, block in enumerate(stale):
+                if run_start is None:
+                    run_start = block
+                if i + 1 == len(stale) or stale[i + 1] != block + 1:
+                    self._reset(
+                        run_start * self._block_chars,
+                        min((block + 1) * self._block_chars, self._loaded_chars),
+                    )
+                    run_start = None
+        finally:
+            self._edit.blockSignals(was_blocked)
+        self.format_visible()
+
+    def formatted_blocks(self) -> int:
+        """Number of blocks formatted so far (for diagnostics and tests)."""
+        return len(self._formatted)
+
+    # =========================================================================
+    # Internal
+    # =========================================================================
+
+    def _schedule(self, *_args):
+        if self._active:
+            self._format_timer.start()
+
+    def _load_next(self):
+        self._append(self._block_chars * LOAD_BLOCKS_PER_TICK)
+
+    def _append(self, chars: int):
+        """Append at least ``chars`` more characters (whole blocks)."""
+        blocks = -(-chars // self._block_chars)
+        end = min(len(self._text), self._loaded_chars + blocks * self._block_chars)
+        cursor = QTextCursor(self._edit.document())
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        was_blocked = self._edit.blockSignals(True)
+        try:
+            cursor.insertText(self._text[self._loaded_chars : end])
+        finally:
+            self._edit.blockSignals(was_blocked)
+        self._loaded_chars = end
+        if not self.is_loading:
+            self._load_timer.stop()
+            logger.debug("load: complete (%d chars)", self._loaded_chars)
+            self.loaded.emit()
+        self._schedule()
+
+    def _visible_range(self) -> tuple[int, int]:
+        """Document positions at the top-left and bottom-right of the viewport."""
+        viewport = self._edit.viewport()
+        top = self._edit.cursorForPosition(QPoint(0, 0)).position()
+        bottom = self._edit.cursorForPosition(
+            QPoint(viewport.width() - 1, viewport.height() - 1)
+        ).position()
+        return top, max(top, bottom) + 1
+
+    def _blocks_for(self, start: int, end: int) -> range:
+        """Blocks overlapping ``[start, end)`` that are fully loaded."""
+        start = max(start, 0)
+        end = min(end, self._loaded_chars)
+        if end <= start:
+            return range(0)
+        last = (end - 1) // self._block_chars
+        if (last + 1) * self._block_chars > self._loaded_chars and self.is_loading:
+            last -= 1  # Partly loaded: format once it is complete
+        return range(start // self._block_chars, last + 1)
+
+    def _format_blocks(self, blocks):
+        pending = [b for b in blocks if b not in self._formatted]
+        if not pending:
+            return
+        was_blocked = self._edit.blockSignals(True)
+        try:
+            for block in pending:
+                start = block * self._block_chars
+                end = min(start + self._block_chars, self._loaded_chars)
+                self._reset(start, end)
+                self._format_range(start, end)
+                self._formatted.add(block)
+        finally:
+            self._edit.blockSignals(was_blocked)
+
+    def _reset(self, start: int, end: int):
+        """Clear formatting in ``[start, end)``."""
+        if end <= start:
+            return
+        cursor = QTextCursor(self._edit.document())
+        cursor.setPosition(start, QTextCursor.MoveMode.MoveAnchor)
+        cursor.setPosition(end, QTextCursor.MoveMode.KeepAnchor)
+        cursor.setCharFormat(QTextCharFormat())
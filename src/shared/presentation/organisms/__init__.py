@@ -32,7 +32,7 @@ from .details_panel import DetailsPanel
 from .file_manager_toolbar import EmptyState, FileManagerToolbar
 from .files_panel import FilesPanel
 from .folder_tree import FolderNode, FolderTree
-from .image_viewer import ImageMetadata, ImageViewer
+from .image_viewer import ImageMetadata, ImageViewer, ThumbnailProvider
 from .media_player import MediaPlayer
 from .source_stats_row import SourceStatCard, SourceStatsRow
 from .source_table import BulkActionsBar, SourceTable
@@ -71,6 +71,7 @@ __all__ = [
     "FolderTree",
     # Media viewers
     "ImageViewer",
+    "ThumbnailProvider",
     "ImageMetadata",
     "MediaPlayer",
     # Text highlighting
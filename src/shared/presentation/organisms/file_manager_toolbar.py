@@ -30,6 +30,7 @@ class FileManagerToolbar(QFrame):
 
     Signals:
         import_clicked: User wants to import source files
+        import_folder_clicked: User wants to import a folder tree
         link_clicked: User wants to link external files
         create_text_clicked: User wants to create a new text document
         export_clicked: User wants to export selected source files
@@ -44,6 +45,7 @@ class FileManagerToolbar(QFrame):
     """
 
     import_clicked = Signal()
+    import_folder_clicked = Signal()
     link_clicked = Signal()
     create_text_clicked = Signal()
     export_clicked = Signal()
@@ -89,6 +91,7 @@ class FileManagerToolbar(QFrame):
         )
         self._import_menu = QMenu(self._import_btn)
         self._import_menu.addAction("Source Files...", self.import_clicked.emit)
+        self._import_menu.addAction("Folder...", self.import_folder_clicked.emit)
         self._import_from_s3_action = self._import_menu.addAction(
             "From S3 Data Store...", self.import_from_s3_clicked.emit
         )
@@ -8,17 +8,32 @@ Implements QC-027.03 Import Image Files:
 Also supports QC-027.04 for image metadata display.
 
 Uses Pillow for image loading (better format support and metadata).
+
+Large photos are decoded at full resolution only once zoomed in to at
+least half their size:
+- Fit-to-window and zoom levels up to the preview's resolution draw a
+  preview decoded at reduced resolution (see decode_reduced)
+- Higher zoom levels draw tiles of the visible area only, cut on demand
+  from the image decoded at a power-of-two reduction and kept in a small
+  LRU cache; the decoded image is dropped when the factor changes or the
+  viewer returns to the preview
+- With a thumbnail cache, a cached thumbnail is shown at once and the
+  preview is decoded from the event loop
 """
 
 from __future__ import annotations
 
+import contextlib
+import math
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Protocol
 
 from PIL import Image
 from PIL.ExifTags import TAGS
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QImage, QPixmap, QWheelEvent
+from PySide6.QtCore import QRectF, QSize, Qt, QTimer, Signal
+from PySide6.QtGui import QImage, QPainter, QPixmap, QWheelEvent
 from PySide6.QtWidgets import (
     QFrame,
     QHBoxLayout,
@@ -37,6 +52,28 @@ from design_system import (
     get_colors,
     get_qicon,
 )
+from src.shared.infra.image_decoding import decode_reduced
+
+# Preview decoded for fit-to-window: at least this long on its longest side
+PREVIEW_MIN_SIZE = 1024
+
+# Tile edge in pixels of the reduced image the tile is cut from
+TILE_SIZE = 512
+
+# Decoded tiles kept for repainting and panning back
+TILE_CACHE_SIZE = 64
+
+
+class ThumbnailProvider(Protocol):
+    """Thumbnails of image files (e.g. the sources ThumbnailCache)."""
+
+    def get(self, path: str | Path) -> Path | None:
+        """Thumbnail of the image as it is now, or None if not cached."""
+        ...
+
+    def get_or_create(self, path: str | Path) -> Path:
+        """Thumbnail of the image, decoding and storing it if not cached."""
+        ...
 
 
 @dataclass(frozen=True)
@@ -60,6 +97,7 @@ class ImageViewer(QWidget):
     - Zoom in/out with mouse wheel
     - Pan with click and drag
     - Image metadata display
+    - Reduced-resolution preview and on-demand tiles for large images
 
     Signals:
         image_loaded(str): Emitted when an image is successfully loaded
@@ -76,14 +114,28 @@ class ImageViewer(QWidget):
     def __init__(
         self,
         colors: ColorPalette | None = None,
+        thumbnail_cache: ThumbnailProvider | None = None,
         parent=None,
     ):
         super().__init__(parent)
         self._colors = colors or get_colors()
+        self._thumbnail_cache = thumbnail_cache
         self._current_path: Path | None = None
         self._zoom_level = 1.0
         self._fit_mode = True  # True = fit to window, False = actual size
 
+        # Full image size; preview pixmap and its scale relative to it
+        self._image_size: QSize | None = None
+        self._preview: QPixmap | None = None
+        self._preview_scale = 0.0
+        # (factor, image reduced by it), decoded the first time a tile needs it
+        self._decoded: tuple[int, Image.Image] | None = None
+        self._tiles: OrderedDict[tuple[int, int, int], QPixmap] = OrderedDict()
+
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.timeout.connect(self._load_preview)
+
         self._setup_ui()
         self._connect_signals()
 
@@ -170,7 +222,6 @@ class ImageViewer(QWidget):
     def _setup_image_area(self, parent_layout: QVBoxLayout):
         """Create the scrollable image display area."""
         self._scroll_area = QScrollArea()
-        self._scroll_area.setWidgetResizable(True)
         self._scroll_area.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self._scroll_area.setStyleSheet(f"""
             QScrollArea {{
@@ -195,16 +246,12 @@ class ImageViewer(QWidget):
             }}
         """)
 
-        # Image label
-        self._image_label = QLabel()
-        self._image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self._image_label.setStyleSheet("""
-            QLabel {
-                background-color: transparent;
-            }
-        """)
+        # Image canvas, sized to the image at the current zoom level
+        self._scroll_area.setWidgetResizable(False)
+        self._canvas = _ImageCanvas(self)
+        self._canvas.setStyleSheet("background-color: transparent;")
 
-        self._scroll_area.setWidget(self._image_label)
+        self._scroll_area.setWidget(self._canvas)
         parent_layout.addWidget(self._scroll_area, 1)
 
     def _setup_info_bar(self, parent_layout: QVBoxLayout):
@@ -265,6 +312,9 @@ class ImageViewer(QWidget):
         """
         Load and display an image file using Pillow.
 
+        Only the header is read here; pixels are decoded at the resolution
+        the display needs.
+
         Args:
             path: Path to the image file
         """
@@ -274,26 +324,32 @@ class ImageViewer(QWidget):
             return
 
         try:
-            # Load with Pillow for better format support
-            pil_image = Image.open(path)
-
-            # Extract metadata before conversion
-            self._metadata = self._extract_metadata(pil_image, path)
-
-            # Convert to QPixmap
-            pixmap = self._pil_to_pixmap(pil_image)
-            if pixmap.isNull():
-                self.load_failed.emit(f"Failed to convert image: {path}")
-                return
-
+            # Open with Pillow for better format support; reads the header only
+            with Image.open(path) as pil_image:
+                metadata = self._extract_metadata(pil_image, path)
         except Exception as e:
             self.load_failed.emit(f"Failed to load image: {e}")
             return
 
+        self._reset_image()
+        self._metadata = metadata
         self._current_path = path
-        self._original_pixmap = pixmap
+        self._image_size = QSize(metadata.width, metadata.height)
         self._zoom_level = 1.0
 
+        thumbnail = self._thumbnail_cache.get(path) if self._thumbnail_cache else None
+        if thumbnail is not None:
+            # Show the cached thumbnail now, sharpen from the event loop
+            self._set_preview(QPixmap(str(thumbnail)))
+            self._preview_timer.start(0)
+        elif not self._load_preview():
+            self.load_failed.emit(f"Failed to convert image: {path}")
+            self._reset_image()
+            return
+        elif self._thumbnail_cache is not None:
+            with contextlib.suppress(OSError):
+                self._thumbnail_cache.get_or_create(path)
+
         if self._fit_mode:
             self._fit_to_window()
         else:
@@ -308,26 +364,28 @@ class ImageViewer(QWidget):
         # Convert to RGB/RGBA for Qt compatibility
         if pil_image.mode == "RGBA":
             qimage_format = QImage.Format.Format_RGBA8888
+            bytes_per_pixel = 4
         elif pil_image.mode == "RGB":
             qimage_format = QImage.Format.Format_RGB888
+            bytes_per_pixel = 3
         else:
             # Convert other modes to RGB
             pil_image = pil_image.convert("RGB")
             qimage_format = QImage.Format.Format_RGB888
+            bytes_per_pixel = 3
 
         # Get image data
         data = pil_image.tobytes("raw", pil_image.mode)
 
-        # Create QImage
+        # QImage wraps data without copying; fromImage makes the one copy
         qimage = QImage(
             data,
             pil_image.width,
             pil_image.height,
+            pil_image.width * bytes_per_pixel,
             qimage_format,
         )
-
-        # QImage doesn't copy data, so we need to copy it
-        return QPixmap.fromImage(qimage.copy())
+        return QPixmap.fromImage(qimage)
 
     def _extract_metadata(self, pil_image: Image.Image, path: Path) -> ImageMetadata:
         """Extract metadata from a PIL Image."""
@@ -361,7 +419,7 @@ class ImageViewer(QWidget):
 
     def clear(self):
         """Clear the current image."""
-        self._image_label.clear()
+        self._reset_image()
         self._current_path = None
         self._metadata = None
         self._info_label.setText("No image loaded")
@@ -390,46 +448,177 @@ class ImageViewer(QWidget):
         """Zoom out by 25% (public API)."""
         self._on_zoom_out()
 
+    def set_thumbnail_cache(self, cache: ThumbnailProvider | None):
+        """Show cached thumbnails first when loading images."""
+        self._thumbnail_cache = cache
+
+    def is_tiled(self) -> bool:
+        """Whether the current zoom level is drawn from tiles, not the preview."""
+        return self._image_size is not None and self._zoom_level > self._preview_scale
+
     # Internal methods
 
     def _fit_to_window(self):
         """Scale image to fit the viewport."""
-        if not hasattr(self, "_original_pixmap"):
+        if self._image_size is None:
             return
 
         viewport_size = self._scroll_area.viewport().size()
-        scaled = self._original_pixmap.scaled(
-            viewport_size,
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation,
+        fitted = self._image_size.scaled(
+            viewport_size, Qt.AspectRatioMode.KeepAspectRatio
         )
-        self._image_label.setPixmap(scaled)
-        self._zoom_level = scaled.width() / self._original_pixmap.width()
-        self._update_zoom_label()
+        if (
+            fitted.width() > self._preview_width()
+            and self._preview_scale < 1.0
+            and not self._preview_timer.isActive()
+        ):
+            self._load_preview()
+        self._zoom_level = fitted.width() / self._image_size.width()
+        self._apply_zoom()
 
     def _show_actual_size(self):
         """Show image at actual size (100%)."""
-        if not hasattr(self, "_original_pixmap"):
+        if self._image_size is None:
             return
 
-        self._image_label.setPixmap(self._original_pixmap)
         self._zoom_level = 1.0
-        self._update_zoom_label()
+        self._apply_zoom()
 
     def _apply_zoom(self):
         """Apply the current zoom level."""
-        if not hasattr(self, "_original_pixmap"):
+        if self._image_size is None:
             return
 
-        new_size = self._original_pixmap.size() * self._zoom_level
-        scaled = self._original_pixmap.scaled(
-            new_size,
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation,
+        self._canvas.resize(
+            max(1, round(self._image_size.width() * self._zoom_level)),
+            max(1, round(self._image_size.height() * self._zoom_level)),
         )
-        self._image_label.setPixmap(scaled)
+        if not self.is_tiled():
+            self._release_decoded()  # Tiles already cut stay cached
+        self._canvas.update()
         self._update_zoom_label()
 
+    def _load_preview(self) -> bool:
+        """Decode the preview at (at least) viewport size. Returns success."""
+        if self._current_path is None or self._image_size is None:
+            return False
+        viewport = self._scroll_area.viewport().size()
+        side = max(PREVIEW_MIN_SIZE, viewport.width(), viewport.height())
+        try:
+            preview = self._pil_to_pixmap(
+                decode_reduced(self._current_path, (side, side))
+            )
+        except Exception:
+            return False
+        if preview.isNull():
+            return False
+        self._set_preview(preview)
+        self._canvas.update()
+        return True
+
+    def _set_preview(self, pixmap: QPixmap):
+        self._preview = pixmap
+        self._preview_scale = pixmap.width() / self._image_size.width()
+
+    def _preview_width(self) -> int:
+        return self._preview.width() if self._preview is not None else 0
+
+    def _reset_image(self):
+        """Drop every decoded form of the current image."""
+        self._preview_timer.stop()
+        self._image_size = None
+        self._preview = None
+        self._preview_scale = 0.0
+        self._release_decoded()
+        self._tiles.clear()
+        self._canvas.resize(0, 0)
+        self._canvas.update()
+
+    def _paint(self, painter: QPainter, exposed: QRectF):
+        """Draw the exposed part of the canvas at the current zoom level."""
+        if self._image_size is None or self._preview is None:
+            return
+        zoom = self._zoom_level
+        if not self.is_tiled():
+            painter.drawPixmap(
+                QRectF(self._canvas.rect()),
+                self._preview,
+                QRectF(self._preview.rect()),
+            )
+            return
+
+        # Tiles are cut from the image reduced by the largest power of two
+        # that still has at least one image pixel per screen pixel
+        factor = 2 ** max(0, math.floor(math.log2(1 / zoom))) if zoom < 1 else 1
+        span = TILE_SIZE * factor  # Full-resolution pixels per tile edge
+        columns = math.ceil(self._image_size.width() / span)
+        rows = math.ceil(self._image_size.height() / span)
+        first_col = max(0, int(exposed.left() / zoom) // span)
+        last_col = min(columns - 1, int(exposed.right() / zoom) // span)
+        first_row = max(0, int(exposed.top() / zoom) // span)
+        last_row = min(rows - 1, int(exposed.bottom() / zoom) // span)
+
+        for row in range(first_row, last_row + 1):
+            for col in range(first_col, last_col + 1):
+                tile = self._tile(factor, col, row)
+                if tile is None:
+                    return
+                painter.drawPixmap(
+                    QRectF(
+                        col * span * zoom,
+                        row * span * zoom,
+                        tile.width() * factor * zoom,
+                        tile.height() * factor * zoom,
+                    ),
+                    tile,
+                    QRectF(tile.rect()),
+                )
+
+    def _tile(self, factor: int, col: int, row: int) -> QPixmap | None:
+        """Tile (col, row) of the image reduced by ``factor``, decoded on demand."""
+        key = (factor, col, row)
+        tile = self._tiles.get(key)
+        if tile is not None:
+            self._tiles.move_to_end(key)
+            return tile
+
+        image = self._decoded_at(factor)
+        if image is None:
+            return None
+        box = (
+            col * TILE_SIZE,
+            row * TILE_SIZE,
+            min(image.width, (col + 1) * TILE_SIZE),
+            min(image.height, (row + 1) * TILE_SIZE),
+        )
+        tile = self._pil_to_pixmap(image.crop(box))
+
+        self._tiles[key] = tile
+        if len(self._tiles) > TILE_CACHE_SIZE:
+            self._tiles.popitem(last=False)
+        return tile
+
+    def _decoded_at(self, factor: int) -> Image.Image | None:
+        """The image reduced by ``factor``, replacing one decoded at another."""
+        if self._decoded is not None and self._decoded[0] == factor:
+            return self._decoded[1]
+        self._release_decoded()
+        size = (
+            math.ceil(self._image_size.width() / factor),
+            math.ceil(self._image_size.height() / factor),
+        )
+        try:
+            image = decode_reduced(self._current_path, size)
+        except Exception:
+            return None
+        self._decoded = (factor, image)
+        return image
+
+    def _release_decoded(self):
+        if self._decoded is not None:
+            self._decoded[1].close()
+        self._decoded = None
+
     def _update_zoom_label(self):
         """Update the zoom level display."""
         percent = int(self._zoom_level * 100)
@@ -511,5 +700,19 @@ class ImageViewer(QWidget):
     def resizeEvent(self, event):
         """Handle resize to refit image if in fit mode."""
         super().resizeEvent(event)
-        if self._fit_mode and hasattr(self, "_original_pixmap"):
+        if self._fit_mode and self._image_size is not None:
             self._fit_to_window()
+
+
+class _ImageCanvas(QWidget):
+    """Scroll area widget that paints the viewer's image (preview or tiles)."""
+
+    def __init__(self, viewer: ImageViewer):
+        super().__init__()
+        self._viewer = viewer
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        self._viewer._paint(painter, QRectF(event.rect()))
+        painter.end()
@@ -44,6 +44,7 @@ class SourceTableRow(QWidget):
         file_size: int,
         colors: ColorPalette = None,
         parent=None,
+        media_info: str | None = None,
     ):
         super().__init__(parent)
         self._colors = colors or get_colors()
@@ -91,6 +92,8 @@ class SourceTableRow(QWidget):
         info_layout.addWidget(name_label)
 
         size_text = self._format_size(file_size)
+        if media_info:
+            size_text = f"{size_text} · {media_info}"
         size_label = QLabel(size_text)
         size_label.setStyleSheet(f"""
             color: {self._colors.text_secondary};
@@ -464,6 +467,7 @@ class SourceTable(QFrame):
             source_type=source.source_type,
             file_size=source.file_size,
             colors=self._colors,
+            media_info=source.media_info,
         )
         self._table.setCellWidget(row, self.COL_NAME, name_widget)
 
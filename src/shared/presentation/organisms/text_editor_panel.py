@@ -22,9 +22,19 @@ Implements QC-007.09 Search in Text:
 - AC #6: Regex search support
 - AC #7: Clear search removes highlights
 - AC #8: Match counter shows current/total
+
+Large documents (WindowedFormatter.min_chars and up) are loaded in blocks,
+and highlights are applied only to the blocks around the viewport, found
+through an interval index; further blocks are formatted as the user
+scrolls. Positions stay document positions throughout.
+
+Coded segments can be added, removed and recolored one at a time
+(add_segment, remove_segment, recolor_code); each repaints only the
+characters of the segment, recomputing overlap underlines locally.
 """
 
 import re
+from bisect import bisect_left
 from dataclasses import dataclass, field
 
 from PySide6.QtCore import Signal
@@ -52,12 +62,16 @@ from design_system import (
     TextColor,
     get_colors,
 )
+from src.shared.common.interval_index import IntervalIndex
 
 # Telemetry
 from src.shared.infra.telemetry import SpanContext, traced
 
 # Import molecules
-from src.shared.presentation.molecules.editor import LineNumberGutter
+from src.shared.presentation.molecules.editor import (
+    LineNumberGutter,
+    WindowedFormatter,
+)
 from src.shared.presentation.molecules.highlighting import OverlapDetector
 from src.shared.presentation.molecules.selection import SelectionPopupController
 
@@ -73,6 +87,11 @@ class HighlightRange:
     metadata: dict = field(default_factory=dict)
 
 
+def _segment_metadata(segment: dict) -> dict:
+    """Segment identity kept on a highlight for incremental updates."""
+    return {key: segment[key] for key in ("id", "code_id") if key in segment}
+
+
 class TextEditorPanel(QFrame):
     """
     Panel for displaying and coding text content.
@@ -126,6 +145,7 @@ class TextEditorPanel(QFrame):
         self._colors = colors or get_colors()
         self._show_line_numbers = show_line_numbers
         self._highlights: list[HighlightRange] = []
+        self._highlight_index: IntervalIndex[HighlightRange] | None = None
         self._text = ""
 
         # Search state (QC-007.09)
@@ -188,6 +208,12 @@ class TextEditorPanel(QFrame):
         self._text_edit.selectionChanged.connect(self._on_selection_changed)
         self._text_edit.textChanged.connect(self._on_text_changed)
 
+        # Block-wise loading and formatting for large documents
+        self._formatter = WindowedFormatter(
+            self._text_edit, self._format_window, parent=self
+        )
+        self._formatter.loaded.connect(self._update_line_numbers)
+
         content_layout.addWidget(self._text_edit, 1)
         main_layout.addWidget(content_frame, 1)
 
@@ -274,14 +300,26 @@ class TextEditorPanel(QFrame):
         """
         self._title_label.setText(title)
         self._text = text
-        self._text_edit.setPlainText(text)
         self._highlights.clear()
+        self._highlight_index = None
+        self._formatter.load(text)
         self._update_line_numbers()
 
     def get_text(self) -> str:
         """Get the current text content."""
+        if self._formatter.active:
+            return self._text  # The document may still be loading
         return self._text_edit.toPlainText()
 
+    def is_windowed(self) -> bool:
+        """Whether the document is large enough to be formatted in blocks."""
+        return self._formatter.active
+
+    def _text_length(self) -> int:
+        if self._formatter.active:
+            return len(self._text)
+        return len(self._text_edit.toPlainText())
+
     def set_stats(self, stats: list[tuple[str, str]]):
         """
         Update the stats display in the header.
@@ -355,7 +393,7 @@ class TextEditorPanel(QFrame):
         if start >= end or start < 0:
             return
 
-        text_len = len(self._text_edit.toPlainText())
+        text_len = self._text_length()
         if end > text_len:
             end = text_len
         if start >= text_len:
@@ -364,12 +402,11 @@ class TextEditorPanel(QFrame):
         # Store the highlight
         highlight = HighlightRange(start=start, end=end, color=color, memo=memo)
         self._highlights.append(highlight)
+        if self._highlight_index is not None:
+            self._highlight_index = self._highlight_index.with_added([highlight])
 
-        # Apply the highlight formatting
-        self._apply_highlight(highlight)
-
-        # Check and apply overlap underlines (AC #5)
-        self._apply_overlap_underlines()
+        # Repaint just this range, with local overlap underlines (AC #5)
+        self._repaint_range(start, end)
 
         # Emit signal
         self.highlight_applied.emit(start, end, color)
@@ -387,6 +424,10 @@ class TextEditorPanel(QFrame):
             highlights: List of dicts with keys: start, end, color, memo (optional)
         """
         with SpanContext("set_highlights", {"segment_count": len(highlights)}):
+            if self._formatter.active:
+                self._set_highlights_windowed(highlights)
+                return
+
             # Save cursor position and scroll
             cursor = self._text_edit.textCursor()
             original_pos = cursor.position()
@@ -424,11 +465,16 @@ class TextEditorPanel(QFrame):
                             end = len(text)
 
                         highlight = HighlightRange(
-                            start=start, end=end, color=color, memo=memo
+                            start=start,
+                            end=end,
+                            color=color,
+                            memo=memo,
+                            metadata=_segment_metadata(h),
                         )
                         self._highlights.append(highlight)
                         self._apply_highlight(highlight)
 
+                    self._highlight_index = None
                     apply_span.set_attribute("applied_count", len(self._highlights))
 
                 # Check overlaps only once at the end
@@ -442,8 +488,131 @@ class TextEditorPanel(QFrame):
                 if scrollbar:
                     scrollbar.setValue(scroll_pos)
 
-    def _apply_highlight(self, highlight: HighlightRange):
-        """Apply formatting for a single highlight."""
+    def _set_highlights_windowed(self, highlights: list[dict]):
+        """Store highlights and format only the blocks around the viewport."""
+        text_len = len(self._text)
+        self._highlights = [
+            HighlightRange(
+                start=h["start"],
+                end=min(h["end"], text_len),
+                color=h["color"],
+                memo=h.get("memo", ""),
+                metadata=_segment_metadata(h),
+            )
+            for h in highlights
+            if 0 <= h["start"] < h["end"] and h["start"] < text_len
+        ]
+        self._highlight_index = None
+        self._formatter.invalidate()
+
+    # =========================================================================
+    # Public API - Incremental Segment Updates
+    # =========================================================================
+
+    def add_segment(self, segment: dict):
+        """
+        Highlight one coded segment, repainting only its characters.
+
+        A highlight already placed at the same range and color by
+        highlight_range() (before the segment was saved) is adopted rather
+        than duplicated.
+
+        Args:
+            segment: Dict with keys start, end, color and optionally id,
+                code_id, memo (as passed to set_highlights)
+        """
+        start = segment["start"]
+        end = min(segment["end"], self._text_length())
+        if start < 0 or start >= end:
+            return
+
+        metadata = _segment_metadata(segment)
+        for existing in self._index().overlapping(start, end):
+            if (
+                not existing.metadata
+                and (existing.start, existing.end) == (start, end)
+                and existing.color == segment["color"]
+            ):
+                existing.metadata.update(metadata)
+                return
+
+        highlight = HighlightRange(
+            start=start,
+            end=end,
+            color=segment["color"],
+            memo=segment.get("memo", ""),
+            metadata=metadata,
+        )
+        self._highlights.append(highlight)
+        self._highlight_index = self._index().with_added([highlight])
+        self._repaint_range(start, end)
+
+    def remove_segment(self, segment_id: str | int):
+        """Remove the highlight of a coded segment, repainting only its characters."""
+        removed = [h for h in self._highlights if h.metadata.get("id") == segment_id]
+        if not removed:
+            return
+        self._highlights = [h for h in self._highlights if h not in removed]
+        self._highlight_index = self._index().without(lambda h: h in removed)
+        for highlight in removed:
+            self._repaint_range(highlight.start, highlight.end)
+
+    def recolor_code(self, code_id: str | int, color: str):
+        """Change the color of a code's highlights, repainting only those."""
+        recolored = [
+            h for h in self._highlights if h.metadata.get("code_id") == code_id
+        ]
+        for highlight in recolored:
+            highlight.color = color
+            self._repaint_range(highlight.start, highlight.end)
+
+    def _repaint_range(self, start: int, end: int):
+        """Reset and re-apply formatting in ``[start, end)`` only."""
+        if self._formatter.active:
+            self._formatter.refresh(start, end)
+            return
+        self._text_edit.blockSignals(True)
+        try:
+            cursor = self._text_edit.textCursor()
+            cursor.setPosition(start, QTextCursor.MoveMode.MoveAnchor)
+            cursor.setPosition(end, QTextCursor.MoveMode.KeepAnchor)
+            cursor.setCharFormat(QTextCharFormat())
+            self._format_window(start, end)
+        finally:
+            self._text_edit.blockSignals(False)
+
+    def _index(self) -> IntervalIndex[HighlightRange]:
+        """Interval index over the current highlights, rebuilt after changes."""
+        if self._highlight_index is None:
+            self._highlight_index = IntervalIndex(
+                self._highlights, lambda h: (h.start, h.end)
+            )
+        return self._highlight_index
+
+    def _format_window(self, start: int, end: int):
+        """Apply highlights, overlap underlines and search matches in ``[start, end)``."""
+        hits = self._index().overlapping(start, end)
+        for highlight in hits:
+            self._apply_highlight(highlight, clip=(start, end))
+
+        overlaps = IntervalIndex(hits, lambda h: (h.start, h.end)).overlap_regions()
+        for overlap_start, overlap_end in overlaps:
+            self._underline(max(overlap_start, start), min(overlap_end, end))
+
+        if self._search_matches:
+            fmt = self._search_format()
+            i = bisect_left(self._search_matches, (start, start))
+            while i > 0 and self._search_matches[i - 1][1] > start:
+                i -= 1
+            for match_start, match_end in self._search_matches[i:]:
+                if match_start >= end:
+                    break
+                self._merge_format(max(match_start, start), min(match_end, end), fmt)
+
+    def _apply_highlight(
+        self, highlight: HighlightRange, clip: tuple[int, int] | None = None
+    ):
+        """Apply formatting for a single highlight (limited to ``clip`` if given)."""
         fmt = QTextCharFormat()
 
         # Background color
@@ -461,9 +630,12 @@ class TextEditorPanel(QFrame):
             fmt.setFontWeight(QFont.Weight.Bold)
 
         # Apply to text range
+        start, end = highlight.start, highlight.end
+        if clip is not None:
+            start, end = max(start, clip[0]), min(end, clip[1])
         cursor = self._text_edit.textCursor()
-        cursor.setPosition(highlight.start, QTextCursor.MoveMode.MoveAnchor)
-        cursor.setPosition(highlight.end, QTextCursor.MoveMode.KeepAnchor)
+        cursor.setPosition(start, QTextCursor.MoveMode.MoveAnchor)
+        cursor.setPosition(end, QTextCursor.MoveMode.KeepAnchor)
         cursor.setCharFormat(fmt)
 
     def clear_highlights(self):
@@ -476,6 +648,12 @@ class TextEditorPanel(QFrame):
             return
 
         self._highlights.clear()
+        self._highlight_index = None
+
+        if self._formatter.active:
+            self._formatter.invalidate()
+            self.highlights_cleared.emit()
+            return
 
         # Remove all formatting
         text = self._text_edit.toPlainText()
@@ -506,6 +684,9 @@ class TextEditorPanel(QFrame):
         Returns:
             List of (start, end) tuples for overlapping regions
         """
+        if self._formatter.active:
+            # Sweep over the index; pairwise comparison is too slow here
+            return self._index().overlap_regions()
         overlaps = self._overlap_detector.find_overlaps(self._highlights)
         return [(r.start, r.end) for r in overlaps]
 
@@ -519,14 +700,20 @@ class TextEditorPanel(QFrame):
         overlaps = self.get_overlap_regions()
 
         for start, end in overlaps:
-            cursor = self._text_edit.textCursor()
-            cursor.setPosition(start, QTextCursor.MoveMode.MoveAnchor)
-            cursor.setPosition(end, QTextCursor.MoveMode.KeepAnchor)
+            self._underline(start, end)
+
+    def _underline(self, start: int, end: int):
+        """Underline an overlapping region."""
+        fmt = QTextCharFormat()
+        fmt.setUnderlineStyle(QTextCharFormat.UnderlineStyle.SingleUnderline)
+        fmt.setUnderlineColor(QColor(self._colors.text_on_dark))
+        self._merge_format(start, end, fmt)  # Merge to preserve background
 
-            fmt = QTextCharFormat()
-            fmt.setUnderlineStyle(QTextCharFormat.UnderlineStyle.SingleUnderline)
-            fmt.setUnderlineColor(QColor(self._colors.text_on_dark))
-            cursor.mergeCharFormat(fmt)  # Merge to preserve background
+    def _merge_format(self, start: int, end: int, fmt: QTextCharFormat):
+        cursor = self._text_edit.textCursor()
+        cursor.setPosition(start, QTextCursor.MoveMode.MoveAnchor)
+        cursor.setPosition(end, QTextCursor.MoveMode.KeepAnchor)
+        cursor.mergeCharFormat(fmt)
 
     # =========================================================================
     # Public API - Line Numbers (AC #6)
@@ -556,7 +743,7 @@ class TextEditorPanel(QFrame):
 
     def _update_line_numbers(self):
         """Update line numbers based on text content."""
-        text = self._text_edit.toPlainText()
+        text = self.get_text()
         line_count = text.count("\n") + 1 if text else 1
         self._line_numbers.set_line_count(line_count)
 
@@ -598,6 +785,7 @@ class TextEditorPanel(QFrame):
             start: Start position
             end: End position
         """
+        self._formatter.ensure_loaded(max(start, end))
         cursor = self._text_edit.textCursor()
         cursor.setPosition(start, QTextCursor.MoveMode.MoveAnchor)
         cursor.setPosition(end, QTextCursor.MoveMode.KeepAnchor)
@@ -610,6 +798,7 @@ class TextEditorPanel(QFrame):
         Args:
             position: Character position to scroll to
         """
+        self._formatter.ensure_loaded(position)
         cursor = self._text_edit.textCursor()
         cursor.setPosition(position)
         self._text_edit.setTextCursor(cursor)
@@ -631,9 +820,9 @@ class TextEditorPanel(QFrame):
         Returns:
             QTextCharFormat at the position or None if invalid
         """
-        text = self._text_edit.toPlainText()
-        if position < 0 or position >= len(text):
+        if position < 0 or position >= self._text_length():
             return None
+        self._formatter.ensure_formatted(position, position + 1)
 
         cursor = self._text_edit.textCursor()
         cursor.setPosition(position)
@@ -753,7 +942,7 @@ class TextEditorPanel(QFrame):
             self.search_results_changed.emit(0, -1)
             return []
 
-        text = self._text_edit.toPlainText()
+        text = self.get_text()
         if not text:
             self.search_results_changed.emit(0, -1)
             return []
@@ -857,21 +1046,30 @@ class TextEditorPanel(QFrame):
 
     def _apply_search_highlights(self):
         """Apply highlight formatting to all search matches."""
+        if self._formatter.active:
+            self._formatter.invalidate()  # Matches are formatted per block
+            return
+
+        fmt = self._search_format()
+        for start, end in self._search_matches:
+            self._merge_format(start, end, fmt)
+
+    def _search_format(self) -> QTextCharFormat:
         fmt = QTextCharFormat()
         fmt.setBackground(QBrush(QColor(self._search_highlight_color)))
         fmt.setForeground(QBrush(QColor("#000000")))  # Black text on yellow
-
-        for start, end in self._search_matches:
-            cursor = self._text_edit.textCursor()
-            cursor.setPosition(start, QTextCursor.MoveMode.MoveAnchor)
-            cursor.setPosition(end, QTextCursor.MoveMode.KeepAnchor)
-            cursor.mergeCharFormat(fmt)
+        return fmt
 
     def _clear_search_highlights(self):
         """Remove search highlight formatting."""
         if not self._search_matches:
             return
 
+        if self._formatter.active:
+            self._search_matches.clear()
+            self._formatter.invalidate()
+            return
+
         # Re-apply original formatting by clearing and re-applying code highlights
         text = self._text_edit.toPlainText()
         if text:
@@ -8,8 +8,16 @@ These components implement qualitative coding-specific functionality:
 - Coded text display
 
 For generic text display, use design_system.TextPanel instead.
+
+Large read-only texts are loaded in blocks and highlighted only around the
+viewport (see WindowedFormatter); positions stay source positions, offset
+by ``file_start``.
+
+Once highlighted, add_segment / remove_segment / recolor_code repaint only
+the characters of the affected segments.
 """
 
+import logging
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -38,6 +46,10 @@ from design_system import (
     TextColor,
     get_colors,
 )
+from src.shared.common.interval_index import IntervalIndex
+from src.shared.presentation.molecules.editor import WindowedFormatter
+
+logger = logging.getLogger("qualcoder.shared.presentation.text_highlighter")
 
 # =============================================================================
 # Domain Data Classes
@@ -127,7 +139,7 @@ class TextHighlighter(QFrame):
         highlighter = TextHighlighter()
         highlighter.set_text("Interview transcript content...")
 
-        # Add coded segments
+        # Add coded segments (repainted at once after the first highlight())
         highlighter.add_segment(CodeSegment(
             segment_id="1",
             code_id=101,
@@ -188,12 +200,17 @@ class TextHighlighter(QFrame):
         # Data storage
         self._text = ""
         self._segments: list[CodeSegment] = []
+        self._segment_index: IntervalIndex[CodeSegment] | None = None
         self._annotations: list[Annotation] = []
         self._codes: dict[int, dict] = {}  # code_id -> {name, color, ...}
 
         # File offset (for partial file loading like QualCoder)
         self._file_start = 0
 
+        # Highlight state, re-applied to blocks formatted later (windowed mode)
+        self._lit = False
+        self._show_important_only = False
+
         # Selection popup
         self._popup = None
 
@@ -236,6 +253,11 @@ class TextHighlighter(QFrame):
         self._text_edit.selectionChanged.connect(self._on_selection_changed)
         self._text_edit.cursorPositionChanged.connect(self._on_cursor_changed)
 
+        # Block-wise loading and highlighting for large read-only texts
+        self._formatter = WindowedFormatter(
+            self._text_edit, self._format_window, parent=self
+        )
+
         main_layout.addWidget(self._text_edit, 1)
 
         # Create selection popup
@@ -303,10 +325,17 @@ class TextHighlighter(QFrame):
         """
         self._text = text
         self._file_start = file_start
-        self._text_edit.setPlainText(text)
+        self._lit = False
+        if self._editable:
+            # Edits would shift block boundaries: always load at once
+            self._text_edit.setPlainText(text)
+        else:
+            self._formatter.load(text)
 
     def get_text(self) -> str:
         """Get the current text content."""
+        if self._formatter.active:
+            return self._text  # The document may still be loading
         return self._text_edit.toPlainText()
 
     def set_title(self, title: str):
@@ -370,28 +399,61 @@ class TextHighlighter(QFrame):
     # =========================================================================
 
     def add_segment(self, segment: CodeSegment):
-        """Add a coded segment."""
+        """Add a coded segment (painted at once if the text is highlighted)."""
         self._segments.append(segment)
+        if self._segment_index is not None:
+            self._segment_index = self._segment_index.with_added([segment])
+        self._repaint(segment.pos0, segment.pos1)
 
     def add_segments(self, segments: list[CodeSegment]):
         """Add multiple coded segments."""
         self._segments.extend(segments)
+        self._segment_index = None
 
     def clear_segments(self):
         """Remove all coded segments."""
         self._segments.clear()
+        self._segment_index = None
 
     def set_segments(self, segments: list[CodeSegment]):
         """Replace all segments."""
         self._segments = list(segments)
+        self._segment_index = None
 
     def get_segments(self) -> list[CodeSegment]:
         """Get all coded segments."""
         return list(self._segments)
 
     def remove_segment(self, segment_id: str):
-        """Remove a segment by ID."""
+        """Remove a segment by ID (repainting only its characters)."""
+        removed = [s for s in self._segments if s.segment_id == segment_id]
+        if not removed:
+            return
         self._segments = [s for s in self._segments if s.segment_id != segment_id]
+        if self._segment_index is not None:
+            self._segment_index = self._segment_index.without(
+                lambda s: s.segment_id == segment_id
+            )
+        for segment in removed:
+            self._repaint(segment.pos0, segment.pos1)
+
+    def recolor_code(self, code_id: int, color: str):
+        """Change the color of a code's segments, repainting only those."""
+        recolored = [s for s in self._segments if s.code_id == code_id]
+        for segment in recolored:
+            segment.code_color = color
+        if code_id in self._codes:
+            self._codes[code_id]["color"] = color
+        for segment in recolored:
+            self._repaint(segment.pos0, segment.pos1)
+
+    def _index(self) -> IntervalIndex[CodeSegment]:
+        """Interval index over the current segments, rebuilt after changes."""
+        if self._segment_index is None:
+            self._segment_index = IntervalIndex(
+                self._segments, lambda s: (s.pos0, s.pos1)
+            )
+        return self._segment_index
 
     # =========================================================================
     # Public API - Annotations
@@ -426,8 +488,16 @@ class TextHighlighter(QFrame):
         if not self._text:
             return
 
+        self._show_important_only = show_important_only
+        if self._formatter.active:
+            # Only the blocks around the viewport are formatted now
+            self._lit = True
+            self._formatter.invalidate()
+            return
+
         # Remove existing highlighting
         self.unlight()
+        self._lit = True
 
         # Apply code highlights
         for segment in self._segments:
@@ -435,36 +505,95 @@ class TextHighlighter(QFrame):
                 if show_important_only and not segment.important:
                     continue
                 self._apply_segment_highlight(segment)
-            except Exception as e:
-                print(f"TextHighlighter: Error highlighting segment: {e}")
+            except Exception:
+                logger.warning("highlight: failed segment %s", segment, exc_info=True)
 
         # Apply annotation highlights (bold)
         for annotation in self._annotations:
             try:
                 self._apply_annotation_highlight(annotation)
-            except Exception as e:
-                print(f"TextHighlighter: Error highlighting annotation: {e}")
+            except Exception:
+                logger.warning(
+                    "highlight: failed annotation %s", annotation, exc_info=True
+                )
 
         # Apply underline to overlapping regions
         if not show_important_only:
             try:
                 self._apply_overlap_underlines()
-            except Exception as e:
-                print(f"TextHighlighter: Error applying overlaps: {e}")
+            except Exception:
+                logger.warning("highlight: failed overlap underlines", exc_info=True)
 
     def unlight(self):
         """Remove all highlighting from the text."""
         if not self._text:
             return
 
+        self._lit = False
+        if self._formatter.active:
+            self._formatter.invalidate()
+            return
+
         cursor = self._text_edit.textCursor()
         cursor.setPosition(0, QTextCursor.MoveMode.MoveAnchor)
         cursor.setPosition(len(self._text), QTextCursor.MoveMode.KeepAnchor)
         cursor.setCharFormat(QTextCharFormat())
         self._text_edit.setTextCursor(cursor)
 
-    def _apply_segment_highlight(self, segment: CodeSegment):
-        """Apply highlighting for a single segment."""
+    def _repaint(self, pos0: int, pos1: int):
+        """
+        Re-apply highlighting to source range ``[pos0, pos1)`` only.
+
+        Does nothing until highlight() has been called, so segments can be
+        added in bulk before the first paint.
+        """
+        if not self._lit:
+            return
+        start = max(pos0 - self._file_start, 0)
+        end = min(pos1 - self._file_start, len(self._text))
+        if start >= end:
+            return
+        if self._formatter.active:
+            self._formatter.refresh(start, end)
+            return
+        cursor = self._text_edit.textCursor()
+        cursor.setPosition(start, QTextCursor.MoveMode.MoveAnchor)
+        cursor.setPosition(end, QTextCursor.MoveMode.KeepAnchor)
+        cursor.setCharFormat(QTextCharFormat())
+        self._format_window(start, end)
+
+    def _format_window(self, start: int, end: int):
+        """Highlight segments, annotations and overlaps inside ``[start, end)``."""
+        if not self._lit:
+            return
+        clip = (start, end)
+        segments = self._index().overlapping(
+            start + self._file_start, end + self._file_start
+        )
+        for segment in segments:
+            if self._show_important_only and not segment.important:
+                continue
+            self._apply_segment_highlight(segment, clip)
+
+        for annotation in self._annotations:
+            self._apply_annotation_highlight(annotation, clip)
+
+        if not self._show_important_only:
+            overlaps = IntervalIndex(
+                segments, lambda s: (s.pos0, s.pos1)
+            ).overlap_regions()
+            self._apply_overlap_underlines(overlaps, clip)
+
+    @staticmethod
+    def _clipped(pos0: int, pos1: int, clip: tuple[int, int] | None) -> tuple[int, int]:
+        if clip is None:
+            return pos0, pos1
+        return max(pos0, clip[0]), min(pos1, clip[1])
+
+    def _apply_segment_highlight(
+        self, segment: CodeSegment, clip: tuple[int, int] | None = None
+    ):
+        """Apply highlighting for a single segment (limited to ``clip`` if given)."""
         if segment is None:
             return
 
@@ -503,15 +632,19 @@ class TextHighlighter(QFrame):
         text_len = len(self._text) if self._text else 0
 
         if 0 <= pos0 < pos1 <= text_len:
+            pos0, pos1 = self._clipped(pos0, pos1, clip)
             cursor = self._text_edit.textCursor()
             cursor.setPosition(pos0, QTextCursor.MoveMode.MoveAnchor)
             cursor.setPosition(pos1, QTextCursor.MoveMode.KeepAnchor)
             cursor.setCharFormat(fmt)
 
-    def _apply_annotation_highlight(self, annotation: Annotation):
+    def _apply_annotation_highlight(
+        self, annotation: Annotation, clip: tuple[int, int] | None = None
+    ):
         """Apply bold formatting for annotations."""
         pos0 = annotation.pos0 - self._file_start
         pos1 = annotation.pos1 - self._file_start
+        pos0, pos1 = self._clipped(pos0, pos1, clip)
 
         if 0 <= pos0 < pos1 <= len(self._text):
             cursor = self._text_edit.textCursor()
@@ -522,9 +655,14 @@ class TextHighlighter(QFrame):
             fmt.setFontWeight(QFont.Weight.Bold)
             cursor.mergeCharFormat(fmt)  # Merge to preserve background
 
-    def _apply_overlap_underlines(self):
-        """Apply underline to overlapping coded regions."""
-        overlaps = self._detect_overlaps()
+    def _apply_overlap_underlines(
+        self,
+        overlaps: list[tuple[int, int]] | None = None,
+        clip: tuple[int, int] | None = None,
+    ):
+        """Apply underline to overlapping coded regions (all by default)."""
+        if overlaps is None:
+            overlaps = self._detect_overlaps()
 
         # Underline color: white on dark, black on light
         underline_color = (
@@ -534,8 +672,9 @@ class TextHighlighter(QFrame):
         )
 
         for start, end in overlaps:
-            pos0 = start - self._file_start
-            pos1 = end - self._file_start
+            pos0, pos1 = self._clipped(
+                start - self._file_start, end - self._file_start, clip
+            )
 
             if 0 <= pos0 < pos1 <= len(self._text):
                 cursor = self._text_edit.textCursor()
@@ -551,50 +690,12 @@ class TextHighlighter(QFrame):
         """
         Detect overlapping coded regions.
 
-        Returns list of (start, end) tuples for overlapping ranges.
-        Based on QualCoder's apply_underline_to_overlaps() logic.
+        Returns list of (start, end) tuples for ranges covered by two or
+        more segments, with adjacent ranges merged (as in QualCoder's
+        apply_underline_to_overlaps()). Uses a sweep over the interval
+        index instead of comparing every pair of segments.
         """
-        overlaps = []
-        segments = self._segments
-
-        for i, seg_i in enumerate(segments):
-            for j, seg_j in enumerate(segments):
-                if i >= j:
-                    continue  # Avoid duplicate comparisons
-
-                # Check for overlap
-                if (
-                    seg_j.pos0 <= seg_i.pos0 < seg_j.pos1
-                    or seg_i.pos0 <= seg_j.pos0 < seg_i.pos1
-                ):
-                    # Calculate overlap region
-                    overlap_start = max(seg_i.pos0, seg_j.pos0)
-                    overlap_end = min(seg_i.pos1, seg_j.pos1)
-
-                    if overlap_start < overlap_end:
-                        overlaps.append((overlap_start, overlap_end))
-
-        # Remove duplicates and merge adjacent
-        return self._merge_overlaps(overlaps)
-
-    def _merge_overlaps(self, overlaps: list[tuple[int, int]]) -> list[tuple[int, int]]:
-        """Merge adjacent/overlapping ranges."""
-        if not overlaps:
-            return []
-
-        # Sort by start position
-        sorted_overlaps = sorted(set(overlaps), key=lambda x: x[0])
-        merged = [sorted_overlaps[0]]
-
-        for start, end in sorted_overlaps[1:]:
-            last_start, last_end = merged[-1]
-            if start <= last_end:
-                # Merge with previous
-                merged[-1] = (last_start, max(last_end, end))
-            else:
-                merged.append((start, end))
-
-        return merged
+        return self._index().overlap_regions()
 
     # =========================================================================
     # Public API - Selection & Navigation
@@ -614,6 +715,7 @@ class TextHighlighter(QFrame):
 
     def scroll_to_position(self, pos: int):
         """Scroll to a specific text position."""
+        self._formatter.ensure_loaded(pos - self._file_start)
         cursor = self._text_edit.textCursor()
         cursor.setPosition(pos - self._file_start)
         self._text_edit.setTextCursor(cursor)
@@ -621,6 +723,7 @@ class TextHighlighter(QFrame):
 
     def select_range(self, start: int, end: int):
         """Select a range of text."""
+        self._formatter.ensure_loaded(max(start, end) - self._file_start)
         cursor = self._text_edit.textCursor()
         cursor.setPosition(start - self._file_start, QTextCursor.MoveMode.MoveAnchor)
         cursor.setPosition(end - self._file_start, QTextCursor.MoveMode.KeepAnchor)
@@ -640,8 +743,7 @@ class TextHighlighter(QFrame):
 
     def get_codes_at_position(self, pos: int) -> list[CodeSegment]:
         """Get all code segments that include the given position."""
-        pos_adjusted = pos + self._file_start
-        return [s for s in self._segments if s.pos0 <= pos_adjusted < s.pos1]
+        return self._index().stab(pos + self._file_start)
 
     def update_stats_display(self):
         """Update the header stats based on current data."""
@@ -250,3 +250,58 @@ class TestAsyncBatchImport:
         # Only batch1 (3 files) imported — batch2 was rejected
         sources = source_repo.get_all()
         assert len(sources) == 3
+
+
+@allure.story("QC-027.11 Import Folder Bulk Import")
+class TestExtractionPipeline:
+    """Extraction runs in worker processes; persistence commits in batches."""
+
+    @allure.title("Worker processes return extracted text in input order")
+    def test_pipeline_extracts_in_order(self, tmp_path):
+        from src.contexts.sources.infra.extraction_pool import ExtractionPipeline
+
+        paths = _create_text_files(tmp_path / "pool", 6)
+        pipeline = ExtractionPipeline(max_workers=2, queue_size=2)
+
+        async def _collect():
+            return [extracted async for extracted in pipeline.run(paths)]
+
+        results = asyncio.run(_collect())
+
+        assert [r.path for r in results] == paths
+        assert all(r.error is None for r in results)
+        assert results[3].fulltext.startswith("Content of document 3.")
+
+    @allure.title("Batch import commits once per N files")
+    def test_commits_batched(
+        self, source_repo, folder_repo, case_repo, project_state, event_bus, tmp_path
+    ):
+        from src.contexts.sources.presentation.viewmodels.file_manager_viewmodel import (
+            FileManagerViewModel,
+        )
+
+        class _CountingSession:
+            commits = 0
+
+            def commit(self):
+                self.commits += 1
+
+        session = _CountingSession()
+        viewmodel = FileManagerViewModel(
+            source_repo=source_repo,
+            folder_repo=folder_repo,
+            case_repo=case_repo,
+            state=project_state,
+            event_bus=event_bus,
+            session=session,
+            extraction_workers=2,
+            import_commit_every=2,
+        )
+
+        _run_batch_import(viewmodel, _create_text_files(tmp_path / "commit", 5))
+
+        assert len(source_repo.get_all()) == 5
+        assert session.commits == 3
+        assert source_repo.get_by_name("doc_004.txt").fulltext.startswith(
+            "Content of document 4."
+        )
@@ -0,0 +1,286 @@
+"""
+QC-039.02 Import REFI-QDA Project - Bulk Import Tests
+
+In bulk mode a .qdpx archive is imported as one transaction:
+- Codes, sources and segments are written in batches, checked against the
+  codebook as before the import and against each other
+- Only the RefiQdaImported summary event is published
+- Progress is reported while the archive is parsed
+- The file manager and coding views refresh on the summary event
+- A cancelled or unreadable import is rolled back, in bulk mode or not
+- Benchmark: a 200k-coding project imports in seconds
+"""
+
+from __future__ import annotations
+
+import time
+import zipfile
+
+import allure
+import pytest
+
+from src.contexts.coding.core.entities import Code, Color
+from src.contexts.exchange.core.commandHandlers import import_refi_qda as import_mod
+from src.contexts.exchange.core.commands import ImportRefiQdaCommand
+from src.contexts.exchange.core.events import RefiQdaImported
+from src.shared.common.types import CodeId
+
+pytestmark = [
+    pytest.mark.e2e,
+    allure.epic("QualCoder v2"),
+    allure.feature("QC-039 Import Export Formats"),
+]
+
+BULK_XML = """\
+<?xml version="1.0" encoding="utf-8"?>
+<Project xmlns="urn:QDA-XML:project:1.0" name="BulkTest">
+  <CodeBook>
+    <Codes>
+      <Code guid="cat1" name="Emotions" isCodable="false">
+        <Code guid="c1" name="Joy" isCodable="true" color="#00ff00"/>
+        <Code guid="c2" name="joy" isCodable="true" color="#00aa00"/>
+      </Code>
+      <Code guid="c3" name="Existing" isCodable="true" color="#0000ff"/>
+      <Code guid="c4" name="Trust" isCodable="true" color="not-a-color"/>
+      <Code guid="c5" name="Learning" isCodable="true" color="#ff8800"/>
+    </Codes>
+  </CodeBook>
+  <Sources>
+    <TextSource guid="s1" name="interview.txt" plainTextPath="internal://s1.txt">
+      <PlainTextSelection guid="p1" startPosition="7" endPosition="12">
+        <Coding guid="k1"><CodeRef targetGUID="c1"/></Coding>
+      </PlainTextSelection>
+      <PlainTextSelection guid="p2" startPosition="13" endPosition="18">
+        <Coding guid="k2"><CodeRef targetGUID="c2"/></Coding>
+      </PlainTextSelection>
+    </TextSource>
+  </Sources>
+  <Coding guid="k3">
+    <CodeRef targetGUID="c5"/>
+    <TextRange start="19" end="27" sourceGUID="s1"/>
+  </Coding>
+</Project>
+"""
+
+TEXT = "I felt happy about learning today."
+
+
+class _Session:
+    """Commits and rolls back the test connection, counting calls."""
+
+    def __init__(self, connection) -> None:
+        self._conn = connection
+        self.commits = 0
+        self.rollbacks = 0
+
+    def commit(self) -> None:
+        self.commits += 1
+        self._conn.commit()
+
+    def rollback(self) -> None:
+        self.rollbacks += 1
+        self._conn.rollback()
+
+
+def _make_large_qdpx(tmp_path, n_sources: int, codings_per_source: int):
+    """A .qdpx with 20 codes and n_sources texts, each with its selections."""
+    qdpx_path = tmp_path / f"large_{n_sources * codings_per_source}.qdpx"
+    codes = "".join(
+        f'<Code guid="c{i}" name="Code {i}" isCodable="true" color="#3366cc"/>'
+        for i in range(20)
+    )
+    with zipfile.ZipFile(qdpx_path, "w", zipfile.ZIP_DEFLATED) as zf:
+        with zf.open("project.qde", "w") as qde:
+            qde.write(
+                b'<Project xmlns="urn:QDA-XML:project:1.0" name="Large"><CodeBook>'
+                + f"<Codes>{codes}</Codes></CodeBook><Sources>".encode()
+            )
+            for s in range(n_sources):
+                qde.write(
+                    f'<TextSource guid="s{s}" name="interview_{s:03}.txt" '
+                    f'plainTextPath="internal://s{s}.txt">'.encode()
+                )
+                qde.write(
+                    "".join(
+                        f'<PlainTextSelection guid="p{s}_{j}" '
+                        f'startPosition="{j * 10}" endPosition="{j * 10 + 8}">'
+                        f'<Coding guid="k{s}_{j}"><CodeRef targetGUID="c{j % 20}"/>'
+                        "</Coding></PlainTextSelection>"
+                        for j in range(codings_per_source)
+                    ).encode()
+                )
+                qde.write(b"</TextSource>")
+            qde.write(b"</Sources></Project>")
+        for s in range(n_sources):
+            zf.writestr(f"Sources/s{s}.txt", "participant " * codings_per_source)
+    return qdpx_path
+
+
+def _import(repos, qdpx, bulk: bool = True, **kwargs):
+    source_repo, code_repo, category_repo, segment_repo, event_bus = repos
+    return import_mod.import_refi_qda(
+        command=ImportRefiQdaCommand(source_path=str(qdpx), bulk=bulk),
+        source_repo=source_repo,
+        code_repo=code_repo,
+        category_repo=category_repo,
+        segment_repo=segment_repo,
+        event_bus=event_bus,
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def repos(source_repo, code_repo, category_repo, segment_repo, event_bus):
+    return source_repo, code_repo, category_repo, segment_repo, event_bus
+
+
+@allure.story("QC-039.02 Import REFI-QDA Project")
+class TestBulkImport:
+    @allure.title("Bulk import writes everything and publishes one summary event")
+    def test_bulk_import(
+        self, repos, db_connection, tmp_path, make_qdpx, source_repo, code_repo
+    ):
+        _, _, category_repo, segment_repo, event_bus = repos
+        code_repo.save(
+            Code(id=CodeId.new(), name="Existing", color=Color.from_hex("#123456"))
+        )
+        published = []
+        event_bus.subscribe_all(published.append)
+        session = _Session(db_connection)
+        qdpx = make_qdpx(tmp_path, BULK_XML, {"Sources/s1.txt": TEXT})
+
+        result = _import(repos, qdpx, session=session)
+
+        assert result.is_success, result.error
+        assert [type(e) for e in published] == [RefiQdaImported]
+        event = published[0]
+        assert (event.codes_created, event.sources_created) == (2, 1)
+        assert event.segments_created == 2
+        assert (session.commits, session.rollbacks) == (1, 0)
+
+        with allure.step("Duplicate names and invalid colors are skipped"):
+            codes = {c.name: c for c in code_repo.get_all()}
+            assert set(codes) == {"Existing", "Joy", "Learning"}
+            (category,) = category_repo.get_all()
+            assert category.name == "Emotions"
+            assert codes["Joy"].category_id == category.id
+            assert codes["Learning"].category_id is None
+
+        with allure.step("Segments are cut from the source text"):
+            (source,) = source_repo.get_all()
+            assert source.fulltext == TEXT
+            segments = segment_repo.get_by_source(source.id)
+            assert sorted(s.selected_text for s in segments) == ["happy", "learning"]
+
+    @pytest.mark.parametrize("bulk", [True, False], ids=["bulk", "per_item"])
+    @allure.title("A cancelled import is rolled back; progress is reported")
+    def test_cancel_and_progress(
+        self, repos, db_connection, tmp_path, source_repo, code_repo, monkeypatch, bulk
+    ):
+        monkeypatch.setattr(import_mod, "PROGRESS_EVERY", 50)
+        monkeypatch.setattr(import_mod, "SEGMENT_BATCH_SIZE", 100)
+        qdpx = _make_large_qdpx(tmp_path, n_sources=20, codings_per_source=100)
+
+        with allure.step("Cancel after batches have been written"):
+            session = _Session(db_connection)
+            checks = []
+            result = _import(
+                repos,
+                qdpx,
+                bulk=bulk,
+                session=session,
+                is_cancelled=lambda: checks.append(1) or len(checks) >= 3,
+            )
+            assert result.is_failure
+            assert result.error_code == "REFI_QDA_NOT_IMPORTED/CANCELLED"
+            assert (session.commits, session.rollbacks) == (0, 1)
+            assert source_repo.list_summaries() == []
+            assert code_repo.get_all() == []
+
+        with allure.step("Progress moves forward and ends at the full size"):
+            progress: list[tuple[int, int]] = []
+            result = _import(
+                repos,
+                qdpx,
+                bulk=bulk,
+                session=session,
+                on_progress=lambda *p: progress.append(p),
+            )
+            assert result.is_success, result.error
+            assert result.data.segments_created == 2000
+            assert len(progress) > 10
+            done = [position for position, _ in progress]
+            assert done == sorted(done)
+            size = progress[-1][1]
+            assert progress[-1] == (size, size)
+
+    @pytest.mark.parametrize("bulk", [True, False], ids=["bulk", "per_item"])
+    @allure.title("An archive unreadable part way through is rolled back")
+    def test_parse_error(
+        self, repos, db_connection, tmp_path, make_qdpx, source_repo, code_repo, bulk
+    ):
+        broken_xml = BULK_XML.replace("</Sources>", "<Sources>")
+        qdpx = make_qdpx(tmp_path, broken_xml, {"Sources/s1.txt": TEXT})
+        session = _Session(db_connection)
+
+        result = _import(repos, qdpx, bulk=bulk, session=session)
+
+        assert result.is_failure
+        assert result.error_code == "REFI_QDA_NOT_IMPORTED/PARSE_ERROR"
+        assert (session.commits, session.rollbacks) == (0, 1)
+        assert source_repo.list_summaries() == []
+        assert code_repo.get_all() == []
+
+
+@allure.story("QC-039.02 Import REFI-QDA Project")
+class TestBulkImportViews:
+    @allure.title("Views refresh once on the summary event")
+    def test_views_refresh(self, wired_app, tmp_path, make_qdpx):
+        from PySide6.QtWidgets import QApplication
+
+        screens = wired_app["screens"]
+        files_vm = screens["files"]._viewmodel
+        coding_vm = screens["coding"]._viewmodel
+        refreshed: list[str] = []
+        files_vm.sources_changed.connect(lambda: refreshed.append("sources"))
+        coding_vm.codes_changed.connect(
+            lambda categories: refreshed.append(
+                sorted(c.name for cat in categories for c in cat.codes)
+            )
+        )
+        qdpx = make_qdpx(tmp_path, BULK_XML, {"Sources/s1.txt": TEXT})
+
+        assert screens["files"]._exchange_vm.import_refi_qda(str(qdpx))
+        QApplication.processEvents()
+
+        assert refreshed.count("sources") == 1
+        (codes,) = [r for r in refreshed if r != "sources"]
+        assert {"Joy", "Learning"} <= set(codes)
+        assert [s.name for s in files_vm.load_sources()] == ["interview.txt"]
+
+
+@allure.story("QC-039.02 Import REFI-QDA Project")
+@allure.severity(allure.severity_level.NORMAL)
+class TestBulkImportBenchmark:
+    @pytest.mark.slow
+    @allure.title("A 200k-coding project imports in one transaction")
+    def test_benchmark(self, repos, db_connection, tmp_path, segment_repo):
+        qdpx = _make_large_qdpx(tmp_path, n_sources=100, codings_per_source=2_000)
+        session = _Session(db_connection)
+
+        started = time.perf_counter()
+        result = _import(repos, qdpx, session=session)
+        elapsed = time.perf_counter() - started
+
+        assert result.is_success, result.error
+        assert result.data.sources_created == 100
+        assert result.data.segments_created == 200_000
+        # Maintained counts kept up
+        assert sum(segment_repo.count_all_by_code().values()) == 200_000
+        assert (session.commits, session.rollbacks) == (1, 0)
+        # Timing is reported, not asserted: parallel runs make it unreliable
+        allure.attach(
+            f"200000 codings in {elapsed:.2f}s ({200_000 / elapsed:,.0f} codings/s)",
+            name="bulk_refi_qda_import_benchmark",
+            attachment_type=allure.attachment_type.TEXT,
+        )
@@ -0,0 +1,271 @@
+"""
+QC-050.01 Bulk Repository Writes - End-to-End Tests
+
+save_many / delete_many on the coding, sources, cases and folders
+repositories:
+- Insert and update in one INSERT ... ON CONFLICT DO UPDATE executemany
+- Existing rows keep their creation date; indexes stay in sync
+- Outbox receives one upsert or delete entry per row written
+"""
+
+from __future__ import annotations
+
+import allure
+import pytest
+from sqlalchemy import event
+
+from src.contexts.cases.core.entities import AttributeType, Case, CaseAttribute
+from src.contexts.cases.infra.case_repository import SQLiteCaseRepository
+from src.contexts.coding.core.entities import (
+    Category,
+    Code,
+    Color,
+    TextPosition,
+    TextSegment,
+)
+from src.contexts.coding.infra.repositories import (
+    SQLiteCategoryRepository,
+    SQLiteCodeRepository,
+    SQLiteSegmentRepository,
+)
+from src.contexts.folders.core.entities import Folder
+from src.contexts.folders.infra.folder_repository import SQLiteFolderRepository
+from src.contexts.projects.core.entities import Source, SourceType
+from src.contexts.sources.infra.fulltext_index import SQLiteFulltextIndex
+from src.contexts.sources.infra.source_repository import SQLiteSourceRepository
+from src.shared.common.types import (
+    CaseId,
+    CategoryId,
+    CodeId,
+    FolderId,
+    SegmentId,
+    SourceId,
+)
+
+pytestmark = [
+    pytest.mark.e2e,
+    allure.epic("QualCoder v2"),
+    allure.feature("QC-050 Performance"),
+]
+
+
+class RecordingOutbox:
+    """Outbox double that records each call."""
+
+    def __init__(self):
+        self.calls: list[tuple] = []
+
+    def write_upsert(self, kind, entity_id, payload):
+        self.calls.append(("upsert", kind, entity_id))
+
+    def write_delete(self, kind, entity_id):
+        self.calls.append(("delete", kind, entity_id))
+
+
+@pytest.fixture
+def statements(db_engine):
+    """Record SQL statements sent to the database."""
+    captured: list[str] = []
+
+    def _capture(_conn, _cursor, statement, _params, _context, _many):
+        captured.append(statement.strip().split()[0].upper())
+
+    event.listen(db_engine, "before_cursor_execute", _capture)
+    yield captured
+    event.remove(db_engine, "before_cursor_execute", _capture)
+
+
+def _segment(i: int, source_id: str = "s1", code_id: str = "c1") -> TextSegment:
+    return TextSegment(
+        id=SegmentId(value=f"g{i}"),
+        source_id=SourceId(value=source_id),
+        code_id=CodeId(value=code_id),
+        position=TextPosition(start=i, end=i + 5),
+        selected_text=f"text {i}",
+    )
+
+
+@allure.story("QC-050.01 Bulk Repository Writes")
+class TestSaveMany:
+    @allure.title("Segments are inserted and updated in one statement")
+    def test_segments_upsert(self, db_connection, statements):
+        repo = SQLiteSegmentRepository(db_connection)
+
+        with allure.step("Insert 1,000 segments"):
+            statements.clear()
+            assert repo.save_many([_segment(i) for i in range(1000)]) == 1000
+            assert statements == ["INSERT"]
+            assert repo.count_by_source(SourceId(value="s1")) == 1000
+
+        with allure.step("Re-saving updates in place"):
+            original_date = repo.get_by_id(SegmentId(value="g1")).created_at
+            updated = _segment(1, code_id="c2")
+            assert repo.save_many([updated, _segment(5000)]) == 2
+            stored = repo.get_by_id(SegmentId(value="g1"))
+            assert stored.code_id.value == "c2"
+            assert stored.created_at == original_date
+            assert repo.count_by_source(SourceId(value="s1")) == 1001
+
+        with allure.step("Single save no longer probes for existence"):
+            statements.clear()
+            repo.save(_segment(1))
+            assert statements == ["INSERT"]
+
+        assert repo.save_many([]) == 0
+
+    @allure.title("Sources, codes, categories and folders upsert in bulk")
+    def test_other_repositories(self, db_connection):
+        sources = SQLiteSourceRepository(db_connection)
+        codes = SQLiteCodeRepository(db_connection)
+        categories = SQLiteCategoryRepository(db_connection)
+        folders = SQLiteFolderRepository(db_connection)
+
+        folders.save_many(
+            [Folder(id=FolderId(value=f"f{i}"), name=f"Folder {i}") for i in range(3)]
+        )
+        categories.save_many(
+            [Category(id=CategoryId(value="k1"), name="Themes")],
+        )
+        codes.save_many(
+            [
+                Code(id=CodeId(value=f"c{i}"), name=f"Code {i}", color=Color(1, 2, 3))
+                for i in range(3)
+            ]
+        )
+        sources.save_many(
+            [
+                Source(
+                    id=SourceId(value=f"s{i}"),
+                    name=f"doc_{i}.txt",
+                    source_type=SourceType.TEXT,
+                    fulltext=f"document number {i}",
+                )
+                for i in range(3)
+            ]
+        )
+        assert len(folders.get_all()) == 3
+        assert categories.get_by_id(CategoryId(value="k1")).name == "Themes"
+        assert [c.name for c in codes.get_all()] == ["Code 0", "Code 1", "Code 2"]
+        assert sources.count() == 3
+
+        with allure.step("Updates go through the same statement"):
+            codes.save_many(
+                [
+                    Code(
+                        id=CodeId(value="c0"),
+                        name="Renamed",
+                        color=Color(9, 9, 9),
+                        category_id=CategoryId(value="k1"),
+                    )
+                ]
+            )
+            renamed = codes.get_by_id(CodeId(value="c0"))
+            assert renamed.name == "Renamed"
+            assert renamed.category_id.value == "k1"
+
+            sources.save_many(
+                [
+                    Source(
+                        id=SourceId(value="s0"),
+                        name="doc_0.txt",
+                        source_type=SourceType.TEXT,
+                        fulltext="replacement transcript",
+                        folder_id=FolderId(value="f1"),
+                    )
+                ]
+            )
+            assert sources.count_by_folder()["f1"] == 1
+
+        with allure.step("Full-text index follows the upsert"):
+            index = SQLiteFulltextIndex(db_connection)
+            assert index.matching_source_ids("replacement") == ["s0"]
+            assert index.search("number", kinds=("source",)).total == 2
+
+    @allure.title("Cases are written with their attributes and source links")
+    def test_cases(self, db_connection):
+        repo = SQLiteCaseRepository(db_connection)
+        cases = [
+            Case(
+                id=CaseId(value=f"case{i}"),
+                name=f"P{i}",
+                attributes=(
+                    CaseAttribute(name="age", attr_type=AttributeType.NUMBER, value=i),
+                ),
+                source_ids=("s1", "s2") if i else ("s1",),
+            )
+            for i in range(3)
+        ]
+        assert repo.save_many(cases) == 3
+        assert repo.count() == 3
+        assert repo.get_attribute(CaseId(value="case2"), "age").value == 2
+        assert sorted(repo.get_source_ids(CaseId(value="case1"))) == ["s1", "s2"]
+
+        with allure.step("Re-saving replaces attributes and reconciles links"):
+            changed = Case(
+                id=CaseId(value="case1"),
+                name="P1 renamed",
+                attributes=(
+                    CaseAttribute(name="role", attr_type=AttributeType.TEXT, value="x"),
+                ),
+                source_ids=("s2", "s3"),
+            )
+            repo.save_many([changed])
+            stored = repo.get_by_id(CaseId(value="case1"))
+            assert stored.name == "P1 renamed"
+            assert [a.name for a in stored.attributes] == ["role"]
+            assert sorted(stored.source_ids) == ["s2", "s3"]
+
+
+@allure.story("QC-050.01 Bulk Repository Writes")
+class TestDeleteMany:
+    @allure.title("delete_many removes rows in chunks and reports the count")
+    def test_delete_many(self, db_connection):
+        segments = SQLiteSegmentRepository(db_connection)
+        segments.save_many([_segment(i) for i in range(1200)])
+
+        ids = [SegmentId(value=f"g{i}") for i in range(0, 1200, 2)]
+        assert segments.delete_many(ids + [SegmentId(value="missing")]) == 600
+        assert segments.count_by_source(SourceId(value="s1")) == 600
+        assert segments.delete_many([]) == 0
+
+    @allure.title("Deleting cases removes their attributes and links")
+    def test_delete_cases(self, db_connection):
+        repo = SQLiteCaseRepository(db_connection)
+        repo.save_many(
+            [
+                Case(
+                    id=CaseId(value=f"case{i}"),
+                    name=f"P{i}",
+                    attributes=(
+                        CaseAttribute(
+                            name="a", attr_type=AttributeType.TEXT, value="v"
+                        ),
+                    ),
+                    source_ids=("s1",),
+                )
+                for i in range(2)
+            ]
+        )
+        assert repo.delete_many([CaseId(value="case0")]) == 1
+        assert repo.count() == 1
+        assert repo.get_attributes(CaseId(value="case0")) == []
+        assert repo.get_source_ids(CaseId(value="case0")) == []
+
+
+@allure.story("QC-050.01 Bulk Repository Writes")
+class TestOutboxEntries:
+    @allure.title("Bulk writes produce one outbox entry per row")
+    def test_outbox(self, db_connection):
+        outbox = RecordingOutbox()
+        repo = SQLiteSegmentRepository(db_connection, outbox=outbox)
+
+        repo.save_many([_segment(i) for i in range(3)])
+        repo.delete_many([SegmentId(value="g0"), SegmentId(value="g1")])
+
+        assert outbox.calls == [
+            ("upsert", "segment", "g0"),
+            ("upsert", "segment", "g1"),
+            ("upsert", "segment", "g2"),
+            ("delete", "segment", "g0"),
+            ("delete", "segment", "g1"),
+        ]
@@ -0,0 +1,218 @@
+"""
+QC-034.14 Case Listing at Scale - End-to-End Tests
+
+Loading cases no longer costs two extra queries per case:
+- Attributes and source links are batch-loaded (3 queries for any count)
+- list_cases pages, filters and counts in SQL
+- compare_cases fetches all requested cases in one batch
+- The case manager filters and searches through the repository
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import allure
+import pytest
+from sqlalchemy import event
+
+from src.contexts.cases.core.entities import (
+    AttributeType,
+    Case,
+    CaseAttribute,
+    CaseFilter,
+)
+from src.contexts.cases.infra.case_repository import SQLiteCaseRepository
+from src.shared.common.types import CaseId, SourceId
+
+if TYPE_CHECKING:
+    from src.shared.infra.app_context import AppContext
+
+pytestmark = [
+    pytest.mark.e2e,
+    allure.epic("QualCoder v2"),
+    allure.feature("QC-034 Manage Cases"),
+]
+
+
+def _case(i: int, **kwargs) -> Case:
+    return Case(id=CaseId(value=f"case{i:03d}"), name=f"P{i:03d}", **kwargs)
+
+
+def _participants(count: int) -> list[Case]:
+    """Every case has one attribute; even cases are linked to a source."""
+    return [
+        _case(
+            i,
+            attributes=(
+                CaseAttribute(name="age", attr_type=AttributeType.NUMBER, value=i),
+            ),
+            source_ids=(f"s{i % 3}",) if i % 2 == 0 else (),
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def case_repo(db_connection) -> SQLiteCaseRepository:
+    return SQLiteCaseRepository(db_connection)
+
+
+@pytest.fixture
+def selects(db_engine):
+    """Count SELECT statements sent to the database."""
+    captured: list[str] = []
+
+    def _capture(_conn, _cursor, statement, _params, _context, _many):
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append(statement)
+
+    event.listen(db_engine, "before_cursor_execute", _capture)
+    yield captured
+    event.remove(db_engine, "before_cursor_execute", _capture)
+
+
+@allure.story("QC-034.14 Case Listing at Scale")
+class TestBatchLoading:
+    @allure.title("Loading all cases takes three queries regardless of count")
+    def test_get_all_query_count(self, case_repo, selects):
+        case_repo.save_many(_participants(300))
+
+        selects.clear()
+        cases = case_repo.get_all()
+
+        assert len(cases) == 300
+        assert len(selects) == 3
+        assert cases[2].attributes[0].value == 2
+        assert cases[0].source_ids == ("s0",)
+        assert cases[1].source_ids == ()
+
+    @allure.title("Single and multi-ID lookups keep their children")
+    def test_lookups(self, case_repo, selects):
+        case_repo.save_many(_participants(10))
+
+        selects.clear()
+        case = case_repo.get_by_id(CaseId(value="case004"))
+        assert case.source_ids == ("s1",)
+        assert len(selects) == 3
+        assert case_repo.get_by_id(CaseId(value="missing")) is None
+
+        found = case_repo.get_by_ids(
+            [CaseId(value="case002"), CaseId(value="case001"), CaseId(value="nope")]
+        )
+        assert [c.name for c in found] == ["P001", "P002"]
+
+        linked = case_repo.get_cases_for_source(SourceId(value="s0"))
+        assert [c.name for c in linked] == ["P000", "P006"]
+
+
+@allure.story("QC-034.14 Case Listing at Scale")
+class TestPagedListing:
+    @allure.title("list_cases returns one ordered page and the total")
+    def test_paging(self, case_repo, selects):
+        case_repo.save_many(_participants(250))
+
+        selects.clear()
+        page = case_repo.list_cases(offset=100, limit=50)
+
+        assert page.total == 250
+        assert [c.name for c in page.cases][:2] == ["P100", "P101"]
+        assert len(page.cases) == 50
+        assert page.has_more
+        assert len(selects) == 4
+
+        last = case_repo.list_cases(offset=240, limit=50)
+        assert len(last.cases) == 10
+        assert not last.has_more
+
+    @allure.title("Filters combine name, source and content criteria")
+    def test_filters(self, case_repo):
+        case_repo.save_many(_participants(20))
+        case_repo.save(_case(99, source_ids=("s1",)))
+
+        with_sources = case_repo.list_cases(case_filter=CaseFilter(with_sources=True))
+        assert with_sources.total == 11
+
+        bare = case_repo.list_cases(
+            case_filter=CaseFilter(with_sources=True, has_attributes=True)
+        )
+        assert bare.total == 10
+
+        by_source = case_repo.list_cases(case_filter=CaseFilter(source_id="s1"))
+        assert [c.name for c in by_source.cases] == ["P004", "P010", "P016", "P099"]
+
+        by_name = case_repo.list_cases(case_filter=CaseFilter(name_contains="p01"))
+        assert by_name.total == 10
+
+        with allure.step("LIKE wildcards in the query are matched literally"):
+            assert (
+                case_repo.list_cases(case_filter=CaseFilter(name_contains="%")).total
+                == 0
+            )
+
+
+# =============================================================================
+# Consumers
+# =============================================================================
+
+
+@pytest.fixture
+def project_with_cases(app_context: AppContext, tmp_path: Path) -> AppContext:
+    path = tmp_path / "cases.qda"
+    assert app_context.create_project(name="Cases", path=str(path)).is_success
+    assert app_context.open_project(str(path)).is_success
+    app_context.cases_context.case_repo.save_many(_participants(30))
+    return app_context
+
+
+@allure.story("QC-034.14 Case Listing at Scale")
+class TestConsumers:
+    @allure.title("list_cases and compare_cases tools use paged and batched reads")
+    def test_mcp_tools(self, project_with_cases: AppContext):
+        from src.contexts.cases.interface.mcp_tools import CaseTools
+
+        tools = CaseTools(ctx=project_with_cases)
+
+        listing = tools.execute("list_cases", {"offset": 10, "limit": 5})
+        assert listing["success"] is True
+        data = listing["data"]
+        assert data["total_count"] == 30
+        assert [c["name"] for c in data["cases"]] == [
+            f"P{i:03d}" for i in range(10, 15)
+        ]
+        assert data["has_more"] is True
+
+        compared = tools.execute(
+            "compare_cases", {"case_ids": ["case002", "case000", "case004"]}
+        )
+        assert compared["success"] is True
+        assert [c["case_id"] for c in compared["data"]["cases"]] == [
+            "case002",
+            "case000",
+            "case004",
+        ]
+
+        missing = tools.execute("compare_cases", {"case_ids": ["case000", "nope"]})
+        assert missing["error_code"] == "CASES_NOT_COMPARED/CASE_NOT_FOUND"
+        assert "nope" in missing["error"]
+
+    @allure.title("Case manager filters and searches through the repository")
+    def test_viewmodel(self, project_with_cases: AppContext):
+        from src.contexts.cases.presentation.viewmodels.case_manager_viewmodel import (
+            CaseManagerViewModel,
+        )
+
+        vm = CaseManagerViewModel(
+            case_repo=project_with_cases.cases_context.case_repo,
+            state=project_with_cases.state,
+            event_bus=project_with_cases.event_bus,
+        )
+
+        assert len(vm.filter_cases(filter_type="with_sources")) == 15
+        assert len(vm.filter_cases(filter_type="has_attributes")) == 30
+        assert [c.name for c in vm.search_cases("p02")] == [
+            f"P{i:03d}" for i in range(20, 30)
+        ]
+        page = vm.filter_cases(query="p0", offset=5, limit=3)
+        assert [c.name for c in page] == ["P005", "P006", "P007"]
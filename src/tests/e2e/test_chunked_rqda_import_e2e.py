@@ -0,0 +1,269 @@
+"""
+QC-039.03 Import RQDA Project - Chunked Import Tests
+
+Legacy RQDA databases are imported as a stream:
+- Codings are fetched, mapped and written one bounded batch at a time
+- The whole import is one transaction, rolled back if the database is
+  unreadable or a write fails part way through
+- Only the RqdaImported summary event is published
+- Progress is reported in rows after each batch
+- Benchmark: memory stays flat as the coding count grows; throughput is
+  reported in rows per second
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+import time
+import tracemalloc
+
+import allure
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.exc import OperationalError
+
+from src.contexts.coding.infra.repositories import (
+    SQLiteCategoryRepository,
+    SQLiteCodeRepository,
+    SQLiteSegmentRepository,
+)
+from src.contexts.exchange.core.commandHandlers import import_rqda as import_mod
+from src.contexts.exchange.core.commands import ImportRqdaCommand
+from src.contexts.projects.infra.schema import create_all_contexts
+from src.contexts.sources.infra.source_repository import SQLiteSourceRepository
+from src.shared.infra.event_bus import EventBus
+
+pytestmark = [
+    pytest.mark.e2e,
+    allure.epic("QualCoder v2"),
+    allure.feature("QC-039 Import Export Formats"),
+]
+
+TEXT = "participant " * 200
+
+
+class _Session:
+    """Commits and rolls back the test connection, counting calls."""
+
+    def __init__(self, connection) -> None:
+        self._conn = connection
+        self.commits = 0
+        self.rollbacks = 0
+
+    def commit(self) -> None:
+        self.commits += 1
+        self._conn.commit()
+
+    def rollback(self) -> None:
+        self.rollbacks += 1
+        self._conn.rollback()
+
+
+def _seed(conn, n_sources: int, codings_per_source: int) -> None:
+    """20 codes (one deleted) and n_sources texts with their codings."""
+    conn.executemany(
+        "INSERT INTO freecode (name, id, color, status) VALUES (?, ?, ?, ?)",
+        [(f"Code {i}", i, "#3366cc", 0 if i == 19 else 1) for i in range(20)],
+    )
+    conn.executemany(
+        "INSERT INTO source (name, id, file, status) VALUES (?, ?, ?, 1)",
+        [(f"interview_{s:03}.txt", s, TEXT) for s in range(n_sources)],
+    )
+    conn.executemany(
+        "INSERT INTO coding (cid, fid, seltext, selfirst, selend, status) "
+        "VALUES (?, ?, 'participant', ?, ?, 1)",
+        (
+            (j % 20, s, (j * 12) % 2000, (j * 12) % 2000 + 11)
+            for s in range(n_sources)
+            for j in range(codings_per_source)
+        ),
+    )
+    conn.commit()
+    conn.close()
+
+
+def _import(repos, rqda_path, **kwargs):
+    source_repo, code_repo, category_repo, segment_repo, event_bus = repos
+    return import_mod.import_rqda(
+        command=ImportRqdaCommand(source_path=str(rqda_path)),
+        source_repo=source_repo,
+        code_repo=code_repo,
+        category_repo=category_repo,
+        segment_repo=segment_repo,
+        event_bus=event_bus,
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def repos(source_repo, code_repo, category_repo, segment_repo, event_bus):
+    return source_repo, code_repo, category_repo, segment_repo, event_bus
+
+
+@allure.story("QC-039.03 Import RQDA Project")
+class TestChunkedImport:
+    @allure.title("Codings are written in batches inside one transaction")
+    def test_batches(
+        self,
+        repos,
+        db_connection,
+        tmp_path,
+        create_rqda_db,
+        segment_repo,
+        monkeypatch,
+    ):
+        monkeypatch.setattr(import_mod, "SEGMENT_BATCH_SIZE", 100)
+        batch_sizes: list[int] = []
+        original = segment_repo.save_many
+        monkeypatch.setattr(
+            segment_repo,
+            "save_many",
+            lambda segments: batch_sizes.append(len(segments)) or original(segments),
+        )
+        conn, rqda_path = create_rqda_db(tmp_path / "project.rqda")
+        _seed(conn, n_sources=5, codings_per_source=50)
+        session = _Session(db_connection)
+        progress: list[tuple[int, int]] = []
+        published = []
+        repos[-1].subscribe_all(published.append)
+
+        result = _import(
+            repos, rqda_path, session=session, on_progress=lambda *p: progress.append(p)
+        )
+
+        assert result.is_success, result.error
+        assert (result.data.codes_created, result.data.sources_created) == (19, 5)
+        # Codings of the deleted code are dropped
+        assert result.data.segments_created == 5 * 50 - 5 * 2
+        assert (session.commits, session.rollbacks) == (1, 0)
+        assert [type(e).__name__ for e in published] == ["RqdaImported"]
+
+        with allure.step("Each batch is one save_many call"):
+            assert len(batch_sizes) == 3
+            assert max(batch_sizes) <= 100
+
+        with allure.step("Progress counts rows and ends at the total"):
+            assert [done for done, _ in progress] == [124, 224, 274]
+            assert {total for _, total in progress} == {274}
+
+        with allure.step("Segments reference the imported codes and sources"):
+            counts = segment_repo.count_all_by_code()
+            assert sum(counts.values()) == 240
+
+    @allure.title("An unreadable database is rolled back")
+    def test_rollback(self, repos, db_connection, tmp_path, source_repo, code_repo):
+        rqda_path = tmp_path / "broken.rqda"
+        conn = sqlite3.connect(rqda_path)
+        conn.execute(
+            "CREATE TABLE freecode (name TEXT, id INTEGER, status INTEGER, "
+            "color TEXT, memo TEXT)"
+        )
+        conn.execute(
+            "CREATE TABLE source (name TEXT, id INTEGER, file TEXT, "
+            "memo TEXT, status INTEGER)"
+        )
+        conn.execute("CREATE TABLE coding (cid INTEGER, fid INTEGER, status INTEGER)")
+        conn.execute("INSERT INTO freecode VALUES ('Joy', 1, 1, '#00ff00', NULL)")
+        conn.execute("INSERT INTO source VALUES ('a.txt', 1, 'text', NULL, 1)")
+        conn.commit()
+        conn.close()
+        session = _Session(db_connection)
+
+        result = _import(repos, rqda_path, session=session)
+
+        assert result.is_failure
+        assert result.error_code == "RQDA_NOT_IMPORTED/PARSE_ERROR"
+        assert (session.commits, session.rollbacks) == (0, 1)
+        assert source_repo.list_summaries() == []
+        assert code_repo.get_all() == []
+
+    @allure.title("A failed write is rolled back")
+    def test_write_failure(
+        self,
+        repos,
+        db_connection,
+        tmp_path,
+        create_rqda_db,
+        source_repo,
+        code_repo,
+        segment_repo,
+        monkeypatch,
+    ):
+        def fail(_segments):
+            raise OperationalError("INSERT", {}, Exception("disk I/O error"))
+
+        monkeypatch.setattr(segment_repo, "save_many", fail)
+        conn, rqda_path = create_rqda_db(tmp_path / "project.rqda")
+        _seed(conn, n_sources=2, codings_per_source=10)
+        session = _Session(db_connection)
+
+        result = _import(repos, rqda_path, session=session)
+
+        assert result.is_failure
+        assert result.error_code == "RQDA_NOT_IMPORTED/WRITE_FAILED"
+        assert (session.commits, session.rollbacks) == (0, 1)
+        assert source_repo.list_summaries() == []
+        assert code_repo.get_all() == []
+
+
+def _measure(rqda_path, traced: bool) -> tuple[int, float, int]:
+    """Import into a fresh project; (segments, seconds, traced peak bytes)."""
+    engine = create_engine("sqlite:///:memory:")
+    create_all_contexts(engine)
+    with engine.connect() as conn:
+        repos = (
+            SQLiteSourceRepository(conn),
+            SQLiteCodeRepository(conn),
+            SQLiteCategoryRepository(conn),
+            SQLiteSegmentRepository(conn),
+            EventBus(history_size=100),
+        )
+        if traced:
+            tracemalloc.start()
+        started = time.perf_counter()
+        result = _import(repos, rqda_path, session=_Session(conn))
+        elapsed = time.perf_counter() - started
+        peak = 0
+        if traced:
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+    engine.dispose()
+    assert result.is_success, result.error
+    return result.data.segments_created, elapsed, peak
+
+
+@allure.story("QC-039.03 Import RQDA Project")
+@allure.severity(allure.severity_level.NORMAL)
+class TestChunkedImportBenchmark:
+    @pytest.mark.slow
+    @allure.title("Memory stays flat as the coding count grows")
+    def test_benchmark(self, tmp_path, create_rqda_db, caplog):
+        paths = {}
+        for per_source in (200, 2_000):
+            conn, paths[per_source] = create_rqda_db(
+                tmp_path / f"project_{per_source}.rqda"
+            )
+            _seed(conn, n_sources=100, codings_per_source=per_source)
+        small, _, small_peak = _measure(paths[200], traced=True)
+        large, _, large_peak = _measure(paths[2_000], traced=True)
+
+        # Tracing slows allocation down, so throughput is timed separately
+        with caplog.at_level(logging.INFO, logger="qualcoder.exchange.core"):
+            _, seconds, _ = _measure(paths[2_000], traced=False)
+        (summary,) = [m for m in caplog.messages if m.startswith("RQDA imported")]
+
+        allure.attach(
+            f"{small:>7} codings: peak {small_peak / 2**20:6.1f} MiB\n"
+            f"{large:>7} codings: peak {large_peak / 2**20:6.1f} MiB, "
+            f"{seconds:.2f}s\n{summary}",
+            name="chunked_rqda_import_benchmark",
+            attachment_type=allure.attachment_type.TEXT,
+        )
+        assert (small, large) == (19_000, 190_000)
+        assert "rows/s" in summary
+        # 10x the codings; the peak is bounded by the batch in flight
+        assert large_peak - small_peak < 8 * 2**20, (
+            f"Peak memory grew {large_peak / 2**20:.1f} MiB for {large} codings "
+            f"vs {small_peak / 2**20:.1f} MiB for {small}"
+        )
@@ -799,12 +799,18 @@ class TestPhase6FullValidatedWorkflow:
         with allure.step("Verify audit trail (Lincoln & Guba trustworthiness)"):
             history = app_context.event_bus.get_history()
             event_types = [e.event_type for e in history]
+            # Batches record their segments in one aggregated event
+            coded_segments = sum(
+                len(e.event.segments) if e.event_type == "coding.segments_coded" else 1
+                for e in history
+                if e.event_type in ("coding.segment_coded", "coding.segments_coded")
+            )
 
             assert "coding.code_created" in event_types
-            assert "coding.segment_coded" in event_types
+            assert coded_segments > 0
             assert "coding.category_created" in event_types
             assert "coding.code_moved_to_category" in event_types
 
             assert event_types.count("coding.code_created") == 5
-            assert event_types.count("coding.segment_coded") == 5
+            assert coded_segments == 5
             assert event_types.count("coding.category_created") == 2
@@ -0,0 +1,300 @@
+"""
+QC-050.05 Codebook Read Model - End-to-End Tests
+
+The codebook is loaded once per open project and kept current by events:
+- Lookups by id and name, category trees and segment counts are in memory
+- Code, category and segment commands update the model without reloading
+- Subscribers that run on the same event already see the updated model
+- Codes and categories written without events are picked up on next access
+- Viewmodel coordinator and MCP tools read from the model
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import allure
+import pytest
+from sqlalchemy import event
+
+from src.contexts.coding.core.commandHandlers import (
+    apply_code,
+    create_category,
+    create_code,
+    delete_category,
+    delete_code,
+    merge_codes,
+    move_code_to_category,
+    remove_segment,
+    rename_code,
+)
+from src.contexts.coding.core.commands import (
+    ApplyCodeCommand,
+    CreateCategoryCommand,
+    CreateCodeCommand,
+    DeleteCategoryCommand,
+    DeleteCodeCommand,
+    MergeCodesCommand,
+    MoveCodeToCategoryCommand,
+    RemoveCodeCommand,
+    RenameCodeCommand,
+)
+from src.contexts.coding.core.entities import Category, Code, Color
+from src.contexts.coding.infra.codebook_read_model import CodebookReadModel
+from src.contexts.coding.infra.codebook_version import codebook_version
+from src.contexts.coding.infra.repositories import (
+    SQLiteCategoryRepository,
+    SQLiteCodeRepository,
+    SQLiteSegmentRepository,
+)
+from src.contexts.projects.core.events import SourceRemoved
+from src.shared.common.types import CategoryId, CodeId, SourceId
+from src.shared.infra.event_bus import EventBus
+
+if TYPE_CHECKING:
+    from src.shared.infra.app_context import AppContext
+
+pytestmark = [
+    pytest.mark.e2e,
+    allure.epic("QualCoder v2"),
+    allure.feature("QC-050 Performance"),
+]
+
+
+@pytest.fixture
+def repos(db_connection) -> dict:
+    return {
+        "code_repo": SQLiteCodeRepository(db_connection),
+        "category_repo": SQLiteCategoryRepository(db_connection),
+        "segment_repo": SQLiteSegmentRepository(db_connection),
+        "event_bus": EventBus(),
+    }
+
+
+@pytest.fixture
+def codebook(repos, db_connection) -> CodebookReadModel:
+    model = CodebookReadModel(
+        repos["code_repo"],
+        repos["category_repo"],
+        repos["segment_repo"],
+        version=lambda: codebook_version(db_connection),
+    )
+    model.enable(repos["event_bus"])
+    yield model
+    model.disable()
+
+
+@pytest.fixture
+def codebook_reads(db_engine):
+    """Record SELECTs that load the whole codebook or all segment counts."""
+    reads: list[str] = []
+
+    def _capture(_conn, _cursor, statement, _params, _context, _many):
+        sql = " ".join(statement.lower().split())
+        if not sql.startswith("select"):
+            return
+        full_scan = " where " not in sql and (
+            "from cod_code" in sql or "from cod_category" in sql
+        )
+        if full_scan or "from cod_segment_count_code" in sql:
+            reads.append(statement)
+
+    event.listen(db_engine, "before_cursor_execute", _capture)
+    yield reads
+    event.remove(db_engine, "before_cursor_execute", _capture)
+
+
+def _code(repos, name: str, category_id=None):
+    result = create_code(
+        CreateCodeCommand(name=name, color="#112233", category_id=category_id),
+        **repos,
+    )
+    assert result.is_success
+    return result.data.id.value
+
+
+def _apply(repos, code_id, source_id: str, start: int):
+    result = apply_code(
+        ApplyCodeCommand(
+            code_id=code_id,
+            source_id=source_id,
+            start_position=start,
+            end_position=start + 5,
+        ),
+        **repos,
+    )
+    assert result.is_success
+    return result.data.id.value
+
+
+@allure.story("QC-050.05 Codebook Read Model")
+class TestCodebookReadModel:
+    @allure.title("Commands keep the model current without reloading it")
+    def test_commands(self, repos, codebook, monkeypatch):
+        reloads: list[int] = []
+        monkeypatch.setattr(codebook, "reload", lambda: reloads.append(1))
+
+        trust = _code(repos, "Trust")
+        doubt = _code(repos, "Doubt")
+        seg = _apply(repos, trust, "s1", 0)
+        _apply(repos, trust, "s1", 10)
+        _apply(repos, doubt, "s2", 0)
+
+        assert codebook.get_code_by_name("Trust").id.value == trust
+        # Case-insensitive, like CodeRepository.get_by_name
+        assert codebook.get_code_by_name("tRUST").id.value == trust
+        assert [c.name for c in codebook.get_all_codes()] == ["Doubt", "Trust"]
+        assert codebook.segment_counts() == {trust: 2, doubt: 1}
+
+        with allure.step("Rename and uncode"):
+            assert rename_code(
+                RenameCodeCommand(code_id=trust, new_name="Confidence"), **repos
+            ).is_success
+            assert remove_segment(RemoveCodeCommand(segment_id=seg), **repos).is_success
+            assert codebook.get_code_by_name("Trust") is None
+            assert codebook.get_code_by_name("CONFIDENCE").id.value == trust
+            assert codebook.get_code(trust).name == "Confidence"
+            assert codebook.segment_count(trust) == 1
+
+        with allure.step("Merge moves counts to the target"):
+            assert merge_codes(
+                MergeCodesCommand(source_code_id=doubt, target_code_id=trust),
+                **repos,
+            ).is_success
+            assert codebook.get_code(doubt) is None
+            assert codebook.segment_counts() == {trust: 2}
+
+        with allure.step("Delete drops the code and its count"):
+            assert delete_code(
+                DeleteCodeCommand(code_id=trust, delete_segments=True), **repos
+            ).is_success
+            assert codebook.get_all_codes() == []
+            assert codebook.segment_counts() == {}
+
+        assert reloads == []
+
+    @allure.title("Categories form a tree and orphaned codes move to the parent")
+    def test_categories(self, repos, codebook):
+        parent = create_category(CreateCategoryCommand(name="Emotions"), **repos)
+        parent_id = parent.data.id.value
+        child = create_category(
+            CreateCategoryCommand(name="Negative", parent_id=parent_id), **repos
+        )
+        child_id = child.data.id.value
+        fear = _code(repos, "Fear")
+        assert move_code_to_category(
+            MoveCodeToCategoryCommand(code_id=fear, category_id=child_id), **repos
+        ).is_success
+
+        tree = codebook.category_children()
+        assert [c.name for c in tree[None]] == ["Emotions"]
+        assert [c.name for c in tree[parent_id]] == ["Negative"]
+        assert [c.name for c in codebook.codes_by_category()[child_id]] == ["Fear"]
+
+        assert delete_category(
+            DeleteCategoryCommand(category_id=child_id), **repos
+        ).is_success
+        assert codebook.get_category(child_id) is None
+        assert codebook.get_code(fear).category_id.value == parent_id
+
+    @allure.title("Counts invalidated by source removal reload with one query")
+    def test_stale_counts(self, repos, codebook, codebook_reads):
+        code_id = _code(repos, "Place")
+        _apply(repos, code_id, "s1", 0)
+        _apply(repos, code_id, "s2", 0)
+        repos["segment_repo"].delete_by_source(SourceId(value="s1"))
+        codebook_reads.clear()
+        repos["event_bus"].publish(
+            SourceRemoved.create(source_id=SourceId(value="s1"), name="s1")
+        )
+        assert codebook_reads == []
+
+        assert codebook.segment_count(code_id) == 1
+        assert codebook.segment_count(code_id) == 1
+        assert len(codebook_reads) == 1
+
+    @allure.title("Codes and categories written without events are reloaded")
+    def test_writes_without_events(self, repos, codebook, codebook_reads):
+        _code(repos, "Trust")
+        codebook_reads.clear()
+        assert [c.name for c in codebook.get_all_codes()] == ["Trust"]
+        assert codebook_reads == []
+
+        repos["code_repo"].save(
+            Code(id=CodeId("99"), name="Loyalty", color=Color.from_hex("#4CAF50"))
+        )
+        repos["category_repo"].save(Category(id=CategoryId("7"), name="Values"))
+
+        assert [c.name for c in codebook.get_all_codes()] == ["Loyalty", "Trust"]
+        assert codebook.get_category("7").name == "Values"
+        # One reload, then served from memory again
+        reloads = len(codebook_reads)
+        assert codebook.get_code_by_name("Loyalty").id.value == "99"
+        assert len(codebook_reads) == reloads
+
+    @allure.title("Earlier subscribers see the model already updated")
+    def test_subscriber_order(self, repos):
+        bus = repos["event_bus"]
+        seen: list[list[str]] = []
+        model = CodebookReadModel(
+            repos["code_repo"], repos["category_repo"], repos["segment_repo"]
+        )
+        bus.subscribe(
+            "coding.code_created",
+            lambda _e: seen.append([c.name for c in model.get_all_codes()]),
+        )
+        model.enable(bus)
+
+        _code(repos, "Hope")
+        assert seen == [["Hope"]]
+
+
+# =============================================================================
+# Consumers
+# =============================================================================
+
+
+@pytest.fixture
+def project(app_context: AppContext, tmp_path: Path) -> AppContext:
+    path = tmp_path / "codebook.qda"
+    assert app_context.create_project(name="Codebook", path=str(path)).is_success
+    assert app_context.open_project(str(path)).is_success
+    return app_context
+
+
+@allure.story("QC-050.05 Codebook Read Model")
+class TestConsumers:
+    @allure.title("Coordinator and MCP tools read codes from the model")
+    def test_reads(self, project: AppContext, codebook_reads):
+        from src.contexts.coding.interface.mcp_tools import CodingTools
+        from src.contexts.coding.presentation.coordinator import CodingCoordinator
+
+        coding_ctx = project.coding_context
+        assert coding_ctx.codebook.is_loaded
+        tools = CodingTools(ctx=project)
+        created = tools.execute("create_code", {"name": "Theme", "color": "#123456"})
+        assert created["success"] is True
+        codebook_reads.clear()
+
+        coordinator = CodingCoordinator(
+            code_repo=coding_ctx.code_repo,
+            category_repo=coding_ctx.category_repo,
+            segment_repo=coding_ctx.segment_repo,
+            event_bus=project.event_bus,
+            codebook=coding_ctx.codebook,
+        )
+        for _ in range(3):
+            assert [c.name for c in coordinator.get_all_codes()] == ["Theme"]
+            assert coordinator.get_segment_counts_by_code() == {}
+            listed = tools.execute("list_codes", {})
+            assert [c["name"] for c in listed["data"]] == ["Theme"]
+            tools.execute("detect_duplicate_codes", {})
+
+        assert codebook_reads == []
+
+    @allure.title("Closing the project unsubscribes and empties the model")
+    def test_close_project(self, project: AppContext):
+        codebook = project.coding_context.codebook
+        project.close_project()
+        assert not codebook.is_loaded
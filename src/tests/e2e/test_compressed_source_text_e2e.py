@@ -0,0 +1,378 @@
+"""
+QC-027.18 Compressed Source Text - End-to-End Tests
+
+Source text can be stored as independently compressed chunks:
+- Reads decompress transparently; range reads touch only overlapping chunks
+- Full-text search still finds and highlights compressed text
+- Existing projects migrate to compressed storage and back
+- Older databases gain the chunk table on open
+- Benchmark: database size, open time and range-read latency
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from pathlib import Path
+
+import allure
+import pytest
+from sqlalchemy import create_engine, inspect, text
+
+from src.contexts.projects.core.commands import CompressSourceTextsCommand
+from src.contexts.projects.core.entities import Source, SourceType
+from src.contexts.projects.infra.schema import create_all_contexts
+from src.contexts.projects.infra.settings_repository import (
+    SQLiteProjectSettingsRepository,
+)
+from src.contexts.sources.core.commandHandlers.compress_source_texts import (
+    compress_source_texts,
+)
+from src.contexts.sources.infra import text_compression
+from src.contexts.sources.infra.fulltext_index import (
+    SQLiteFulltextIndex,
+    create_fulltext_index,
+    drop_fulltext_index,
+)
+from src.contexts.sources.infra.schema import upgrade_source_columns
+from src.contexts.sources.infra.source_repository import SQLiteSourceRepository
+from src.contexts.sources.infra.text_compression import (
+    CODEC_ZLIB,
+    TEXT_CODEC_SETTING,
+    ChunkLayout,
+    available_codecs,
+    compress_chunks,
+    decompress_chunk,
+)
+from src.shared.common.types import SourceId
+
+pytestmark = [
+    pytest.mark.e2e,
+    allure.epic("QualCoder v2"),
+    allure.feature("QC-027 Manage Sources"),
+]
+
+_WORDS = (
+    "participant interviewer community health research clinic family work "
+    "support trust experience story change school money time help people"
+).split()
+
+
+def _transcript(n_chars: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    words: list[str] = []
+    size = 0
+    while size < n_chars:
+        word = rng.choice(_WORDS)
+        words.append(word)
+        size += len(word) + 1
+    return " ".join(words)[:n_chars]
+
+
+def _source(name: str, fulltext: str) -> Source:
+    return Source(
+        id=SourceId.new(), name=name, source_type=SourceType.TEXT, fulltext=fulltext
+    )
+
+
+def _integrity_check(conn) -> None:
+    conn.execute(
+        text(
+            "INSERT INTO source_fulltext_fts(source_fulltext_fts, rank) "
+            "VALUES ('integrity-check', 0)"
+        )
+    )
+
+
+@allure.story("QC-027.18 Compressed Source Text")
+class TestChunkLayout:
+    @allure.title("Chunk ranges cover exactly the requested characters")
+    def test_chunks_for(self):
+        layout = ChunkLayout(CODEC_ZLIB, chunk_chars=10, length=35)
+        assert layout.chunk_count == 4
+        assert layout.chunks_for(0, 10) == range(0, 1)
+        assert layout.chunks_for(9, 11) == range(0, 2)
+        assert layout.chunks_for(30, 100) == range(3, 4)
+        assert layout.chunks_for(40, 50) == range(0)
+        assert layout.chunk_start(3) == 30
+
+    @pytest.mark.parametrize("codec", available_codecs())
+    @allure.title("Chunks round-trip through every available codec")
+    def test_round_trip(self, codec: str):
+        body = "Zoë said: ünïcode ✓ " * 50
+        chunks = compress_chunks(body, codec, chunk_chars=64)
+        assert len(chunks) == -(-len(body) // 64)
+        assert "".join(decompress_chunk(codec, c) for c in chunks) == body
+
+
+@allure.story("QC-027.18 Compressed Source Text")
+class TestCompressedRepository:
+    @allure.title("Reads decompress transparently, range reads only needed chunks")
+    def test_reads(self, db_connection, monkeypatch):
+        repo = SQLiteSourceRepository(
+            db_connection, text_codec=CODEC_ZLIB, chunk_chars=100
+        )
+        body = _transcript(1_000)
+        source = _source("long.txt", body)
+        repo.save(source)
+
+        stored = db_connection.execute(
+            text("SELECT fulltext, text_codec FROM src_source")
+        ).one()
+        assert stored.fulltext is None
+        assert stored.text_codec == CODEC_ZLIB
+
+        assert repo.get_by_id(source.id).fulltext == body
+        assert repo.get_fulltext(source.id) == body
+        assert repo.get_length(source.id) == 1_000
+
+        decompressed: list[str] = []
+        original = text_compression.decompress_chunk
+        monkeypatch.setattr(
+            text_compression,
+            "decompress_chunk",
+            lambda codec, data: decompressed.append(codec) or original(codec, data),
+        )
+        assert repo.get_text_range(source.id, 250, 380) == body[250:380]
+        assert len(decompressed) == 2
+        assert repo.get_text_range(source.id, 990, 2_000) == body[990:]
+        assert repo.get_text_range(source.id, 5_000, 6_000) == ""
+
+    @allure.title("Updates and deletes replace and remove chunks")
+    def test_update_delete(self, db_connection, monkeypatch):
+        repo = SQLiteSourceRepository(
+            db_connection, text_codec=CODEC_ZLIB, chunk_chars=100
+        )
+        source = _source("doc.txt", _transcript(500))
+        repo.save(source)
+        repo.save(_source("other.txt", "short"))
+
+        with allure.step("Saving metadata keeps the chunks without decompressing"):
+            decompressed: list[str] = []
+            original = text_compression.decompress_chunk
+            monkeypatch.setattr(
+                text_compression,
+                "decompress_chunk",
+                lambda codec, data: decompressed.append(codec) or original(codec, data),
+            )
+            repo.save(source.with_memo("metadata only"))
+            assert decompressed == []
+            # Compressed before text hashes were stored: compared by content
+            db_connection.execute(text("UPDATE src_source SET text_hash = NULL"))
+            repo.save(source.with_memo("metadata again"))
+            assert len(decompressed) == 5
+            repo.save(source)
+            assert len(decompressed) == 5
+            monkeypatch.undo()
+
+        revised = _transcript(250, seed=1)
+        repo.save(
+            Source(
+                id=source.id,
+                name="doc.txt",
+                source_type=SourceType.TEXT,
+                fulltext=revised,
+            )
+        )
+        assert repo.get_fulltext(source.id) == revised
+        assert repo.get_text_range(source.id, 200, 300) == revised[200:]
+
+        repo.delete(source.id)
+        chunks = db_connection.execute(
+            text("SELECT count(*) FROM src_source_text WHERE source_id = :id"),
+            {"id": source.id.value},
+        ).scalar()
+        assert chunks == 0
+        assert repo.get_text_range(source.id, 0, 10) is None
+
+    @allure.title("Unavailable codecs are rejected")
+    def test_unknown_codec(self, db_connection):
+        with pytest.raises(ValueError, match="not available"):
+            SQLiteSourceRepository(db_connection, text_codec="lzma9")
+
+
+@allure.story("QC-027.18 Compressed Source Text")
+class TestCompressedSearch:
+    @allure.title("Search finds, highlights and forgets compressed text")
+    def test_search(self, db_connection):
+        repo = SQLiteSourceRepository(
+            db_connection, text_codec=CODEC_ZLIB, chunk_chars=100
+        )
+        index = SQLiteFulltextIndex(db_connection)
+        body = _transcript(400) + " the lighthouse keeper " + _transcript(400)
+        source = _source("coast.txt", body)
+        repo.save(source)
+        _integrity_check(db_connection)
+
+        page = index.search("lighthouse", kinds=("source",))
+        assert [h.ref_id for h in page.hits] == [source.id.value]
+        assert "<mark>lighthouse</mark>" in page.hits[0].snippet
+
+        with allure.step("Edited text replaces the indexed words"):
+            repo.save(
+                Source(
+                    id=source.id,
+                    name="coast.txt",
+                    source_type=SourceType.TEXT,
+                    fulltext="the harbour master",
+                )
+            )
+            assert index.search("lighthouse").total == 0
+            assert index.matching_source_ids("harbour") == [source.id.value]
+            _integrity_check(db_connection)
+
+        with allure.step("A rebuilt index still covers compressed text"):
+            drop_fulltext_index(db_connection)
+            create_fulltext_index(db_connection)
+            assert index.matching_source_ids("harbour") == [source.id.value]
+
+        with allure.step("Deleted sources leave the index"):
+            repo.delete(source.id)
+            assert index.search("harbour").total == 0
+            _integrity_check(db_connection)
+
+
+@allure.story("QC-027.18 Compressed Source Text")
+class TestCompressMigration:
+    @allure.title("Existing sources migrate to compressed storage and back")
+    def test_migrate(self, db_connection, source_repo, project_state):
+        settings = SQLiteProjectSettingsRepository(db_connection)
+        index = SQLiteFulltextIndex(db_connection)
+        texts = {f"doc_{i}.txt": _transcript(20_000, seed=i) for i in range(3)}
+        source_repo.save_many([_source(name, body) for name, body in texts.items()])
+
+        compressed = compress_source_texts(
+            command=CompressSourceTextsCommand(codec=CODEC_ZLIB),
+            state=project_state,
+            source_repo=source_repo,
+            settings_repo=settings,
+        )
+        assert compressed.is_success
+        assert (compressed.data["rewritten"], compressed.data["total"]) == (3, 3)
+        assert compressed.data["bytes_after"] < compressed.data["bytes_before"] / 2
+        assert settings.get(TEXT_CODEC_SETTING) == CODEC_ZLIB
+        for name, body in texts.items():
+            assert source_repo.get_by_name(name).fulltext == body
+        assert len(index.matching_source_ids("participant")) == 3
+        _integrity_check(db_connection)
+
+        with allure.step("Running again rewrites nothing"):
+            again = compress_source_texts(
+                command=CompressSourceTextsCommand(codec=CODEC_ZLIB),
+                state=project_state,
+                source_repo=source_repo,
+            )
+            assert again.data["rewritten"] == 0
+
+        with allure.step("Decompressing restores plain fulltext"):
+            plain = compress_source_texts(
+                command=CompressSourceTextsCommand(codec=None),
+                state=project_state,
+                source_repo=source_repo,
+                settings_repo=settings,
+            )
+            assert plain.data["rewritten"] == 3
+            assert settings.get(TEXT_CODEC_SETTING) is None
+            stored = db_connection.execute(
+                text("SELECT count(*) FROM src_source WHERE fulltext IS NOT NULL")
+            ).scalar()
+            assert stored == 3
+            assert len(index.matching_source_ids("participant")) == 3
+            _integrity_check(db_connection)
+
+    @allure.title("Unavailable codec fails with a suggestion")
+    def test_unavailable_codec(self, source_repo, project_state):
+        result = compress_source_texts(
+            command=CompressSourceTextsCommand(codec="brotli"),
+            state=project_state,
+            source_repo=source_repo,
+        )
+        assert result.error_code == "SOURCES_NOT_COMPRESSED/CODEC_UNAVAILABLE"
+
+
+@allure.story("QC-027.18 Compressed Source Text")
+class TestCompressedSchemaUpgrade:
+    @allure.title("Older databases gain the chunk table and layout columns")
+    def test_upgrade(self):
+        engine = create_engine("sqlite:///:memory:")
+        with engine.begin() as conn:
+            conn.execute(
+                text(
+                    "CREATE TABLE src_source (id VARCHAR(36) PRIMARY KEY, "
+                    "name VARCHAR(255) NOT NULL, mediapath VARCHAR(500), "
+                    "source_type VARCHAR(20), folder_id VARCHAR(36))"
+                )
+            )
+            upgrade_source_columns(conn)
+            upgrade_source_columns(conn)  # Idempotent
+
+        inspector = inspect(engine)
+        columns = {c["name"] for c in inspector.get_columns("src_source")}
+        assert {"text_codec", "text_length", "text_chunk_chars", "text_hash"} <= columns
+        assert "src_source_text" in inspector.get_table_names()
+        engine.dispose()
+
+
+def _build_project(path: Path, codec: str | None, texts: list[str]) -> None:
+    engine = create_engine(f"sqlite:///{path}")
+    create_all_contexts(engine)
+    with engine.connect() as conn:
+        repo = SQLiteSourceRepository(conn, text_codec=codec)
+        repo.save_many([_source(f"doc_{i}.txt", t) for i, t in enumerate(texts)])
+        conn.commit()
+        conn.execute(text("VACUUM"))
+    engine.dispose()
+
+
+def _measure(path: Path, codec: str | None, reads: int = 200) -> dict[str, float]:
+    """Open the project, then time random 2,000-character range reads."""
+    started = time.perf_counter()
+    engine = create_engine(f"sqlite:///{path}")
+    conn = engine.connect()
+    repo = SQLiteSourceRepository(conn, text_codec=codec)
+    ids = [s.id for s in repo.list_summaries()]
+    opened_s = time.perf_counter() - started
+
+    rng = random.Random(1)
+    started = time.perf_counter()
+    for _ in range(reads):
+        source_id = rng.choice(ids)
+        start = rng.randrange(0, repo.get_length(source_id) - 2_000)
+        assert len(repo.get_text_range(source_id, start, start + 2_000)) == 2_000
+    read_s = (time.perf_counter() - started) / reads
+    conn.close()
+    engine.dispose()
+    return {"size": path.stat().st_size, "open_s": opened_s, "read_s": read_s}
+
+
+@allure.story("QC-027.18 Compressed Source Text")
+@allure.severity(allure.severity_level.NORMAL)
+class TestCompressionBenchmark:
+    @pytest.mark.slow
+    @allure.title("Compressed storage: smaller file, fast range reads")
+    def test_benchmark(self, tmp_path: Path):
+        texts = [_transcript(500_000, seed=i) for i in range(10)]
+        codec = text_compression.default_codec()
+        results = {}
+        for label, storage in (("plain", None), (codec, codec)):
+            path = tmp_path / f"{label}.qda"
+            _build_project(path, storage, texts)
+            results[label] = _measure(path, storage)
+
+        allure.attach(
+            "\n".join(
+                f"{label:>6}: {r['size'] / 1e6:6.2f} MB on disk, "
+                f"open {r['open_s'] * 1000:6.1f}ms, "
+                f"range read {r['read_s'] * 1e6:7.1f}µs"
+                for label, r in results.items()
+            ),
+            name="compression_benchmark",
+            attachment_type=allure.attachment_type.TEXT,
+        )
+        plain, packed = results["plain"], results[codec]
+        assert packed["size"] < plain["size"] * 0.6
+        # Generous bound: parallel workers share the CPU; a full decompress of
+        # a 500k-character source per read would still be far slower
+        assert packed["read_s"] < 0.05, (
+            f"Compressed range read took {packed['read_s'] * 1000:.2f}ms"
+        )
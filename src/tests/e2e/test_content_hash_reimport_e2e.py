@@ -0,0 +1,289 @@
+"""
+QC-027.12 Re-import Unchanged Sources - End-to-End Tests
+
+Every imported file records its size, mtime and a BLAKE2b content hash:
+- Re-importing an unchanged file is skipped without reading it
+- A touched but identical file only refreshes the recorded mtime
+- A changed file is re-extracted into the existing source, unless the
+  source has coded segments
+- Renamed copies of imported content are detected and skipped in batches
+- Folder re-imports send only new and changed files to the extractors
+- Older databases gain the new columns and hash index on open
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import allure
+import pytest
+from sqlalchemy import create_engine, inspect, text
+
+from src.contexts.coding.core.entities import TextPosition, TextSegment
+from src.contexts.projects.core.commands import (
+    ImportFileSourceCommand,
+    ImportFolderCommand,
+)
+from src.contexts.sources.core.commandHandlers import import_file_source as handler
+from src.contexts.sources.core.commandHandlers.import_file_source import (
+    CODED_SOURCE_CHANGED,
+    DUPLICATE_CONTENT,
+    UNCHANGED,
+    file_unchanged,
+    import_file_source,
+)
+from src.contexts.sources.core.commandHandlers.import_folder import import_folder
+from src.contexts.sources.infra.content_hash import hash_file
+from src.contexts.sources.infra.extraction_pool import (
+    ExtractionPipeline,
+    extract_file,
+)
+from src.contexts.sources.infra.schema import upgrade_source_columns
+from src.shared.common.types import CodeId, SegmentId
+
+pytestmark = [
+    pytest.mark.e2e,
+    allure.epic("QualCoder v2"),
+    allure.feature("QC-027 Manage Sources"),
+]
+
+
+def _import(
+    path: Path, source_repo, project_state, event_bus, segment_repo=None, **kwargs
+):
+    return import_file_source(
+        command=ImportFileSourceCommand(file_path=str(path), **kwargs),
+        state=project_state,
+        source_repo=source_repo,
+        event_bus=event_bus,
+        segment_repo=segment_repo,
+    )
+
+
+def _bump_mtime(path: Path) -> None:
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+@allure.story("QC-027.12 Re-import Unchanged Sources")
+class TestContentHash:
+    @allure.title("Streaming hash matches BLAKE2b over the whole file")
+    def test_hash_file(self, tmp_path: Path):
+        path = tmp_path / "data.bin"
+        data = os.urandom(10_000)
+        path.write_bytes(data)
+
+        expected = hashlib.blake2b(data, digest_size=32).hexdigest()
+        assert hash_file(path) == expected
+        assert hash_file(path, chunk_size=7) == expected
+
+
+@allure.story("QC-027.12 Re-import Unchanged Sources")
+class TestReimportFile:
+    @allure.title("Unchanged, touched and changed files on re-import")
+    def test_reimport(
+        self, source_repo, project_state, event_bus, tmp_path: Path, monkeypatch
+    ):
+        path = tmp_path / "interview.txt"
+        path.write_text("first version", encoding="utf-8")
+        first = _import(path, source_repo, project_state, event_bus)
+        assert first.is_success
+        source_id = first.data.id
+        assert source_repo.get_by_id(source_id).content_hash == hash_file(path)
+
+        with allure.step("Unchanged file is skipped without hashing"):
+            monkeypatch.setattr(
+                handler, "hash_file", lambda _p: pytest.fail("file was hashed")
+            )
+            again = _import(path, source_repo, project_state, event_bus)
+            assert again.error_code == UNCHANGED
+            assert file_unchanged(source_repo, path)
+            monkeypatch.undo()
+
+        with allure.step("Touched file refreshes its mtime only"):
+            _bump_mtime(path)
+            assert not file_unchanged(source_repo, path)
+            touched = _import(path, source_repo, project_state, event_bus)
+            assert touched.error_code == UNCHANGED
+            assert file_unchanged(source_repo, path)
+
+        with allure.step("Changed file is re-extracted into the same source"):
+            updates = []
+            event_bus.subscribe("projects.source_updated", updates.append)
+            path.write_text("second, longer version", encoding="utf-8")
+            _bump_mtime(path)
+            changed = _import(path, source_repo, project_state, event_bus)
+            assert changed.is_success
+            assert changed.data.id == source_id
+            assert source_repo.get_by_id(source_id).fulltext == (
+                "second, longer version"
+            )
+            assert source_repo.count() == 1
+            assert len(updates) == 1
+
+    @allure.title("A changed file of a coded source is not re-extracted")
+    def test_coded_source_changed(
+        self, source_repo, segment_repo, project_state, event_bus, tmp_path: Path
+    ):
+        path = tmp_path / "coded.txt"
+        path.write_text("I trust my team", encoding="utf-8")
+        source = _import(path, source_repo, project_state, event_bus).data
+        segment_repo.save(
+            TextSegment(
+                id=SegmentId(value="g1"),
+                source_id=source.id,
+                code_id=CodeId(value="c1"),
+                position=TextPosition(start=2, end=7),
+                selected_text="trust",
+            )
+        )
+
+        path.write_text("We doubt everything now", encoding="utf-8")
+        _bump_mtime(path)
+        for dry_run in (True, False):
+            refused = _import(
+                path,
+                source_repo,
+                project_state,
+                event_bus,
+                segment_repo=segment_repo,
+                dry_run=dry_run,
+            )
+            assert refused.error_code == CODED_SOURCE_CHANGED
+            assert "1 coded segment" in refused.error
+        assert source_repo.get_by_id(source.id).fulltext == "I trust my team"
+
+        with allure.step("Folder imports report it as a failure"):
+            result = import_folder(
+                command=ImportFolderCommand(folder_path=str(tmp_path)),
+                state=project_state,
+                source_repo=source_repo,
+                folder_repo=None,
+                event_bus=event_bus,
+                pipeline=_counting_pipeline([]),
+                segment_repo=segment_repo,
+            ).data
+            assert (result["imported"], result["failed"]) == (0, 1)
+            assert "coded segment" in result["failures"][0]["error"]
+
+    @allure.title("Renamed copies are detected and skipped on request")
+    def test_renamed_duplicate(
+        self, source_repo, project_state, event_bus, tmp_path: Path
+    ):
+        original = tmp_path / "a.txt"
+        original.write_text("same words", encoding="utf-8")
+        copy = tmp_path / "renamed.txt"
+        copy.write_bytes(original.read_bytes())
+        assert _import(original, source_repo, project_state, event_bus).is_success
+
+        skipped = _import(
+            copy, source_repo, project_state, event_bus, skip_duplicates=True
+        )
+        assert skipped.error_code == DUPLICATE_CONTENT
+        assert "a.txt" in skipped.error
+
+        assert _import(copy, source_repo, project_state, event_bus).is_success
+        assert source_repo.count() == 2
+
+
+def _counting_pipeline(calls: list[str], **kwargs) -> ExtractionPipeline:
+    def worker(path: str):
+        calls.append(Path(path).name)
+        return extract_file(path)
+
+    return ExtractionPipeline(
+        max_workers=2, executor_factory=ThreadPoolExecutor, worker=worker, **kwargs
+    )
+
+
+@allure.story("QC-027.12 Re-import Unchanged Sources")
+class TestReimportFolder:
+    @allure.title("Folder re-import extracts only new and changed files")
+    def test_folder_reimport(
+        self, source_repo, folder_repo, project_state, event_bus, tmp_path: Path
+    ):
+        root = tmp_path / "drop"
+        root.mkdir()
+        for i in range(4):
+            (root / f"doc_{i}.txt").write_text(f"document {i}", encoding="utf-8")
+
+        def _run(calls: list[str]):
+            return import_folder(
+                command=ImportFolderCommand(folder_path=str(root)),
+                state=project_state,
+                source_repo=source_repo,
+                folder_repo=folder_repo,
+                event_bus=event_bus,
+                pipeline=_counting_pipeline(
+                    calls,
+                    is_unchanged=lambda p: file_unchanged(source_repo, p),
+                ),
+            ).data
+
+        first_calls: list[str] = []
+        first = _run(first_calls)
+        assert (first["imported"], first["skipped"]) == (4, 0)
+        assert len(first_calls) == 4
+
+        with allure.step("Unchanged tree: nothing extracted"):
+            calls: list[str] = []
+            again = _run(calls)
+            assert (again["imported"], again["skipped"], again["failed"]) == (0, 4, 0)
+            assert calls == []
+
+        with allure.step("One changed file and one renamed copy"):
+            changed = root / "doc_1.txt"
+            changed.write_text("document 1, revised", encoding="utf-8")
+            _bump_mtime(changed)
+            (root / "doc_9.txt").write_text("document 2", encoding="utf-8")
+
+            calls = []
+            third = _run(calls)
+            assert sorted(calls) == ["doc_1.txt", "doc_9.txt"]
+            assert (third["imported"], third["skipped"]) == (1, 4)
+            assert source_repo.count() == 4
+            assert source_repo.get_by_name("doc_1.txt").fulltext == (
+                "document 1, revised"
+            )
+
+    @allure.title("Workers skip extracting content already in the project")
+    def test_known_hashes(self, tmp_path: Path, monkeypatch):
+        from src.contexts.sources.infra import extraction_pool
+
+        path = tmp_path / "known.txt"
+        path.write_text("known content", encoding="utf-8")
+        monkeypatch.setattr(
+            extraction_pool, "_known_hashes", frozenset({hash_file(path)})
+        )
+
+        extracted = extract_file(str(path))
+        assert extracted.skipped
+        assert extracted.fulltext is None
+        assert extracted.content_hash == hash_file(path)
+
+
+@allure.story("QC-027.12 Re-import Unchanged Sources")
+class TestSchemaUpgrade:
+    @allure.title("Older src_source tables gain fingerprint columns and indexes")
+    def test_upgrade(self):
+        engine = create_engine("sqlite:///:memory:")
+        with engine.begin() as conn:
+            conn.execute(
+                text(
+                    "CREATE TABLE src_source (id VARCHAR(36) PRIMARY KEY, "
+                    "name VARCHAR(255) NOT NULL, mediapath VARCHAR(500), "
+                    "source_type VARCHAR(20), folder_id VARCHAR(36))"
+                )
+            )
+            upgrade_source_columns(conn)
+            upgrade_source_columns(conn)  # Idempotent
+
+        inspector = inspect(engine)
+        columns = {c["name"] for c in inspector.get_columns("src_source")}
+        assert {"content_hash", "file_mtime_ns"} <= columns
+        indexes = {i["name"] for i in inspector.get_indexes("src_source")}
+        assert {"idx_src_source_hash", "idx_src_source_mediapath"} <= indexes
+        engine.dispose()
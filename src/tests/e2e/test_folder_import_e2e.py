@@ -0,0 +1,239 @@
+"""
+QC-027.11 Import Folder - End-to-End Tests
+
+Importing a directory tree:
+- Files are discovered lazily with os.scandir, hidden and unsupported skipped
+- A dry run reports file count, size and folders without importing
+- Subdirectories are mirrored as project folders
+- Same-named files in different directories are all imported
+- The file manager streams the tree through the batch import
+"""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import allure
+import pytest
+from returns.result import Failure, Success
+
+from src.contexts.sources.core.commandHandlers.import_file_source import (
+    ALL_SUPPORTED_EXTENSIONS,
+)
+from src.contexts.sources.infra.folder_scanner import (
+    estimate_folder,
+    iter_source_files,
+)
+
+if TYPE_CHECKING:
+    from src.shared.infra.app_context import AppContext
+
+pytestmark = [
+    pytest.mark.e2e,
+    allure.epic("QualCoder v2"),
+    allure.feature("QC-027 Manage Sources"),
+]
+
+
+@pytest.fixture
+def tree(tmp_path: Path) -> Path:
+    """
+    interviews/
+        a.txt
+        notes.xyz          (unsupported)
+        .cache/hidden.txt  (hidden)
+        site1/b.txt
+        site1/deep/notes.txt
+        site2/notes.txt
+    """
+    root = tmp_path / "interviews"
+    for rel, body in {
+        "a.txt": "root file",
+        "notes.xyz": "skip",
+        ".cache/hidden.txt": "skip",
+        "site1/b.txt": "site one",
+        "site1/deep/notes.txt": "deep notes",
+        "site2/notes.txt": "site two notes",
+    }.items():
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(body, encoding="utf-8")
+    return root
+
+
+@pytest.fixture
+def project(app_context: AppContext, tmp_path: Path) -> AppContext:
+    path = tmp_path / "folders.qda"
+    assert app_context.create_project(name="Folders", path=str(path)).is_success
+    assert app_context.open_project(str(path)).is_success
+    return app_context
+
+
+@allure.story("QC-027.11 Import Folder Bulk Import")
+class TestFolderScanner:
+    @allure.title("Scanner yields supported files lazily in name order")
+    def test_scan(self, tree: Path):
+        scanned = iter_source_files(tree, ALL_SUPPORTED_EXTENSIONS)
+        first = next(scanned)
+        assert first.path == str(tree / "a.txt")
+
+        rest = [(s.relative_dir, Path(s.path).name) for s in scanned]
+        assert rest == [
+            (("site1",), "b.txt"),
+            (("site1", "deep"), "notes.txt"),
+            (("site2",), "notes.txt"),
+        ]
+
+        flat = list(iter_source_files(tree, ALL_SUPPORTED_EXTENSIONS, recursive=False))
+        assert [Path(s.path).name for s in flat] == ["a.txt"]
+
+    @allure.title("Estimate counts files, bytes and skipped entries")
+    def test_estimate(self, tree: Path):
+        estimate = estimate_folder(tree, ALL_SUPPORTED_EXTENSIONS)
+
+        assert estimate.file_count == 4
+        assert estimate.total_bytes == sum(
+            len(t) for t in ("root file", "site one", "deep notes", "site two notes")
+        )
+        assert estimate.directory_count == 4
+        assert estimate.skipped_count == 1
+        assert estimate.by_extension == {".txt": 4}
+
+
+@allure.story("QC-027.11 Import Folder Bulk Import")
+class TestImportFolderTool:
+    @allure.title("Dry run estimates without importing")
+    def test_dry_run(self, project: AppContext, tree: Path):
+        from src.contexts.sources.interface.mcp_tools import SourceTools
+
+        tools = SourceTools(ctx=project)
+        result = tools.execute(
+            "import_folder", {"folder_path": str(tree), "dry_run": True}
+        )
+
+        assert isinstance(result, Success)
+        data = result.unwrap()
+        assert data["dry_run"] is True
+        assert data["file_count"] == 4
+        assert project.sources_context.source_repo.count() == 0
+
+    @allure.title("Import mirrors directories as folders")
+    def test_import(self, project: AppContext, tree: Path):
+        from src.contexts.sources.interface.mcp_tools import SourceTools
+
+        tools = SourceTools(ctx=project)
+        result = tools.execute("import_folder", {"folder_path": str(tree)})
+
+        assert isinstance(result, Success)
+        data = result.unwrap()
+        assert data["imported"] == 4
+        assert data["failed"] == 0
+        assert data["folders_created"] == 4
+
+        folders = {f.id.value: f for f in project.folders_context.folder_repo.get_all()}
+        sources = {
+            s.name: s for s in project.sources_context.source_repo.list_summaries()
+        }
+        assert set(sources) == {"a.txt", "b.txt", "notes.txt", "site2/notes.txt"}
+
+        def _folder_path(folder_id) -> list[str]:
+            names = []
+            while folder_id is not None:
+                folder = folders[folder_id.value]
+                names.insert(0, folder.name)
+                folder_id = folder.parent_id
+            return names
+
+        assert _folder_path(sources["a.txt"].folder_id) == ["interviews"]
+        assert _folder_path(sources["notes.txt"].folder_id) == [
+            "interviews",
+            "site1",
+            "deep",
+        ]
+        assert _folder_path(sources["site2/notes.txt"].folder_id) == [
+            "interviews",
+            "site2",
+        ]
+
+        with allure.step("Re-import reuses folders and skips unchanged files"):
+            again = tools.execute("import_folder", {"folder_path": str(tree)}).unwrap()
+            assert again["folders_created"] == 0
+            assert (again["imported"], again["skipped"], again["failed"]) == (0, 4, 0)
+
+    @allure.title("Relative paths and missing directories are rejected")
+    def test_invalid(self, project: AppContext, tree: Path):
+        from src.contexts.sources.interface.mcp_tools import SourceTools
+
+        tools = SourceTools(ctx=project)
+        assert not isinstance(
+            tools.execute("import_folder", {"folder_path": "interviews"}), Success
+        )
+        assert not isinstance(
+            tools.execute("import_folder", {"folder_path": str(tree / "missing")}),
+            Success,
+        )
+
+    @allure.title("Import without an open project fails")
+    def test_no_project(self, app_context: AppContext, tree: Path):
+        from src.contexts.sources.interface.mcp_tools import SourceTools
+
+        tools = SourceTools(ctx=app_context)
+        result = tools.execute("import_folder", {"folder_path": str(tree)})
+
+        assert isinstance(result, Failure)
+        assert "No project" in result.failure()
+
+
+@allure.story("QC-027.11 Import Folder Bulk Import")
+class TestFileManagerFolderImport:
+    @allure.title("File manager streams the tree with progress and folders")
+    def test_viewmodel_import(
+        self, source_repo, folder_repo, case_repo, project_state, event_bus, tree
+    ):
+        from src.contexts.sources.presentation.viewmodels.file_manager_viewmodel import (
+            FileManagerViewModel,
+        )
+
+        viewmodel = FileManagerViewModel(
+            source_repo=source_repo,
+            folder_repo=folder_repo,
+            case_repo=case_repo,
+            state=project_state,
+            event_bus=event_bus,
+            extraction_workers=2,
+        )
+        estimate = viewmodel.estimate_folder_import(str(tree))
+        assert estimate["file_count"] == 4
+
+        progress: list[tuple[int, int]] = []
+        finished: list[tuple[int, int]] = []
+        folders_changed: list[int] = []
+        viewmodel.batch_import_progress.connect(
+            lambda cur, tot, _name: progress.append((cur, tot))
+        )
+        viewmodel.batch_import_finished.connect(
+            lambda imp, fail, _paths: finished.append((imp, fail))
+        )
+        viewmodel.folders_changed.connect(lambda: folders_changed.append(1))
+
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            viewmodel.import_folder(str(tree), total=estimate["file_count"])
+            loop.run_until_complete(viewmodel._import_task)
+        finally:
+            loop.close()
+            asyncio.set_event_loop(None)
+
+        assert finished == [(4, 0)]
+        assert progress == [(i, 4) for i in range(1, 5)]
+        assert folders_changed
+        assert {f.name for f in folder_repo.get_all()} == {
+            "interviews",
+            "site1",
+            "deep",
+            "site2",
+        }
+        assert source_repo.get_by_name("site2/notes.txt").fulltext == "site two notes"
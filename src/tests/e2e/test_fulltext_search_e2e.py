@@ -0,0 +1,241 @@
+"""
+QC-033.01 Full-Text Search - End-to-End Tests
+
+Covers the FTS5 index over source text, segment text and memos:
+- Index is kept current by triggers on insert, update and delete
+- Ranked, paged search with highlighted snippets
+- File manager content search and the search_text MCP tool
+- Older databases without the index are upgraded on open
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import allure
+import pytest
+from returns.result import Failure, Success
+
+from src.contexts.coding.core.entities import Code, Color, TextPosition, TextSegment
+from src.contexts.coding.infra.repositories import (
+    SQLiteCodeRepository,
+    SQLiteSegmentRepository,
+)
+from src.contexts.projects.core.entities import Source, SourceType
+from src.contexts.sources.infra.fulltext_index import (
+    SQLiteFulltextIndex,
+    drop_fulltext_index,
+    to_match_query,
+)
+from src.contexts.sources.infra.source_repository import SQLiteSourceRepository
+from src.shared.common.types import CodeId, SegmentId, SourceId
+
+if TYPE_CHECKING:
+    from src.shared.infra.app_context import AppContext
+
+pytestmark = [
+    pytest.mark.e2e,
+    allure.epic("QualCoder v2"),
+    allure.feature("QC-033 Search and Find"),
+]
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def repos(db_connection):
+    return (
+        SQLiteSourceRepository(db_connection),
+        SQLiteCodeRepository(db_connection),
+        SQLiteSegmentRepository(db_connection),
+        SQLiteFulltextIndex(db_connection),
+    )
+
+
+def _source(sid: str, name: str, text: str) -> Source:
+    return Source(
+        id=SourceId(value=sid), name=name, source_type=SourceType.TEXT, fulltext=text
+    )
+
+
+def _segment(seg_id: str, code_id: str, source_id: str, text: str, memo=None):
+    return TextSegment(
+        id=SegmentId(value=seg_id),
+        source_id=SourceId(value=source_id),
+        code_id=CodeId(value=code_id),
+        position=TextPosition(start=0, end=len(text)),
+        selected_text=text,
+        memo=memo,
+    )
+
+
+# =============================================================================
+# Index maintenance
+# =============================================================================
+
+
+@allure.story("QC-033.01 Full-Text Search")
+class TestIndexMaintenance:
+    @allure.title("Sources are indexed, re-indexed and un-indexed by triggers")
+    def test_source_lifecycle(self, repos):
+        source_repo, _, _, index = repos
+
+        with allure.step("Insert sources"):
+            source_repo.save(_source("s1", "interview_1", "I worry about rent"))
+            source_repo.save(_source("s2", "interview_2", "Family comes first"))
+            assert index.matching_source_ids("rent") == ["s1"]
+
+        with allure.step("Update text replaces indexed terms"):
+            updated = _source("s1", "interview_1", "Transport costs too much")
+            source_repo.save(updated)
+            assert index.matching_source_ids("rent") == []
+            assert index.matching_source_ids("transport") == ["s1"]
+
+        with allure.step("Delete removes the source from the index"):
+            source_repo.delete(SourceId(value="s1"))
+            assert index.matching_source_ids("transport") == []
+            assert index.search("family").total == 1
+
+    @allure.title("Segment text, segment memos and code memos are searchable")
+    def test_segments_and_memos(self, repos):
+        source_repo, code_repo, segment_repo, index = repos
+        source_repo.save(_source("s1", "interview_1", "We walked to the clinic"))
+        code_repo.save(
+            Code(
+                id=CodeId(value="c1"),
+                name="Access",
+                color=Color(10, 20, 30),
+                memo="Barriers to healthcare",
+            )
+        )
+        segment_repo.save(
+            _segment("g1", "c1", "s1", "walked to the clinic", memo="distance")
+        )
+
+        page = index.search("clinic")
+        assert {h.kind for h in page.hits} == {"source", "segment"}
+
+        memo_hit = index.search("distance").hits[0]
+        assert memo_hit.kind == "segment_memo"
+        assert memo_hit.source_id == "s1"
+        assert memo_hit.source_name == "interview_1"
+
+        assert index.search("healthcare").hits[0].kind == "code_memo"
+
+        segment_repo.delete(SegmentId(value="g1"))
+        assert index.search("distance").total == 0
+        assert index.search("clinic", kinds=("segment",)).total == 0
+
+
+# =============================================================================
+# Search API
+# =============================================================================
+
+
+@allure.story("QC-033.01 Full-Text Search")
+class TestSearchApi:
+    @allure.title("Results are ranked, paged and highlighted")
+    def test_ranked_paged_highlighted(self, repos):
+        source_repo, _, _, index = repos
+        for i in range(5):
+            filler = "other words here " * (i * 5)
+            source_repo.save(_source(f"s{i}", f"doc_{i}", f"housing {filler}"))
+
+        first = index.search("housing", limit=2)
+        assert first.total == 5
+        assert len(first.hits) == 2
+        assert first.has_more
+        assert first.hits[0].ref_id == "s0"  # Shortest document ranks best
+        assert "<mark>housing</mark>" in first.hits[0].snippet
+
+        last = index.search("housing", offset=4, limit=2)
+        assert len(last.hits) == 1
+        assert not last.has_more
+
+    @allure.title("User input is treated literally and prefix-matched")
+    def test_query_sanitising(self, repos):
+        source_repo, _, _, index = repos
+        source_repo.save(_source("s1", "doc", 'She said "NOT again" (sigh)'))
+
+        assert to_match_query("   ") == ""
+        assert index.search('"').total == 0
+        assert index.search("NOT again").total == 1
+        assert index.search("(sig").total == 1
+
+
+# =============================================================================
+# Consumers
+# =============================================================================
+
+
+@pytest.fixture
+def open_project(app_context: AppContext, tmp_path: Path) -> Path:
+    path = tmp_path / "search.qda"
+    assert app_context.create_project(name="Search", path=str(path)).is_success
+    assert app_context.open_project(str(path)).is_success
+    return path
+
+
+@allure.story("QC-033.01 Full-Text Search")
+class TestSearchConsumers:
+    @allure.title("search_text MCP tool returns ranked, scoped results")
+    def test_mcp_search_text(self, app_context: AppContext, open_project: Path):
+        from src.contexts.sources.interface.mcp_tools import SourceTools
+
+        tools = SourceTools(ctx=app_context)
+        tools.execute(
+            "add_text_source",
+            {"name": "notes.txt", "content": "Neighbourhood safety at night"},
+        )
+
+        result = tools.execute("search_text", {"query": "safety", "scope": ["source"]})
+        assert isinstance(result, Success)
+        data = result.unwrap()
+        assert data["total"] == 1
+        assert data["results"][0]["source_name"] == "notes.txt"
+        assert "<mark>safety</mark>" in data["results"][0]["snippet"]
+
+        bad = tools.execute("search_text", {"query": "x", "scope": ["nope"]})
+        assert isinstance(bad, Failure)
+
+    @allure.title("File manager search matches source content as well as names")
+    def test_file_manager_content_search(
+        self, app_context: AppContext, open_project: Path
+    ):
+        from src.contexts.sources.presentation.viewmodels.file_manager_viewmodel import (
+            FileManagerViewModel,
+        )
+
+        repo = app_context.sources_context.source_repo
+        repo.save(_source("s1", "budget.txt", "nothing relevant"))
+        repo.save(_source("s2", "interview.txt", "we discussed the budget cuts"))
+
+        vm = FileManagerViewModel(
+            source_repo=repo,
+            folder_repo=app_context.folders_context.folder_repo,
+            case_repo=app_context.cases_context.case_repo,
+            state=app_context.state,
+            event_bus=app_context.event_bus,
+            fulltext_index=app_context.sources_context.fulltext_index,
+        )
+
+        names = [dto.name for dto in vm.search_sources("budget")]
+        assert names == ["budget.txt", "interview.txt"]
+
+    @allure.title("Databases created without the index are upgraded on open")
+    def test_upgrade_on_open(self, app_context: AppContext, open_project: Path):
+        session = app_context.session
+        app_context.sources_context.source_repo.save(
+            _source("s1", "legacy.txt", "pre-existing transcript text")
+        )
+        drop_fulltext_index(session)
+        session.commit()
+        app_context.close_project()
+
+        assert app_context.open_project(str(open_project)).is_success
+        index = app_context.sources_context.fulltext_index
+        assert index.matching_source_ids("transcript") == ["s1"]
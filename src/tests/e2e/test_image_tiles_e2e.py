@@ -0,0 +1,108 @@
+"""
+QC-050.09 Image Tiles - End-to-End Tests
+
+Large photos in the ImageViewer are decoded only as far as the display
+needs:
+- Fit-to-window draws a preview decoded at reduced resolution
+- Zooming in past the preview draws tiles of the visible area only, cut
+  from the image decoded at the reduction the zoom level needs
+- With a thumbnail cache, the cached thumbnail is shown first
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import allure
+import pytest
+from PIL import Image
+from PySide6.QtWidgets import QApplication
+
+from src.contexts.sources.infra.thumbnail_cache import ThumbnailCache
+from src.shared.presentation.organisms import ImageViewer
+from src.shared.presentation.organisms.image_viewer import TILE_SIZE
+
+pytestmark = [
+    pytest.mark.e2e,
+    allure.epic("QualCoder v2"),
+    allure.feature("QC-050 Performance"),
+]
+
+
+@pytest.fixture
+def field_photo(tmp_path: Path) -> Path:
+    """A 6000x4000 JPEG."""
+    path = tmp_path / "field_photo.jpg"
+    Image.new("RGB", (6000, 4000), color=(30, 120, 60)).save(path, "JPEG")
+    return path
+
+
+@pytest.fixture
+def viewer(qtbot, qapp, colors):
+    viewer = ImageViewer(colors=colors)
+    qtbot.addWidget(viewer)
+    viewer.resize(800, 600)
+    viewer.show()
+    QApplication.processEvents()
+    return viewer
+
+
+@allure.story("QC-050.09 Image Tiles")
+class TestImageTiles:
+    @allure.title("Fit to window draws a reduced-resolution preview")
+    def test_fit_uses_preview(self, viewer, field_photo: Path):
+        viewer.load_image(field_photo)
+        QApplication.processEvents()
+
+        metadata = viewer.get_metadata()
+        assert (metadata.width, metadata.height) == (6000, 4000)
+        assert viewer._preview.width() < 6000
+        assert viewer.get_zoom_level() < 1.0
+        assert not viewer.is_tiled()
+        assert viewer._decoded is None
+
+    @allure.title("Actual size draws only the visible tiles")
+    def test_actual_size_tiles(self, viewer, field_photo: Path):
+        viewer.load_image(field_photo)
+        viewer.show_actual_size()
+        viewer.grab()
+
+        assert viewer.is_tiled()
+        assert viewer._canvas.width() == 6000
+        all_tiles = -(-6000 // TILE_SIZE) * -(-4000 // TILE_SIZE)
+        assert 0 < len(viewer._tiles) < all_tiles
+
+        viewer.load_image(field_photo)
+        assert not viewer._tiles
+        assert viewer._decoded is None
+
+    @allure.title("Tiles are cut from a reduced decode, released on fit")
+    def test_reduced_tiles(self, viewer, field_photo: Path):
+        viewer.load_image(field_photo)
+        QApplication.processEvents()
+        viewer._zoom_level = 0.2
+        viewer._apply_zoom()
+        viewer.grab()
+
+        assert viewer.is_tiled()
+        factor, image = viewer._decoded
+        assert (factor, image.size) == (4, (1500, 1000))
+        assert {key[0] for key in viewer._tiles} == {4}
+
+        viewer.fit_to_window()
+        assert not viewer.is_tiled()
+        assert viewer._decoded is None
+        assert viewer._tiles
+
+    @allure.title("A cached thumbnail is shown before the preview is decoded")
+    def test_thumbnail_first(self, viewer, field_photo: Path, tmp_path: Path):
+        cache = ThumbnailCache.for_project(tmp_path)
+        viewer.set_thumbnail_cache(cache)
+        viewer.load_image(field_photo)
+        assert cache.get(field_photo) is not None
+
+        viewer.load_image(field_photo)
+        assert viewer._preview.width() == 256
+
+        QApplication.processEvents()
+        assert viewer._preview.width() > 256
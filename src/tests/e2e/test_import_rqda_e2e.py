@@ -55,7 +55,7 @@ class TestImportRQDA:
         from src.contexts.exchange.core.events import RqdaImported
 
         published = []
-        event_bus.subscribe("exchange.rqda_imported", published.append)
+        event_bus.subscribe_all(published.append)
 
         conn, rqda_path = create_rqda_db(tmp_path / "project.rqda")
         _seed_rqda_data(conn)
@@ -83,9 +83,8 @@ class TestImportRQDA:
             sources = source_repo.get_all()
             assert any(s.name == "interview.txt" for s in sources)
 
-        with allure.step("Verify event"):
-            assert len(published) == 1
-            assert isinstance(published[0], RqdaImported)
+        with allure.step("Only the summary event is published"):
+            assert [type(e) for e in published] == [RqdaImported]
             assert published[0].codes_created == 2
             assert published[0].sources_created == 1
 
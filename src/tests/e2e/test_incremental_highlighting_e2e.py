@@ -0,0 +1,185 @@
+"""
+QC-050.08 Incremental Highlighting - End-to-End Tests
+
+Coding changes repaint only the characters they touch:
+- add_segment / remove_segment / recolor_code on TextEditorPanel and
+  TextHighlighter re-apply formats inside the segment's range only
+- Overlap underlines are recomputed for that range
+- A highlight placed before the segment was saved is adopted, not doubled
+- Applying a code in the coding screen adds one highlight
+"""
+
+from __future__ import annotations
+
+import allure
+import pytest
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication
+
+from src.shared.presentation.organisms.text_editor_panel import TextEditorPanel
+from src.shared.presentation.organisms.text_highlighter import (
+    CodeSegment,
+    TextHighlighter,
+)
+
+pytestmark = [
+    pytest.mark.e2e,
+    allure.epic("QualCoder v2"),
+    allure.feature("QC-050 Performance"),
+]
+
+TEXT = "INTERVIEWER: How was the course? PARTICIPANT: I enjoyed it a lot."
+
+
+def _background(fmt) -> str:
+    return fmt.background().color().name().upper()
+
+
+@pytest.fixture
+def panel(qapp, colors):
+    panel = TextEditorPanel(colors=colors)
+    panel.set_document("interview.txt", text=TEXT)
+    panel.set_highlights(
+        [{"id": 1, "code_id": 10, "start": 0, "end": 11, "color": "#FFC107"}]
+    )
+    return panel
+
+
+@allure.story("QC-050.08 Incremental Highlighting")
+class TestEditorPanelIncremental:
+    """Segment-level updates on TextEditorPanel."""
+
+    @allure.title("add_segment paints its range and underlines local overlaps")
+    def test_add_segment(self, panel):
+        panel.add_segment(
+            {"id": 2, "code_id": 20, "start": 5, "end": 20, "color": "#2196F3"}
+        )
+
+        assert panel.get_highlight_count() == 2
+        assert panel.get_char_format_at(6).fontUnderline()
+        assert not panel.get_char_format_at(15).fontUnderline()
+        assert _background(panel.get_char_format_at(15)) == "#2196F3"
+        assert _background(panel.get_char_format_at(2)) == "#FFC107"
+
+    @allure.title("remove_segment clears only its characters")
+    def test_remove_segment(self, panel):
+        panel.add_segment(
+            {"id": 2, "code_id": 20, "start": 5, "end": 20, "color": "#2196F3"}
+        )
+        panel.remove_segment(2)
+
+        assert panel.get_highlight_count() == 1
+        assert not panel.get_char_format_at(6).fontUnderline()
+        assert _background(panel.get_char_format_at(6)) == "#FFC107"
+        fmt = panel.get_char_format_at(15)
+        assert fmt.background().style() == Qt.BrushStyle.NoBrush
+
+    @allure.title("recolor_code repaints the code's segments")
+    def test_recolor_code(self, panel):
+        panel.recolor_code(10, "#4CAF50")
+
+        assert _background(panel.get_char_format_at(3)) == "#4CAF50"
+
+    @allure.title("A highlight placed before saving is adopted by add_segment")
+    def test_adopts_optimistic_highlight(self, panel):
+        panel.highlight_range(30, 40, "#E91E63")
+        panel.add_segment(
+            {"id": 3, "code_id": 30, "start": 30, "end": 40, "color": "#E91E63"}
+        )
+
+        assert panel.get_highlight_count() == 2
+        panel.remove_segment(3)
+        assert panel.get_highlight_count() == 1
+
+
+@allure.story("QC-050.08 Incremental Highlighting")
+class TestHighlighterIncremental:
+    """Segment-level updates on TextHighlighter."""
+
+    @allure.title("Segments added after highlight() are painted at once")
+    def test_add_remove_recolor(self, qapp, colors):
+        highlighter = TextHighlighter(colors=colors, show_selection_popup=False)
+        highlighter.set_text(TEXT)
+        highlighter.add_segment(
+            CodeSegment(
+                segment_id="a", code_id=1, code_color="#FFC107", pos0=0, pos1=11
+            )
+        )
+        highlighter.highlight()
+
+        highlighter.add_segment(
+            CodeSegment(
+                segment_id="b", code_id=2, code_color="#2196F3", pos0=5, pos1=20
+            )
+        )
+
+        def fmt_at(pos):
+            cursor = highlighter._text_edit.textCursor()
+            cursor.setPosition(pos)
+            cursor.setPosition(pos + 1, cursor.MoveMode.KeepAnchor)
+            return cursor.charFormat()
+
+        assert fmt_at(6).fontUnderline()
+        assert _background(fmt_at(15)) == "#2196F3"
+
+        highlighter.recolor_code(2, "#4CAF50")
+        assert _background(fmt_at(15)) == "#4CAF50"
+
+        highlighter.remove_segment("b")
+        assert not fmt_at(6).fontUnderline()
+        assert fmt_at(15).background().style() == Qt.BrushStyle.NoBrush
+        assert highlighter.get_segment_count() == 1
+
+
+@allure.story("QC-050.08 Incremental Highlighting")
+class TestCodingScreenIncremental:
+    """Applying a code through the wired coding screen."""
+
+    @allure.title("Quick mark adds exactly one highlight to the editor")
+    def test_quick_mark_adds_one_highlight(self, coding_screen_ready):
+        screen = coding_screen_ready["screens"]["coding"]
+        code = coding_screen_ready["seeded"]["codes"][0]
+        editor = screen._page.editor_panel
+        before = editor.get_highlight_count()
+
+        screen.set_active_code(str(code.id.value), code.name, code.color.to_hex())
+        screen.set_text_selection(0, 8)
+        screen.quick_mark()
+        QApplication.processEvents()
+
+        assert editor.get_highlight_count() == before + 1
+        assert _background(editor.get_char_format_at(2)) == code.color.to_hex().upper()
+
+    @allure.title("Recolor and unmark repaint through the viewmodel signals")
+    def test_recolor_and_unmark(self, coding_screen_ready):
+        from src.contexts.coding.core.commandHandlers import change_code_color
+        from src.contexts.coding.core.commands import ChangeCodeColorCommand
+
+        ctx = coding_screen_ready["ctx"]
+        screen = coding_screen_ready["screens"]["coding"]
+        code = coding_screen_ready["seeded"]["codes"][1]
+        editor = screen._page.editor_panel
+        before = editor.get_highlight_count()
+        screen.set_active_code(str(code.id.value), code.name, code.color.to_hex())
+        screen.set_text_selection(0, 8)
+        screen.quick_mark()
+        QApplication.processEvents()
+
+        with allure.step("Recolor repaints the code's segment"):
+            coding = ctx.coding_context
+            assert change_code_color(
+                ChangeCodeColorCommand(code_id=str(code.id.value), new_color="#9C27B0"),
+                code_repo=coding.code_repo,
+                category_repo=coding.category_repo,
+                segment_repo=coding.segment_repo,
+                event_bus=ctx.event_bus,
+            ).is_success
+            QApplication.processEvents()
+            assert _background(editor.get_char_format_at(2)) == "#9C27B0"
+
+        with allure.step("Unmark removes the highlight"):
+            screen.unmark()
+            QApplication.processEvents()
+            assert editor.get_highlight_count() == before
+            fmt = editor.get_char_format_at(2)
+            assert fmt.background().style() == Qt.BrushStyle.NoBrush
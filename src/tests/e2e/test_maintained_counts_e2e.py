@@ -0,0 +1,196 @@
+"""
+QC-050.06 Maintained Counts - End-to-End Tests
+
+Segment and source counts live in trigger-maintained aggregate tables:
+- Every insert, update and delete on cod_segment / src_source adjusts them
+- Count reads and the project summary never scan cod_segment or src_source
+- Bulk deletes and reassignments report rowcount without a count query
+- Missing aggregates are rebuilt when a project database is upgraded
+"""
+
+from __future__ import annotations
+
+import allure
+import pytest
+from sqlalchemy import event, text
+
+from src.contexts.coding.core.entities import (
+    Code,
+    Color,
+    TextPosition,
+    TextSegment,
+)
+from src.contexts.coding.infra.repositories import (
+    SQLiteCodeRepository,
+    SQLiteSegmentRepository,
+)
+from src.contexts.coding.infra.segment_counts import drop_segment_counts
+from src.contexts.projects.core.entities import Source, SourceType
+from src.contexts.projects.infra.project_repository import SQLiteProjectRepository
+from src.contexts.projects.infra.schema import upgrade_all_contexts
+from src.contexts.sources.infra.source_counts import drop_source_counts
+from src.contexts.sources.infra.source_repository import SQLiteSourceRepository
+from src.shared.common.types import CodeId, FolderId, SegmentId, SourceId
+
+pytestmark = [
+    pytest.mark.e2e,
+    allure.epic("QualCoder v2"),
+    allure.feature("QC-050 Performance"),
+]
+
+
+def _segment(sid: str, cid: str, fid: str) -> TextSegment:
+    return TextSegment(
+        id=SegmentId(value=sid),
+        source_id=SourceId(value=fid),
+        code_id=CodeId(value=cid),
+        position=TextPosition(start=0, end=5),
+        selected_text="x",
+    )
+
+
+@pytest.fixture
+def repos(db_connection) -> dict:
+    codes = SQLiteCodeRepository(db_connection)
+    for cid in ("c1", "c2"):
+        codes.save(Code(id=CodeId(value=cid), name=cid.upper(), color=Color(1, 2, 3)))
+    sources = SQLiteSourceRepository(db_connection)
+    sources.save_many(
+        [
+            Source(id=SourceId(value="s1"), name="a.txt", source_type=SourceType.TEXT),
+            Source(id=SourceId(value="s2"), name="b.pdf", source_type=SourceType.PDF),
+            Source(
+                id=SourceId(value="s3"),
+                name="c.pdf",
+                source_type=SourceType.PDF,
+                folder_id=FolderId(value="f1"),
+            ),
+        ]
+    )
+    segments = SQLiteSegmentRepository(db_connection)
+    segments.save_many(
+        [_segment(f"g{i}", "c1", "s1") for i in range(3)]
+        + [_segment("h1", "c1", "s2"), _segment("h2", "c2", "s2")]
+    )
+    return {"codes": codes, "sources": sources, "segments": segments}
+
+
+@pytest.fixture
+def scans(db_engine):
+    """Record SELECTs that read cod_segment or src_source directly."""
+    captured: list[str] = []
+
+    def _capture(_conn, _cursor, statement, _params, _context, _many):
+        sql = " ".join(statement.lower().split())
+        if sql.startswith("select") and (
+            "from cod_segment " in f"{sql} " or "from src_source " in f"{sql} "
+        ):
+            captured.append(statement)
+
+    event.listen(db_engine, "before_cursor_execute", _capture)
+    yield captured
+    event.remove(db_engine, "before_cursor_execute", _capture)
+
+
+@allure.story("QC-050.06 Maintained Counts")
+class TestSegmentCounts:
+    @allure.title("Counts follow inserts, reassignments and deletes")
+    def test_counts(self, repos, scans):
+        segments = repos["segments"]
+        c1, c2 = CodeId(value="c1"), CodeId(value="c2")
+        s1, s2 = SourceId(value="s1"), SourceId(value="s2")
+
+        assert segments.count_all_by_code() == {"c1": 4, "c2": 1}
+        assert segments.count_by_source(s1) == 3
+        assert segments.count_by_source_and_code(s2, c2) == 1
+        assert segments.count_all() == 5
+
+        with allure.step("Reassign returns rowcount and moves counts"):
+            assert segments.reassign_code(c2, c1) == 1
+            assert segments.count_all_by_code() == {"c1": 5}
+            assert segments.count_by_source_and_code(s2, c1) == 2
+
+        with allure.step("Moving a segment to another source"):
+            moved = _segment("g0", "c1", "s2")
+            segments.save(moved)
+            assert segments.count_all_by_source() == {"s1": 2, "s2": 3}
+
+        with allure.step("Bulk deletes return rowcount"):
+            assert segments.delete_by_source(s1) == 2
+            assert segments.delete_by_code(c1) == 3
+            assert segments.delete_by_code(c1) == 0
+            assert segments.count_all() == 0
+            assert segments.count_all_by_source() == {}
+
+        assert scans == []
+
+
+@allure.story("QC-050.06 Maintained Counts")
+class TestSourceCounts:
+    @allure.title("Per-type and per-folder counts follow source writes")
+    def test_counts(self, repos, scans):
+        sources = repos["sources"]
+
+        assert sources.count() == 3
+        assert sources.count_by_type() == {SourceType.TEXT: 1, SourceType.PDF: 2}
+        assert sources.count_by_folder() == {None: 2, "f1": 1}
+
+        assert sources.clear_folder_assignment(FolderId(value="f1")) == 1
+        assert sources.count_by_folder() == {None: 3}
+
+        sources.delete(SourceId(value="s2"))
+        assert sources.count_by_type() == {SourceType.TEXT: 1, SourceType.PDF: 1}
+        assert [s for s in scans if "count(" in s.lower()] == []
+
+    @allure.title("The project summary reads only the aggregates")
+    def test_summary(self, repos, db_connection, scans):
+        summary = SQLiteProjectRepository()._compute_summary(db_connection)
+
+        assert summary.total_sources == 3
+        assert summary.text_count == 1
+        assert summary.pdf_count == 2
+        assert summary.total_codes == 2
+        assert summary.total_segments == 5
+        assert scans == []
+
+
+@allure.story("QC-050.06 Maintained Counts")
+class TestRebuild:
+    @allure.title("Upgrading a database without aggregates rebuilds them")
+    def test_upgrade(self, repos, db_connection):
+        drop_segment_counts(db_connection)
+        drop_source_counts(db_connection)
+        db_connection.execute(
+            text(
+                "INSERT INTO cod_segment(ctid, cid, fid, pos0, pos1, seltext) "
+                "VALUES ('late', 'c2', 's3', 0, 1, 'x')"
+            )
+        )
+
+        upgrade_all_contexts(db_connection)
+
+        assert repos["segments"].count_all_by_code() == {"c1": 4, "c2": 2}
+        assert repos["segments"].count_by_source(SourceId(value="s3")) == 1
+        assert repos["sources"].count_by_folder() == {None: 2, "f1": 1}
+
+    @allure.title("A failed upgrade on open is rolled back, not committed")
+    def test_failed_upgrade(self, repos, db_connection, tmp_path, monkeypatch):
+        from src.contexts.sources.infra import source_counts
+
+        drop_segment_counts(db_connection)
+        drop_source_counts(db_connection)
+        db_connection.commit()
+
+        def fail(_connection):
+            raise RuntimeError("migration failed")
+
+        monkeypatch.setattr(source_counts, "create_source_counts", fail)
+
+        project = SQLiteProjectRepository(db_connection).load(tmp_path / "p.qda")
+
+        assert project is None
+        # Created before the failing step, then rolled back with it
+        tables = db_connection.execute(
+            text("SELECT name FROM sqlite_master WHERE name LIKE 'cod_segment_count%'")
+        ).all()
+        assert tables == []
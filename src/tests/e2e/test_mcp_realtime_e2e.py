@@ -132,7 +132,7 @@ def test_mcp_server_info_tools_and_context(mcp_test_env):
 @pytest.mark.e2e
 @allure.story("QC-050.08 Tool registration and response format")
 def test_mcp_segment_coded_emits_signal(mcp_test_env, qapp):
-    """Test that batch_apply_codes triggers segment_coded signal."""
+    """Test that batch_apply_codes triggers one segments_coded signal."""
     loop = mcp_test_env["loop"]
     ctx = mcp_test_env["ctx"]
     signal_bridge = mcp_test_env["signal_bridge"]
@@ -175,7 +175,7 @@ def test_mcp_segment_coded_emits_signal(mcp_test_env, qapp):
     sources_ctx.source_repo.save(source)
 
     received = []
-    signal_bridge.segment_coded.connect(lambda p: received.append(p))
+    signal_bridge.segments_coded.connect(lambda p: received.append(p))
 
     async def _test():
         async with httpx.AsyncClient() as client:
@@ -205,8 +205,9 @@ def test_mcp_segment_coded_emits_signal(mcp_test_env, qapp):
 
     loop.run_until_complete(_test())
 
-    assert len(received) > 0, "No segment_coded signal received!"
-    payload = received[0]
+    assert len(received) == 1, "Expected one segments_coded signal per batch"
+    assert received[0].source_ids == ("99",)
+    payload = received[0].segments[0]
     assert payload.code_id == code_id
     assert payload.source_id == "99"
     assert payload.start_pos == 0
@@ -0,0 +1,269 @@
+"""
+QC-027.20 Cached Media Metadata - End-to-End Tests
+
+Image and media metadata is stored in the project database per
+(path, size, mtime):
+- A file is probed once; later lookups read the stored result
+- An edited file is probed again
+- Batch extraction runs on a thread pool and skips cached files
+- Batch imports cache the metadata extracted by the import workers, and
+  the source list and metadata dialog read it without probing files
+- The metadata dialog commits only a fresh extraction, and never in the
+  middle of a batch import
+- Older databases gain the metadata table on open
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from pathlib import Path
+
+import allure
+import pytest
+from PIL import Image
+from sqlalchemy import create_engine, inspect, text
+
+from src.contexts.projects.core.entities import Source, SourceType
+from src.contexts.sources.infra import metadata_cache
+from src.contexts.sources.infra.image_extractor import ImageExtractionResult
+from src.contexts.sources.infra.metadata_cache import (
+    SQLiteMetadataCache,
+    extract_metadata_batch,
+)
+from src.contexts.sources.infra.schema import upgrade_source_columns
+from src.contexts.sources.presentation.viewmodels.file_manager_viewmodel import (
+    FileManagerViewModel,
+)
+from src.shared.common.types import SourceId
+
+pytestmark = [
+    pytest.mark.e2e,
+    allure.epic("QualCoder v2"),
+    allure.feature("QC-027 Manage Sources"),
+]
+
+
+def _photo(
+    path: Path, size=(640, 480), make: str = "Canon", color=(30, 120, 200)
+) -> str:
+    exif = Image.Exif()
+    exif[0x010F] = make  # Make
+    exif[0x0110] = "EOS R5"  # Model
+    Image.new("RGB", size, color=color).save(path, "JPEG", exif=exif)
+    return str(path)
+
+
+@pytest.fixture
+def probes(monkeypatch) -> list[str]:
+    """Path of every file the cache extracts metadata from."""
+    probed: list[str] = []
+    original = metadata_cache.extract_metadata
+    monkeypatch.setattr(
+        metadata_cache,
+        "extract_metadata",
+        lambda source_type, path: probed.append(str(path))
+        or original(source_type, path),
+    )
+    return probed
+
+
+@allure.story("QC-027.20 Cached Media Metadata")
+class TestMetadataCache:
+    @allure.title("A file is probed once and its metadata reused")
+    def test_probed_once(self, db_connection, tmp_path, probes):
+        cache = SQLiteMetadataCache(db_connection)
+        photo = _photo(tmp_path / "site_visit.jpg")
+
+        result = cache.lookup(photo)
+        assert isinstance(result, ImageExtractionResult)
+        assert (result.width, result.height, result.format) == (640, 480, "JPEG")
+        assert result.metadata["exif"]["Make"] == "Canon"
+
+        assert cache.lookup(photo) == result
+        st = os.stat(photo)
+        assert cache.get(photo, st.st_size, st.st_mtime_ns) == result
+        assert probes == [photo]
+
+    @allure.title("An edited file is probed again")
+    def test_edited_file(self, db_connection, tmp_path, probes):
+        cache = SQLiteMetadataCache(db_connection)
+        photo = _photo(tmp_path / "site_visit.jpg")
+        before = os.stat(photo)
+        cache.lookup(photo)
+
+        _photo(Path(photo), size=(320, 200), make="Nikon")
+        os.utime(photo, ns=(before.st_atime_ns, before.st_mtime_ns + 1_000_000_000))
+
+        after = os.stat(photo)
+        assert cache.get(photo, after.st_size, after.st_mtime_ns) is None
+        result = cache.lookup(photo)
+        assert (result.width, result.height) == (320, 200)
+        assert result.metadata["exif"]["Make"] == "Nikon"
+        assert len(probes) == 2
+
+    @allure.title("Batch extraction runs on threads and skips cached files")
+    def test_extract_many(self, db_connection, tmp_path, probes):
+        cache = SQLiteMetadataCache(db_connection)
+        photos = [_photo(tmp_path / f"photo_{i:02}.jpg") for i in range(12)]
+        notes = tmp_path / "notes.txt"
+        notes.write_text("Not an image", encoding="utf-8")
+        missing = str(tmp_path / "missing.jpg")
+
+        cache.lookup(photos[0])
+        found = cache.extract_many([*photos, str(notes), missing], max_workers=4)
+
+        assert set(found) == set(photos)
+        assert sorted(probes) == sorted([*photos, str(notes)])
+        assert cache.extract_many(photos) == found
+        assert len(probes) == 13
+
+        with allure.step("Results come back in input order"):
+            batch = list(extract_metadata_batch([str(notes), photos[3]], 2))
+            assert [path for path, _ in batch] == [str(notes), photos[3]]
+            assert batch[0][1] is None
+            assert batch[1][1] == found[photos[3]]
+
+
+@allure.story("QC-027.20 Cached Media Metadata")
+class TestFileManager:
+    @allure.title("Imported media metadata is listed and shown without probing")
+    def test_import_list_and_dialog(
+        self,
+        db_connection,
+        source_repo,
+        folder_repo,
+        case_repo,
+        project_state,
+        event_bus,
+        tmp_path,
+        probes,
+    ):
+        cache = SQLiteMetadataCache(db_connection)
+        viewmodel = FileManagerViewModel(
+            source_repo=source_repo,
+            folder_repo=folder_repo,
+            case_repo=case_repo,
+            state=project_state,
+            event_bus=event_bus,
+            metadata_cache=cache,
+            extraction_workers=2,
+        )
+        # Distinct pixels, so duplicate detection imports all three
+        photos = [
+            _photo(
+                tmp_path / f"photo_{i}.jpg", size=(800, 600), color=(30, 60 * i, 200)
+            )
+            for i in range(3)
+        ]
+
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            viewmodel.import_sources_batch(photos)
+            loop.run_until_complete(viewmodel._import_task)
+        finally:
+            loop.close()
+            asyncio.set_event_loop(None)
+
+        sources = viewmodel.load_sources()
+        assert [s.media_info for s in sources] == ["800 × 600 · JPEG"] * 3
+
+        properties = dict(viewmodel.get_source_properties(sources[0].id))
+        assert properties["Dimensions"] == "800 × 600"
+        assert properties["Camera"] == "Canon EOS R5"
+        assert probes == []
+
+    @allure.title("The metadata dialog commits only a fresh extraction")
+    def test_dialog_commits(
+        self,
+        db_connection,
+        source_repo,
+        folder_repo,
+        case_repo,
+        project_state,
+        event_bus,
+        tmp_path,
+        probes,
+        monkeypatch,
+    ):
+        commits: list[int] = []
+
+        class Session:
+            def commit(self):
+                commits.append(1)
+
+        viewmodel = FileManagerViewModel(
+            source_repo=source_repo,
+            folder_repo=folder_repo,
+            case_repo=case_repo,
+            state=project_state,
+            event_bus=event_bus,
+            session=Session(),
+            metadata_cache=SQLiteMetadataCache(db_connection),
+        )
+        photos = [_photo(tmp_path / f"photo_{i}.jpg") for i in range(2)]
+        for i, photo in enumerate(photos):
+            source_repo.save(
+                Source(
+                    id=SourceId(value=f"s{i}"),
+                    name=Path(photo).name,
+                    source_type=SourceType.IMAGE,
+                    file_path=Path(photo),
+                )
+            )
+
+        assert dict(viewmodel.get_source_properties("s0"))["Dimensions"]
+        assert len(commits) == 1
+        viewmodel.get_source_properties("s0")
+        assert len(commits) == 1
+
+        with allure.step("A batch import commits the extraction itself"):
+            monkeypatch.setattr(
+                FileManagerViewModel, "is_importing", property(lambda _self: True)
+            )
+            viewmodel.get_source_properties("s1")
+            assert len(commits) == 1
+            assert probes == photos
+
+    @allure.title("Folder imports by agents cache media metadata")
+    def test_mcp_import_folder(self, app_context, tmp_path, probes):
+        from src.contexts.sources.interface.mcp_tools import SourceTools
+
+        project = tmp_path / "media.qda"
+        assert app_context.create_project(name="Media", path=str(project)).is_success
+        assert app_context.open_project(str(project)).is_success
+        folder = tmp_path / "photos"
+        folder.mkdir()
+        photos = [
+            _photo(folder / f"photo_{i}.jpg", color=(200, 60 * i, 30)) for i in range(3)
+        ]
+
+        result = SourceTools(ctx=app_context).execute(
+            "import_folder", {"folder_path": str(folder)}
+        )
+
+        assert result.unwrap()["imported"] == 3
+        cache = app_context.sources_context.metadata_cache
+        for photo in photos:
+            assert (cache.lookup(photo).width, cache.lookup(photo).height) == (640, 480)
+        assert probes == []
+
+
+@allure.story("QC-027.20 Cached Media Metadata")
+class TestSchemaUpgrade:
+    @allure.title("Older databases gain the metadata table")
+    def test_upgrade(self):
+        engine = create_engine("sqlite:///:memory:")
+        with engine.begin() as conn:
+            conn.execute(
+                text(
+                    "CREATE TABLE src_source (id VARCHAR(36) PRIMARY KEY, "
+                    "name VARCHAR(255) NOT NULL, fulltext TEXT, "
+                    "mediapath VARCHAR(500), source_type VARCHAR(20), "
+                    "folder_id VARCHAR(36))"
+                )
+            )
+            upgrade_source_columns(conn)
+            tables = set(inspect(conn).get_table_names())
+        assert "src_file_metadata" in tables
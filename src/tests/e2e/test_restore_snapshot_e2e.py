@@ -0,0 +1,161 @@
+"""
+QC-048 Restore Snapshot - Derived Data Tests
+
+Restoring a VCS snapshot replaces the project tables wholesale:
+- Maintained counts and the full-text index (excluded from snapshots) are
+  rebuilt from the restored tables, and their triggers work again
+- Compressed source text survives the round trip
+- Cached source texts and chunk layouts are dropped
+- Stored speaker turns (excluded from snapshots) are dropped
+- Indexes of the re-created tables are created again
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import allure
+import pytest
+from sqlalchemy import text
+
+from src.contexts.coding.core.entities import (
+    Code,
+    Color,
+    TextPosition,
+    TextSegment,
+)
+from src.contexts.projects.core.commandHandlers.restore_snapshot import (
+    restore_snapshot,
+)
+from src.contexts.projects.core.entities import Source, SourceType
+from src.contexts.projects.core.vcs_commands import RestoreSnapshotCommand
+from src.contexts.projects.core.vcs_invariants import resolve_db_path
+from src.contexts.sources.core.services.speaker_detector import SpeakerTurn
+from src.contexts.sources.infra.content_hash import hash_text
+from src.shared.common.types import CodeId, SegmentId, SourceId
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from src.shared.infra.app_context import AppContext
+
+pytestmark = [
+    pytest.mark.e2e,
+    allure.epic("QualCoder v2"),
+    allure.feature("QC-048 Version Control"),
+]
+
+BEFORE = "the harbour at dawn " * 2_000
+AFTER = "a quiet meadow " * 1_000
+
+
+def _segment(sid: str) -> TextSegment:
+    return TextSegment(
+        id=SegmentId(value=sid),
+        source_id=SourceId(value="s1"),
+        code_id=CodeId(value="c1"),
+        position=TextPosition(start=0, end=5),
+        selected_text="x",
+    )
+
+
+def _source(text: str) -> Source:
+    return Source(
+        id=SourceId(value="s1"),
+        name="s1.txt",
+        source_type=SourceType.TEXT,
+        fulltext=text,
+    )
+
+
+def _snapshot(ctx: AppContext, message: str) -> str:
+    """Dump the project and commit it; returns the commit SHA."""
+    ctx.lifecycle.session.commit()
+    projects = ctx.projects_context
+    project_path = ctx.state.project.path
+    vcs_dir = projects.diffable_adapter.get_vcs_dir(project_path)
+    assert projects.diffable_adapter.dump(
+        resolve_db_path(project_path), vcs_dir
+    ).is_success
+    assert projects.git_adapter.init().is_success
+    assert projects.git_adapter.add_all(vcs_dir).is_success
+    return projects.git_adapter.commit(message).unwrap()
+
+
+@pytest.fixture
+def project(app_context: AppContext, tmp_path: Path, monkeypatch) -> AppContext:
+    for name in ("AUTHOR", "COMMITTER"):
+        monkeypatch.setenv(f"GIT_{name}_NAME", "Test User")
+        monkeypatch.setenv(f"GIT_{name}_EMAIL", "test@test.com")
+    monkeypatch.setenv("GIT_CONFIG_GLOBAL", "/dev/null")
+    monkeypatch.setenv("GIT_CONFIG_NOSYSTEM", "1")
+    path = tmp_path / "restore.qda"
+    assert app_context.create_project(name="Restore", path=str(path)).is_success
+    assert app_context.open_project(str(path)).is_success
+    return app_context
+
+
+@allure.story("QC-048 SQLite Database Version Control")
+class TestRestoreDerivedData:
+    @allure.title("Counts, full-text index and caches follow the restored tables")
+    def test_restore(self, project: AppContext):
+        sources = project.sources_context
+        coding = project.coding_context
+        sources.source_repo.set_text_codec("zlib")
+        sources.source_repo.save(_source(BEFORE))
+        coding.code_repo.save(
+            Code(id=CodeId(value="c1"), name="C1", color=Color(1, 2, 3))
+        )
+        coding.segment_repo.save(_segment("g1"))
+        snapshot = _snapshot(project, "one segment")
+
+        coding.segment_repo.save(_segment("g2"))
+        sources.source_repo.save(_source(AFTER))
+        provider = sources.content_provider
+        s1 = SourceId(value="s1")
+        provider.cache.invalidate(s1)
+        assert provider.get_text_range(s1, 0, 7) == AFTER[:7]
+        sources.source_repo.save_speaker_turns(
+            s1, hash_text(AFTER), [SpeakerTurn(0, 7, "A")]
+        )
+        _snapshot(project, "two segments")
+
+        result = restore_snapshot(
+            command=RestoreSnapshotCommand(
+                project_path=str(project.state.project.path), ref=snapshot
+            ),
+            diffable_adapter=project.projects_context.diffable_adapter,
+            git_adapter=project.projects_context.git_adapter,
+            event_bus=project.event_bus,
+        )
+
+        assert result.is_success, result.error
+        with allure.step("Counts are rebuilt and kept current again"):
+            assert coding.segment_repo.count_all_by_code() == {"c1": 1}
+            coding.segment_repo.save(_segment("g3"))
+            assert coding.segment_repo.count_all_by_code() == {"c1": 2}
+
+        with allure.step("The full-text index matches the restored text"):
+            index = sources.fulltext_index
+            assert index.search("harbour").total == 1
+            assert index.search("meadow").total == 0
+
+        with allure.step("Cached texts and chunk layouts are dropped"):
+            assert len(provider.cache) == 0
+            assert provider.get_text_range(s1, 30_000, 30_007) == BEFORE[30_000:30_007]
+            assert provider.get_content(s1) == BEFORE
+
+        with allure.step("Speaker turns of the replaced text are dropped"):
+            assert sources.source_repo.get_speaker_turns(s1) is None
+
+        with allure.step("Indexes of the re-created tables are back"):
+            indexes = set(
+                project.lifecycle.session.execute(
+                    text("SELECT name FROM sqlite_master WHERE type = 'index'")
+                ).scalars()
+            )
+            assert {
+                "idx_cas_source_link_unique",
+                "idx_cod_code_catid",
+                "idx_src_folder_parent",
+            } <= indexes
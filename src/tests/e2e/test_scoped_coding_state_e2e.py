@@ -0,0 +1,190 @@
+"""
+QC-050.02 Scoped Coding State - End-to-End Tests
+
+Coding commands validate against the slice of state their deriver reads:
+- apply_code queries only same-code segments overlapping the selection
+- delete/merge read only the affected code's segments
+- No command scans the whole segment table
+- batch_apply_codes reads each source once and writes with one bulk insert
+"""
+
+from __future__ import annotations
+
+import allure
+import pytest
+from sqlalchemy import event
+
+from src.contexts.coding.core.commandHandlers.apply_code import apply_code
+from src.contexts.coding.core.commandHandlers.batch_apply_codes import (
+    batch_apply_codes,
+)
+from src.contexts.coding.core.commandHandlers.merge_codes import merge_codes
+from src.contexts.coding.core.commands import (
+    ApplyCodeCommand,
+    BatchApplyCodesCommand,
+    MergeCodesCommand,
+)
+from src.contexts.coding.core.entities import (
+    Code,
+    Color,
+    TextPosition,
+    TextSegment,
+)
+from src.contexts.coding.core.events import SegmentsCoded
+from src.contexts.coding.infra.repositories import (
+    SQLiteCategoryRepository,
+    SQLiteCodeRepository,
+    SQLiteSegmentRepository,
+)
+from src.shared.common.types import CodeId, SegmentId, SourceId
+from src.shared.infra.event_bus import EventBus
+
+pytestmark = [
+    pytest.mark.e2e,
+    allure.epic("QualCoder v2"),
+    allure.feature("QC-050 Performance"),
+]
+
+
+@pytest.fixture
+def repos(db_connection) -> dict:
+    codes = SQLiteCodeRepository(db_connection)
+    segments = SQLiteSegmentRepository(db_connection)
+    for cid in ("c1", "c2"):
+        codes.save(Code(id=CodeId(value=cid), name=cid.upper(), color=Color(1, 2, 3)))
+    segments.save_many(
+        [
+            TextSegment(
+                id=SegmentId(value=f"g{i}"),
+                source_id=SourceId(value=f"s{i % 4}"),
+                code_id=CodeId(value="c1"),
+                position=TextPosition(start=i * 10, end=i * 10 + 5),
+                selected_text="x",
+            )
+            for i in range(400)
+        ]
+    )
+    return {
+        "code_repo": codes,
+        "category_repo": SQLiteCategoryRepository(db_connection),
+        "segment_repo": segments,
+        "event_bus": EventBus(),
+    }
+
+
+@pytest.fixture
+def segment_scans(db_engine):
+    """Record SELECTs on the segment table that have no WHERE clause."""
+    scans: list[str] = []
+
+    def _capture(_conn, _cursor, statement, _params, _context, _many):
+        sql = " ".join(statement.lower().split())
+        is_select = sql.startswith("select")
+        if is_select and "from cod_segment" in sql and " where " not in sql:
+            scans.append(statement)
+
+    event.listen(db_engine, "before_cursor_execute", _capture)
+    yield scans
+    event.remove(db_engine, "before_cursor_execute", _capture)
+
+
+@allure.story("QC-050.02 Scoped Coding State")
+class TestScopedCodingState:
+    @allure.title("Overlap checks use a range query on the source and code")
+    def test_get_overlapping(self, repos):
+        segment_repo = repos["segment_repo"]
+        s0, c1 = SourceId(value="s0"), CodeId(value="c1")
+
+        # s0 holds segments at [0,5), [40,45), [80,85), ...
+        hits = segment_repo.get_overlapping(s0, c1, 3, 42)
+        assert [s.id.value for s in hits] == ["g0", "g4"]
+        assert segment_repo.get_overlapping(s0, c1, 5, 40) == []
+        assert segment_repo.get_overlapping(s0, CodeId(value="c2"), 0, 100) == []
+
+    @allure.title("apply_code and merge_codes never load every segment")
+    def test_handlers(self, repos, segment_scans):
+        overlapping = apply_code(
+            ApplyCodeCommand(
+                code_id="c1", source_id="s0", start_position=2, end_position=8
+            ),
+            **repos,
+        )
+        assert overlapping.error_code == "SEGMENT_NOT_CODED/OVERLAPPING_SEGMENT"
+
+        applied = apply_code(
+            ApplyCodeCommand(
+                code_id="c2", source_id="s0", start_position=2, end_position=8
+            ),
+            **repos,
+        )
+        assert applied.is_success
+
+        merged = merge_codes(
+            MergeCodesCommand(source_code_id="c2", target_code_id="c1"), **repos
+        )
+        assert merged.is_success
+        assert merged.data.segments_moved == 1
+        assert segment_scans == []
+
+        with allure.step("The recorder does catch a full scan"):
+            repos["segment_repo"].get_all()
+            assert len(segment_scans) == 1
+
+
+@pytest.fixture
+def statements(db_engine):
+    """Record every statement as (sql, executemany)."""
+    captured: list[tuple[str, bool]] = []
+
+    def _capture(_conn, _cursor, statement, _params, _context, many):
+        captured.append((" ".join(statement.lower().split()), many))
+
+    event.listen(db_engine, "before_cursor_execute", _capture)
+    yield captured
+    event.remove(db_engine, "before_cursor_execute", _capture)
+
+
+@allure.story("QC-050.02 Scoped Coding State")
+class TestBatchApplyCodes:
+    @allure.title("A 300-operation batch reads each source once and inserts once")
+    def test_single_bulk_insert(self, repos, statements):
+        published = []
+        repos["event_bus"].subscribe("coding.segments_coded", published.append)
+        ops = tuple(
+            ApplyCodeCommand(
+                code_id="c2",
+                source_id=f"s{i % 3}",
+                start_position=i * 10,
+                end_position=i * 10 + 5,
+            )
+            for i in range(300)
+        ) + (
+            ApplyCodeCommand(
+                code_id="c2", source_id="s0", start_position=2, end_position=4
+            ),
+        )
+
+        result = batch_apply_codes(BatchApplyCodesCommand(operations=ops), **repos)
+
+        assert result.is_success
+        assert result.data.succeeded == 300
+        assert result.data.results[-1].error_code == (
+            "BATCH_APPLY_CODES/SEGMENT_NOT_CODED/OVERLAPPING_SEGMENT"
+        )
+
+        segment_reads = [
+            sql
+            for sql, _ in statements
+            if sql.startswith("select") and "from cod_segment" in sql
+        ]
+        inserts = [
+            many
+            for sql, many in statements
+            if sql.startswith("insert into cod_segment")
+        ]
+        assert len(segment_reads) == 3
+        assert inserts == [True]
+
+        (batch_event,) = published
+        assert isinstance(batch_event, SegmentsCoded)
+        assert len(batch_event.segments) == 300
@@ -807,15 +807,21 @@ class TestPhase6FullWorkflowRealData:
         with allure.step("Phase 6: Verify event audit trail (Lincoln & Guba)"):
             history = app_context.event_bus.get_history()
             event_types = [e.event_type for e in history]
+            # Batches record their segments in one aggregated event
+            coded_segments = sum(
+                len(e.event.segments) if e.event_type == "coding.segments_coded" else 1
+                for e in history
+                if e.event_type in ("coding.segment_coded", "coding.segments_coded")
+            )
 
             assert "coding.code_created" in event_types
-            assert "coding.segment_coded" in event_types
+            assert coded_segments > 0
             assert "coding.category_created" in event_types
             assert "coding.code_moved_to_category" in event_types
             assert "coding.code_deleted" in event_types
 
             # 4 codes created, 1 deleted = 3 remaining (verified above)
             assert event_types.count("coding.code_created") == 4
-            assert event_types.count("coding.segment_coded") == 3
+            assert coded_segments == 3
             assert event_types.count("coding.category_created") == 2
             assert event_types.count("coding.code_deleted") == 1
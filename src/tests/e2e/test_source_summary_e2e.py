@@ -0,0 +1,181 @@
+"""
+QC-027.07 Source Summaries - End-to-End Tests
+
+Listings, counts and name checks read source metadata only:
+- SourceSummary projection carries no fulltext
+- Per-type and per-folder counts come from grouped queries
+- Text is loaded lazily by ID when it is actually needed
+- File manager and list_sources never select the fulltext column
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import allure
+import pytest
+from sqlalchemy import event
+
+from src.contexts.folders.core.entities import Folder
+from src.contexts.folders.infra.folder_repository import SQLiteFolderRepository
+from src.contexts.projects.core.entities import Source, SourceSummary, SourceType
+from src.contexts.sources.infra.source_repository import SQLiteSourceRepository
+from src.shared.common.types import FolderId, SourceId
+
+if TYPE_CHECKING:
+    from src.shared.infra.app_context import AppContext
+
+pytestmark = [
+    pytest.mark.e2e,
+    allure.epic("QualCoder v2"),
+    allure.feature("QC-027 Manage Sources"),
+]
+
+
+def _source(sid: str, name: str, **kwargs) -> Source:
+    kwargs.setdefault("source_type", SourceType.TEXT)
+    return Source(id=SourceId(value=sid), name=name, **kwargs)
+
+
+@pytest.fixture
+def source_repo(db_connection) -> SQLiteSourceRepository:
+    return SQLiteSourceRepository(db_connection)
+
+
+@allure.story("QC-027.07 Source Summaries")
+class TestSummaryQueries:
+    @allure.title("Summaries carry metadata but never the document text")
+    def test_list_summaries(self, source_repo, db_connection):
+        folder_repo = SQLiteFolderRepository(db_connection)
+        folder_repo.save(Folder(id=FolderId(value="f1"), name="Interviews"))
+        source_repo.save(
+            _source(
+                "s1",
+                "b_interview.txt",
+                fulltext="x" * 10_000,
+                memo="first",
+                folder_id=FolderId(value="f1"),
+            )
+        )
+        source_repo.save(_source("s2", "a_photo.png", source_type=SourceType.IMAGE))
+
+        summaries = source_repo.list_summaries()
+        assert [s.name for s in summaries] == ["a_photo.png", "b_interview.txt"]
+        assert all(isinstance(s, SourceSummary) for s in summaries)
+        assert not hasattr(summaries[1], "fulltext")
+        assert summaries[1].memo == "first"
+
+        assert [s.name for s in source_repo.list_summaries(SourceType.IMAGE)] == [
+            "a_photo.png"
+        ]
+        in_folder = source_repo.list_summaries(folder_id=FolderId(value="f1"))
+        assert [s.id.value for s in in_folder] == ["s1"]
+
+        assert source_repo.get_summary(SourceId(value="s1")).folder_id.value == "f1"
+        assert source_repo.get_summary(SourceId(value="nope")) is None
+
+        with allure.step("Text is loaded on demand"):
+            assert source_repo.get_fulltext(SourceId(value="s1")) == "x" * 10_000
+            assert source_repo.get_fulltext(SourceId(value="s2")) is None
+
+    @allure.title("Counts by type and folder use grouped queries")
+    def test_counts(self, source_repo, db_connection):
+        SQLiteFolderRepository(db_connection).save(
+            Folder(id=FolderId(value="f1"), name="Batch")
+        )
+        source_repo.save(_source("s1", "a.txt", folder_id=FolderId(value="f1")))
+        source_repo.save(_source("s2", "b.txt", folder_id=FolderId(value="f1")))
+        source_repo.save(_source("s3", "c.mp3", source_type=SourceType.AUDIO))
+
+        assert source_repo.count() == 3
+        assert source_repo.count_by_type() == {
+            SourceType.TEXT: 2,
+            SourceType.AUDIO: 1,
+        }
+        assert source_repo.count_by_folder() == {"f1": 2, None: 1}
+
+
+# =============================================================================
+# Consumers
+# =============================================================================
+
+
+@pytest.fixture
+def open_project(app_context: AppContext, tmp_path: Path) -> Path:
+    path = tmp_path / "summary.qda"
+    assert app_context.create_project(name="Summary", path=str(path)).is_success
+    assert app_context.open_project(str(path)).is_success
+    return path
+
+
+@pytest.fixture
+def selected_fulltext(app_context: AppContext):
+    """Record every SELECT that reads src_source.fulltext."""
+    statements: list[str] = []
+    engine = app_context.lifecycle.engine
+
+    def _capture(_conn, _cursor, statement, _params, _context, _many):
+        sql = statement.lower()
+        if sql.lstrip().startswith("select") and "src_source.fulltext" in sql:
+            statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _capture)
+    yield statements
+    event.remove(engine, "before_cursor_execute", _capture)
+
+
+@allure.story("QC-027.07 Source Summaries")
+class TestMetadataOnlyConsumers:
+    @allure.title("File manager listings and counts never read source text")
+    def test_file_manager(
+        self, app_context: AppContext, open_project: Path, selected_fulltext
+    ):
+        from src.contexts.sources.presentation.viewmodels.file_manager_viewmodel import (
+            FileManagerViewModel,
+        )
+
+        repo = app_context.sources_context.source_repo
+        repo.save(_source("s1", "one.txt", fulltext="long transcript"))
+        repo.save(_source("s2", "two.pdf", source_type=SourceType.PDF))
+        selected_fulltext.clear()
+
+        vm = FileManagerViewModel(
+            source_repo=repo,
+            folder_repo=app_context.folders_context.folder_repo,
+            case_repo=app_context.cases_context.case_repo,
+            state=app_context.state,
+            event_bus=app_context.event_bus,
+        )
+
+        assert [dto.name for dto in vm.load_sources()] == ["one.txt", "two.pdf"]
+        summary = vm.get_summary()
+        assert (summary.total_sources, summary.text_count, summary.pdf_count) == (
+            2,
+            1,
+            1,
+        )
+        assert [dto.id for dto in vm.filter_sources(source_type="pdf")] == ["s2"]
+        assert [dto.name for dto in vm.search_sources("two")] == ["two.pdf"]
+        assert vm.get_folders() == []
+        assert selected_fulltext == []
+
+    @allure.title("list_sources tool and name checks never read source text")
+    def test_mcp_and_import(
+        self, app_context: AppContext, open_project: Path, selected_fulltext
+    ):
+        from src.contexts.sources.interface.mcp_tools import SourceTools
+
+        tools = SourceTools(ctx=app_context)
+        assert tools.execute(
+            "add_text_source", {"name": "notes.txt", "content": "hello"}
+        ).unwrap()
+        duplicate = tools.execute(
+            "add_text_source", {"name": "NOTES.txt", "content": "again"}
+        )
+        assert "already exists" in duplicate.failure()
+
+        listing = tools.execute("list_sources", {}).unwrap()
+        assert listing["count"] == 1
+        assert listing["sources"][0]["name"] == "notes.txt"
+        assert selected_fulltext == []
@@ -0,0 +1,225 @@
+"""
+QC-027.08 Source Text Range Reads - End-to-End Tests
+
+Reading part of a source no longer loads its whole text:
+- get_text_range/get_length run SQL substr()/length()
+- A shared, size-bounded LRU cache serves repeated reads
+- SourceUpdated/SourceRemoved drop cached text
+- Coding and MCP tools read through the cached content provider
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import allure
+import pytest
+from sqlalchemy import event
+
+from src.contexts.projects.core.entities import Source, SourceType
+from src.contexts.projects.core.events import SourceRemoved, SourceUpdated
+from src.contexts.sources.infra.source_repository import SQLiteSourceRepository
+from src.contexts.sources.infra.source_text import (
+    SourceContentProvider,
+    SourceTextCache,
+)
+from src.shared.common.types import SourceId
+from src.shared.infra.event_bus import EventBus
+
+if TYPE_CHECKING:
+    from src.shared.infra.app_context import AppContext
+
+pytestmark = [
+    pytest.mark.e2e,
+    allure.epic("QualCoder v2"),
+    allure.feature("QC-027 Manage Sources"),
+]
+
+TEXT = "Größe: naïve café — " + "lorem ipsum " * 5_000
+
+
+def _source(sid: str, text: str) -> Source:
+    return Source(
+        id=SourceId(value=sid),
+        name=f"{sid}.txt",
+        source_type=SourceType.TEXT,
+        fulltext=text,
+    )
+
+
+@pytest.fixture
+def source_repo(db_connection) -> SQLiteSourceRepository:
+    repo = SQLiteSourceRepository(db_connection)
+    repo.save(_source("s1", TEXT))
+    repo.save(_source("s2", "short text"))
+    return repo
+
+
+@pytest.fixture
+def fulltext_reads(db_engine):
+    """Record SELECTs that return the raw fulltext column."""
+    captured: list[str] = []
+
+    def _capture(_conn, _cursor, statement, _params, _context, _many):
+        sql = " ".join(statement.lower().split())
+        columns = sql.split(" from ", 1)[0]
+        if sql.startswith("select") and "src_source.fulltext" in columns.replace(
+            "substr(src_source.fulltext", ""
+        ).replace("length(src_source.fulltext", ""):
+            captured.append(statement)
+
+    event.listen(db_engine, "before_cursor_execute", _capture)
+    yield captured
+    event.remove(db_engine, "before_cursor_execute", _capture)
+
+
+@allure.story("QC-027.08 Source Text Range Reads")
+class TestRangeReads:
+    @allure.title("Ranges and lengths are computed in SQL, in characters")
+    def test_repository(self, source_repo, fulltext_reads):
+        s1 = SourceId(value="s1")
+
+        assert source_repo.get_length(s1) == len(TEXT)
+        assert source_repo.get_text_range(s1, 0, 5) == TEXT[0:5]
+        assert source_repo.get_text_range(s1, 7, 20) == TEXT[7:20]
+        tail = source_repo.get_text_range(s1, len(TEXT) - 3, len(TEXT) + 50)
+        assert tail == TEXT[-3:]
+        assert source_repo.get_text_range(s1, 10, 10) == ""
+        assert source_repo.get_length(SourceId(value="missing")) is None
+        assert source_repo.get_text_range(SourceId(value="missing"), 0, 5) is None
+        assert fulltext_reads == []
+
+        with allure.step("The recorder does catch a fulltext read"):
+            source_repo.get_fulltext(s1)
+            assert len(fulltext_reads) == 1
+
+    @allure.title("The provider serves ranges from SQL until the text is cached")
+    def test_provider(self, source_repo, fulltext_reads):
+        provider = SourceContentProvider(source_repo)
+        s1 = SourceId(value="s1")
+
+        assert provider.get_text_range(s1, 7, 12) == TEXT[7:12]
+        assert provider.get_length(s1) == len(TEXT)
+        assert fulltext_reads == []
+
+        assert provider.get_content(s1) == TEXT
+        assert provider.get_content(s1) == TEXT
+        assert provider.get_text_range(s1, 100, 120) == TEXT[100:120]
+        assert len(fulltext_reads) == 1
+
+
+@allure.story("QC-027.08 Source Text Range Reads")
+class TestSourceTextCache:
+    @allure.title("The cache evicts least recently used texts past its budget")
+    def test_lru_bound(self):
+        cache = SourceTextCache(max_chars=10)
+        a, b, c = (SourceId(value=v) for v in "abc")
+
+        cache.put(a, "aaaa")
+        cache.put(b, "bbbb")
+        assert cache.get(a) == "aaaa"  # a is now most recent
+        cache.put(c, "cccc")
+
+        assert cache.get(b) is None
+        assert cache.get(a) == "aaaa"
+        assert cache.size == 8
+        assert len(cache) == 2
+
+        with allure.step("Texts larger than the budget are not cached"):
+            cache.put(b, "x" * 11)
+            assert cache.get(b) is None
+            assert cache.get_length(b) == 11
+
+    @allure.title("Source update and removal events drop cached text")
+    def test_invalidation(self, source_repo):
+        bus = EventBus()
+        provider = SourceContentProvider(source_repo)
+        provider.cache.enable(bus)
+        s2 = SourceId(value="s2")
+
+        assert provider.get_content(s2) == "short text"
+        source_repo.save(_source("s2", "edited text, longer"))
+        assert provider.get_content(s2) == "short text"
+
+        bus.publish(SourceUpdated.create(source_id=s2))
+        assert provider.get_content(s2) == "edited text, longer"
+        assert provider.get_length(s2) == len("edited text, longer")
+
+        bus.publish(SourceRemoved.create(source_id=s2, name="s2.txt"))
+        assert len(provider.cache) == 0
+
+        provider.cache.disable()
+        provider.get_content(s2)
+        bus.publish(SourceRemoved.create(source_id=s2, name="s2.txt"))
+        assert len(provider.cache) == 1
+
+
+# =============================================================================
+# Consumers
+# =============================================================================
+
+
+@pytest.fixture
+def project(app_context: AppContext, tmp_path: Path) -> AppContext:
+    path = tmp_path / "text.qda"
+    assert app_context.create_project(name="Text", path=str(path)).is_success
+    assert app_context.open_project(str(path)).is_success
+    app_context.sources_context.source_repo.save(_source("7", TEXT))
+    return app_context
+
+
+@allure.story("QC-027.08 Source Text Range Reads")
+class TestConsumers:
+    @allure.title("Coding and read_source_content use the shared provider")
+    def test_tools(self, project: AppContext):
+        from src.contexts.coding.core.commandHandlers import create_code
+        from src.contexts.coding.core.commands import CreateCodeCommand
+        from src.contexts.coding.interface.mcp_tools import CodingTools
+        from src.contexts.sources.interface.mcp_tools import SourceTools
+
+        coding_ctx = project.coding_context
+        created = create_code(
+            command=CreateCodeCommand(name="Theme", color="#123456"),
+            code_repo=coding_ctx.code_repo,
+            category_repo=coding_ctx.category_repo,
+            segment_repo=coding_ctx.segment_repo,
+            event_bus=project.event_bus,
+        )
+        code_id = created.data.id.value
+
+        coding = CodingTools(ctx=project)
+
+        applied = coding.execute(
+            "batch_apply_codes",
+            {
+                "operations": [
+                    {
+                        "code_id": code_id,
+                        "source_id": 7,
+                        "start_position": 7,
+                        "end_position": 18,
+                    }
+                ]
+            },
+        )
+        assert applied["success"] is True
+        segments = coding.execute("list_segments_for_source", {"source_id": "7"})
+        assert segments["data"][0]["selected_text"] == TEXT[7:18]
+
+        page = SourceTools(ctx=project).execute(
+            "read_source_content", {"source_id": "7", "start_pos": 5, "max_length": 10}
+        )
+        data = page.unwrap()
+        assert data["content"] == TEXT[5:15]
+        assert data["total_length"] == len(TEXT)
+        assert data["has_more"] is True
+
+    @allure.title("Closing the project unsubscribes and empties the cache")
+    def test_close_project(self, project: AppContext):
+        cache = project.sources_context.content_provider.cache
+        project.sources_context.content_provider.get_content(SourceId(value="7"))
+        assert len(cache) == 1
+
+        project.close_project()
+        assert len(cache) == 0
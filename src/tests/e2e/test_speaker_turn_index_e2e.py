@@ -0,0 +1,236 @@
+"""
+QC-027.19 Speaker Turn Index - End-to-End Tests
+
+Speaker turns are stored per source with the hash of the text they were
+found in:
+- A source is scanned once; later requests read the stored turns
+- Saving different text drops the stored turns, saving metadata keeps them
+- Corpus-wide speaker counts scan only unindexed sources, then one query
+- Deleting a source deletes its turns
+- Older databases gain the turn tables on open
+- Auto-coding by speaker and the detect_speakers MCP tool read the index
+"""
+
+from __future__ import annotations
+
+import allure
+import pytest
+from sqlalchemy import create_engine, inspect, text
+
+from src.contexts.projects.core.entities import Source, SourceType
+from src.contexts.sources.infra import speaker_index
+from src.contexts.sources.infra.schema import upgrade_source_columns
+from src.contexts.sources.infra.source_repository import SQLiteSourceRepository
+from src.contexts.sources.infra.speaker_index import SpeakerTurnIndex
+from src.shared.common.types import SourceId
+
+pytestmark = [
+    pytest.mark.e2e,
+    allure.epic("QualCoder v2"),
+    allure.feature("QC-027 Manage Sources"),
+]
+
+INTERVIEW = (
+    "INTERVIEWER: How did the programme start?\n"
+    "PARTICIPANT: With a few families.\n"
+    "INTERVIEWER: And then?\n"
+    "[Observer] Participant laughs.\n"
+)
+
+
+def _source(name: str, fulltext: str | None) -> Source:
+    return Source(
+        id=SourceId.new(), name=name, source_type=SourceType.TEXT, fulltext=fulltext
+    )
+
+
+@pytest.fixture
+def scans(monkeypatch) -> list[int]:
+    """Length of every text the index scans."""
+    scanned: list[int] = []
+    original = speaker_index.iter_speaker_turns
+    monkeypatch.setattr(
+        speaker_index,
+        "iter_speaker_turns",
+        lambda t: scanned.append(len(t)) or original(t),
+    )
+    return scanned
+
+
+@allure.story("QC-027.19 Speaker Turn Index")
+class TestSourceTurns:
+    @allure.title("A source is scanned once and its turns are reused")
+    def test_scanned_once(self, db_connection, scans):
+        repo = SQLiteSourceRepository(db_connection)
+        source = _source("interview.txt", INTERVIEW)
+        repo.save(source)
+        index = SpeakerTurnIndex(repo)
+
+        turns = index.turns(source.id)
+        assert [t.speaker for t in turns] == [
+            "INTERVIEWER",
+            "PARTICIPANT",
+            "INTERVIEWER",
+            "Observer",
+        ]
+        assert INTERVIEW[turns[1].start : turns[1].end] == "With a few families."
+
+        assert index.turns(source.id, INTERVIEW) == turns
+        detector = index.detector(source.id)
+        assert [s.text for s in detector.get_speaker_segments("INTERVIEWER")] == [
+            "How did the programme start?",
+            "And then?",
+        ]
+        assert len(scans) == 1
+
+    @allure.title("Changed text drops stored turns; metadata edits keep them")
+    def test_invalidation(self, db_connection, scans):
+        repo = SQLiteSourceRepository(db_connection)
+        source = _source("interview.txt", INTERVIEW)
+        repo.save(source)
+        index = SpeakerTurnIndex(repo)
+        index.turns(source.id)
+
+        repo.save(source.with_memo("Second interview"))
+        assert repo.get_speaker_turns(source.id) is not None
+
+        revised = INTERVIEW + "MODERATOR: Thank you.\n"
+        repo.save(
+            Source(
+                id=source.id,
+                name="interview.txt",
+                source_type=SourceType.TEXT,
+                fulltext=revised,
+            )
+        )
+        assert repo.get_speaker_turns(source.id) is None
+        assert index.turns(source.id)[-1].speaker == "MODERATOR"
+        assert len(scans) == 2
+
+        with allure.step("Turns stored for other text are not returned for it"):
+            assert repo.get_speaker_turns(source.id, text_hash="0" * 64) is None
+
+        with allure.step("Deleting the source deletes its turns"):
+            repo.delete(source.id)
+            rows = db_connection.execute(
+                text("SELECT count(*) FROM src_speaker_turn")
+            ).scalar()
+            assert rows == 0
+            assert repo.get_speaker_turns(source.id) is None
+
+
+@allure.story("QC-027.19 Speaker Turn Index")
+class TestCorpusCounts:
+    @allure.title("Corpus speaker counts scan each transcript at most once")
+    def test_corpus_counts(self, db_connection, scans):
+        repo = SQLiteSourceRepository(db_connection)
+        sources = [
+            _source(f"interview_{i:03}.txt", INTERVIEW + f"[Guest {i}] Bye.\n")
+            for i in range(500)
+        ]
+        repo.save_many(sources)
+        repo.save(_source("no_speakers.txt", "Field notes without speakers."))
+        repo.save(_source("photo.jpg", None))
+        index = SpeakerTurnIndex(repo)
+
+        counts = index.corpus_speaker_counts()
+        assert len(counts) == 501
+        assert counts[sources[7].id.value] == {
+            "INTERVIEWER": 2,
+            "PARTICIPANT": 1,
+            "Observer": 1,
+            "Guest 7": 1,
+        }
+        assert len(scans) == 501
+
+        assert index.corpus_speaker_counts() == counts
+        assert len(scans) == 501
+
+
+@allure.story("QC-027.19 Speaker Turn Index")
+class TestConsumers:
+    @allure.title("Auto-coding by speaker reads the stored turns of the source")
+    def test_auto_coding_controller(self, db_connection, scans):
+        from src.contexts.coding.presentation.services import AutoCodingController
+
+        repo = SQLiteSourceRepository(db_connection)
+        source = _source("interview.txt", INTERVIEW)
+        repo.save(source)
+        controller = AutoCodingController(SpeakerTurnIndex(repo))
+
+        speakers = controller.detect_speakers(INTERVIEW, source.id.value).unwrap()
+        assert [(s.name, s.count) for s in speakers] == [
+            ("INTERVIEWER", 2),
+            ("PARTICIPANT", 1),
+            ("Observer", 1),
+        ]
+        for speaker in speakers:
+            controller.get_speaker_segments(INTERVIEW, speaker.name, source.id.value)
+        assert scans == [len(INTERVIEW)]
+        assert repo.get_speaker_turns(source.id) is not None
+
+        with allure.step("Without a source the text is scanned directly"):
+            matches = controller.get_speaker_segments(INTERVIEW, "PARTICIPANT")
+            turn = matches.unwrap()[0]
+            assert INTERVIEW[turn.start : turn.end] == "With a few families."
+            assert scans == [len(INTERVIEW)]
+
+    @allure.title("The detect_speakers tool lists speakers from the index")
+    def test_mcp_tool(self, app_context, tmp_path):
+        from src.contexts.sources.interface.mcp_tools import SourceTools
+
+        tools = SourceTools(ctx=app_context)
+        assert tools.execute("detect_speakers", {}).failure() == "No project open"
+
+        path = tmp_path / "speakers.qda"
+        assert app_context.create_project(name="Speakers", path=str(path)).is_success
+        assert app_context.open_project(str(path)).is_success
+        repo = app_context.sources_context.source_repo
+        source = _source("interview.txt", INTERVIEW)
+        repo.save(source)
+        repo.save(_source("notes.txt", "Field notes without speakers."))
+
+        corpus = tools.execute("detect_speakers", {}).unwrap()
+        assert corpus["sources"] == [
+            {
+                "source_id": source.id.value,
+                "speakers": [
+                    {"name": "INTERVIEWER", "turns": 2},
+                    {"name": "PARTICIPANT", "turns": 1},
+                    {"name": "Observer", "turns": 1},
+                ],
+            }
+        ]
+
+        one = tools.execute("detect_speakers", {"source_id": source.id.value})
+        turns = one.unwrap()["turns"]
+        assert [t["speaker"] for t in turns] == [
+            "INTERVIEWER",
+            "PARTICIPANT",
+            "INTERVIEWER",
+            "Observer",
+        ]
+        assert INTERVIEW[turns[1]["start"] : turns[1]["end"]] == "With a few families."
+        assert tools.execute("detect_speakers", {"source_id": "missing"}).failure() == (
+            "Source not found: missing"
+        )
+
+
+@allure.story("QC-027.19 Speaker Turn Index")
+class TestSchemaUpgrade:
+    @allure.title("Older databases gain the speaker turn tables")
+    def test_upgrade(self):
+        engine = create_engine("sqlite:///:memory:")
+        with engine.begin() as conn:
+            conn.execute(
+                text(
+                    "CREATE TABLE src_source (id VARCHAR(36) PRIMARY KEY, "
+                    "name VARCHAR(255) NOT NULL, fulltext TEXT, "
+                    "mediapath VARCHAR(500), source_type VARCHAR(20), "
+                    "folder_id VARCHAR(36))"
+                )
+            )
+            upgrade_source_columns(conn)
+            upgrade_source_columns(conn)  # Idempotent
+            tables = set(inspect(conn).get_table_names())
+        assert {"src_speaker_index", "src_speaker_turn"} <= tables
@@ -655,7 +655,7 @@ class _MockSourceRepo:
     def __init__(self, sources: list):
         self._sources = sources
 
-    def get_all(self) -> list:
+    def list_summaries(self) -> list:
         return self._sources
 
 
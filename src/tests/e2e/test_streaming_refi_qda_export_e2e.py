@@ -0,0 +1,266 @@
+"""
+QC-039.01 Export REFI-QDA Project - Streaming Export Tests
+
+The .qdpx archive is written as a stream:
+- Segments are read one page per source at a time, in position order
+- Source texts are copied into the archive in chunks, as internal:// files
+- The exported archive imports back with every coding
+- Older databases gain the segment paging index on open
+- Benchmark: peak RSS of the export stays flat as the segment count grows
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+import zipfile
+from pathlib import Path
+
+import allure
+import pytest
+from sqlalchemy import create_engine, text
+
+from src.contexts.coding.core.entities import Code, Color, TextPosition, TextSegment
+from src.contexts.coding.infra.repositories import (
+    SQLiteCodeRepository,
+    SQLiteSegmentRepository,
+)
+from src.contexts.coding.infra.schema import upgrade_segment_indexes
+from src.contexts.exchange.core.commandHandlers import export_refi_qda as export_mod
+from src.contexts.exchange.core.commands import ExportRefiQdaCommand
+from src.contexts.exchange.infra.refi_qda_reader import (
+    ParsedCoding,
+    ParsedSource,
+    RefiQdaReader,
+)
+from src.contexts.projects.infra.schema import create_all_contexts
+from src.contexts.sources.core.entities import Source, SourceType
+from src.contexts.sources.infra.source_repository import SQLiteSourceRepository
+from src.shared.common.types import CodeId, SegmentId, SourceId
+
+pytestmark = [
+    pytest.mark.e2e,
+    allure.epic("QualCoder v2"),
+    allure.feature("QC-039 Import Export Formats"),
+]
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+
+# Runs one export in a fresh interpreter and prints its peak RSS growth
+_EXPORT_SCRIPT = """
+import json, resource, sys, time
+from sqlalchemy import create_engine
+from src.contexts.coding.infra.repositories import (
+    SQLiteCategoryRepository, SQLiteCodeRepository, SQLiteSegmentRepository,
+)
+from src.contexts.exchange.core.commandHandlers.export_refi_qda import (
+    export_refi_qda,
+)
+from src.contexts.exchange.core.commands import ExportRefiQdaCommand
+from src.contexts.sources.infra.source_repository import SQLiteSourceRepository
+from src.shared.infra.event_bus import EventBus
+
+db_path, output_path = sys.argv[1:3]
+unit = 1 if sys.platform == "darwin" else 1024  # ru_maxrss: bytes or KiB
+with create_engine(f"sqlite:///{db_path}").connect() as conn:
+    before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    started = time.perf_counter()
+    result = export_refi_qda(
+        command=ExportRefiQdaCommand(output_path=output_path),
+        source_repo=SQLiteSourceRepository(conn),
+        code_repo=SQLiteCodeRepository(conn),
+        category_repo=SQLiteCategoryRepository(conn),
+        segment_repo=SQLiteSegmentRepository(conn),
+        event_bus=EventBus(),
+    )
+    elapsed = time.perf_counter() - started
+    after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+assert result.is_success, result.error
+print(json.dumps({
+    "segments": result.data.segment_count,
+    "rss_growth": (after - before) * unit,
+    "seconds": elapsed,
+}))
+"""
+
+
+def _segment(source_id: SourceId, code_id: CodeId, start: int) -> TextSegment:
+    return TextSegment(
+        id=SegmentId.new(),
+        source_id=source_id,
+        code_id=code_id,
+        position=TextPosition(start=start, end=start + 20),
+        selected_text="x" * 20,
+    )
+
+
+def _build_project(path: Path, n_sources: int, segments_per_source: int) -> None:
+    engine = create_engine(f"sqlite:///{path}")
+    create_all_contexts(engine)
+    with engine.begin() as conn:
+        codes = [
+            Code(id=CodeId.new(), name=f"Code {i}", color=Color.from_hex("#3366CC"))
+            for i in range(50)
+        ]
+        SQLiteCodeRepository(conn).save_many(codes)
+        source_repo = SQLiteSourceRepository(conn)
+        segment_repo = SQLiteSegmentRepository(conn)
+        for s in range(n_sources):
+            source = Source(
+                id=SourceId.new(),
+                name=f"interview_{s:03}.txt",
+                fulltext="participant interviewer community " * 15_000,
+                source_type=SourceType.TEXT,
+            )
+            source_repo.save(source)
+            segment_repo.save_many(
+                [
+                    _segment(source.id, codes[i % len(codes)].id, (i * 37) % 500_000)
+                    for i in range(segments_per_source)
+                ]
+            )
+    engine.dispose()
+
+
+def _export(db_path: Path, output_path: Path) -> dict:
+    completed = subprocess.run(
+        [sys.executable, "-c", _EXPORT_SCRIPT, str(db_path), str(output_path)],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(completed.stdout.splitlines()[-1])
+
+
+@allure.story("QC-039.01 Export REFI-QDA Project")
+class TestStreamingExport:
+    @allure.title("Segments are read page by page in position order")
+    def test_segment_pages(self, segment_repo, code_repo):
+        code = Code(id=CodeId.new(), name="Positive", color=Color.from_hex("#00FF00"))
+        code_repo.save(code)
+        source_id = SourceId.new()
+        starts = [40, 5, 5, 90, 17, 5, 61]
+        segment_repo.save_many([_segment(source_id, code.id, s) for s in starts])
+        segment_repo.save(_segment(SourceId.new(), code.id, 0))
+
+        pages = list(segment_repo.iter_pages_by_source(source_id, page_size=3))
+        assert [len(page) for page in pages] == [3, 3, 1]
+        segments = [seg for page in pages for seg in page]
+        assert [s.position.start for s in segments] == sorted(starts)
+        assert len({s.id for s in segments}) == len(starts)
+        assert list(segment_repo.iter_pages_by_source(SourceId.new())) == []
+
+    @allure.title("Source texts are streamed in chunks and codings round-trip")
+    def test_round_trip(
+        self,
+        source_repo,
+        code_repo,
+        category_repo,
+        segment_repo,
+        event_bus,
+        tmp_path,
+        monkeypatch,
+    ):
+        monkeypatch.setattr(export_mod, "TEXT_CHUNK_CHARS", 1000)
+        ranges = []
+        original = source_repo.get_text_range
+        monkeypatch.setattr(
+            source_repo,
+            "get_text_range",
+            lambda sid, start, end: ranges.append((start, end))
+            or original(sid, start, end),
+        )
+        body = "I felt very happy about learning. " * 200
+        source = Source(
+            id=SourceId.new(),
+            name="interview.txt",
+            fulltext=body,
+            source_type=SourceType.TEXT,
+        )
+        source_repo.save(source)
+        code = Code(id=CodeId.new(), name="Positive", color=Color.from_hex("#00FF00"))
+        code_repo.save(code)
+        segment_repo.save_many(
+            [_segment(source.id, code.id, start) for start in range(0, 2500, 10)]
+        )
+
+        output = tmp_path / "project.qdpx"
+        result = export_mod.export_refi_qda(
+            command=ExportRefiQdaCommand(output_path=str(output)),
+            source_repo=source_repo,
+            code_repo=code_repo,
+            category_repo=category_repo,
+            segment_repo=segment_repo,
+            event_bus=event_bus,
+        )
+        assert result.is_success, result.error
+        assert result.data.segment_count == 250
+        assert ranges[:2] == [(0, 1000), (1000, 2000)]
+        assert len(ranges) == 7
+
+        with RefiQdaReader(output) as reader:
+            items = list(reader.items())
+            parsed = next(i for i in items if isinstance(i, ParsedSource))
+            assert parsed.name == "interview.txt"
+            assert parsed.text_path.startswith("Sources/")
+            assert reader.read_text(parsed) == body
+            codings = [i for i in items if isinstance(i, ParsedCoding)]
+        assert sorted(c.start for c in codings) == list(range(0, 2500, 10))
+
+        with zipfile.ZipFile(output) as zf:
+            assert zf.namelist()[-1] == "project.qde"
+            assert b"PlainTextContent" not in zf.read("project.qde")
+
+    @allure.title("Older databases gain the segment paging index")
+    def test_upgrade(self):
+        engine = create_engine("sqlite:///:memory:")
+        with engine.begin() as conn:
+            conn.execute(
+                text(
+                    "CREATE TABLE cod_segment (ctid VARCHAR(36) PRIMARY KEY, "
+                    "cid VARCHAR(36) NOT NULL, fid VARCHAR(36) NOT NULL, "
+                    "pos0 INTEGER NOT NULL, pos1 INTEGER NOT NULL, "
+                    "seltext TEXT NOT NULL)"
+                )
+            )
+            upgrade_segment_indexes(conn)
+            upgrade_segment_indexes(conn)  # Idempotent
+            indexes = {
+                row[1] for row in conn.execute(text("PRAGMA index_list(cod_segment)"))
+            }
+        assert "idx_cod_segment_fid_pos0" in indexes
+
+
+@allure.story("QC-039.01 Export REFI-QDA Project")
+@allure.severity(allure.severity_level.NORMAL)
+class TestStreamingExportBenchmark:
+    @pytest.mark.slow
+    @allure.title("Export peak RSS stays flat as the segment count grows")
+    def test_benchmark(self, tmp_path: Path):
+        pytest.importorskip("resource")
+        results = {}
+        for per_source in (1_000, 20_000):
+            db_path = tmp_path / f"project_{per_source}.qda"
+            _build_project(db_path, n_sources=10, segments_per_source=per_source)
+            results[per_source] = _export(db_path, tmp_path / f"{per_source}.qdpx")
+
+        allure.attach(
+            "\n".join(
+                f"{r['segments']:>7} segments: "
+                f"peak RSS +{r['rss_growth'] / 2**20:6.1f} MiB, "
+                f"{r['seconds']:6.2f}s"
+                for r in results.values()
+            ),
+            name="refi_qda_export_benchmark",
+            attachment_type=allure.attachment_type.TEXT,
+        )
+        small, large = results[1_000], results[20_000]
+        assert (small["segments"], large["segments"]) == (10_000, 200_000)
+        # 20x the segments; growth stays within the pages and buffers in flight
+        assert large["rss_growth"] - small["rss_growth"] < 16 * 2**20, (
+            f"Peak RSS grew {large['rss_growth'] / 2**20:.1f} MiB for "
+            f"{large['segments']} segments vs "
+            f"{small['rss_growth'] / 2**20:.1f} MiB for {small['segments']}"
+        )
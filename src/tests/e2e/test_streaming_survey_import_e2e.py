@@ -0,0 +1,243 @@
+"""
+QC-039.06 Import Survey Data - Streaming Import Tests
+
+Survey CSV files are imported as a stream:
+- Attribute types are inferred from a sampled prefix of the rows
+- Cases and attributes are written in batches, one executemany per table,
+  inside one transaction that is rolled back if the file turns out to be
+  unreadable part way through
+- Only the SurveyCSVImported summary event is published, on which the
+  case manager refreshes its list once
+- Benchmark: a 1M-cell file imports with flat memory; throughput is
+  reported in cells per second
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+import tracemalloc
+from datetime import datetime
+
+import allure
+import pytest
+from sqlalchemy import create_engine
+
+from src.contexts.cases.core.entities import AttributeType
+from src.contexts.cases.infra.case_repository import SQLiteCaseRepository
+from src.contexts.cases.interface.signal_bridge import CasesSignalBridge
+from src.contexts.cases.presentation import CaseManagerViewModel
+from src.contexts.exchange.core.commandHandlers import import_survey_csv as import_mod
+from src.contexts.exchange.core.commands import ImportSurveyCSVCommand
+from src.contexts.exchange.core.events import SurveyCSVImported
+from src.contexts.projects.infra.schema import create_all_contexts
+from src.shared.infra.event_bus import EventBus
+
+pytestmark = [
+    pytest.mark.e2e,
+    allure.epic("QualCoder v2"),
+    allure.feature("QC-039 Import Export Formats"),
+]
+
+SURVEY = (
+    "Name,Age,Member,Joined,Comment\n"
+    'Alice,30,true,2024-01-02,"Likes it, mostly"\n'
+    "Bob,0,FALSE,,\n"
+    ",41,true,2020-01-01,No name\n"
+    "Carol,unknown,true,2021-05-05,Short\n"
+)
+
+
+class _Session:
+    """Commits and rolls back the test connection, counting calls."""
+
+    def __init__(self, connection) -> None:
+        self._conn = connection
+        self.commits = 0
+        self.rollbacks = 0
+
+    def commit(self) -> None:
+        self.commits += 1
+        self._conn.commit()
+
+    def rollback(self) -> None:
+        self.rollbacks += 1
+        self._conn.rollback()
+
+
+def _write_survey(path, respondents: int, questions: int) -> None:
+    """Respondents x questions cells: alternating text and numeric answers."""
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        f.write("Respondent," + ",".join(f"Q{j}" for j in range(questions)) + "\n")
+        for i in range(respondents):
+            answers = (
+                str((i * j) % 7) if j % 2 else f"answer {j}" for j in range(questions)
+            )
+            f.write(f"R{i}," + ",".join(answers) + "\n")
+
+
+def _import(case_repo, event_bus, path, **kwargs):
+    return import_mod.import_survey_csv(
+        command=ImportSurveyCSVCommand(source_path=str(path)),
+        case_repo=case_repo,
+        event_bus=event_bus,
+        **kwargs,
+    )
+
+
+@allure.story("QC-039.06 Import Survey Data")
+class TestStreamingSurveyImport:
+    @allure.title("Typed attributes are written in batches with one summary event")
+    def test_typed_batches(
+        self, case_repo, event_bus, db_connection, tmp_path, monkeypatch
+    ):
+        monkeypatch.setattr(import_mod, "ATTRIBUTE_BATCH_SIZE", 8)
+        batch_sizes: list[int] = []
+        original = case_repo.insert_many
+        monkeypatch.setattr(
+            case_repo,
+            "insert_many",
+            lambda cases: batch_sizes.append(len(cases)) or original(cases),
+        )
+        published = []
+        event_bus.subscribe_all(published.append)
+        csv_file = tmp_path / "survey.csv"
+        csv_file.write_text(SURVEY, encoding="utf-8")
+        session = _Session(db_connection)
+
+        result = _import(case_repo, event_bus, csv_file, session=session)
+
+        assert result.is_success, result.error
+        assert [type(e) for e in published] == [SurveyCSVImported]
+        assert published[0].cases_created == 3
+        assert (session.commits, session.rollbacks) == (1, 0)
+        # Two rows per batch of 8 cells over 4 attribute columns
+        assert batch_sizes == [2, 1]
+
+        with allure.step("Types come from the sample; misfits are kept as text"):
+            alice = case_repo.get_by_name("Alice")
+            assert alice.get_attribute("Member").attr_type == AttributeType.BOOLEAN
+            assert alice.get_attribute("Member").value is True
+            assert alice.get_attribute("Joined").value == datetime(2024, 1, 2)
+            assert alice.get_attribute("Comment").value == "Likes it, mostly"
+            assert alice.get_attribute("Age").attr_type == AttributeType.TEXT
+            bob = case_repo.get_by_name("Bob")
+            assert bob.get_attribute("Member").value is False
+            assert bob.get_attribute("Joined") is None
+
+        with allure.step("Numeric columns are stored as numbers, zero included"):
+            csv_file.write_text("Name,Age\nDan,0\nEve,52\n", encoding="utf-8")
+            assert _import(case_repo, event_bus, csv_file).is_success
+            age = case_repo.get_by_name("Dan").get_attribute("Age")
+            assert (age.attr_type, age.value) == (AttributeType.NUMBER, 0)
+
+    @allure.title("A file unreadable part way through is rolled back")
+    def test_rollback(self, case_repo, event_bus, db_connection, tmp_path, monkeypatch):
+        monkeypatch.setattr(import_mod, "TYPE_SAMPLE_ROWS", 10)
+        monkeypatch.setattr(import_mod, "ATTRIBUTE_BATCH_SIZE", 100)
+        csv_file = tmp_path / "broken.csv"
+        _write_survey(csv_file, respondents=2_000, questions=10)
+        with open(csv_file, "ab") as f:
+            f.write(b"R-bad,\xff\xfe\n")
+        session = _Session(db_connection)
+
+        result = _import(case_repo, event_bus, csv_file, session=session)
+
+        assert result.is_failure
+        assert result.error_code == "CSV_NOT_IMPORTED/PARSE_ERROR"
+        assert (session.commits, session.rollbacks) == (0, 1)
+        assert case_repo.count() == 0
+
+    @allure.title("The case manager refreshes once on the summary event")
+    def test_case_manager_refresh(
+        self, case_repo, event_bus, project_state, cases_context, tmp_path, qapp
+    ):
+        from PySide6.QtTest import QSignalSpy
+        from PySide6.QtWidgets import QApplication
+
+        CasesSignalBridge.clear_instance()
+        bridge = CasesSignalBridge.instance(event_bus)
+        bridge.start()
+        viewmodel = CaseManagerViewModel(
+            case_repo=case_repo,
+            state=project_state,
+            event_bus=event_bus,
+            cases_ctx=cases_context,
+            signal_bridge=bridge,
+        )
+        imported = QSignalSpy(bridge.cases_imported)
+        created = QSignalSpy(bridge.case_created)
+        cases_changed = QSignalSpy(viewmodel.cases_changed)
+        summary_changed = QSignalSpy(viewmodel.summary_changed)
+        csv_file = tmp_path / "survey.csv"
+        csv_file.write_text(SURVEY, encoding="utf-8")
+
+        try:
+            assert _import(case_repo, event_bus, csv_file).is_success
+            QApplication.processEvents()
+
+            assert (imported.count(), created.count()) == (1, 0)
+            payload = imported.at(0)[0]
+            assert (payload.cases_created, payload.attributes_per_case) == (3, 4)
+            assert (cases_changed.count(), summary_changed.count()) == (1, 1)
+            assert len(viewmodel.load_cases()) == 3
+        finally:
+            viewmodel.teardown()
+            bridge.stop()
+            CasesSignalBridge.clear_instance()
+
+
+def _measure(path, traced: bool) -> tuple[int, float, int]:
+    """Import into a fresh project; (cases, seconds, traced peak bytes)."""
+    engine = create_engine("sqlite:///:memory:")
+    create_all_contexts(engine)
+    with engine.connect() as conn:
+        if traced:
+            tracemalloc.start()
+        started = time.perf_counter()
+        result = _import(
+            SQLiteCaseRepository(conn), EventBus(), path, session=_Session(conn)
+        )
+        elapsed = time.perf_counter() - started
+        peak = 0
+        if traced:
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+    engine.dispose()
+    assert result.is_success, result.error
+    return result.data.cases_created, elapsed, peak
+
+
+@allure.story("QC-039.06 Import Survey Data")
+@allure.severity(allure.severity_level.NORMAL)
+class TestStreamingSurveyImportBenchmark:
+    @pytest.mark.slow
+    @allure.title("A 1M-cell survey imports with flat memory")
+    def test_benchmark(self, tmp_path, caplog):
+        paths = {}
+        for respondents in (1_250, 5_000):
+            paths[respondents] = tmp_path / f"survey_{respondents}.csv"
+            _write_survey(paths[respondents], respondents, questions=200)
+        small, _, small_peak = _measure(paths[1_250], traced=True)
+        large, _, large_peak = _measure(paths[5_000], traced=True)
+
+        # Tracing slows allocation down, so throughput is timed separately
+        with caplog.at_level(logging.INFO, logger="qualcoder.exchange.core"):
+            _, seconds, _ = _measure(paths[5_000], traced=False)
+        (summary,) = [m for m in caplog.messages if m.startswith("Survey CSV")]
+
+        allure.attach(
+            f"{small * 200:>9} cells: peak {small_peak / 2**20:6.1f} MiB\n"
+            f"{large * 200:>9} cells: peak {large_peak / 2**20:6.1f} MiB, "
+            f"{seconds:.2f}s ({large * 200 / seconds:,.0f} cells/s)\n{summary}",
+            name="streaming_survey_import_benchmark",
+            attachment_type=allure.attachment_type.TEXT,
+        )
+        assert (small, large) == (1_250, 5_000)
+        assert "cells/s" in summary
+        # 4x the cells; the peak is bounded by the sample and the batch in flight
+        assert large_peak - small_peak < 8 * 2**20, (
+            f"Peak memory grew {large_peak / 2**20:.1f} MiB for {large * 200} "
+            f"cells vs {small_peak / 2**20:.1f} MiB for {small * 200}"
+        )
+        assert seconds < 120, f"1M-cell survey import took {seconds:.1f}s"
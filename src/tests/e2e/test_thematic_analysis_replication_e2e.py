@@ -1020,9 +1020,15 @@ class TestPhase6FullWorkflow:
         with allure.step("Phase 6: Verify event audit trail (Lincoln & Guba)"):
             history = app_context.event_bus.get_history()
             event_types = [e.event_type for e in history]
+            # Batches record their segments in one aggregated event
+            coded_segments = sum(
+                len(e.event.segments) if e.event_type == "coding.segments_coded" else 1
+                for e in history
+                if e.event_type in ("coding.segment_coded", "coding.segments_coded")
+            )
 
             assert "coding.code_created" in event_types, "Missing code creation events"
-            assert "coding.segment_coded" in event_types, "Missing coding events"
+            assert coded_segments > 0, "Missing coding events"
             assert "coding.category_created" in event_types, "Missing category events"
             assert "coding.code_moved_to_category" in event_types, (
                 "Missing organization events"
@@ -1031,6 +1037,6 @@ class TestPhase6FullWorkflow:
             # All 5 codes should have been created
             assert event_types.count("coding.code_created") == 5
             # All 5 segments should have been coded
-            assert event_types.count("coding.segment_coded") == 5
+            assert coded_segments == 5
             # 3 categories created
             assert event_types.count("coding.category_created") == 3
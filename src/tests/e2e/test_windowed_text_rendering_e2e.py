@@ -0,0 +1,140 @@
+"""
+QC-050.07 Windowed Text Rendering - End-to-End Tests
+
+Large transcripts in the coding screen are loaded in blocks and
+highlighted only around the viewport:
+- The editor holds the first blocks at once, the rest after the event loop
+- Only blocks near the viewport are formatted; others format on demand
+- Selections and highlights keep document / source positions
+- Small documents keep the eager behaviour
+"""
+
+from __future__ import annotations
+
+import allure
+import pytest
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication
+
+from src.shared.presentation.molecules.editor import WINDOWED_MIN_CHARS
+from src.shared.presentation.organisms.text_editor_panel import TextEditorPanel
+from src.shared.presentation.organisms.text_highlighter import (
+    CodeSegment,
+    TextHighlighter,
+)
+
+pytestmark = [
+    pytest.mark.e2e,
+    allure.epic("QualCoder v2"),
+    allure.feature("QC-050 Performance"),
+]
+
+LINE = "SPEAKER: a line of focus group transcript text that goes on.\n"
+
+
+def _large_text() -> str:
+    return LINE * (WINDOWED_MIN_CHARS // len(LINE) * 2)
+
+
+def _drain_loading(widget) -> None:
+    while widget._formatter.is_loading:
+        QApplication.processEvents()
+
+
+@allure.story("QC-050.07 Windowed Text Rendering")
+class TestWindowedEditorPanel:
+    """TextEditorPanel with a multi-hundred-kilobyte document."""
+
+    @allure.title("Large documents load in blocks and keep absolute positions")
+    def test_loads_in_blocks(self, qapp, colors):
+        text = _large_text()
+        panel = TextEditorPanel(colors=colors)
+        panel.set_document("big.txt", text=text)
+
+        assert panel.is_windowed()
+        assert panel.get_text() == text
+        assert len(panel._text_edit.toPlainText()) < len(text)
+
+        _drain_loading(panel)
+        assert panel._text_edit.toPlainText() == text
+
+        far = len(text) - len(LINE)
+        panel.select_range(far, far + 7)
+        assert panel.get_selection() == (far, far + 7)
+        assert panel.get_selected_text() == "SPEAKER"
+
+    @allure.title("Only blocks near the viewport are formatted")
+    def test_formats_visible_blocks_only(self, qapp, colors):
+        text = _large_text()
+        panel = TextEditorPanel(colors=colors)
+        panel.set_document("big.txt", text=text)
+        _drain_loading(panel)
+
+        far = len(text) - 2 * len(LINE)
+        panel.set_highlights(
+            [
+                {"start": 0, "end": 7, "color": "#FFC107"},
+                {"start": 3, "end": 12, "color": "#2196F3"},
+                {"start": far, "end": far + 7, "color": "#4CAF50"},
+            ]
+        )
+        formatter = panel._formatter
+        formatted = formatter.formatted_blocks()
+        assert 0 < formatted < len(text) // 16_384
+
+        fmt = panel.get_char_format_at(1)
+        assert fmt.background().color().name().upper() == "#FFC107"
+        assert panel.get_char_format_at(5).fontUnderline()
+        assert panel.get_overlap_regions() == [(3, 7)]
+
+        # Formatted on demand, not by set_highlights
+        fmt = panel.get_char_format_at(far + 1)
+        assert fmt.background().color().name().upper() == "#4CAF50"
+        assert formatter.formatted_blocks() == formatted + 1
+
+        panel.clear_highlights()
+        fmt = panel.get_char_format_at(far + 1)
+        assert fmt.background().style() == Qt.BrushStyle.NoBrush
+
+    @allure.title("Small documents are loaded and highlighted eagerly")
+    def test_small_document_unchanged(self, qapp, colors):
+        panel = TextEditorPanel(colors=colors)
+        panel.set_document("small.txt", text="Short interview text.")
+
+        assert not panel.is_windowed()
+        panel.highlight_range(0, 5, "#FFC107")
+        fmt = panel.get_char_format_at(2)
+        assert fmt.background().color().name().upper() == "#FFC107"
+
+
+@allure.story("QC-050.07 Windowed Text Rendering")
+class TestWindowedTextHighlighter:
+    """TextHighlighter with a large partial text."""
+
+    @allure.title("Segments map through file_start in windowed mode")
+    def test_file_start_offsets(self, qapp, colors):
+        text = _large_text()
+        highlighter = TextHighlighter(colors=colors, show_selection_popup=False)
+        highlighter.set_text(text, file_start=1000)
+        _drain_loading(highlighter)
+
+        highlighter.set_segments(
+            [
+                CodeSegment(
+                    segment_id="s1",
+                    code_color="#FFC107",
+                    pos0=1000,
+                    pos1=1007,
+                )
+            ]
+        )
+        highlighter.highlight()
+
+        cursor = highlighter._text_edit.textCursor()
+        cursor.setPosition(2)
+        cursor.setPosition(3, cursor.MoveMode.KeepAnchor)
+        assert cursor.charFormat().background().color().name().upper() == "#FFC107"
+        assert [s.segment_id for s in highlighter.get_codes_at_position(2)] == ["s1"]
+
+        highlighter.select_range(len(text) + 1000 - 7, len(text) + 1000)
+        assert highlighter.get_selection() == (len(text) - 7, len(text))
@@ -84,10 +84,12 @@ conn = engine.connect()
 
 # Create tables
 from src.contexts.coding.infra.schema import code_cat, code_name, code_text
+from src.contexts.coding.infra.segment_counts import create_segment_counts
 
 code_name.create(conn, checkfirst=True)
 code_cat.create(conn, checkfirst=True)
 code_text.create(conn, checkfirst=True)
+create_segment_counts(conn)
 
 # Create repositories
 from src.contexts.coding.infra.repositories import (